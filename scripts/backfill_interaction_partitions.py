@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+backfill_interaction_partitions.py — index legacy interaction files per user
+=============================================================================
+
+Purpose:
+  One-off migration for day files written before per-user interaction
+  partitions existed.  Walks the interaction directories once and appends
+  each record to its user's partition, so GDPR export and erasure cover
+  old data without ever walking the directories again.  Safe to re-run:
+  files already indexed are skipped.  The API also runs this automatically
+  at startup for the default directory; use the script for extra
+  directories or to migrate before deploying.
+
+Usage:
+  python scripts/backfill_interaction_partitions.py
+  python scripts/backfill_interaction_partitions.py --dir ./interactions --dir "/mnt/careertrojan/user_data/interactions"
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.backend_api.services.interaction_partitions import get_interaction_partitions
+
+
+def main() -> None:
+    store = get_interaction_partitions()
+    parser = argparse.ArgumentParser(description="Index legacy interaction files into per-user partitions")
+    parser.add_argument("--dir", action="append", type=Path, dest="dirs",
+                        help=f"Interaction directory to index (default: {store.interactions_dir})")
+    args = parser.parse_args()
+
+    for base in args.dirs or [store.interactions_dir]:
+        if not base.is_dir():
+            print(f"skip (missing): {base}")
+            continue
+        print(f"{base}: {store.backfill(base)} records indexed")
+        if base.resolve() == store.interactions_dir.resolve():
+            store.mark_backfilled()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+benchmark_deep_parse.py — deep ingest Phase A parsing throughput
+=================================================================
+
+Purpose:
+  Runs the Phase A document parser (text extraction + one batched spaCy
+  pass per document) over a local corpus at several worker counts and
+  reports files/second for each.  Nothing is written to ai_data_final/.
+
+Usage:
+  python scripts/benchmark_deep_parse.py --corpus "L:/antigravity_version_ai_data_final/automated_parser"
+  python scripts/benchmark_deep_parse.py --corpus ./sample_docs --workers 1 4 8 --limit 500
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+# Ensure project root on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# The pipeline module creates its output dirs on import — keep them out of the real data root
+os.environ.setdefault("CAREERTROJAN_DATA_ROOT", tempfile.mkdtemp(prefix="deep_parse_bench_"))
+
+from scripts.deep_ingest_and_train import NLP_BATCH_SIZE, SUPPORTED_EXTENSIONS, iter_parsed_documents
+
+
+def run(files, workers: int, batch_size: int) -> dict:
+    stats = {"parsed": 0, "skipped_existing": 0, "failed": 0}
+    t0 = time.perf_counter()
+    for _ in iter_parsed_documents(files, set(), stats, [], workers=workers, batch_size=batch_size):
+        stats["parsed"] += 1
+    stats["seconds"] = time.perf_counter() - t0
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark deep ingest document parsing")
+    parser.add_argument("--corpus", type=Path, required=True, help="Directory of documents to parse")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--batch-size", type=int, default=NLP_BATCH_SIZE)
+    parser.add_argument("--limit", type=int, default=0, help="Parse at most this many files (0 = all)")
+    args = parser.parse_args()
+
+    files = sorted(p for p in args.corpus.rglob("*") if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS)
+    if args.limit:
+        files = files[:args.limit]
+    print(f"{len(files)} files in {args.corpus}  {dict(Counter(p.suffix.lower() for p in files))}")
+
+    for workers in args.workers:
+        stats = run(files, workers, args.batch_size)
+        rate = stats["parsed"] / stats["seconds"] if stats["seconds"] else 0.0
+        print(f"  workers={workers:<2d}  {stats['parsed']:>6d} parsed  {stats['failed']:>4d} failed  "
+              f"{stats['seconds']:7.2f}s  {rate:8.1f} files/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+benchmark_insight_view.py — InsightView build time, memory and cohort latency
+==============================================================================
+
+Purpose:
+  Folds synthetic profiles into an InsightView, reporting the time for each
+  tenth of the build (flat per-chunk times mean linear scaling), peak RSS,
+  and resolve_cohort() latency for a few filter shapes on the full view.
+
+Usage:
+  python scripts/benchmark_insight_view.py
+  python scripts/benchmark_insight_view.py --profiles 500000 --skills 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.ai_engine.insight_views import InsightView
+
+INDUSTRIES = ["Technology", "Finance", "Retail", "Healthcare", "Education", "Energy"]
+SENIORITIES = ["Junior", "Mid", "Senior", "Lead"]
+
+
+def peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark InsightView build and cohort resolve")
+    parser.add_argument("--profiles", type=int, default=100_000)
+    parser.add_argument("--skills", type=int, default=500, help="Distinct skills in the pool")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pool = [f"skill{i}" for i in range(args.skills)]
+    view = InsightView(axis_maps={"demo": {"Tech": ["skill1", "skill2"]}}, sources=[])
+
+    chunk = max(args.profiles // 10, 1)
+    start = t0 = time.perf_counter()
+    print(f"{'rows':>9} {'chunk s':>9}")
+    for i in range(args.profiles):
+        view.add_profile({
+            "id": f"p{i}",
+            "role": "Engineer",
+            "seniority": rng.choice(SENIORITIES),
+            "skills": rng.sample(pool, rng.randint(1, 8)),
+            "experience_years": rng.randint(0, 25),
+            "match_score": rng.random() * 100,
+            "industry": rng.choice(INDUSTRIES),
+        })
+        if (i + 1) % chunk == 0:
+            now = time.perf_counter()
+            print(f"{i + 1:>9} {now - t0:>9.2f}")
+            t0 = now
+    print(f"\nbuild: {time.perf_counter() - start:.2f}s, peak RSS {peak_rss_mb():.1f} MB")
+
+    for filters in ({}, {"industry": "Finance"}, {"industry": "Technology", "seniority": "Senior"},
+                    {"skills": ["skill3", "skill4"], "min_experience": 5, "match_score_min": 50}):
+        t0 = time.perf_counter()
+        res = view.resolve_cohort(filters)
+        print(f"resolve {filters}: {res['count']} rows in {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+benchmark_neural_training.py — neural trainer time and peak memory vs rows
+===========================================================================
+
+Purpose:
+  Trains one of the PyTorch classifiers from train_neural_networks.py on
+  synthetic feature matrices (same width as prepare_features() output) at
+  each requested row count, each in a fresh subprocess so peak RSS is
+  per-run, and reports wall time, epochs actually run (early stopping),
+  best epoch, validation accuracy and peak resident memory.
+
+Usage:
+  python scripts/benchmark_neural_training.py
+  python scripts/benchmark_neural_training.py --rows 50000 500000 --model lstm --loader-workers 4
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Ensure project root on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+N_FEATURES = 54   # 50 SVD components + 4 scalar features
+N_CLASSES = 12
+
+
+def make_data(rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, N_CLASSES, size=rows)
+    centres = rng.normal(size=(N_CLASSES, N_FEATURES)).astype(np.float32)
+    X = centres[y] + rng.normal(scale=2.0, size=(rows, N_FEATURES)).astype(np.float32)
+    return X, y
+
+
+def peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(rows: int, model_name: str, epochs: int, loader_workers: int) -> dict:
+    from sklearn.model_selection import train_test_split
+    from services.ai_engine.train_neural_networks import (
+        CNNEmbedder, DNNClassifier, LSTMSequenceModel, NeuralNetworkTrainer,
+    )
+
+    X, y = make_data(rows)
+    X_tr, X_te, y_tr, y_te = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+    model_cls = {"dnn": DNNClassifier, "cnn": CNNEmbedder, "lstm": LSTMSequenceModel}[model_name]
+
+    trainer = NeuralNetworkTrainer()
+    trainer.loader_workers = loader_workers
+    t0 = time.perf_counter()
+    metrics = trainer._train_classifier(
+        model_cls(input_dim=N_FEATURES, num_classes=N_CLASSES), X_tr, y_tr, X_te, y_te, epochs=epochs,
+    )
+    return {
+        "rows": rows,
+        "seconds": round(time.perf_counter() - t0, 2),
+        "epochs": metrics["epochs"],
+        "best_epoch": metrics["best_epoch"],
+        "val_acc": round(metrics["final_accuracy"], 4),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark neural trainer time / memory")
+    parser.add_argument("--rows", type=int, nargs="+", default=[50_000, 500_000])
+    parser.add_argument("--model", choices=["dnn", "cnn", "lstm"], default="dnn")
+    parser.add_argument("--epochs", type=int, default=50, help="Epoch cap (early stopping may end sooner)")
+    parser.add_argument("--loader-workers", type=int, default=0)
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child, args.model, args.epochs, args.loader_workers)))
+        return
+
+    print(f"{'rows':>9} {'seconds':>9} {'epochs':>7} {'best':>5} {'val_acc':>8} {'peak MB':>9}")
+    for rows in args.rows:
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", str(rows), "--model", args.model,
+             "--epochs", str(args.epochs), "--loader-workers", str(args.loader_workers)],
+            capture_output=True, text=True, check=True,
+        )
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{r['rows']:>9} {r['seconds']:>9.2f} {r['epochs']:>7} {r['best_epoch']:>5} "
+              f"{r['val_acc']:>8.4f} {r['peak_rss_mb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
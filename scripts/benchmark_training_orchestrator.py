@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+benchmark_training_orchestrator.py — serial vs concurrent model training
+=========================================================================
+
+Purpose:
+  Builds a synthetic candidate database in a temporary directory, trains
+  every model once in-process (--cpus 1) and once across a process pool
+  with the given CPU budget, and reports wall-clock time, summed per-model
+  time and the resulting speedup.  Run it on a multi-core box.
+
+Usage:
+  python scripts/benchmark_training_orchestrator.py
+  python scripts/benchmark_training_orchestrator.py --candidates 50000 --cpus 8
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Ensure project root on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+TITLES = ["Software Engineer", "Staff Nurse", "Financial Analyst", "Sales Manager",
+          "HR Recruiter", "Maths Teacher", "Operations Director"]
+WORDS = ("python sql leadership budgeting negotiation patient care forecasting hiring "
+         "curriculum logistics cloud compliance analytics stakeholder reporting").split()
+
+
+def write_candidates(path: Path, n: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    candidates = [
+        {
+            "Job Title": rng.choice(TITLES),
+            "summary": " ".join(rng.choices(WORDS, k=rng.randint(30, 120))),
+            "years_experience": rng.randint(1, 30),
+            "salary": rng.randint(25_000, 120_000),
+        }
+        for _ in range(n)
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(candidates), encoding="utf-8")
+
+
+def run(data_dir: Path, work: Path, cpus: int) -> dict:
+    from services.ai_engine.training_orchestrator import TrainingOrchestrator
+
+    orchestrator = TrainingOrchestrator(
+        data_dir=str(data_dir),
+        models_dir=str(work / "models"),
+        registry_dir=str(work / "registry"),
+        cpu_budget=cpus,
+    )
+    if not orchestrator.train_all_models():
+        raise SystemExit("training failed")
+    return orchestrator.training_state
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent TrainingOrchestrator runs")
+    parser.add_argument("--candidates", type=int, default=20_000)
+    parser.add_argument("--cpus", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        data_dir = tmp / "data"
+        write_candidates(data_dir / "core_databases" / "Candidate_database_merged.json", args.candidates)
+        os.environ["ML_MODELS_PATH"] = str(tmp / "models")
+        os.chdir(tmp)  # checkpoints are written relative to the working directory
+
+        results = {cpus: run(data_dir, tmp, cpus) for cpus in (1, args.cpus)}
+
+    print("\n" + "=" * 70)
+    print(f"{'cpus':>5} {'workers':>8} {'wall s':>9} {'model s':>9}  per-model")
+    for cpus, state in results.items():
+        per_model = ", ".join(f"{m}={s:.1f}" for m, s in state["model_durations"].items())
+        print(f"{cpus:>5} {state['workers']:>8} {state['total_duration']:>9.2f} {state['model_time']:>9.2f}  {per_model}")
+    serial, parallel = results[1]["total_duration"], results[args.cpus]["total_duration"]
+    print(f"\nspeedup: {serial / max(parallel, 1e-9):.2f}x wall-clock with {args.cpus} CPUs")
+
+
+if __name__ == "__main__":
+    main()
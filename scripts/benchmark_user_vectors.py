@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+benchmark_user_vectors.py — UserVectorStore load, recall and latency
+=====================================================================
+
+Purpose:
+  Fills a throwaway UserVectorStore with synthetic users in batches, then
+  reports batched-upsert throughput, cold-open cost, Recall@10 of the
+  cosine top-k against a float64 numpy reference, and p50/p99 latency.
+
+Usage:
+  python scripts/benchmark_user_vectors.py
+  python scripts/benchmark_user_vectors.py --users 100000 1000000 --queries 200
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Ensure project root on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.backend_api.services.career.user_vector_service import CORE_AXES, UserVectorStore
+
+
+def run(n_users: int, n_queries: int, batch: int, root: Path) -> dict:
+    rng = np.random.default_rng(0)
+    # Clustered profiles, like real career archetypes
+    centers = rng.random((40, len(CORE_AXES)))
+    vectors = np.clip(centers[rng.integers(0, 40, n_users)] + 0.15 * rng.normal(size=(n_users, len(CORE_AXES))), 0, 1)
+    vectors = vectors.round(3)
+
+    store = UserVectorStore(root)
+    t0 = time.perf_counter()
+    for start in range(0, n_users, batch):
+        store.upsert_many([
+            {
+                "user_id": f"u{i}", "resume_id": "r",
+                "vector": dict(zip(CORE_AXES, vectors[i].tolist())), "confidence": {},
+            }
+            for i in range(start, min(start + batch, n_users))
+        ])
+    load_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    cold = UserVectorStore(root)
+    open_ms = (time.perf_counter() - t0) * 1000
+    cold.get("u1", "r")
+
+    norms = np.linalg.norm(vectors, axis=1)
+    normed = vectors / np.where(norms == 0, 1.0, norms)[:, None]
+    latencies, recall = [], 0.0
+    for qi in rng.integers(0, n_users, n_queries):
+        query = dict(zip(CORE_AXES, vectors[qi].tolist()))
+        t0 = time.perf_counter()
+        hits = cold.top_k(query, k=10)
+        latencies.append(time.perf_counter() - t0)
+        scores = normed @ normed[qi]
+        # Ties at the 10th score are all valid answers
+        kth = np.partition(-scores, 9)[9]
+        valid = {f"u{i}" for i in np.flatnonzero(-scores <= kth + 1e-6)}
+        recall += sum(h["user_id"] in valid for h, _ in hits) / 10
+
+    latencies.sort()
+    return {
+        "users": n_users,
+        "upserts_per_s": round(n_users / load_s),
+        "cold_open_ms": round(open_ms, 2),
+        "recall_at_10": round(recall / n_queries, 4),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the user vector store")
+    parser.add_argument("--users", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=5000, help="Records per upsert_many call")
+    args = parser.parse_args()
+
+    for n in args.users:
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run(n, args.queries, args.batch, Path(tmp))
+        print("  ".join(f"{k}={v}" for k, v in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,18 +18,20 @@ SINGLE-RUN UNIFIED PIPELINE that:
 
   Phase C: Full AI model training
            → Bayesian classifier, TF-IDF vectorizer
-           → Sentence-BERT embeddings, spaCy NER
+           → Sentence-BERT embeddings (incremental, keyed by content hash), spaCy NER
            → K-Means/DBSCAN clustering, cosine similarity matrix
            → Job title classifier, salary predictor
            → All models saved to services/ai_engine/trained_models/
 
 Usage:
     python scripts/deep_ingest_and_train.py
+    python scripts/deep_ingest_and_train.py --workers 4 --batch-size 32
 
 Author: CareerTrojan System
 Date: February 2026
 """
 
+import argparse
 import json
 import os
 import re
@@ -42,8 +44,8 @@ import hashlib
 import traceback
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Set, Tuple
-from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
 
 # ── Ensure UTF-8 ──
@@ -59,6 +61,12 @@ AUTOMATED_PARSER_DIR = DATA_ROOT / "automated_parser"
 GAZETTEERS_DIR = AI_DATA_DIR / "gazetteers"
 MODELS_DIR = PROJECT_ROOT / "services" / "ai_engine" / "trained_models"
 LOG_DIR = PROJECT_ROOT / "logs"
+EMBEDDING_STORE_ROOT = AI_DATA_DIR / "embedding_store"  # one training-corpus store per model
+SENTENCE_MODEL_NAME = "all-MiniLM-L6-v2"
+EMBEDDING_SAMPLE = 5000  # rows used for clustering (the similarity matrix takes 2,000 of them)
+
+# Project root on sys.path for services.* / scripts.* imports
+sys.path.insert(0, str(PROJECT_ROOT))
 
 # Ensure output dirs
 for d in [AI_DATA_DIR / "parsed_from_automated", AI_DATA_DIR / "parsed_resumes",
@@ -99,7 +107,7 @@ def get_sentence_model():
     if _sentence_model is None:
         try:
             from sentence_transformers import SentenceTransformer
-            _sentence_model = SentenceTransformer("all-MiniLM-L6-v2")
+            _sentence_model = SentenceTransformer(SENTENCE_MODEL_NAME)
         except Exception as e:
             logger.warning("Sentence-BERT not available: %s", e)
     return _sentence_model
@@ -342,8 +350,29 @@ def extract_job_titles_from_text(text: str) -> List[str]:
     return list(titles)[:50]
 
 
-def extract_skills_from_text(text: str) -> List[str]:
-    """Extract skills from text using keyword context and NER."""
+# One spaCy parse per document covers both NER consumers: skills look at
+# entities in the first NER_SKILL_CHARS, companies at the first NER_COMPANY_CHARS.
+NER_SKILL_CHARS = 5000
+NER_COMPANY_CHARS = 8000
+NLP_BATCH_SIZE = 32
+
+
+def _entities(text: str, doc, limit: int) -> list:
+    """Entities ending within text[:limit]; parses the prefix if no doc is given."""
+    if doc is None:
+        try:
+            doc = get_spacy_nlp()(text[:limit])
+        except Exception:
+            return []
+    return [ent for ent in doc.ents if ent.end_char <= limit]
+
+
+def extract_skills_from_text(text: str, doc=None) -> List[str]:
+    """Extract skills from text using keyword context and NER.
+
+    ``doc`` is an existing spaCy parse of the document (see iter_parsed_documents);
+    without one the text is parsed here.
+    """
     skills = set()
     text_lower = text.lower()
 
@@ -361,29 +390,19 @@ def extract_skills_from_text(text: str) -> List[str]:
             idx = text_lower.find(indicator, idx + 1)
 
     # spaCy NER for additional extraction
-    try:
-        nlp = get_spacy_nlp()
-        doc = nlp(text[:5000])
-        for ent in doc.ents:
-            if ent.label_ in ("ORG", "PRODUCT", "WORK_OF_ART") and 2 < len(ent.text) < 50:
-                skills.add(ent.text)
-    except Exception:
-        pass
+    for ent in _entities(text, doc, NER_SKILL_CHARS):
+        if ent.label_ in ("ORG", "PRODUCT", "WORK_OF_ART") and 2 < len(ent.text) < 50:
+            skills.add(ent.text)
 
     return list(skills)[:100]
 
 
-def extract_company_names(text: str) -> List[str]:
-    """Extract company names using spaCy NER."""
+def extract_company_names(text: str, doc=None) -> List[str]:
+    """Extract company names using spaCy NER (reusing ``doc`` when given)."""
     companies = set()
-    try:
-        nlp = get_spacy_nlp()
-        doc = nlp(text[:8000])
-        for ent in doc.ents:
-            if ent.label_ == "ORG" and 2 < len(ent.text) < 80:
-                companies.add(ent.text)
-    except Exception:
-        pass
+    for ent in _entities(text, doc, NER_COMPANY_CHARS):
+        if ent.label_ == "ORG" and 2 < len(ent.text) < 80:
+            companies.add(ent.text)
     return list(companies)[:50]
 
 
@@ -437,63 +456,18 @@ class ParsedDocument:
         }
 
 
-def deep_parse_automated_parser() -> Dict[str, Any]:
-    """
-    Phase A: Deep-parse every supported file in automated_parser/.
-    Returns summary statistics and all parsed documents.
-    """
-    logger.info("=" * 80)
-    logger.info("PHASE A: DEEP DOCUMENT PARSING — automated_parser/")
-    logger.info("=" * 80)
+_NO_PARSE = type("_NoParse", (), {"ents": ()})()  # stands in for a doc when spaCy is unavailable
 
-    if not AUTOMATED_PARSER_DIR.exists():
-        logger.error("automated_parser directory not found: %s", AUTOMATED_PARSER_DIR)
-        return {"error": "directory_not_found"}
-
-    # Load existing parse progress to skip already-parsed files
-    progress_file = AI_DATA_DIR / "deep_parse_progress.json"
-    processed_hashes: Set[str] = set()
-    if progress_file.exists():
-        try:
-            with open(progress_file, "r") as f:
-                processed_hashes = set(json.load(f).get("processed_hashes", []))
-            logger.info("Loaded %d previously processed file hashes", len(processed_hashes))
-        except Exception:
-            pass
-
-    # Collect all supported files
-    all_files = []
-    ignored_dirs = {"__pycache__", ".git", ".venv", "node_modules", "incoming", "completed"}
-    for fpath in AUTOMATED_PARSER_DIR.rglob("*"):
-        if not fpath.is_file():
-            continue
-        if any(ig in fpath.parts for ig in ignored_dirs):
-            continue
-        if fpath.suffix.lower() in SUPPORTED_EXTENSIONS:
-            all_files.append(fpath)
-
-    logger.info("Found %d supported files in automated_parser/", len(all_files))
-
-    # Stats
-    stats = {
-        "total_files": len(all_files),
-        "parsed": 0,
-        "skipped_existing": 0,
-        "failed": 0,
-        "by_type": Counter(),
-        "by_extension": Counter(),
-    }
-
-    all_parsed: List[ParsedDocument] = []
-    all_raw_texts: List[str] = []
-    all_job_titles: List[str] = []
-    all_skills: List[str] = []
-    all_companies: List[str] = []
-    new_hashes: List[str] = []
 
+def _load_documents(files: List[Path], processed_hashes: Set[str], stats: Dict[str, Any],
+                    new_hashes: List[str]):
+    """
+    Hash, extract and classify each file; yields (ner_text, context) pairs for
+    spaCy's pipe(as_tuples=True).  Skipped and failed files are recorded in
+    ``stats`` / ``new_hashes`` and never reach the NLP stage.
+    """
     start_time = time.time()
-
-    for i, filepath in enumerate(all_files):
+    for i, filepath in enumerate(files):
         try:
             # Progress reporting
             if (i + 1) % 50 == 0 or i == 0:
@@ -501,7 +475,7 @@ def deep_parse_automated_parser() -> Dict[str, Any]:
                 rate = (i + 1) / elapsed if elapsed > 0 else 0
                 logger.info(
                     "  [%d/%d] %.1f files/sec — %s",
-                    i + 1, len(all_files), rate, filepath.name[:60],
+                    i + 1, len(files), rate, filepath.name[:60],
                 )
 
             # Check hash for deduplication
@@ -526,80 +500,319 @@ def deep_parse_automated_parser() -> Dict[str, Any]:
                 new_hashes.append(file_hash)  # Mark as attempted
                 continue
 
-            # Classify document
-            doc_type = classify_document(filepath, raw_text)
+            context = {
+                "filepath": filepath,
+                "file_hash": file_hash,
+                "ext": ext,
+                "raw_text": raw_text,
+                "doc_type": classify_document(filepath, raw_text),
+            }
+            yield raw_text[:NER_COMPANY_CHARS], context
+
+        except Exception as e:
+            logger.debug("Failed to parse %s: %s", filepath.name, e)
+            stats["failed"] += 1
+
+
+def _skip_failed_batch(proc_name, proc, docs, e):
+    """spaCy error handler: drop the failing batch and keep the long-lived pipe() running."""
+    logger.warning("spaCy %s failed on a batch (%s) — re-parsing its documents one by one",
+                   proc_name or "worker process", e)
+
 
-            # Extract structured data
-            job_titles = extract_job_titles_from_text(raw_text)
-            skills = extract_skills_from_text(raw_text)
-            companies = extract_company_names(raw_text)
-            contact = extract_contact_info(raw_text)
+def _raise_error(proc_name, proc, docs, e):
+    """spaCy's default error handler."""
+    raise e
 
-            # Build parsed record
-            parsed = ParsedDocument(
-                source_file=str(filepath.relative_to(DATA_ROOT)),
-                file_hash=file_hash,
-                doc_type=doc_type,
+
+def _parse_one(nlp, text: str, ctx: Dict[str, Any]):
+    try:
+        return nlp(text), ctx
+    except Exception as e:
+        logger.debug("spaCy failed on %s: %s", ctx["filepath"].name, e)
+        return None, ctx
+
+
+def _parse_stream(nlp, loaded, batch_size: int, workers: int):
+    """
+    Parse (text, context) pairs with one nlp.pipe() over the whole stream,
+    so the ``workers`` processes start once.  Only (text, sequence number)
+    pairs cross to the workers; contexts stay in this process.
+
+    A batch a spaCy component fails on is dropped by the error handler and
+    its documents are re-parsed one by one, so a bad document fails alone
+    (``None`` in place of its doc).  If pipe() itself dies (e.g. the
+    tokenizer raises), the documents it had taken are re-parsed the same
+    way and a fresh pipe() picks up the rest of the stream.
+    """
+    has_handler = hasattr(nlp, "set_error_handler")
+    pending = deque()  # (seq, text, ctx) taken by pipe() and not yet returned
+    taken = 0
+
+    def feed():
+        nonlocal taken
+        for text, ctx in loaded:
+            seq, taken = taken, taken + 1
+            pending.append((seq, text, ctx))
+            yield text, seq
+
+    def retry(before: Optional[int] = None) -> list:
+        # Pending documents pipe() dropped — all of them, or those ahead of ``before``
+        if has_handler:
+            nlp.set_error_handler(_raise_error)
+        try:
+            out = []
+            while pending and (before is None or pending[0][0] < before):
+                _, text, ctx = pending.popleft()
+                out.append(_parse_one(nlp, text, ctx))
+            return out
+        finally:
+            if has_handler:
+                nlp.set_error_handler(_skip_failed_batch)
+
+    if has_handler:
+        nlp.set_error_handler(_skip_failed_batch)
+    try:
+        while True:
+            taken_before = taken
+            try:
+                for doc, seq in nlp.pipe(feed(), as_tuples=True, batch_size=batch_size,
+                                         n_process=max(1, workers)):
+                    yield from retry(before=seq)
+                    _, _, ctx = pending.popleft()
+                    yield doc, ctx
+                yield from retry()
+                return
+            except Exception as e:
+                logger.warning("spaCy pipe() failed (%s) — re-parsing %d taken documents one by one",
+                               e, len(pending))
+                yield from retry()
+                if taken == taken_before:
+                    # pipe() fails before taking anything: no point restarting it
+                    for text, ctx in loaded:
+                        yield _parse_one(nlp, text, ctx)
+                    return
+    finally:
+        if has_handler:
+            nlp.set_error_handler(_raise_error)
+
+
+def iter_parsed_documents(files: List[Path], processed_hashes: Set[str], stats: Dict[str, Any],
+                          new_hashes: List[str], workers: int = 1,
+                          batch_size: int = NLP_BATCH_SIZE):
+    """
+    Parse files into ParsedDocuments with a single spaCy pass per document.
+
+    Texts stream through one ``nlp.pipe`` in batches of ``batch_size``
+    across ``workers`` processes; skills and companies both come from that
+    parse.  A document spaCy cannot parse is counted as failed on its own;
+    the rest of its batch is still parsed.
+    """
+    loaded = _load_documents(files, processed_hashes, stats, new_hashes)
+    try:
+        nlp = get_spacy_nlp()
+        parsed = _parse_stream(nlp, loaded, batch_size, workers)
+    except Exception as e:
+        logger.warning("spaCy unavailable (%s) — parsing without NER", e)
+        parsed = ((_NO_PARSE, ctx) for _, ctx in loaded)
+
+    for doc, ctx in parsed:
+        filepath, raw_text = ctx["filepath"], ctx["raw_text"]
+        if doc is None:
+            stats["failed"] += 1
+            continue
+        try:
+            yield ParsedDocument(
+                source_file=str(filepath.relative_to(DATA_ROOT)) if filepath.is_relative_to(DATA_ROOT) else str(filepath),
+                file_hash=ctx["file_hash"],
+                doc_type=ctx["doc_type"],
                 raw_text=raw_text,
                 text_length=len(raw_text),
-                job_titles=job_titles,
-                skills=skills,
-                companies=companies,
-                contact_info=contact,
+                job_titles=extract_job_titles_from_text(raw_text),
+                skills=extract_skills_from_text(raw_text, doc),
+                companies=extract_company_names(raw_text, doc),
+                contact_info=extract_contact_info(raw_text),
                 parsed_at=datetime.now().isoformat(),
-                file_extension=ext,
+                file_extension=ctx["ext"],
                 file_size_kb=round(filepath.stat().st_size / 1024, 2),
             )
-
-            all_parsed.append(parsed)
-            all_raw_texts.append(raw_text)
-            all_job_titles.extend(job_titles)
-            all_skills.extend(skills)
-            all_companies.extend(companies)
-            new_hashes.append(file_hash)
-
-            stats["parsed"] += 1
-            stats["by_type"][doc_type] += 1
-            stats["by_extension"][ext] += 1
-
         except Exception as e:
             logger.debug("Failed to parse %s: %s", filepath.name, e)
             stats["failed"] += 1
-            continue
 
-    elapsed = time.time() - start_time
 
-    # ── Save parsed documents ──
-    logger.info("Saving parsed documents to ai_data_final/...")
+PARSE_SPOOL = AI_DATA_DIR / "deep_parse_spool.jsonl"
+CHECKPOINT_EVERY = 100  # documents between progress checkpoints
 
-    # Save per-document JSON files
-    output_dir = AI_DATA_DIR / "parsed_from_automated"
-    cv_output_dir = AI_DATA_DIR / "parsed_resumes"
-    jd_output_dir = AI_DATA_DIR / "parsed_job_descriptions"
 
-    cv_count = 0
-    jd_count = 0
-    for parsed_doc in all_parsed:
-        try:
-            safe_name = re.sub(r'[<>:"/\\|?*]', '_', Path(parsed_doc.source_file).stem)[:80]
-            doc_dict = parsed_doc.to_dict()
-
-            # Save to appropriate directory based on type
-            if parsed_doc.doc_type == "cv":
-                out_path = cv_output_dir / f"{safe_name}.json"
-                cv_count += 1
-            elif parsed_doc.doc_type == "job_description":
-                out_path = jd_output_dir / f"{safe_name}.json"
-                jd_count += 1
-            else:
-                out_path = output_dir / f"{safe_name}.json"
-
-            with open(out_path, "w", encoding="utf-8") as f:
-                json.dump(doc_dict, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.debug("Failed to save %s: %s", parsed_doc.source_file, e)
+class ParseSpool:
+    """
+    Append-only JSONL of the documents parsed by Phase A, full text included.
+
+    Records are written as they are parsed and fsync'd at every progress
+    checkpoint, so a crash loses at most CHECKPOINT_EVERY documents: their
+    hashes are not checkpointed yet, so the next run parses them again.
+    Such a document can then be in the spool twice; ``records()`` yields
+    each file hash once.
+    The consolidated outputs are folded from the spool when Phase A ends,
+    so records left by a crashed run are folded in on the next run.
+    Phase B mines ``texts()`` straight from disk.  main() removes the spool
+    once Phase B has finished with it.
+    """
 
-    # ── Update consolidated_terms.json ──
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or PARSE_SPOOL)
+        self._fh = None
+
+    def __enter__(self) -> "ParseSpool":
+        self._fh = open(self.path, "a", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
+        self._fh.close()
+        self._fh = None
+
+    def append(self, parsed: "ParsedDocument") -> None:
+        record = parsed.to_dict()
+        record["raw_text"] = parsed.raw_text
+        self._fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+
+    def records(self):
+        """Spooled documents, first copy of each file hash only."""
+        if not self.path.exists():
+            return
+        seen: Set[str] = set()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from a crashed run
+                file_hash = record.get("file_hash")
+                if file_hash in seen:
+                    continue  # re-parsed after a crash
+                seen.add(file_hash)
+                yield record
+
+    def texts(self) -> "_SpoolTexts":
+        """Re-iterable view of the spooled raw texts (for Phase B)."""
+        return _SpoolTexts(self)
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+class _SpoolTexts:
+    def __init__(self, spool: ParseSpool):
+        self._spool = spool
+
+    def __iter__(self):
+        return (r.get("raw_text", "") for r in self._spool.records())
+
+
+def _iter_json_array(path: Path, chunk_size: int = 1 << 16):
+    """Yield the elements of a top-level JSON array, reading ``chunk_size`` characters at a time."""
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf, eof = "", False
+
+        def fill() -> bool:
+            nonlocal buf, eof
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf += chunk
+            return not eof
+
+        while not buf.strip() and fill():
+            pass
+        buf = buf.lstrip()
+        if not buf.startswith("["):
+            raise ValueError(f"{path.name} is not a JSON array")
+        buf = buf[1:]
+        while True:
+            buf = buf.lstrip()
+            if buf.startswith(","):
+                buf = buf[1:].lstrip()
+            if buf.startswith("]"):
+                return
+            try:
+                item, end = decoder.raw_decode(buf)
+                # An element ending the buffer may be cut short (a number, say)
+                complete = eof or buf[end:].strip() != ""
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                fill()
+                continue
+            yield item
+            buf = buf[end:]
+
+
+def _write_json_atomic(path: Path, data: Any, **kwargs) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, **kwargs)
+    os.replace(tmp, path)
+
+
+def _save_progress(progress_file: Path, processed: Set[str]) -> None:
+    _write_json_atomic(progress_file, {
+        "processed_hashes": sorted(processed),
+        "last_run": datetime.now().isoformat(),
+        "total_processed": len(processed),
+    }, indent=2)
+
+
+def _save_parsed_document(parsed: "ParsedDocument") -> str:
+    """Write one parsed document to its per-type directory; returns its doc_type."""
+    safe_name = re.sub(r'[<>:"/\\|?*]', '_', Path(parsed.source_file).stem)[:80]
+    # Save to appropriate directory based on type
+    if parsed.doc_type == "cv":
+        out_dir = AI_DATA_DIR / "parsed_resumes"
+    elif parsed.doc_type == "job_description":
+        out_dir = AI_DATA_DIR / "parsed_job_descriptions"
+    else:
+        out_dir = AI_DATA_DIR / "parsed_from_automated"
+    with open(out_dir / f"{safe_name}.json", "w", encoding="utf-8") as f:
+        json.dump(parsed.to_dict(), f, indent=2, ensure_ascii=False)
+    return parsed.doc_type
+
+
+def _candidate_record(doc: Dict[str, Any]) -> Dict[str, Any]:
+    titles = doc.get("job_titles") or []
+    return {
+        "name": Path(doc["source_file"]).stem.replace("_", " "),
+        "file_hash": doc["file_hash"],
+        "source_file": doc["source_file"],
+        "skills": doc.get("skills", []),
+        "Job Title": titles[0] if titles else "",
+        "current_position": titles[0] if titles else "",
+        "companies": doc.get("companies", []),
+        "contact": doc.get("contact_info", {}),
+        "raw_text": doc.get("raw_text", "")[:5000],
+        "text_length": doc.get("text_length", 0),
+        "parsed_at": doc.get("parsed_at"),
+    }
+
+
+def _fold_spool_into_outputs(spool: ParseSpool) -> Dict[str, Any]:
+    """
+    Stream the spool once, folding every record into the consolidated outputs:
+    consolidated_terms.json, Candidate_database_merged.json and
+    enhanced_job_titles_database.json.  Only the distinct terms, titles and
+    skill mappings are held in memory; existing candidate records are
+    streamed through to the rewritten file and new ones go straight to
+    disk, so only their file hashes are kept.  Replaying a spool twice is
+    harmless: every output dedupes.
+    """
     consolidated_path = AI_DATA_DIR / "consolidated_terms.json"
     existing_terms = []
     if consolidated_path.exists():
@@ -609,64 +822,9 @@ def deep_parse_automated_parser() -> Dict[str, Any]:
         except Exception:
             pass
 
-    # Add new terms (skills, job titles, companies)
-    new_terms = set()
-    for skill in all_skills:
-        if len(skill) > 3:
-            new_terms.add(skill.strip())
-    for title in all_job_titles:
-        if len(title) > 3:
-            new_terms.add(title.strip())
-    for company in all_companies:
-        if len(company) > 3:
-            new_terms.add(company.strip())
-
-    existing_set = set(existing_terms)
-    truly_new = new_terms - existing_set
-    updated_terms = existing_terms + sorted(truly_new)
-
-    with open(consolidated_path, "w", encoding="utf-8") as f:
-        json.dump(updated_terms, f, indent=2, ensure_ascii=False)
-    logger.info("consolidated_terms.json updated: %d existing + %d new = %d total",
-                len(existing_terms), len(truly_new), len(updated_terms))
-
-    # ── Update core_databases/Candidate_database_merged.json ──
     merged_db_path = AI_DATA_DIR / "core_databases" / "Candidate_database_merged.json"
-    existing_candidates = []
-    if merged_db_path.exists():
-        try:
-            with open(merged_db_path, "r", encoding="utf-8") as f:
-                existing_candidates = json.load(f)
-        except Exception:
-            pass
+    seen_hashes: Set[str] = set()
 
-    existing_hashes = {c.get("file_hash") for c in existing_candidates if isinstance(c, dict)}
-    new_candidates = []
-    for parsed_doc in all_parsed:
-        if parsed_doc.doc_type == "cv" and parsed_doc.file_hash not in existing_hashes:
-            # Build a candidate record
-            candidate = {
-                "name": Path(parsed_doc.source_file).stem.replace("_", " "),
-                "file_hash": parsed_doc.file_hash,
-                "source_file": parsed_doc.source_file,
-                "skills": parsed_doc.skills,
-                "Job Title": parsed_doc.job_titles[0] if parsed_doc.job_titles else "",
-                "current_position": parsed_doc.job_titles[0] if parsed_doc.job_titles else "",
-                "companies": parsed_doc.companies,
-                "contact": parsed_doc.contact_info,
-                "raw_text": parsed_doc.raw_text[:5000],
-                "text_length": parsed_doc.text_length,
-                "parsed_at": parsed_doc.parsed_at,
-            }
-            new_candidates.append(candidate)
-
-    all_candidates = existing_candidates + new_candidates
-    with open(merged_db_path, "w", encoding="utf-8") as f:
-        json.dump(all_candidates, f, indent=2, ensure_ascii=False)
-    logger.info("Candidate_database_merged.json: %d existing + %d new = %d total",
-                len(existing_candidates), len(new_candidates), len(all_candidates))
-
-    # ── Update enhanced_job_titles_database.json ──
     job_titles_db_path = AI_DATA_DIR / "enhanced_job_titles_database.json"
     existing_jt_db = {}
     if job_titles_db_path.exists():
@@ -675,9 +833,71 @@ def deep_parse_automated_parser() -> Dict[str, Any]:
                 existing_jt_db = json.load(f)
         except Exception:
             pass
+    skill_mappings = existing_jt_db.get("skill_mappings", {})
 
-    # Build unique job titles with frequency
-    jt_counter = Counter(t.strip().title() for t in all_job_titles if len(t.strip()) > 3)
+    new_terms: Set[str] = set()
+    job_titles: Set[str] = set()
+    skills: Set[str] = set()
+    jt_counter: Counter = Counter()
+    new_candidates = 0
+
+    # Candidates are streamed into a temp file: existing entries first, then new CVs
+    cand_tmp = merged_db_path.with_name(merged_db_path.name + ".tmp")
+    with open(cand_tmp, "w", encoding="utf-8") as cand_f:
+        cand_f.write("[")
+        first = True
+        existing_count = 0
+        if merged_db_path.exists():
+            try:
+                for candidate in _iter_json_array(merged_db_path):
+                    if isinstance(candidate, dict):
+                        seen_hashes.add(candidate.get("file_hash"))
+                    cand_f.write(("" if first else ",") + "\n" + json.dumps(candidate, indent=2, ensure_ascii=False))
+                    first = False
+                    existing_count += 1
+            except Exception as e:
+                logger.warning("Candidate_database_merged.json unreadable after %d records: %s",
+                               existing_count, e)
+
+        for doc in spool.records():
+            # Add new terms (skills, job titles, companies)
+            for term in doc.get("skills", []) + doc.get("job_titles", []) + doc.get("companies", []):
+                if len(term) > 3:
+                    new_terms.add(term.strip())
+            job_titles.update(doc.get("job_titles", []))
+            skills.update(doc.get("skills", []))
+            jt_counter.update(t.strip().title() for t in doc.get("job_titles", []) if len(t.strip()) > 3)
+
+            # Skill mappings from extracted skills
+            for title in doc.get("job_titles", []):
+                title_key = title.strip().title()
+                if title_key not in skill_mappings:
+                    skill_mappings[title_key] = list(set(doc.get("skills", [])[:20]))
+                else:
+                    existing = set(skill_mappings[title_key])
+                    for s in doc.get("skills", [])[:20]:
+                        existing.add(s)
+                    skill_mappings[title_key] = list(existing)[:30]
+
+            if doc.get("doc_type") == "cv" and doc.get("file_hash") not in seen_hashes:
+                seen_hashes.add(doc["file_hash"])
+                cand_f.write(("" if first else ",") + "\n"
+                             + json.dumps(_candidate_record(doc), indent=2, ensure_ascii=False))
+                first = False
+                new_candidates += 1
+        cand_f.write("\n]")
+    os.replace(cand_tmp, merged_db_path)
+    logger.info("Candidate_database_merged.json: %d existing + %d new = %d total",
+                existing_count, new_candidates, existing_count + new_candidates)
+
+    # ── Update consolidated_terms.json ──
+    truly_new = new_terms - set(existing_terms)
+    updated_terms = existing_terms + sorted(truly_new)
+    _write_json_atomic(consolidated_path, updated_terms, indent=2, ensure_ascii=False)
+    logger.info("consolidated_terms.json updated: %d existing + %d new = %d total",
+                len(existing_terms), len(truly_new), len(updated_terms))
+
+    # ── Update enhanced_job_titles_database.json ──
     existing_titles = set(existing_jt_db.get("normalized_job_titles", []))
     new_titles = set(jt_counter.keys()) - existing_titles
 
@@ -686,59 +906,143 @@ def deep_parse_automated_parser() -> Dict[str, Any]:
     existing_jt_db["normalized_job_titles"] = sorted(
         set(existing_jt_db["normalized_job_titles"]) | new_titles
     )
-
-    # Skill mappings from extracted skills
-    skill_mappings = existing_jt_db.get("skill_mappings", {})
-    for parsed_doc in all_parsed:
-        for title in parsed_doc.job_titles:
-            title_key = title.strip().title()
-            if title_key not in skill_mappings:
-                skill_mappings[title_key] = list(set(parsed_doc.skills[:20]))
-            else:
-                existing = set(skill_mappings[title_key])
-                for s in parsed_doc.skills[:20]:
-                    existing.add(s)
-                skill_mappings[title_key] = list(existing)[:30]
     existing_jt_db["skill_mappings"] = skill_mappings
-
-    with open(job_titles_db_path, "w", encoding="utf-8") as f:
-        json.dump(existing_jt_db, f, indent=2, ensure_ascii=False)
+    _write_json_atomic(job_titles_db_path, existing_jt_db, indent=2, ensure_ascii=False)
     logger.info("enhanced_job_titles_database.json: %d titles, %d skill mappings",
                 len(existing_jt_db["normalized_job_titles"]), len(skill_mappings))
 
+    return {
+        "new_candidates": new_candidates,
+        "new_terms": len(truly_new),
+        "new_job_titles": len(new_titles),
+        "job_titles": sorted(job_titles),
+        "skills": sorted(skills),
+    }
+
+
+def deep_parse_automated_parser(workers: int = 1, batch_size: int = NLP_BATCH_SIZE) -> Dict[str, Any]:
+    """
+    Phase A: Deep-parse every supported file in automated_parser/.
+    Returns summary statistics, the distinct job titles and skills, and the
+    spooled texts for Phase B.
+    ``workers`` spaCy processes parse the documents in batches of ``batch_size``.
+
+    Documents are written out and spooled as they are parsed, so memory
+    does not grow with the corpus, and progress is checkpointed every
+    CHECKPOINT_EVERY documents.
+    """
+    logger.info("=" * 80)
+    logger.info("PHASE A: DEEP DOCUMENT PARSING — automated_parser/")
+    logger.info("=" * 80)
+
+    if not AUTOMATED_PARSER_DIR.exists():
+        logger.error("automated_parser directory not found: %s", AUTOMATED_PARSER_DIR)
+        return {"error": "directory_not_found"}
+
+    # Load existing parse progress to skip already-parsed files
+    progress_file = AI_DATA_DIR / "deep_parse_progress.json"
+    processed_hashes: Set[str] = set()
+    if progress_file.exists():
+        try:
+            with open(progress_file, "r") as f:
+                processed_hashes = set(json.load(f).get("processed_hashes", []))
+            logger.info("Loaded %d previously processed file hashes", len(processed_hashes))
+        except Exception:
+            pass
+
+    # Collect all supported files
+    all_files = []
+    ignored_dirs = {"__pycache__", ".git", ".venv", "node_modules", "incoming", "completed"}
+    for fpath in AUTOMATED_PARSER_DIR.rglob("*"):
+        if not fpath.is_file():
+            continue
+        if any(ig in fpath.parts for ig in ignored_dirs):
+            continue
+        if fpath.suffix.lower() in SUPPORTED_EXTENSIONS:
+            all_files.append(fpath)
+
+    logger.info("Found %d supported files in automated_parser/", len(all_files))
+
+    # Stats
+    stats = {
+        "total_files": len(all_files),
+        "parsed": 0,
+        "skipped_existing": 0,
+        "failed": 0,
+        "by_type": Counter(),
+        "by_extension": Counter(),
+    }
+
+    spool = ParseSpool()
+    if spool.path.exists():
+        logger.info("Found spool from an interrupted run — its documents will be folded in")
+    new_hashes: List[str] = []
+    total_chars = 0
+    cv_count = 0
+    jd_count = 0
+
+    start_time = time.time()
+
+    with spool:
+        for parsed in iter_parsed_documents(all_files, processed_hashes, stats, new_hashes,
+                                            workers=workers, batch_size=batch_size):
+            try:
+                doc_type = _save_parsed_document(parsed)
+                cv_count += doc_type == "cv"
+                jd_count += doc_type == "job_description"
+            except Exception as e:
+                logger.debug("Failed to save %s: %s", parsed.source_file, e)
+            spool.append(parsed)
+            new_hashes.append(parsed.file_hash)
+            total_chars += parsed.text_length
+
+            stats["parsed"] += 1
+            stats["by_type"][parsed.doc_type] += 1
+            stats["by_extension"][parsed.file_extension] += 1
+
+            # ── Checkpoint: spool durable first, then the hashes it covers ──
+            if stats["parsed"] % CHECKPOINT_EVERY == 0:
+                spool.flush()
+                processed_hashes.update(new_hashes)
+                new_hashes.clear()
+                _save_progress(progress_file, processed_hashes)
+
+    elapsed = time.time() - start_time
+
+    # ── Fold the spool into the consolidated outputs ──
+    logger.info("Folding parsed documents into ai_data_final/ databases...")
+    folded = _fold_spool_into_outputs(spool)
+
     # ── Save progress (hashes) ──
-    all_processed = processed_hashes | set(new_hashes)
-    with open(progress_file, "w", encoding="utf-8") as f:
-        json.dump({
-            "processed_hashes": sorted(all_processed),
-            "last_run": datetime.now().isoformat(),
-            "total_processed": len(all_processed),
-        }, f, indent=2)
+    processed_hashes.update(new_hashes)
+    _save_progress(progress_file, processed_hashes)
 
     stats["elapsed_seconds"] = round(elapsed, 2)
+    stats["files_per_second"] = round(stats["parsed"] / elapsed, 2) if elapsed > 0 else 0.0
+    stats["workers"] = workers
     stats["cvs_saved"] = cv_count
     stats["jds_saved"] = jd_count
-    stats["new_candidates"] = len(new_candidates)
-    stats["new_terms"] = len(truly_new)
-    stats["new_job_titles"] = len(new_titles)
-    stats["total_raw_text_chars"] = sum(len(t) for t in all_raw_texts)
+    stats["new_candidates"] = folded["new_candidates"]
+    stats["new_terms"] = folded["new_terms"]
+    stats["new_job_titles"] = folded["new_job_titles"]
+    stats["total_raw_text_chars"] = total_chars
 
     logger.info("=" * 80)
-    logger.info("PHASE A COMPLETE — %d parsed, %d skipped, %d failed in %.1fs",
-                stats["parsed"], stats["skipped_existing"], stats["failed"], elapsed)
+    logger.info("PHASE A COMPLETE — %d parsed, %d skipped, %d failed in %.1fs (%.1f files/sec, %d workers)",
+                stats["parsed"], stats["skipped_existing"], stats["failed"], elapsed,
+                stats["files_per_second"], workers)
     logger.info("  CVs: %d | JDs: %d | New candidates: %d | New terms: %d",
-                cv_count, jd_count, len(new_candidates), len(truly_new))
+                cv_count, jd_count, folded["new_candidates"], folded["new_terms"])
     logger.info("  By type: %s", dict(stats["by_type"]))
     logger.info("  By ext:  %s", dict(stats["by_extension"]))
     logger.info("=" * 80)
 
     return {
         "stats": stats,
-        "all_raw_texts": all_raw_texts,
-        "all_job_titles": all_job_titles,
-        "all_skills": all_skills,
-        "all_companies": all_companies,
-        "all_parsed": all_parsed,
+        "all_raw_texts": spool.texts(),
+        "all_job_titles": folded["job_titles"],
+        "all_skills": folded["skills"],
+        "spool": spool,
     }
 
 
@@ -861,11 +1165,129 @@ def categorize_term(term: str) -> Optional[str]:
     return None
 
 
-def run_collocation_mining(all_texts: List[str], all_job_titles: List[str],
-                           all_skills: List[str]) -> Dict[str, Any]:
+COUNTER_CAP = 2_000_000  # max distinct keys per collocation counter before pruning
+
+
+def _prune(counter: Counter, cap: int, *linked: Counter) -> None:
+    """
+    Keep ``counter`` under ``cap`` keys by dropping its rarest entries
+    (lossy counting): raise the floor until at most half the cap remain.
+    ``linked`` counters keyed the same way lose the same keys.
+    """
+    if len(counter) <= cap:
+        return
+    floor = 2
+    while len(counter) > cap // 2:
+        for key in [k for k, c in counter.items() if c < floor]:
+            del counter[key]
+            for other in linked:
+                other.pop(key, None)
+        floor += 1
+
+
+class CollocationCounts:
+    """
+    Streaming statistics behind every Phase B scorer, folded one text at a
+    time so the whole corpus can be mined without holding it in memory.
+    Counters are capped at COUNTER_CAP keys; only n-grams too rare to pass
+    the scorers' frequency filters are lost to pruning.
+    """
+
+    WINDOW = 5
+
+    def __init__(self, cap: int = COUNTER_CAP):
+        self.cap = cap
+        self.texts = 0
+        self.chars = 0
+        # 1. N-grams (CountVectorizer analyzer): term and document frequency
+        self.ngram_tf: Counter = Counter()
+        self.ngram_df: Counter = Counter()
+        # 2. PMI
+        self.unigrams: Counter = Counter()
+        self.bigrams: Counter = Counter()
+        # 3. NLTK finder frequency distributions
+        self.bi_word_fd: Counter = Counter()
+        self.bi_fd: Counter = Counter()
+        self.tri_word_fd: Counter = Counter()
+        self.tri_bi_fd: Counter = Counter()
+        self.tri_wild_fd: Counter = Counter()
+        self.tri_fd: Counter = Counter()
+        # 4. Windowed co-occurrence
+        self.cooc_words: Counter = Counter()
+        self.pairs: Counter = Counter()
+
+        from sklearn.feature_extraction.text import CountVectorizer
+        self._analyzer = CountVectorizer(
+            ngram_range=(2, 4),
+            stop_words="english",
+            token_pattern=r"(?u)\b[a-zA-Z][a-zA-Z-]+\b",
+        ).build_analyzer()
+        try:
+            import nltk
+            from nltk.collocations import BigramCollocationFinder, TrigramCollocationFinder
+            self._finders = (BigramCollocationFinder, TrigramCollocationFinder)
+            # Ensure punkt is available
+            try:
+                nltk.data.find("tokenizers/punkt_tab")
+            except LookupError:
+                nltk.download("punkt_tab", quiet=True)
+        except ImportError:
+            self._finders = None
+
+    def add(self, text: str) -> None:
+        self.texts += 1
+        self.chars += len(text)
+
+        grams = self._analyzer(text)
+        self.ngram_tf.update(grams)
+        self.ngram_df.update(set(grams))
+
+        words = re.findall(r"\b[a-zA-Z][a-zA-Z-]+\b", text.lower())
+        self.unigrams.update(words)
+        self.bigrams.update(zip(words, words[1:]))
+
+        self.cooc_words.update(words)
+        for i, w1 in enumerate(words):
+            for w2 in words[i + 1:i + self.WINDOW + 1]:
+                if w1 != w2:
+                    self.pairs[(w1, w2) if w1 < w2 else (w2, w1)] += 1
+
+        if self._finders:
+            try:
+                from nltk.tokenize import word_tokenize
+                tokens = word_tokenize(text.lower())
+            except Exception:
+                tokens = text.lower().split()
+            bigram_finder_cls, trigram_finder_cls = self._finders
+            bi = bigram_finder_cls.from_words(tokens)
+            self.bi_word_fd.update(bi.word_fd)
+            self.bi_fd.update(bi.ngram_fd)
+            tri = trigram_finder_cls.from_words(tokens)
+            self.tri_word_fd.update(tri.word_fd)
+            self.tri_bi_fd.update(tri.bigram_fd)
+            self.tri_wild_fd.update(tri.wildcard_fd)
+            self.tri_fd.update(tri.ngram_fd)
+
+        if self.texts % 100 == 0:
+            self.prune()
+
+    def prune(self) -> None:
+        _prune(self.ngram_tf, self.cap, self.ngram_df)
+        _prune(self.bigrams, self.cap)
+        _prune(self.pairs, self.cap)
+        _prune(self.bi_fd, self.cap)
+        _prune(self.tri_fd, self.cap)
+        _prune(self.tri_wild_fd, self.cap)
+        _prune(self.tri_bi_fd, self.cap)
+
+
+def run_collocation_mining(all_texts: Iterable[str], all_job_titles: Iterable[str],
+                           all_skills: Iterable[str]) -> Dict[str, Any]:
     """
     Phase B: Mine collocations from all extracted text.
     Combines: N-grams, PMI, NLTK collocations, co-occurrence analysis.
+    ``all_texts`` is streamed once (e.g. Phase A's spool), so the whole
+    corpus is mined without being loaded.
     """
     logger.info("=" * 80)
     logger.info("PHASE B: COLLOCATION MINING & GAZETTEER BUILDING")
@@ -873,38 +1295,34 @@ def run_collocation_mining(all_texts: List[str], all_job_titles: List[str],
 
     start_time = time.time()
 
-    if not all_texts:
+    # ── Single pass: fold every text into the scorers' statistics ──
+    counts = CollocationCounts()
+    for text in all_texts:
+        counts.add(text)
+
+    if not counts.texts:
         logger.warning("No texts available for mining — loading from consolidated_terms.json")
         consolidated_path = AI_DATA_DIR / "consolidated_terms.json"
         if consolidated_path.exists():
             with open(consolidated_path, "r", encoding="utf-8") as f:
                 terms = json.load(f)
-            all_texts = [" ".join(terms[i:i+50]) for i in range(0, len(terms), 50)]
+            for i in range(0, len(terms), 50):
+                counts.add(" ".join(terms[i:i+50]))
         else:
             logger.error("No text sources available for mining")
             return {"error": "no_text"}
+    counts.prune()
 
-    logger.info("Mining from %d text blocks (%d total chars)",
-                len(all_texts), sum(len(t) for t in all_texts))
+    logger.info("Mining from %d text blocks (%d total chars)", counts.texts, counts.chars)
 
     # ── 1. N-gram extraction ──
     logger.info("Step 1: N-gram extraction...")
-    from sklearn.feature_extraction.text import CountVectorizer
-
     ngram_results = {}
     try:
-        vectorizer = CountVectorizer(
-            ngram_range=(2, 4),
-            min_df=2,
-            stop_words="english",
-            max_features=10000,
-            token_pattern=r"(?u)\b[a-zA-Z][a-zA-Z-]+\b",
-        )
-        X = vectorizer.fit_transform(all_texts)
-        feature_names = vectorizer.get_feature_names_out()
-        freqs = X.sum(axis=0).A1
-
-        for phrase, freq in sorted(zip(feature_names, freqs), key=lambda x: -x[1]):
+        # CountVectorizer(min_df=2, max_features=10000) semantics over the streamed counts
+        kept = [(g, tf) for g, tf in counts.ngram_tf.items() if counts.ngram_df[g] >= 2]
+        kept.sort(key=lambda x: -x[1])
+        for phrase, freq in kept[:10000]:
             if freq >= 2 and is_clean_term(phrase):
                 ngram_results[phrase.lower()] = int(freq)
         logger.info("  N-grams: %d clean terms extracted", len(ngram_results))
@@ -915,23 +1333,14 @@ def run_collocation_mining(all_texts: List[str], all_job_titles: List[str],
     logger.info("Step 2: PMI scoring...")
     pmi_results = {}
     try:
-        unigram_counts = Counter()
-        bigram_counts = Counter()
-        total_words = 0
-        for text in all_texts:
-            words = re.findall(r"\b[a-zA-Z][a-zA-Z-]+\b", text.lower())
-            total_words += len(words)
-            unigram_counts.update(words)
-            for i in range(len(words) - 1):
-                bigram_counts[(words[i], words[i + 1])] += 1
-
-        total_bigrams = sum(bigram_counts.values())
-        for (w1, w2), freq in bigram_counts.items():
+        total_words = sum(counts.unigrams.values())
+        total_bigrams = sum(counts.bigrams.values())
+        for (w1, w2), freq in counts.bigrams.items():
             if freq < 3:
                 continue
             p_xy = freq / total_bigrams
-            p_x = unigram_counts[w1] / total_words
-            p_y = unigram_counts[w2] / total_words
+            p_x = counts.unigrams[w1] / total_words
+            p_y = counts.unigrams[w2] / total_words
             if p_x > 0 and p_y > 0:
                 pmi = math.log2(p_xy / (p_x * p_y))
                 if pmi >= 3.0:
@@ -946,26 +1355,12 @@ def run_collocation_mining(all_texts: List[str], all_job_titles: List[str],
     logger.info("Step 3: NLTK collocations...")
     nltk_results = {}
     try:
-        import nltk
         from nltk.collocations import BigramCollocationFinder, TrigramCollocationFinder
         from nltk.metrics import BigramAssocMeasures, TrigramAssocMeasures
-
-        # Ensure punkt is available
-        try:
-            nltk.data.find("tokenizers/punkt_tab")
-        except LookupError:
-            nltk.download("punkt_tab", quiet=True)
-
-        all_words = []
-        for text in all_texts[:2000]:  # Cap for memory
-            try:
-                from nltk.tokenize import word_tokenize
-                all_words.extend(word_tokenize(text.lower()))
-            except Exception:
-                all_words.extend(text.lower().split())
+        from nltk.probability import FreqDist
 
         # Bigrams
-        bigram_finder = BigramCollocationFinder.from_words(all_words)
+        bigram_finder = BigramCollocationFinder(FreqDist(counts.bi_word_fd), FreqDist(counts.bi_fd))
         bigram_finder.apply_freq_filter(3)
         for (w1, w2), score in bigram_finder.score_ngrams(BigramAssocMeasures.pmi)[:500]:
             if w1.isalpha() and w2.isalpha():
@@ -974,7 +1369,10 @@ def run_collocation_mining(all_texts: List[str], all_job_titles: List[str],
                     nltk_results[phrase] = round(score, 3)
 
         # Trigrams
-        trigram_finder = TrigramCollocationFinder.from_words(all_words)
+        trigram_finder = TrigramCollocationFinder(
+            FreqDist(counts.tri_word_fd), FreqDist(counts.tri_bi_fd),
+            FreqDist(counts.tri_wild_fd), FreqDist(counts.tri_fd),
+        )
         trigram_finder.apply_freq_filter(3)
         for (w1, w2, w3), score in trigram_finder.score_ngrams(TrigramAssocMeasures.pmi)[:300]:
             if w1.isalpha() and w2.isalpha() and w3.isalpha():
@@ -990,26 +1388,14 @@ def run_collocation_mining(all_texts: List[str], all_job_titles: List[str],
     logger.info("Step 4: Co-occurrence analysis...")
     cooc_results = {}
     try:
-        window = 5
-        pair_counts = Counter()
-        word_counts = Counter()
-        for text in all_texts[:2000]:
-            words = [w.lower() for w in re.findall(r"\b[a-zA-Z][a-zA-Z-]+\b", text)]
-            word_counts.update(words)
-            for i, w1 in enumerate(words):
-                for j in range(i + 1, min(i + window + 1, len(words))):
-                    w2 = words[j]
-                    if w1 != w2:
-                        pair = tuple(sorted([w1, w2]))
-                        pair_counts[pair] += 1
-
-        total = sum(word_counts.values())
-        for (w1, w2), freq in pair_counts.most_common(1000):
+        total = sum(counts.cooc_words.values())
+        total_pairs = max(sum(counts.pairs.values()), 1)
+        for (w1, w2), freq in counts.pairs.most_common(1000):
             if freq < 3:
                 continue
-            p_xy = freq / max(sum(pair_counts.values()), 1)
-            p_x = word_counts[w1] / total if total > 0 else 0
-            p_y = word_counts[w2] / total if total > 0 else 0
+            p_xy = freq / total_pairs
+            p_x = counts.cooc_words[w1] / total if total > 0 else 0
+            p_y = counts.cooc_words[w2] / total if total > 0 else 0
             if p_x > 0 and p_y > 0:
                 pmi = math.log2(p_xy / (p_x * p_y))
                 if pmi >= 2.0:
@@ -1399,18 +1785,43 @@ def run_ai_model_training() -> Dict[str, Any]:
     try:
         model = get_sentence_model()
         if model:
-            # Embed a representative sample (limit for speed)
-            sample_texts = df["text"].head(min(5000, len(df))).tolist()
-            # Truncate long texts for embedding
-            sample_texts = [t[:512] for t in sample_texts]
-            embeddings = model.encode(sample_texts, show_progress_bar=True, batch_size=32)
-
-            np.save(MODELS_DIR / "candidate_embeddings.npy", embeddings)
+            from services.shared.embedding_store import EmbeddingStore
+            from scripts.embedding_pipeline import corpus_store_dir, embed_new_texts, prune_store
+
+            # Embeddings are keyed by content hash: only new or changed texts are encoded,
+            # so the whole corpus stays covered at the cost of the day's delta. The store
+            # is per model, and vectors stay as the model emits them (not unit-normalised),
+            # so clustering sees the same inputs as a full re-encode.
+            texts = [t[:512] for t in df["text"].tolist()]
+            store = EmbeddingStore(corpus_store_dir(EMBEDDING_STORE_ROOT, SENTENCE_MODEL_NAME),
+                                   dim=model.get_sentence_embedding_dimension(), normalize=False)
+            try:
+                ids, encoded = embed_new_texts(texts, store, model)
+
+                # Export aligned with the training rows, chunk by chunk
+                out_path = MODELS_DIR / "candidate_embeddings.npy"
+                tmp_path = out_path.with_name("candidate_embeddings.tmp.npy")
+                out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32,
+                                                shape=(len(ids), store.dim))
+                for start in range(0, len(ids), 4096):
+                    out[start:start + 4096] = np.stack([store.get(pid) for pid in ids[start:start + 4096]])
+                out.flush()
+                del out
+                os.replace(tmp_path, out_path)
+                # Texts edited or dropped from the corpus would otherwise stay forever
+                pruned = prune_store(store, ids)
+                store_count = len(store)
+            finally:
+                store.close()
+            embeddings = np.load(out_path, mmap_mode="r")
 
             model_info = {
-                "model_name": "all-MiniLM-L6-v2",
+                "model_name": SENTENCE_MODEL_NAME,
                 "embedding_dim": int(embeddings.shape[1]),
                 "samples_embedded": int(embeddings.shape[0]),
+                "newly_encoded": encoded,
+                "pruned": pruned,
+                "store_count": store_count,
                 "provider": "sentence-transformers",
             }
             with open(MODELS_DIR / "sentence_bert_info.json", "w") as f:
@@ -1421,7 +1832,10 @@ def run_ai_model_training() -> Dict[str, Any]:
                 str(MODELS_DIR / "candidate_embeddings.npy"),
                 str(MODELS_DIR / "sentence_bert_info.json"),
             ])
-            logger.info("  Created %d embeddings (%d dimensions)", *embeddings.shape)
+            logger.info("  %d embeddings (%d dimensions), %d newly encoded",
+                        embeddings.shape[0], embeddings.shape[1], encoded)
+            # Clustering and the similarity matrix keep working on a bounded sample
+            embeddings = np.asarray(embeddings[:EMBEDDING_SAMPLE])
         else:
             logger.warning("  Sentence-BERT model not available")
     except Exception as e:
@@ -1612,6 +2026,13 @@ def run_ai_model_training() -> Dict[str, Any]:
 # ═══════════════════════════════════════════════════════════════════════
 
 def main():
+    parser = argparse.ArgumentParser(description="Deep ingestion, collocation mining & AI training")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="spaCy processes for document parsing (default: 1)")
+    parser.add_argument("--batch-size", type=int, default=NLP_BATCH_SIZE,
+                        help=f"documents per spaCy batch (default: {NLP_BATCH_SIZE})")
+    args = parser.parse_args()
+
     pipeline_start = time.time()
 
     logger.info("#" * 80)
@@ -1629,21 +2050,24 @@ def main():
 
     # ═══ PHASE A: Deep Document Parsing ═══
     try:
-        parse_result = deep_parse_automated_parser()
+        parse_result = deep_parse_automated_parser(workers=args.workers, batch_size=args.batch_size)
         final_report["phases"]["A_parsing"] = parse_result.get("stats", {})
         all_texts = parse_result.get("all_raw_texts", [])
         all_job_titles = parse_result.get("all_job_titles", [])
         all_skills = parse_result.get("all_skills", [])
+        spool = parse_result.get("spool")
     except Exception as e:
         logger.error("PHASE A FAILED: %s", e)
         traceback.print_exc()
         final_report["phases"]["A_parsing"] = {"error": str(e)}
-        all_texts, all_job_titles, all_skills = [], [], []
+        all_texts, all_job_titles, all_skills, spool = [], [], [], None
 
     # ═══ PHASE B: Collocation Mining ═══
     try:
         mining_stats = run_collocation_mining(all_texts, all_job_titles, all_skills)
         final_report["phases"]["B_collocation_mining"] = mining_stats
+        if spool is not None and "error" not in mining_stats:
+            spool.remove()  # mined and folded — next run starts a fresh spool
     except Exception as e:
         logger.error("PHASE B FAILED: %s", e)
         traceback.print_exc()
@@ -11,23 +11,36 @@ Purpose:
 Workflow:
   1. Load profile JSON(s) from --input (file or directory)
   2. Extract embedding-worthy text (summary, experience, skills)
-  3. Encode with sentence-transformers model (default: all-MiniLM-L6-v2)
-  4. Save embeddings as .npy or append to profile JSON
-  5. Optionally push to vector index (future: FAISS/Qdrant)
+  3. Skip profiles whose text hash (and model) match the ones already stored
+  4. Encode the rest with sentence-transformers (default: all-MiniLM-L6-v2),
+     batch size sized to free memory unless --batch-size is given
+  5. Upsert vectors into the consolidated, memory-mapped EmbeddingStore
+     (<output>/store — IVF-indexed for top-k similarity queries)
+  6. Write embedding_index.json summarising the run
+
+embed_new_texts() is the same incremental step for bulk corpora keyed by
+content hash (used by deep_ingest_and_train.py): only texts not yet in
+the store are encoded, so a nightly run costs the day's delta.  Each
+model gets its own store (corpus_store_dir), and prune_store() drops
+vectors for texts that have left the corpus.
 
 Usage:
   python scripts/embedding_pipeline.py --input data/profiles/
   python scripts/embedding_pipeline.py --input data/profiles/abc123.json --model all-MiniLM-L6-v2
   python scripts/embedding_pipeline.py --input data/profiles/ --output data/embeddings/ --batch-size 64
+  python scripts/embedding_pipeline.py --input data/profiles/ --collection mentors
+  python scripts/embedding_pipeline.py --input data/profiles/ --force   # re-encode everything
 """
 
 import argparse
+import hashlib
 import json
+import os
 import sys
 import time
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -91,23 +104,111 @@ def extract_text_fields(profile: Dict[str, Any]) -> str:
     return " ".join(parts).strip()
 
 
+# ── Batch sizing ─────────────────────────────────────────────────
+
+MIN_BATCH, MAX_BATCH = 8, 512
+ENCODE_CHUNK = 4096  # texts encoded and stored per step (bounds memory)
+
+
+def content_hash(text: str) -> str:
+    """Stable id for a text's content — unchanged text, unchanged id."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def free_memory_bytes(model=None) -> int:
+    """Free memory on the device the model runs on (GPU if any, else host RAM)."""
+    device = str(getattr(model, "device", "cpu"))
+    if device.startswith("cuda"):
+        try:
+            import torch
+            return int(torch.cuda.mem_get_info()[0])
+        except Exception:
+            pass
+    try:
+        import psutil
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 2 << 30
+
+
+def adaptive_batch_size(model, budget_fraction: float = 0.25) -> int:
+    """
+    Largest power-of-two batch whose activations fit in a fraction of free
+    memory.  Per-text cost is estimated as sequence length × hidden size ×
+    float32 × ~24 live tensors across the encoder layers.
+    """
+    seq_len = getattr(model, "max_seq_length", None) or 256
+    try:
+        dim = model.get_sentence_embedding_dimension() or 384
+    except Exception:
+        dim = 384
+    per_text = seq_len * dim * 4 * 24
+    fit = int(free_memory_bytes(model) * budget_fraction) // per_text
+    size = MIN_BATCH
+    while size * 2 <= min(fit, MAX_BATCH):
+        size *= 2
+    return size
+
+
+def _is_oom(exc: BaseException) -> bool:
+    return isinstance(exc, MemoryError) or "out of memory" in str(exc).lower()
+
+
+def encode_adaptive(
+    model,
+    texts: Sequence[str],
+    batch_size: Optional[int] = None,
+    normalize: bool = True,
+) -> Tuple[np.ndarray, int]:
+    """
+    Encode texts, halving the batch size on out-of-memory.  ``normalize``
+    returns unit-length vectors (as embed_profiles always has).
+    Returns (vectors, batch size that worked) so callers can keep using it.
+    """
+    batch_size = batch_size or adaptive_batch_size(model)
+    while True:
+        try:
+            vectors = model.encode(list(texts), batch_size=batch_size, show_progress_bar=False,
+                                   normalize_embeddings=normalize)
+            return np.asarray(vectors, dtype=np.float32), batch_size
+        except (RuntimeError, MemoryError) as e:
+            if not _is_oom(e) or batch_size <= 1:
+                raise
+            batch_size //= 2
+            logger.warning(f"Out of memory while encoding — retrying with batch_size={batch_size}")
+            try:
+                import torch
+                torch.cuda.empty_cache()
+            except Exception:
+                pass
+
+
 # ── Embedding logic ──────────────────────────────────────────────
 
 def embed_profiles(
     profiles: List[Dict[str, Any]],
     model_name: str = "all-MiniLM-L6-v2",
-    batch_size: int = 32,
+    batch_size: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Generates embeddings for a list of profile dicts.
-    Returns list of {id, embedding (list[float]), text_length}.
+    Returns list of {id, embedding (list[float]), text_length, content_hash}.
     """
     model = get_model(model_name)
     texts = [extract_text_fields(p) for p in profiles]
     ids = [p.get("id", p.get("filename", str(i))) for i, p in enumerate(profiles)]
 
+    batch_size = batch_size or adaptive_batch_size(model)
     logger.info(f"Encoding {len(texts)} profiles (batch_size={batch_size}) …")
-    embeddings = model.encode(texts, batch_size=batch_size, show_progress_bar=True, normalize_embeddings=True)
+    embeddings, _ = encode_adaptive(model, texts, batch_size)
 
     results = []
     for pid, emb, txt in zip(ids, embeddings, texts):
@@ -116,10 +217,97 @@ def embed_profiles(
             "embedding": emb.tolist(),
             "dim": len(emb),
             "text_length": len(txt),
+            "content_hash": content_hash(txt),
+            "model": model_name,
         })
     return results
 
 
+def unchanged_profiles(
+    profiles: List[Dict[str, Any]],
+    store_dir: Path,
+    model_name: str = "all-MiniLM-L6-v2",
+) -> set:
+    """Ids of profiles whose current text hash and model match the stored ones."""
+    from services.shared.embedding_store import EmbeddingStore
+
+    if not (store_dir / EmbeddingStore.META_FILE).exists():
+        return set()
+    store = EmbeddingStore(store_dir)
+    try:
+        unchanged = set()
+        for i, p in enumerate(profiles):
+            pid = str(p.get("id", p.get("filename", str(i))))
+            meta = store.metadata(pid)
+            if (meta and meta.get("model") == model_name
+                    and meta.get("content_hash") == content_hash(extract_text_fields(p))):
+                unchanged.add(pid)
+        return unchanged
+    finally:
+        store.close()
+
+
+def corpus_store_dir(root: Path, model_name: str, collection: str = "training_corpus") -> Path:
+    """
+    Store directory for one model's vectors.  Content-hash keys say nothing
+    about which model produced a vector, so every model gets its own store.
+    """
+    slug = "".join(c if c.isalnum() or c in "-_." else "_" for c in model_name.strip("/"))
+    return Path(root) / f"{collection}__{slug}"
+
+
+def embed_new_texts(
+    texts: Sequence[str],
+    store,
+    model,
+    batch_size: Optional[int] = None,
+) -> Tuple[List[str], int]:
+    """
+    Make sure every text has a vector in ``store`` (an EmbeddingStore keyed
+    by content hash, one store per model — see corpus_store_dir()).  Only
+    texts whose hash is not stored yet are encoded, ENCODE_CHUNK at a time,
+    normalised the same way the store normalises.
+    Returns (ids aligned with ``texts``, number encoded).
+    """
+    model_dim = model.get_sentence_embedding_dimension()
+    if model_dim != store.dim:
+        raise ValueError(f"Model produces {model_dim}-d vectors but the store at {store.path} holds {store.dim}-d")
+    ids = [content_hash(t) for t in texts]
+    todo: Dict[str, str] = {}
+    for pid, text in zip(ids, texts):
+        if pid not in store and pid not in todo:
+            todo[pid] = text
+    if todo:
+        batch_size = batch_size or adaptive_batch_size(model)
+        logger.info(f"Encoding {len(todo)} new texts of {len(texts)} (batch_size={batch_size}) …")
+        pending = list(todo.items())
+        for start in range(0, len(pending), ENCODE_CHUNK):
+            chunk = pending[start:start + ENCODE_CHUNK]
+            vectors, batch_size = encode_adaptive(model, [t for _, t in chunk], batch_size,
+                                                  normalize=store.normalize)
+            store.add([pid for pid, _ in chunk], vectors,
+                      metadata=[{"text_length": len(t)} for _, t in chunk])
+        store.flush()
+    return ids, len(todo)
+
+
+def prune_store(store, keep: Sequence[str]) -> int:
+    """
+    Delete vectors whose id is not in ``keep`` (texts edited or removed
+    since they were encoded) and compact once dead rows outnumber live
+    ones.  Returns the number of vectors deleted.
+    """
+    keep_set = set(keep)
+    removed = store.delete([pid for pid in store.ids() if pid not in keep_set])
+    if removed:
+        if store.dead_rows > len(store):
+            store.compact()
+        else:
+            store.flush()
+        logger.info(f"Pruned {removed} vectors no longer in the corpus ({len(store)} remain)")
+    return removed
+
+
 # ── I/O helpers ──────────────────────────────────────────────────
 
 def load_profiles(input_path: Path) -> List[Dict[str, Any]]:
@@ -141,20 +329,43 @@ def load_profiles(input_path: Path) -> List[Dict[str, Any]]:
     return profiles
 
 
-def save_embeddings(results: List[dict], output_dir: Path):
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Save as individual .npy and a combined index JSON
-    index = []
-    for r in results:
-        npy_path = output_dir / f"{r['id']}.npy"
-        np.save(npy_path, np.array(r["embedding"], dtype=np.float32))
-        index.append({"id": r["id"], "dim": r["dim"], "text_length": r["text_length"], "file": npy_path.name})
+def save_embeddings(
+    results: List[dict],
+    output_dir: Path,
+    model_name: str = "all-MiniLM-L6-v2",
+    collection: str = "candidates",
+):
+    """Upsert vectors into the consolidated store and write a summary index."""
+    from services.shared.embedding_store import EmbeddingStore
 
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if not results:
+        return
+
+    store = EmbeddingStore(output_dir / "store" / collection, dim=results[0]["dim"])
+    try:
+        store.add(
+            [str(r["id"]) for r in results],
+            np.array([r["embedding"] for r in results], dtype=np.float32),
+            metadata=[{"text_length": r["text_length"], "content_hash": r["content_hash"],
+                       "model": r["model"]} for r in results],
+        )
+        total = len(store)
+    finally:
+        store.close()
+
+    index = [{"id": r["id"], "dim": r["dim"], "text_length": r["text_length"]} for r in results]
     index_path = output_dir / "embedding_index.json"
     with open(index_path, "w", encoding="utf-8") as f:
-        json.dump({"model": "all-MiniLM-L6-v2", "count": len(index), "entries": index}, f, indent=2)
-    logger.info(f"Saved {len(index)} embeddings → {output_dir}")
+        json.dump({
+            "model": model_name,
+            "collection": collection,
+            "store": str(Path("store") / collection),
+            "count": len(index),
+            "store_count": total,
+            "entries": index,
+        }, f, indent=2)
+    logger.info(f"Saved {len(index)} embeddings → {output_dir / 'store' / collection} ({total} in store)")
 
 
 # ── CLI ──────────────────────────────────────────────────────────
@@ -164,7 +375,9 @@ def main():
     parser.add_argument("--input", required=True, help="Profile JSON file or directory")
     parser.add_argument("--output", default=None, help="Output directory for .npy embeddings (default: <input>/embeddings)")
     parser.add_argument("--model", default="all-MiniLM-L6-v2", help="SentenceTransformer model name")
-    parser.add_argument("--batch-size", type=int, default=32, help="Encoding batch size")
+    parser.add_argument("--batch-size", type=int, default=None, help="Encoding batch size (default: sized to free memory)")
+    parser.add_argument("--collection", default="candidates", help="Embedding store collection (candidates, jobs, mentors, …)")
+    parser.add_argument("--force", action="store_true", help="Re-encode profiles even if their text is unchanged")
     args = parser.parse_args()
 
     input_path = Path(args.input)
@@ -176,8 +389,18 @@ def main():
         logger.error("No profiles found — nothing to embed.")
         return 1
 
+    if not args.force:
+        unchanged = unchanged_profiles(profiles, output_dir / "store" / args.collection, args.model)
+        if unchanged:
+            logger.info(f"Skipping {len(unchanged)} unchanged profiles")
+            profiles = [p for i, p in enumerate(profiles)
+                        if str(p.get("id", p.get("filename", str(i)))) not in unchanged]
+        if not profiles:
+            logger.info("✅ All profiles up to date — nothing to encode.")
+            return 0
+
     results = embed_profiles(profiles, model_name=args.model, batch_size=args.batch_size)
-    save_embeddings(results, output_dir)
+    save_embeddings(results, output_dir, model_name=args.model, collection=args.collection)
 
     elapsed = round(time.time() - t0, 2)
     logger.info(f"✅ Pipeline complete — {len(results)} embeddings in {elapsed}s")
@@ -4,20 +4,23 @@ nightly_retrain.py — Scheduled model retrain script
 =====================================================
 
 Purpose:
-  Runs a full model retrain cycle via the TrainingOrchestrator.
+  Runs an incremental model retrain cycle via the TrainingOrchestrator.
   Designed to be invoked nightly by Windows Task Scheduler, cron,
-  or a CI/CD pipeline.
+  or a CI/CD pipeline.  Models whose inputs are unchanged are skipped;
+  models that only gained rows are partial-fit / warm-started from their
+  previous artifacts, so a quiet night costs seconds, not a full retrain.
 
 Workflow:
   1. Acquire a file-lock so only one instance runs at a time
   2. Load runtime config (data root, model dirs)
-  3. Invoke TrainingOrchestrator.run_full_training()
-  4. Back up previous models before overwriting
+  3. Back up previous models (content-addressed: unchanged files are not copied again)
+  4. Invoke TrainingOrchestrator(incremental=True).run_full_training()
   5. Write a JSON run-log to logs/nightly_retrain/
   6. Exit 0 on success, 1 on failure
 
 Usage:
-  python scripts/nightly_retrain.py [--dry-run] [--data-dir PATH] [--models-dir PATH]
+  python scripts/nightly_retrain.py [--dry-run] [--full] [--keep-backups N]
+                                    [--cpus N] [--data-dir PATH] [--models-dir PATH]
 
 Schedule (Windows Task Scheduler / cron):
   Action: python scripts/nightly_retrain.py
@@ -26,7 +29,6 @@ Schedule (Windows Task Scheduler / cron):
 
 import argparse
 import json
-import shutil
 import sys
 import time
 from datetime import datetime, timezone
@@ -37,6 +39,7 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from services.ai_engine.config import models_path, AI_DATA_DIR, log_root
+from services.ai_engine.incremental_training import ModelBackups
 
 
 def acquire_lock(lock_path: Path) -> bool:
@@ -53,14 +56,13 @@ def release_lock(lock_path: Path):
     lock_path.unlink(missing_ok=True)
 
 
-def backup_models(src: Path, backup_root: Path):
-    """Copy current models to a timestamped backup folder."""
-    if not src.exists():
-        return None
-    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    dest = backup_root / f"models_backup_{stamp}"
-    shutil.copytree(src, dest, dirs_exist_ok=True)
-    return dest
+def backup_models(src: Path, backup_root: Path, keep: int):
+    """Snapshot current models into the deduplicated backup store; keep the newest ``keep``."""
+    backups = ModelBackups(backup_root)
+    snapshot = backups.snapshot(src)
+    if snapshot is not None:
+        snapshot["blobs_pruned"] = backups.prune(keep)
+    return snapshot
 
 
 def write_run_log(log_dir: Path, result: dict):
@@ -77,6 +79,10 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Print what would happen, don't train")
     parser.add_argument("--data-dir", type=str, default=str(AI_DATA_DIR), help="Training data directory")
     parser.add_argument("--models-dir", type=str, default=str(models_path), help="Output models directory")
+    parser.add_argument("--full", action="store_true", help="Retrain every model from scratch")
+    parser.add_argument("--keep-backups", type=int, default=14, help="Backups to retain (default: 14)")
+    parser.add_argument("--cpus", type=int, default=None,
+                        help="CPU budget for concurrent model training (default: all cores)")
     args = parser.parse_args()
 
     lock_path = log_root / "nightly_retrain" / ".retrain.lock"
@@ -88,9 +94,13 @@ def main():
         "data_dir": args.data_dir,
         "models_dir": args.models_dir,
         "dry_run": args.dry_run,
+        "mode": "full" if args.full else "incremental",
         "status": "unknown",
         "duration_s": 0,
         "backup_path": None,
+        "backup_bytes_written": 0,
+        "skipped_models": [],
+        "updated_models": [],
         "error": None,
     }
 
@@ -114,10 +124,12 @@ def main():
             return 0
 
         # ── Backup existing models ───────────────────────────────
-        backup_dest = backup_models(Path(args.models_dir), backup_root)
-        run_log["backup_path"] = str(backup_dest) if backup_dest else None
-        if backup_dest:
-            print(f"📦 Backed up models → {backup_dest}")
+        backup = backup_models(Path(args.models_dir), backup_root, args.keep_backups)
+        if backup:
+            run_log["backup_path"] = str(backup["manifest"])
+            run_log["backup_bytes_written"] = backup["bytes_written"]
+            print(f"📦 Backed up {backup['files']} model files → {backup['manifest']} "
+                  f"({backup['new_blobs']} new, {backup['bytes_written']:,} bytes written)")
 
         # ── Run training ─────────────────────────────────────────
         from services.ai_engine.training_orchestrator import TrainingOrchestrator
@@ -126,8 +138,14 @@ def main():
             data_dir=args.data_dir,
             models_dir=args.models_dir,
             registry_dir=args.models_dir,
+            incremental=not args.full,
+            cpu_budget=args.cpus,
         )
         success = orchestrator.run_full_training()
+        run_log["skipped_models"] = orchestrator.training_state.get("skipped_models", [])
+        run_log["updated_models"] = orchestrator.training_state.get("updated_models", [])
+        run_log["model_durations"] = orchestrator.training_state.get("model_durations", {})
+        run_log["workers"] = orchestrator.training_state.get("workers", 1)
 
         duration = round(time.time() - t0, 2)
         run_log["duration_s"] = duration
@@ -148,7 +148,7 @@ class GatewayResponse:
 
 
 # ══════════════════════════════════════════════════════════════════════════
-# Ground Truth Tracker (inline for now, will be extracted)
+# Ground Truth Tracker (storage in ground_truth_store.py)
 # ══════════════════════════════════════════════════════════════════════════
 
 class GroundTruthTracker:
@@ -162,15 +162,17 @@ class GroundTruthTracker:
       - Hiring outcome (did candidate get hired?)
     """
     
-    def __init__(self, storage_path: Optional[Path] = None):
+    def __init__(self, storage_path: Optional[Path] = None, cache_size: int = 10000):
+        from services.ai_engine.ground_truth_store import GroundTruthStore
+
         self.storage_path = storage_path or Path(__file__).parent / "ground_truth"
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.predictions_file = self.storage_path / "predictions.jsonl"
         self.outcomes_file = self.storage_path / "outcomes.jsonl"
         
-        # In-memory cache for recent predictions (for fast lookup)
-        self._recent_predictions: Dict[str, Dict] = {}
-        self._max_cache = 10000
+        # Append-only logs + persistent id→offset index, LRU cache and
+        # incrementally joined outcome aggregates (index opened on first use)
+        self.store = GroundTruthStore(self.storage_path, cache_size=cache_size)
         
     def record_prediction(
         self,
@@ -194,17 +196,8 @@ class GroundTruthTracker:
             "outcome": None,  # To be filled in later
         }
         
-        # Cache in memory
-        self._recent_predictions[ground_truth_id] = record
-        if len(self._recent_predictions) > self._max_cache:
-            # Evict oldest
-            oldest = min(self._recent_predictions.keys())
-            del self._recent_predictions[oldest]
-        
-        # Append to disk
         try:
-            with open(self.predictions_file, "a") as f:
-                f.write(json.dumps(record) + "\n")
+            self.store.append_prediction(record)
         except Exception as e:
             logger.warning("Failed to persist prediction: %s", e)
     
@@ -215,7 +208,7 @@ class GroundTruthTracker:
         outcome_value: Any,
         metadata: Dict[str, Any] = None,
     ) -> bool:
-        """Record an outcome for a previous prediction."""
+        """Record an outcome for a previous prediction (joined on arrival)."""
         outcome_record = {
             "ground_truth_id": ground_truth_id,
             "timestamp": datetime.now().isoformat(),
@@ -224,48 +217,38 @@ class GroundTruthTracker:
             "metadata": metadata or {},
         }
         
-        # Update cache if present
-        if ground_truth_id in self._recent_predictions:
-            self._recent_predictions[ground_truth_id]["outcome"] = {
-                outcome_type: outcome_value
-            }
-        
-        # Append to outcomes file
         try:
-            with open(self.outcomes_file, "a") as f:
-                f.write(json.dumps(outcome_record) + "\n")
+            self.store.append_outcome(outcome_record)
             return True
         except Exception as e:
             logger.warning("Failed to persist outcome: %s", e)
             return False
     
     def get_prediction(self, ground_truth_id: str) -> Optional[Dict]:
-        """Retrieve a prediction by ID."""
-        if ground_truth_id in self._recent_predictions:
-            return self._recent_predictions[ground_truth_id]
-        
-        # Scan file (expensive, but rare)
-        if self.predictions_file.exists():
-            with open(self.predictions_file) as f:
-                for line in f:
-                    try:
-                        record = json.loads(line)
-                        if record.get("ground_truth_id") == ground_truth_id:
-                            return record
-                    except json.JSONDecodeError:
-                        continue
-        return None
+        """Retrieve a prediction by ID (cache, else one indexed seek)."""
+        try:
+            return self.store.get(ground_truth_id)
+        except Exception as e:
+            logger.warning("Failed to read prediction %s: %s", ground_truth_id, e)
+            return None
     
-    def get_feedback_stats(self, task_type: str = None, days: int = 30) -> Dict[str, Any]:
-        """Get aggregate stats on prediction accuracy."""
-        # This would query the files and compute accuracy metrics
-        # Simplified for now
-        return {
-            "total_predictions": len(self._recent_predictions),
-            "outcomes_collected": 0,  # TODO: count outcomes
-            "accuracy_by_confidence": {},
-            "calibration_error": 0.0,
-        }
+    def get_feedback_stats(
+        self, task_type: str = None, days: int = 30, outcome_type: str = None,
+    ) -> Dict[str, Any]:
+        """
+        Aggregate stats on prediction accuracy: positive-outcome rate per
+        confidence bucket and expected calibration error, from the index.
+        """
+        try:
+            return self.store.feedback_stats(task_type=task_type, days=days, outcome_type=outcome_type)
+        except Exception as e:
+            logger.warning("Failed to compute feedback stats: %s", e)
+            return {
+                "total_predictions": 0,
+                "outcomes_collected": 0,
+                "accuracy_by_confidence": {},
+                "calibration_error": 0.0,
+            }
     
     def _hash_result(self, result: Any) -> str:
         """Hash a result for comparison without storing full content."""
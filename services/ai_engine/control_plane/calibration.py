@@ -22,6 +22,9 @@ Usage:
     # Calibrate a raw confidence score
     calibrated = calibrator.calibrate(0.85, task_type="score")
     
+    # Calibrate many scores at once
+    calibrated = calibrator.calibrate_batch(np.array([0.2, 0.85]), task_type="score")
+    
     # Train calibration model on historical data
     calibrator.train("score", ground_truth_data)
     
@@ -32,8 +35,10 @@ Author: CareerTrojan System
 Date:   February 2026
 """
 
+import bisect
 import json
 import logging
+import math
 import pickle
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -79,6 +84,13 @@ class ConfidenceCalibrator:
     # Minimum samples required to train calibration
     MIN_SAMPLES = 100
     
+    # Knots used when compiling a Platt model into a lookup table
+    PLATT_TABLE_KNOTS = 257
+    
+    # Temperature search range and grid resolution
+    TEMPERATURE_RANGE = (0.5, 3.0)
+    TEMPERATURE_GRID = 50
+    
     def __init__(self, models_dir: Optional[Path] = None):
         self.models_dir = models_dir or Path(__file__).parent.parent / "calibration_models"
         self.models_dir.mkdir(parents=True, exist_ok=True)
@@ -93,6 +105,10 @@ class ConfidenceCalibrator:
         # Fallback: simple linear adjustment
         self._linear_adjustments: Dict[str, Tuple[float, float]] = {}
         
+        # Compiled piecewise-linear tables: (method, task_type) -> (xs, ys)
+        # Serving reads these instead of calling into sklearn.
+        self._tables: Dict[Tuple[str, str], Tuple[List[float], List[float]]] = {}
+        
         # Load existing models
         self._load_models()
         
@@ -109,8 +125,10 @@ class ConfidenceCalibrator:
                 
                 if "_platt" in pkl_file.stem:
                     self._platt_models[task_type] = model
+                    self._compile_table("platt", task_type, model)
                 elif "_isotonic" in pkl_file.stem:
                     self._isotonic_models[task_type] = model
+                    self._compile_table("isotonic", task_type, model)
                     
             except Exception as e:
                 logger.warning("Failed to load %s: %s", pkl_file, e)
@@ -162,6 +180,55 @@ class ConfidenceCalibrator:
         except Exception as e:
             logger.warning("Failed to save models: %s", e)
     
+    def _compile_table(self, method: str, task_type: str, model: Any) -> None:
+        """Export an isotonic/Platt model as a piecewise-linear lookup table.
+        
+        Isotonic regression is already piecewise-linear between its fitted
+        thresholds, so those are used verbatim. Platt models are sampled on
+        a dense uniform grid over [0, 1].
+        """
+        try:
+            if method == "isotonic":
+                xs = np.asarray(model.X_thresholds_, dtype=float)
+                ys = np.asarray(model.y_thresholds_, dtype=float)
+            else:
+                xs = np.linspace(0.0, 1.0, self.PLATT_TABLE_KNOTS)
+                ys = model.predict_proba(xs.reshape(-1, 1))[:, 1]
+            if len(xs) == 0:
+                return
+            self._tables[(method, task_type)] = (xs.tolist(), ys.tolist())
+        except Exception as e:
+            logger.warning("Failed to compile %s table for %s: %s", method, task_type, e)
+    
+    @staticmethod
+    def _interpolate(x: float, xs: List[float], ys: List[float]) -> float:
+        """O(log n) piecewise-linear lookup, clipped at the table ends."""
+        if x <= xs[0]:
+            return ys[0]
+        if x >= xs[-1]:
+            return ys[-1]
+        i = bisect.bisect_right(xs, x)
+        x0, x1 = xs[i - 1], xs[i]
+        y0, y1 = ys[i - 1], ys[i]
+        if x1 == x0:
+            return y1
+        return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+    
+    def _resolve_method(self, task_type: str, method: str) -> Optional[str]:
+        """Pick the calibration method for ``method="auto"``; None if untrained."""
+        if method != "auto":
+            return method
+        # Try isotonic first (most flexible), then platt, then temperature
+        if task_type in self._isotonic_models:
+            return "isotonic"
+        if task_type in self._platt_models:
+            return "platt"
+        if task_type in self._temperatures:
+            return "temperature"
+        if task_type in self._linear_adjustments:
+            return "linear"
+        return None
+    
     def calibrate(
         self,
         raw_confidence: float,
@@ -180,33 +247,18 @@ class ConfidenceCalibrator:
             Calibrated confidence (0-1)
         """
         # Clamp input
-        raw_confidence = max(0.0, min(1.0, raw_confidence))
-        
-        if method == "auto":
-            # Try isotonic first (most flexible), then platt, then temperature
-            if task_type in self._isotonic_models:
-                method = "isotonic"
-            elif task_type in self._platt_models:
-                method = "platt"
-            elif task_type in self._temperatures:
-                method = "temperature"
-            elif task_type in self._linear_adjustments:
-                method = "linear"
-            else:
-                # No calibration available - return as-is with slight dampening
-                return self._default_calibration(raw_confidence)
+        raw_confidence = max(0.0, min(1.0, float(raw_confidence)))
+        
+        method = self._resolve_method(task_type, method)
+        if method is None:
+            # No calibration available - return as-is with slight dampening
+            return self._default_calibration(raw_confidence)
         
         try:
-            if method == "isotonic":
-                model = self._isotonic_models.get(task_type)
-                if model:
-                    return float(model.predict([[raw_confidence]])[0])
-            
-            elif method == "platt":
-                model = self._platt_models.get(task_type)
-                if model:
-                    # Platt scaling uses logistic regression
-                    return float(model.predict_proba([[raw_confidence]])[0, 1])
+            if method in ("isotonic", "platt"):
+                table = self._tables.get((method, task_type))
+                if table:
+                    return float(self._interpolate(raw_confidence, *table))
             
             elif method == "temperature":
                 temp = self._temperatures.get(task_type, 1.0)
@@ -214,9 +266,8 @@ class ConfidenceCalibrator:
                 # For single confidence: sigmoid(logit / T)
                 if raw_confidence <= 0 or raw_confidence >= 1:
                     return raw_confidence
-                logit = np.log(raw_confidence / (1 - raw_confidence))
-                scaled_logit = logit / temp
-                return float(1 / (1 + np.exp(-scaled_logit)))
+                logit = math.log(raw_confidence / (1 - raw_confidence))
+                return 1.0 / (1.0 + math.exp(-logit / temp))
             
             elif method == "linear":
                 slope, intercept = self._linear_adjustments.get(task_type, (1.0, 0.0))
@@ -227,7 +278,60 @@ class ConfidenceCalibrator:
         
         return self._default_calibration(raw_confidence)
     
-    def _default_calibration(self, raw: float) -> float:
+    def calibrate_batch(
+        self,
+        raw_confidences: np.ndarray,
+        task_type: str,
+        method: str = "auto",
+    ) -> np.ndarray:
+        """
+        Calibrate an array of raw confidence scores in one vectorised pass.
+        
+        Same semantics as :meth:`calibrate`, applied element-wise.
+        
+        Args:
+            raw_confidences: Array-like of uncalibrated confidences (0-1)
+            task_type: Task type to use appropriate calibration model
+            method: "platt", "isotonic", "temperature", "linear", or "auto"
+        
+        Returns:
+            Float array of calibrated confidences, same shape as the input
+        """
+        raw = np.clip(np.asarray(raw_confidences, dtype=float), 0.0, 1.0)
+        
+        method = self._resolve_method(task_type, method)
+        if method is None:
+            return self._default_calibration(raw)
+        
+        try:
+            if method in ("isotonic", "platt"):
+                table = self._tables.get((method, task_type))
+                if table:
+                    # np.interp clips to the end values, like the scalar lookup
+                    return np.interp(raw, table[0], table[1])
+            
+            elif method == "temperature":
+                return self._temperature_scale(raw, self._temperatures.get(task_type, 1.0))
+            
+            elif method == "linear":
+                slope, intercept = self._linear_adjustments.get(task_type, (1.0, 0.0))
+                return np.clip(slope * raw + intercept, 0.0, 1.0)
+        
+        except Exception as e:
+            logger.debug("Batch calibration failed for %s/%s: %s", task_type, method, e)
+        
+        return self._default_calibration(raw)
+    
+    @staticmethod
+    def _temperature_scale(confidences: np.ndarray, temperature: float) -> np.ndarray:
+        """Vectorised sigmoid(logit / T); values at exactly 0 or 1 pass through."""
+        out = confidences.astype(float, copy=True)
+        inner = (confidences > 0) & (confidences < 1)
+        c = confidences[inner]
+        out[inner] = 1.0 / (1.0 + np.exp(-np.log(c / (1 - c)) / temperature))
+        return out
+    
+    def _default_calibration(self, raw):
         """Default calibration when no model is available.
         
         Applies slight dampening to reduce overconfidence.
@@ -267,6 +371,7 @@ class ConfidenceCalibrator:
                 
                 with self._lock:
                     self._isotonic_models[task_type] = model
+                    self._compile_table("isotonic", task_type, model)
                 
             elif method == "platt":
                 from sklearn.linear_model import LogisticRegression
@@ -275,25 +380,10 @@ class ConfidenceCalibrator:
                 
                 with self._lock:
                     self._platt_models[task_type] = model
+                    self._compile_table("platt", task_type, model)
                 
             elif method == "temperature":
-                # Find optimal temperature via grid search
-                best_temp = 1.0
-                best_ece = float('inf')
-                
-                for temp in np.linspace(0.5, 3.0, 50):
-                    calibrated = []
-                    for conf in confidences.ravel():
-                        if conf <= 0 or conf >= 1:
-                            calibrated.append(conf)
-                        else:
-                            logit = np.log(conf / (1 - conf))
-                            calibrated.append(1 / (1 + np.exp(-logit / temp)))
-                    
-                    ece = self._compute_ece(np.array(calibrated), outcomes)
-                    if ece < best_ece:
-                        best_ece = ece
-                        best_temp = temp
+                best_temp = self._fit_temperature(confidences.ravel(), outcomes)
                 
                 with self._lock:
                     self._temperatures[task_type] = float(best_temp)
@@ -315,24 +405,71 @@ class ConfidenceCalibrator:
             logger.exception("Calibration training failed: %s", e)
             return False
     
+    def _fit_temperature(self, confidences: np.ndarray, outcomes: np.ndarray) -> float:
+        """Find the ECE-minimising temperature.
+        
+        Logits are computed once; each grid point is then a single
+        vectorised sigmoid + ECE pass, followed by a golden-section
+        refinement inside the best grid cell.
+        """
+        inner = (confidences > 0) & (confidences < 1)
+        c = confidences[inner]
+        logits = np.log(c / (1 - c))
+        scaled = confidences.astype(float, copy=True)
+        
+        def ece_at(temp: float) -> float:
+            scaled[inner] = 1.0 / (1.0 + np.exp(-logits / temp))
+            return self._compute_ece(scaled, outcomes)
+        
+        grid = np.linspace(*self.TEMPERATURE_RANGE, self.TEMPERATURE_GRID)
+        eces = np.array([ece_at(t) for t in grid])
+        best = int(np.argmin(eces))
+        best_temp, best_ece = float(grid[best]), float(eces[best])
+        
+        # Golden-section search between the neighbouring grid points
+        lo = float(grid[max(best - 1, 0)])
+        hi = float(grid[min(best + 1, len(grid) - 1)])
+        inv_phi = (math.sqrt(5) - 1) / 2
+        for _ in range(20):
+            a = hi - inv_phi * (hi - lo)
+            b = lo + inv_phi * (hi - lo)
+            ece_a, ece_b = ece_at(a), ece_at(b)
+            if ece_a < best_ece:
+                best_temp, best_ece = a, ece_a
+            if ece_b < best_ece:
+                best_temp, best_ece = b, ece_b
+            if ece_a <= ece_b:
+                hi = b
+            else:
+                lo = a
+        
+        return best_temp
+    
     def _compute_ece(
         self,
         confidences: np.ndarray,
         outcomes: np.ndarray,
         n_bins: int = 10,
     ) -> float:
-        """Compute Expected Calibration Error."""
+        """Compute Expected Calibration Error.
+        
+        Bins are right-closed ``(lo, hi]``; values at exactly 0 fall outside
+        every bin, matching the reliability-diagram binning below.
+        """
         bin_boundaries = np.linspace(0, 1, n_bins + 1)
-        ece = 0.0
+        idx = np.searchsorted(bin_boundaries, confidences, side="left") - 1
+        valid = (idx >= 0) & (idx < n_bins)
+        if not valid.any():
+            return 0.0
+        idx = idx[valid]
         
-        for i in range(n_bins):
-            in_bin = (confidences > bin_boundaries[i]) & (confidences <= bin_boundaries[i + 1])
-            prop_in_bin = in_bin.mean()
-            
-            if prop_in_bin > 0:
-                avg_confidence = confidences[in_bin].mean()
-                avg_accuracy = outcomes[in_bin].mean()
-                ece += prop_in_bin * abs(avg_confidence - avg_accuracy)
+        counts = np.bincount(idx, minlength=n_bins)
+        conf_sums = np.bincount(idx, weights=confidences[valid], minlength=n_bins)
+        acc_sums = np.bincount(idx, weights=outcomes[valid], minlength=n_bins)
+        
+        filled = counts > 0
+        gaps = np.abs(conf_sums[filled] - acc_sums[filled]) / counts[filled]
+        ece = np.sum(counts[filled] / len(confidences) * gaps)
         
         return float(ece)
     
@@ -465,6 +602,7 @@ class ConfidenceCalibrator:
             "isotonic_models": list(self._isotonic_models.keys()),
             "temperatures": {k: round(v, 3) for k, v in self._temperatures.items()},
             "linear_adjustments": {k: (round(v[0], 3), round(v[1], 3)) for k, v in self._linear_adjustments.items()},
+            "compiled_tables": {f"{t}:{m}": len(xs) for (m, t), (xs, _) in self._tables.items()},
             "models_dir": str(self.models_dir),
         }
 
@@ -9,7 +9,9 @@ Capabilities:
     - Run regression tests after model updates
     - Compute precision/recall/F1 for skill extraction
     - Measure calibration error
-    - Track latency and cost metrics
+    - Track latency, throughput and cost metrics
+    - Run suites concurrently with per-model-hash result caching
+    - Gate promotions on quality AND per-suite latency/throughput budgets
     - Generate evaluation reports
 
 Usage:
@@ -20,20 +22,25 @@ Usage:
     # Run all golden tests
     report = evaluator.run_golden_tests()
     
-    # Run specific test suite
-    report = evaluator.run_suite("skill_extraction")
+    # Run specific test suite (4 workers, reuse results for an unchanged model)
+    report = evaluator.run_suite("skill_extraction", max_workers=4, model_hash="abc123")
     
-    # Check regression
+    # Set a performance budget for a suite
+    evaluator.set_budget("skill_extraction", p95_latency_ms=250, min_throughput_rps=20)
+    
+    # Check regression (quality + performance budgets)
     is_regressed, details = evaluator.check_regression()
 
 Author: CareerTrojan System
 Date:   February 2026
 """
 
+import hashlib
 import json
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -103,6 +110,10 @@ class EvaluationReport:
     p95_latency_ms: float
     metrics: Dict[str, float] = field(default_factory=dict)
     failed_tests: List[str] = field(default_factory=list)
+    throughput_rps: float = 0.0
+    wall_time_ms: float = 0.0
+    cached_tests: int = 0
+    model_hash: Optional[str] = None
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> Dict[str, Any]:
@@ -114,6 +125,10 @@ class EvaluationReport:
             "pass_rate": round(self.pass_rate, 4),
             "avg_latency_ms": round(self.avg_latency_ms, 2),
             "p95_latency_ms": round(self.p95_latency_ms, 2),
+            "throughput_rps": round(self.throughput_rps, 2),
+            "wall_time_ms": round(self.wall_time_ms, 2),
+            "cached_tests": self.cached_tests,
+            "model_hash": self.model_hash,
             "metrics": {k: round(v, 4) for k, v in self.metrics.items()},
             "failed_tests": self.failed_tests[:20],  # Limit
             "timestamp": self.timestamp,
@@ -130,8 +145,18 @@ class EvaluationHarness:
         - cv_jd_matching: Match score accuracy
         - confidence_calibration: Calibration error measurement
         - latency: Response time benchmarks
+    
+    Test cases within a suite run concurrently on a thread pool; results
+    are returned in suite order. When a ``model_hash`` is supplied, results
+    are cached per (model hash, test case) and reused on the next run.
     """
     
+    # Default worker pool size for run_suite
+    DEFAULT_MAX_WORKERS = 4
+    
+    # Maximum cached test results kept across model hashes
+    MAX_CACHED_RESULTS = 5000
+    
     def __init__(self, test_dir: Optional[Path] = None, reports_dir: Optional[Path] = None):
         self.test_dir = test_dir or Path(__file__).parent.parent / "golden_tests"
         self.reports_dir = reports_dir or Path(__file__).parent.parent / "evaluation_reports"
@@ -143,6 +168,14 @@ class EvaluationHarness:
         self._test_cases: Dict[str, List[TestCase]] = {}
         self._historical_results: List[EvaluationReport] = []
         
+        # Per-suite performance budgets: {"p95_latency_ms": ..., "min_throughput_rps": ...}
+        self._budgets: Dict[str, Dict[str, float]] = {}
+        
+        # Cached test results keyed by "<model_hash>:<test digest>"
+        self._cache_file = self.reports_dir / "cache" / "results.json"
+        self._result_cache: Dict[str, Dict[str, Any]] = {}
+        self._load_result_cache()
+        
         # Load existing golden tests
         self._load_golden_tests()
         
@@ -161,6 +194,8 @@ class EvaluationHarness:
                 
                 suite_name = json_file.stem
                 self._test_cases[suite_name] = []
+                if data.get("budgets"):
+                    self._budgets[suite_name] = dict(data["budgets"])
                 
                 for tc in data.get("test_cases", []):
                     self._test_cases[suite_name].append(TestCase(
@@ -366,19 +401,106 @@ class EvaluationHarness:
         
         self._test_cases[suite].append(test_case)
         
-        # Persist
+        return self._persist_suite(suite)
+    
+    def set_budget(
+        self,
+        suite: str,
+        p95_latency_ms: Optional[float] = None,
+        min_throughput_rps: Optional[float] = None,
+    ) -> bool:
+        """Set the performance budget for a suite (None clears that limit)."""
+        budget = {}
+        if p95_latency_ms is not None:
+            budget["p95_latency_ms"] = float(p95_latency_ms)
+        if min_throughput_rps is not None:
+            budget["min_throughput_rps"] = float(min_throughput_rps)
+        
+        if budget:
+            self._budgets[suite] = budget
+        else:
+            self._budgets.pop(suite, None)
+        
+        return self._persist_suite(suite)
+    
+    def _persist_suite(self, suite: str) -> bool:
+        """Write a suite's test cases and budget back to its JSON file."""
         try:
             path = self.test_dir / f"{suite}.json"
-            data = {"test_cases": [tc.to_dict() for tc in self._test_cases[suite]]}
+            data: Dict[str, Any] = {"test_cases": [tc.to_dict() for tc in self._test_cases.get(suite, [])]}
+            if suite in self._budgets:
+                data["budgets"] = self._budgets[suite]
             with open(path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
             return True
         except Exception as e:
-            logger.exception("Failed to save test case")
+            logger.exception("Failed to save suite %s", suite)
             return False
     
-    def run_suite(self, suite: str) -> EvaluationReport:
-        """Run all tests in a suite."""
+    # ── Result cache ─────────────────────────────────────────────────────
+    
+    def _load_result_cache(self):
+        """Load cached test results from disk."""
+        if not self._cache_file.exists():
+            return
+        try:
+            with open(self._cache_file, 'r', encoding='utf-8') as f:
+                self._result_cache = json.load(f)
+        except Exception as e:
+            logger.warning("Failed to load result cache: %s", e)
+    
+    def _save_result_cache(self):
+        """Persist cached test results, dropping the oldest beyond the cap."""
+        try:
+            with self._lock:
+                overflow = len(self._result_cache) - self.MAX_CACHED_RESULTS
+                for key in list(self._result_cache)[:max(overflow, 0)]:
+                    del self._result_cache[key]
+                snapshot = dict(self._result_cache)
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache_file.with_suffix(".tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp, self._cache_file)
+        except Exception as e:
+            logger.warning("Failed to save result cache: %s", e)
+    
+    @staticmethod
+    def _cache_key(model_hash: str, tc: TestCase) -> str:
+        """Cache key: model hash + digest of the test case definition."""
+        digest = hashlib.sha256(
+            json.dumps(tc.to_dict(), sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        return f"{model_hash}:{digest}"
+    
+    def clear_result_cache(self, model_hash: Optional[str] = None) -> int:
+        """Drop cached results (for one model hash, or all). Returns count removed."""
+        with self._lock:
+            if model_hash is None:
+                removed = len(self._result_cache)
+                self._result_cache.clear()
+            else:
+                keys = [k for k in self._result_cache if k.startswith(f"{model_hash}:")]
+                for k in keys:
+                    del self._result_cache[k]
+                removed = len(keys)
+        self._save_result_cache()
+        return removed
+    
+    def run_suite(
+        self,
+        suite: str,
+        max_workers: Optional[int] = None,
+        model_hash: Optional[str] = None,
+    ) -> EvaluationReport:
+        """
+        Run all tests in a suite.
+        
+        Args:
+            suite: Suite name
+            max_workers: Thread pool size (defaults to DEFAULT_MAX_WORKERS; 1 = sequential)
+            model_hash: Hash of the model under test; enables result caching
+        """
         if suite not in self._test_cases:
             return EvaluationReport(
                 suite=suite,
@@ -407,13 +529,41 @@ class EvaluationHarness:
                 metrics={"error": f"Gateway unavailable: {e}"},
             )
         
-        results = []
-        latencies = []
+        test_cases = list(self._test_cases[suite])
+        results: List[Optional[TestResult]] = [None] * len(test_cases)
+        pending: List[int] = []
         
-        for tc in self._test_cases[suite]:
-            result = self._run_test_case(gateway, tc)
-            results.append(result)
-            latencies.append(result.latency_ms)
+        # Reuse cached results for an unchanged model
+        for i, tc in enumerate(test_cases):
+            cached = self._result_cache.get(self._cache_key(model_hash, tc)) if model_hash else None
+            if cached is not None:
+                results[i] = TestResult(**cached)
+            else:
+                pending.append(i)
+        cached_count = len(test_cases) - len(pending)
+        
+        workers = max(1, min(max_workers or self.DEFAULT_MAX_WORKERS, len(pending) or 1))
+        wall_start = time.perf_counter()
+        if workers == 1:
+            fresh = [self._run_test_case(gateway, test_cases[i]) for i in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"eval-{suite}") as pool:
+                # map() yields in submission order, keeping results deterministic
+                fresh = list(pool.map(lambda i: self._run_test_case(gateway, test_cases[i]), pending))
+        wall_ms = (time.perf_counter() - wall_start) * 1000
+        
+        for i, result in zip(pending, fresh):
+            results[i] = result
+        
+        if model_hash and pending:
+            with self._lock:
+                for i, result in zip(pending, fresh):
+                    # Errors are transient; only cache completed evaluations
+                    if result.error is None:
+                        self._result_cache[self._cache_key(model_hash, test_cases[i])] = result.to_dict()
+            self._save_result_cache()
+        
+        latencies = [r.latency_ms for r in results]
         
         passed = sum(1 for r in results if r.passed)
         failed = len(results) - passed
@@ -438,6 +588,10 @@ class EvaluationHarness:
             p95_latency_ms=np.percentile(latencies, 95) if latencies else 0.0,
             metrics=avg_metrics,
             failed_tests=[r.test_id for r in results if not r.passed],
+            throughput_rps=len(pending) / (wall_ms / 1000) if pending and wall_ms > 0 else 0.0,
+            wall_time_ms=wall_ms,
+            cached_tests=cached_count,
+            model_hash=model_hash,
         )
         
         # Save report
@@ -644,20 +798,58 @@ class EvaluationHarness:
         except Exception as e:
             logger.warning("Failed to save report: %s", e)
     
-    def run_golden_tests(self) -> Dict[str, EvaluationReport]:
+    def run_golden_tests(
+        self,
+        max_workers: Optional[int] = None,
+        model_hash: Optional[str] = None,
+    ) -> Dict[str, EvaluationReport]:
         """Run all golden test suites."""
         reports = {}
         for suite in self._test_cases:
-            reports[suite] = self.run_suite(suite)
+            reports[suite] = self.run_suite(suite, max_workers=max_workers, model_hash=model_hash)
         return reports
     
+    def check_budget(self, report: EvaluationReport) -> List[Dict[str, Any]]:
+        """Return the performance budget violations for a suite report."""
+        budget = self._budgets.get(report.suite)
+        if not budget or report.total_tests == 0:
+            return []
+        
+        violations = []
+        max_p95 = budget.get("p95_latency_ms")
+        if max_p95 is not None and report.p95_latency_ms > max_p95:
+            violations.append({
+                "suite": report.suite,
+                "type": "latency",
+                "budget_p95_latency_ms": max_p95,
+                "current_p95_latency_ms": report.p95_latency_ms,
+            })
+        
+        min_rps = budget.get("min_throughput_rps")
+        # Throughput is only measured over freshly executed tests
+        fresh = report.total_tests - report.cached_tests
+        if min_rps is not None and fresh > 0 and report.throughput_rps < min_rps:
+            violations.append({
+                "suite": report.suite,
+                "type": "throughput",
+                "budget_min_throughput_rps": min_rps,
+                "current_throughput_rps": report.throughput_rps,
+            })
+        
+        return violations
+    
     def check_regression(
         self,
         threshold: float = 0.05,
+        max_workers: Optional[int] = None,
+        model_hash: Optional[str] = None,
     ) -> Tuple[bool, Dict[str, Any]]:
         """
         Check for regression against historical results.
         
+        A suite regresses if its pass rate drops by more than ``threshold``
+        or it breaks its latency/throughput budget.
+        
         Returns:
             (is_regressed, details)
         """
@@ -674,7 +866,7 @@ class EvaluationHarness:
                 pass
         
         # Run current tests
-        current = self.run_golden_tests()
+        current = self.run_golden_tests(max_workers=max_workers, model_hash=model_hash)
         
         # Compare
         regressions = []
@@ -687,10 +879,13 @@ class EvaluationHarness:
                 if curr_rate < hist_rate - threshold:
                     regressions.append({
                         "suite": suite,
+                        "type": "quality",
                         "historical_rate": hist_rate,
                         "current_rate": curr_rate,
                         "delta": curr_rate - hist_rate,
                     })
+            
+            regressions.extend(self.check_budget(report))
         
         is_regressed = len(regressions) > 0
         
@@ -698,6 +893,7 @@ class EvaluationHarness:
             "regressions": regressions,
             "suites_checked": list(current.keys()),
             "threshold": threshold,
+            "budgets": {k: v for k, v in self._budgets.items() if k in current},
         }
     
     def get_stats(self) -> Dict[str, Any]:
@@ -706,6 +902,8 @@ class EvaluationHarness:
             "suites": list(self._test_cases.keys()),
             "test_counts": {k: len(v) for k, v in self._test_cases.items()},
             "total_tests": sum(len(v) for v in self._test_cases.values()),
+            "budgets": dict(self._budgets),
+            "cached_results": len(self._result_cache),
             "reports_dir": str(self.reports_dir),
         }
 
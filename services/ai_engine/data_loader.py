@@ -11,7 +11,7 @@ import json
 import logging
 import random
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Central config for data paths
 try:
@@ -56,6 +56,63 @@ def _infer_seniority(job_title: str, experience_years: int) -> str:
     return "Mid"
 
 
+# Profile sources scanned by DataLoader and the insight views, in priority order
+PROFILE_SOURCES = [
+    ("cv_files", AI_DATA_DIR / "cv_files"),
+    ("parsed_resumes", AI_DATA_DIR / "parsed_resumes"),
+    ("profiles", PROFILES_DIR),
+]
+
+
+def load_profile_file(path: Path, source_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Load one JSON file and normalise it into a visualisation profile.
+
+    Returns None for files without meaningful data (no skills and no role).
+    Raises on unreadable / invalid JSON.
+    """
+    with open(path, "r", encoding="utf-8") as fp:
+        data = json.load(fp)
+
+    # Use schema adapter if available
+    if adapt_any is not None:
+        rec = adapt_any(data, path.stem)
+    else:
+        # Minimal fallback (pre-adapter)
+        rec = {
+            "id": path.stem,
+            "text": data.get("raw_text", data.get("Career Summary", "")),
+            "job_title": data.get("job_title", data.get("Job Title", "")),
+            "skills": data.get("skills", []),
+            "experience_years": data.get("experience_years", 0),
+            "education": data.get("education", "Unknown"),
+            "industry": data.get("industry", "Unknown"),
+        }
+
+    profile_id = rec.get("id", path.stem)
+    # Build the visualisation-friendly profile
+    profile = {
+        "id": profile_id,
+        "role": rec.get("job_title", "Unknown") or "Unknown",
+        "seniority": _infer_seniority(
+            rec.get("job_title", ""),
+            rec.get("experience_years", 0),
+        ),
+        "skills": rec.get("skills", []),
+        "experience_years": rec.get("experience_years", 0),
+        # Placeholder score, stable per profile so incremental views agree
+        "match_score": random.Random(str(profile_id)).random() * 100,
+        "industry": rec.get("industry", "Unknown"),
+        "touchpoints": [],  # populated at runtime
+        "source": source_name,
+    }
+
+    # Only include profiles with meaningful data
+    if profile["skills"] or profile["role"] != "Unknown":
+        return profile
+    return None
+
+
 class DataLoader:
     _instance = None
     _profiles_cache: List[Dict[str, Any]] = []
@@ -78,11 +135,7 @@ class DataLoader:
         normalised into skills, experience_years, industry, etc.
         """
         # Try multiple data sources for best coverage
-        sources = [
-            ("cv_files", AI_DATA_DIR / "cv_files"),
-            ("parsed_resumes", AI_DATA_DIR / "parsed_resumes"),
-            ("profiles", PROFILES_DIR),
-        ]
+        sources = PROFILE_SOURCES
 
         loaded: List[Dict[str, Any]] = []
 
@@ -100,44 +153,9 @@ class DataLoader:
 
             for f in files[:remaining]:
                 try:
-                    with open(f, "r", encoding="utf-8") as fp:
-                        data = json.load(fp)
-
-                    # Use schema adapter if available
-                    if adapt_any is not None:
-                        rec = adapt_any(data, f.stem)
-                    else:
-                        # Minimal fallback (pre-adapter)
-                        rec = {
-                            "id": f.stem,
-                            "text": data.get("raw_text", data.get("Career Summary", "")),
-                            "job_title": data.get("job_title", data.get("Job Title", "")),
-                            "skills": data.get("skills", []),
-                            "experience_years": data.get("experience_years", 0),
-                            "education": data.get("education", "Unknown"),
-                            "industry": data.get("industry", "Unknown"),
-                        }
-
-                    # Build the visualisation-friendly profile
-                    profile = {
-                        "id": rec.get("id", f.stem),
-                        "role": rec.get("job_title", "Unknown") or "Unknown",
-                        "seniority": _infer_seniority(
-                            rec.get("job_title", ""),
-                            rec.get("experience_years", 0),
-                        ),
-                        "skills": rec.get("skills", []),
-                        "experience_years": rec.get("experience_years", 0),
-                        "match_score": random.random() * 100,
-                        "industry": rec.get("industry", "Unknown"),
-                        "touchpoints": [],  # populated at runtime
-                        "source": source_name,
-                    }
-
-                    # Only include profiles with meaningful data
-                    if profile["skills"] or profile["role"] != "Unknown":
+                    profile = load_profile_file(f, source_name)
+                    if profile is not None:
                         loaded.append(profile)
-
                 except Exception as e:
                     logger.debug("Failed to load %s: %s", f, e)
 
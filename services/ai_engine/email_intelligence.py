@@ -201,6 +201,9 @@ _DEFAULT_PATTERN_WEIGHTS: dict[str, float] = {
     "last": 0.01,
 }
 
+# Upper bound on memoised company → domain inferences before the memo resets.
+_MAX_INFERENCE_MEMO = 50_000
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -219,6 +222,11 @@ def _alpha_only(text: str) -> str:
     return re.sub(r"[^a-z]", "", _normalize(text))
 
 
+def _company_key(company: str) -> str:
+    """Normalised company lookup key: lowercase, alphanumerics and spaces."""
+    return re.sub(r"[^a-z0-9 ]", "", company.strip().lower()).strip()
+
+
 # Regex to pull email from  "Display Name <email>"  or bare email
 _EMAIL_FIELD_RE = re.compile(
     r"""
@@ -262,6 +270,37 @@ class EmailIntelligence:
         # company name (lower) → domain (reverse of above, for inference)
         self._company_to_domain: dict[str, str] = {}
 
+        # Lookup indexes, kept in step with the public containers above.
+        # Appends to verified_contacts / domain_to_company made elsewhere, and
+        # replacing either container, are picked up on the next lookup (see
+        # _sync_indexes).  The containers last indexed are held by reference.
+        self._known_domains: set[str] = set()
+        self._indexed_contacts: int = 0
+        self._indexed_companies: int = 0
+        self._contacts_ref: list[dict[str, Any]] = self.verified_contacts
+        self._companies_ref: dict[str, str] = self.domain_to_company
+        # domain → (copy of the pattern counts it was built from, [(pattern, confidence)] best first)
+        self._domain_templates: dict[str, tuple[dict[str, int], int, list[tuple[str, float]]]] = {}
+        # company → inferred domains; dropped whenever an index changes
+        self._domain_inference: dict[str, list[str]] = {}
+        # Ranking used for domains with no learned evidence
+        self._fallback_templates: list[tuple[str, float]] = [
+            (
+                pat,
+                round(
+                    self._compute_confidence(
+                        rank=None,
+                        ratio=weight,
+                        top_ratio=None,
+                        total_hits=0,
+                        is_known_domain=False,
+                    ),
+                    3,
+                ),
+            )
+            for pat, weight in _DEFAULT_PATTERN_WEIGHTS.items()
+        ]
+
         logger.info(
             "EmailIntelligence initialised — data_root=%s", self.data_root
         )
@@ -317,7 +356,7 @@ class EmailIntelligence:
             if domain in FREE_PROVIDERS:
                 continue
 
-            self.verified_contacts.append(
+            self._add_contact(
                 {
                     "email": email,
                     "name": "",
@@ -387,7 +426,7 @@ class EmailIntelligence:
             if domain not in FREE_PROVIDERS and display_name:
                 self._maybe_learn_company(domain, display_name, source)
 
-            self.verified_contacts.append(
+            self._add_contact(
                 {
                     "email": email_addr,
                     "name": display_name,
@@ -515,7 +554,104 @@ class EmailIntelligence:
         # Capitalise nicely
         company_guess = company_guess.replace("-", " ").replace("_", " ").title()
         self.domain_to_company[domain] = company_guess
-        self._company_to_domain[company_guess.lower()] = domain
+        self._index_company(domain, company_guess)
+        self._indexed_companies = len(self.domain_to_company)
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    def _add_contact(self, contact: dict[str, Any]) -> None:
+        """Append a verified contact and index its domain."""
+        self._sync_indexes()
+        self.verified_contacts.append(contact)
+        self._index_domain(contact["domain"])
+        self._indexed_contacts = len(self.verified_contacts)
+
+    def _index_domain(self, domain: str) -> None:
+        if domain not in self._known_domains:
+            self._known_domains.add(domain)
+            self._domain_inference.clear()
+
+    def _index_company(self, domain: str, company: str) -> None:
+        self._company_to_domain[company.lower()] = domain
+        self._domain_inference.clear()
+
+    def _sync_indexes(self) -> None:
+        """Catch the indexes up with direct edits to the public containers.
+
+        Appends are indexed incrementally; a reassigned, shrunk or resized
+        container triggers a rebuild.  O(1) when nothing changed.  Change
+        detection is by identity and length only, so overwriting an entry
+        in place (``verified_contacts[i] = ...``,
+        ``domain_to_company[known] = ...``) is not seen: register contacts
+        through ``add_verified_contact()``, or assign a new container.
+        """
+        n_contacts = len(self.verified_contacts)
+        if self.verified_contacts is not self._contacts_ref or n_contacts < self._indexed_contacts:
+            self._known_domains = set()
+            self._indexed_contacts = 0
+            self._contacts_ref = self.verified_contacts
+            self._domain_inference.clear()
+        for contact in self.verified_contacts[self._indexed_contacts:]:
+            self._index_domain(contact["domain"])
+        self._indexed_contacts = n_contacts
+
+        if (self.domain_to_company is not self._companies_ref
+                or len(self.domain_to_company) != self._indexed_companies):
+            self._company_to_domain = {}
+            for domain, company in self.domain_to_company.items():
+                self._index_company(domain, company)
+            self._indexed_companies = len(self.domain_to_company)
+            self._companies_ref = self.domain_to_company
+            self._domain_inference.clear()
+
+    def add_verified_contact(
+        self,
+        email: str,
+        first_name: str = "",
+        last_name: str = "",
+        name: str = "",
+        source: str = "verified",
+        company: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Register one newly verified address and update every index.
+
+        The domain's pattern counts are bumped in place (no full
+        ``learn_patterns()`` pass), and ``company`` — when given — is mapped
+        to the domain for future inference.  Returns the stored contact, or
+        ``None`` if the address is not a usable email.
+        """
+        email = email.strip().lower()
+        if not self._looks_like_email(email):
+            return None
+        domain = email.rsplit("@", 1)[1]
+        first, last = _normalize(first_name), _normalize(last_name)
+        if name and not (first or last):
+            first, last = self._parse_name_from_display(name)
+
+        contact = {
+            "email": email,
+            "name": name,
+            "first_name": first,
+            "last_name": last,
+            "domain": domain,
+            "source": source,
+        }
+        self._add_contact(contact)
+
+        if domain not in FREE_PROVIDERS:
+            if company and domain not in self.domain_to_company:
+                self.domain_to_company[domain] = company
+                self._index_company(domain, company)
+                self._indexed_companies = len(self.domain_to_company)
+            if first and last:
+                pattern = self._detect_pattern(email, first, last)
+                if pattern is not None:
+                    counts = self.domain_patterns.setdefault(domain, {})
+                    counts[pattern] = counts.get(pattern, 0) + 1
+                    self._domain_templates.pop(domain, None)
+        return contact
 
     # ------------------------------------------------------------------
     # Pattern learning
@@ -530,6 +666,7 @@ class EmailIntelligence:
         Returns ``self.domain_patterns``.
         """
         self.domain_patterns.clear()
+        self._domain_templates.clear()
 
         for contact in self.verified_contacts:
             domain = contact["domain"]
@@ -657,8 +794,6 @@ class EmailIntelligence:
         """
         first = _normalize(first_name)
         last = _normalize(last_name)
-        f_initial = first[0] if first else ""
-        l_initial = last[0] if last else ""
 
         if not first or not last:
             logger.warning(
@@ -682,71 +817,63 @@ class EmailIntelligence:
             )
             return []
 
+        return self._guesses_for(first, last, domains)
+
+    def _guesses_for(self, first: str, last: str, domains: list[str]) -> list[dict[str, Any]]:
+        """Build, de-duplicate and rank guesses for normalised names."""
+        f_initial = first[0]
         results: list[dict[str, Any]] = []
+        seen: set[str] = set()
 
         for dom in domains:
-            dom_patterns = self.domain_patterns.get(dom)
-
-            if dom_patterns:
-                total_hits = sum(dom_patterns.values())
-                # Sort patterns by frequency descending
-                sorted_patterns = sorted(
-                    dom_patterns.items(), key=lambda kv: kv[1], reverse=True
-                )
-                top_pattern, top_count = sorted_patterns[0]
-                top_ratio = top_count / total_hits if total_hits else 0.0
-
-                for rank, (pat, count) in enumerate(sorted_patterns):
-                    ratio = count / total_hits if total_hits else 0.0
-                    confidence = self._compute_confidence(
-                        rank=rank,
-                        ratio=ratio,
-                        top_ratio=top_ratio,
-                        total_hits=total_hits,
-                        is_known_domain=True,
-                    )
-                    addr = self._build_address(first, last, f_initial, pat, dom)
-                    if addr:
-                        results.append(
-                            {
-                                "email": addr,
-                                "pattern": pat,
-                                "confidence": round(confidence, 3),
-                                "domain": dom,
-                            }
-                        )
-            else:
-                # Unknown domain — emit fallback guesses
-                for pat, weight in _DEFAULT_PATTERN_WEIGHTS.items():
-                    confidence = self._compute_confidence(
-                        rank=None,
-                        ratio=weight,
-                        top_ratio=None,
-                        total_hits=0,
-                        is_known_domain=False,
+            for pat, confidence in self._templates_for(dom):
+                addr = self._build_address(first, last, f_initial, pat, dom)
+                # De-duplicate (same email can appear from multiple domains/patterns)
+                if addr and addr not in seen:
+                    seen.add(addr)
+                    results.append(
+                        {
+                            "email": addr,
+                            "pattern": pat,
+                            "confidence": confidence,
+                            "domain": dom,
+                        }
                     )
-                    addr = self._build_address(first, last, f_initial, pat, dom)
-                    if addr:
-                        results.append(
-                            {
-                                "email": addr,
-                                "pattern": pat,
-                                "confidence": round(confidence, 3),
-                                "domain": dom,
-                            }
-                        )
-
-        # De-duplicate (same email can appear from multiple domains/patterns)
-        seen: set[str] = set()
-        unique: list[dict[str, Any]] = []
-        for r in results:
-            key = r["email"]
-            if key not in seen:
-                seen.add(key)
-                unique.append(r)
 
-        unique.sort(key=lambda r: r["confidence"], reverse=True)
-        return unique
+        results.sort(key=lambda r: r["confidence"], reverse=True)
+        return results
+
+    def _templates_for(self, domain: str) -> list[tuple[str, float]]:
+        """Ranked ``(pattern, confidence)`` pairs for a domain.
+
+        Derived from ``domain_patterns`` once per domain and reused until
+        that domain's counts change, however they are changed.
+        """
+        dom_patterns = self.domain_patterns.get(domain)
+        if not dom_patterns:
+            return self._fallback_templates
+
+        total_hits = sum(dom_patterns.values())
+        cached = self._domain_templates.get(domain)
+        if cached is not None and cached[1] == total_hits and cached[0] == dom_patterns:
+            return cached[2]
+
+        # Sort patterns by frequency descending
+        sorted_patterns = sorted(dom_patterns.items(), key=lambda kv: kv[1], reverse=True)
+        top_ratio = sorted_patterns[0][1] / total_hits if total_hits else 0.0
+        templates: list[tuple[str, float]] = []
+        for rank, (pat, count) in enumerate(sorted_patterns):
+            ratio = count / total_hits if total_hits else 0.0
+            confidence = self._compute_confidence(
+                rank=rank,
+                ratio=ratio,
+                top_ratio=top_ratio,
+                total_hits=total_hits,
+                is_known_domain=True,
+            )
+            templates.append((pat, round(confidence, 3)))
+        self._domain_templates[domain] = (dict(dom_patterns), total_hits, templates)
+        return templates
 
     def guess_batch(self, contacts: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Batch-guess emails for a list of contacts.
@@ -756,15 +883,35 @@ class EmailIntelligence:
 
         Returns the same dicts enriched with ``guessed_emails`` (list) and
         ``top_guess`` (str or ``None``).
+
+        Runs in a single pass: domains are resolved once per distinct
+        company and pattern rankings once per domain, so per-contact cost
+        is just building the candidate addresses.
         """
+        self._sync_indexes()
+        domains_for: dict[tuple[str, str | None], list[str]] = {}
         enriched: list[dict[str, Any]] = []
+
         for contact in contacts:
-            guesses = self.guess_email(
-                first_name=contact.get("first_name", ""),
-                last_name=contact.get("last_name", ""),
-                company=contact.get("company", ""),
-                domain=contact.get("domain"),
-            )
+            first = _normalize(contact.get("first_name", ""))
+            last = _normalize(contact.get("last_name", ""))
+            guesses: list[dict[str, Any]] = []
+
+            if first and last:
+                company = contact.get("company", "")
+                domain = contact.get("domain")
+                key = (company, domain)
+                domains = domains_for.get(key)
+                if domains is None:
+                    domains = [domain.lower().strip()] if domain else self._infer_domain(company)
+                    domains_for[key] = domains
+                if domains:
+                    guesses = self._guesses_for(first, last, domains)
+                else:
+                    logger.debug("Could not determine domain for company %r.", company)
+            else:
+                logger.debug("Skipping contact without first and last name: %r", contact)
+
             out = dict(contact)
             out["guessed_emails"] = guesses
             out["top_guess"] = guesses[0]["email"] if guesses else None
@@ -874,21 +1021,19 @@ class EmailIntelligence:
         if not company:
             return []
 
-        company_lower = company.strip().lower()
-        company_clean = re.sub(r"[^a-z0-9 ]", "", company_lower).strip()
-
-        # 1. Exact reverse-lookup
-        if company_lower in self._company_to_domain:
-            return [self._company_to_domain[company_lower]]
+        self._sync_indexes()
+        cached = self._domain_inference.get(company)
+        if cached is not None:
+            return list(cached)
 
-        # Also try cleaned version
-        if company_clean in self._company_to_domain:
-            return [self._company_to_domain[company_clean]]
+        company_lower = company.strip().lower()
+        company_clean = _company_key(company)
 
-        # 2. Check all known domain_to_company values for a fuzzy match
-        for domain, comp_name in self.domain_to_company.items():
-            if comp_name.lower() == company_lower or comp_name.lower() == company_clean:
-                return [domain]
+        # 1-2. Reverse lookup on the raw and cleaned name (the index holds
+        # every learned company name lowercased)
+        domain = self._company_to_domain.get(company_lower) or self._company_to_domain.get(company_clean)
+        if domain:
+            return self._remember_inference(company, [domain])
 
         # 3. Generate candidate domains using comprehensive TLD list
         slug_nospace = company_clean.replace(" ", "")
@@ -903,11 +1048,16 @@ class EmailIntelligence:
                 candidates.append(f"{slug}{tld}")
 
         # Promote any candidate that we've actually seen in verified data
-        known_domains = {c["domain"] for c in self.verified_contacts}
-        promoted: list[str] = [d for d in candidates if d in known_domains]
-        remaining: list[str] = [d for d in candidates if d not in known_domains]
+        promoted: list[str] = [d for d in candidates if d in self._known_domains]
+        remaining: list[str] = [d for d in candidates if d not in self._known_domains]
+
+        return self._remember_inference(company, promoted + remaining)
 
-        return promoted + remaining
+    def _remember_inference(self, company: str, domains: list[str]) -> list[str]:
+        if len(self._domain_inference) >= _MAX_INFERENCE_MEMO:
+            self._domain_inference.clear()
+        self._domain_inference[company] = domains
+        return list(domains)
 
     def validate_domain_tld(self, domain: str) -> bool:
         """Check if a domain ends with a recognised TLD from the reference list."""
@@ -993,10 +1143,14 @@ class EmailIntelligence:
 
         self.domain_patterns = data.get("domain_patterns", {})
         self.domain_to_company = data.get("domain_to_company", {})
-        # Rebuild reverse map
-        self._company_to_domain = {
-            v.lower(): k for k, v in self.domain_to_company.items()
-        }
+        # Rebuild reverse map and drop anything derived from the old patterns
+        self._company_to_domain = {}
+        for domain, company in self.domain_to_company.items():
+            self._index_company(domain, company)
+        self._indexed_companies = len(self.domain_to_company)
+        self._companies_ref = self.domain_to_company
+        self._domain_templates.clear()
+        self._domain_inference.clear()
         logger.info(
             "Loaded patterns for %d domains from %s.",
             len(self.domain_patterns),
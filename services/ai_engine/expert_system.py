@@ -29,14 +29,22 @@ Usage:
         user_skills=["python", "machine learning", "sql"],
         role_requirements=["data science", "deep learning", "python", "cloud computing"],
     )
+
+    roles = skill_matcher.prepare_roles(all_role_requirements)   # once
+    best = skill_matcher.rank_roles(user_skills, roles, top_k=10)
 """
 
+import ast
 import os
 import logging
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import CodeType
+from typing import Callable, Dict, List, Any, Optional, Sequence, Union
 from dataclasses import dataclass, field
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # ── Paths ────────────────────────────────────────────────────────────────
@@ -62,6 +70,197 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
         return {}
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Rule Compilation
+# ═══════════════════════════════════════════════════════════════════════════
+
+# W-1 FIX: conditions are evaluated by an AST-safe evaluator, not raw eval().
+# Only comparisons, boolean ops, arithmetic, attribute access on context
+# values and a few pure calls are allowed — no imports or builtins.
+_SAFE_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.Not,
+    ast.UnaryOp, ast.USub, ast.Compare, ast.Constant, ast.Name,
+    ast.Load, ast.Eq, ast.NotEq, ast.Lt, ast.LtE,
+    ast.Gt, ast.GtE, ast.In, ast.NotIn, ast.Is, ast.IsNot,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult,
+    ast.Attribute, ast.Subscript,
+    ast.List, ast.Tuple, ast.Call,
+)
+_SAFE_METHODS = {"lower", "upper", "strip", "startswith", "endswith"}
+_RULE_GLOBALS = {"__builtins__": {}, "len": len}
+
+# Context keys every rule may reference, with their defaults
+CONTEXT_DEFAULTS: Dict[str, Any] = {
+    "target_role": "",
+    "years_experience": 0,
+    "career_pivot": False,
+    "transferable_skill_count": 0,
+    "has_relevant_certifications": False,
+    "expected_salary_percentile": 50,
+    "industry_switch": False,
+    "years_in_current_industry": 0,
+    "prefers_remote": False,
+    "role_supports_remote": True,
+    "skills": [],
+}
+
+RULES_RELOAD_INTERVAL = 5.0  # seconds between rules-file change checks
+
+
+def _validate_condition(tree: ast.Expression) -> None:
+    """Reject anything beyond the safe node set (raises ValueError)."""
+    for node in ast.walk(tree):
+        if not isinstance(node, _SAFE_NODES):
+            raise ValueError(f"Unsafe AST node: {type(node).__name__}")
+        if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            raise ValueError(f"Unsafe attribute: {node.attr}")
+        # Block function calls except len() and pure string methods
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and func.id == "len":
+                continue
+            if isinstance(func, ast.Attribute) and func.attr in _SAFE_METHODS:
+                continue
+            raise ValueError(f"Unsafe call: {ast.dump(func)}")
+
+
+@dataclass
+class CompiledRule:
+    """A rule whose condition has been parsed, validated and compiled once."""
+    rule: Dict[str, Any]
+    tree: Optional[ast.Expression]
+    code: Optional[CodeType]
+
+    @classmethod
+    def compile(cls, rule: Dict[str, Any]) -> "CompiledRule":
+        condition = str(rule.get("condition", "False"))
+        try:
+            tree = ast.parse(condition, mode="eval")
+            _validate_condition(tree)
+            return cls(rule, tree, compile(tree, f"<rule {rule.get('id', '?')}>", "eval"))
+        except (ValueError, SyntaxError) as e:
+            logger.warning("Rule %s blocked by safety check: %s", rule.get("id"), e)
+            return cls(rule, None, None)
+
+    def matches(self, ctx: Dict[str, Any]) -> bool:
+        if self.code is None:
+            return False
+        try:
+            return bool(eval(self.code, _RULE_GLOBALS, ctx))
+        except Exception as e:
+            logger.debug("Rule %s condition error: %s", self.rule.get("id"), e)
+            return False
+
+
+class _NotVectorizable(Exception):
+    """Condition (or this batch's data) needs the per-context path."""
+
+
+def _column(values: List[Any]) -> np.ndarray:
+    """Context values → numeric or string array; anything else is row-wise only."""
+    types = set(map(type, values))
+    if types <= {bool, int, float}:
+        return np.asarray(values, dtype=np.float64)
+    if types == {str}:
+        return np.asarray(values, dtype=str)
+    raise _NotVectorizable
+
+
+def _truthy(x):
+    if isinstance(x, np.ndarray):
+        if x.dtype.kind == "U":
+            return np.char.str_len(x) > 0
+        return x != 0
+    return bool(x)
+
+
+_VEC_COMPARE = {
+    ast.Eq: np.equal, ast.NotEq: np.not_equal, ast.Lt: np.less,
+    ast.LtE: np.less_equal, ast.Gt: np.greater, ast.GtE: np.greater_equal,
+}
+_VEC_BINOP = {ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply}
+_VEC_METHODS = {"lower": np.char.lower, "upper": np.char.upper, "strip": np.char.strip}
+
+
+def _vec_eval(node: ast.AST, columns: Dict[str, np.ndarray]):
+    """Evaluate a validated condition over whole columns at once."""
+    if isinstance(node, ast.Expression):
+        return _vec_eval(node.body, columns)
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (bool, int, float, str)):
+            return node.value
+        raise _NotVectorizable
+    if isinstance(node, ast.Name):
+        if node.id not in columns:
+            raise _NotVectorizable
+        return columns[node.id]
+    if isinstance(node, ast.BoolOp):
+        parts = [_truthy(_vec_eval(v, columns)) for v in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        out = parts[0]
+        for part in parts[1:]:
+            out = combine(out, part)
+        return out
+    if isinstance(node, ast.UnaryOp):
+        operand = _vec_eval(node.operand, columns)
+        if isinstance(node.op, ast.Not):
+            return np.logical_not(_truthy(operand))
+        if isinstance(node.op, ast.USub) and not (isinstance(operand, np.ndarray) and operand.dtype.kind == "U"):
+            return -operand
+        raise _NotVectorizable
+    if isinstance(node, ast.BinOp) and type(node.op) in _VEC_BINOP:
+        left, right = _vec_eval(node.left, columns), _vec_eval(node.right, columns)
+        if any(isinstance(x, str) or (isinstance(x, np.ndarray) and x.dtype.kind == "U") for x in (left, right)):
+            raise _NotVectorizable
+        return _VEC_BINOP[type(node.op)](left, right)
+    if isinstance(node, ast.Call):
+        func = node.func
+        if isinstance(func, ast.Attribute) and func.attr in _VEC_METHODS and not node.args:
+            key = f"{ast.unparse(func.value)}.{func.attr}()"
+            if key in columns:  # e.g. target_role.lower() shared by several rules
+                return columns[key]
+            target = _vec_eval(func.value, columns)
+            if isinstance(target, np.ndarray) and target.dtype.kind == "U":
+                columns[key] = _VEC_METHODS[func.attr](target)
+                return columns[key]
+        raise _NotVectorizable
+    if isinstance(node, ast.Compare):
+        out = None
+        left = _vec_eval(node.left, columns)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _vec_eval(comparator, columns)
+            if type(op) in _VEC_COMPARE:
+                kinds = {("U" if isinstance(x, str) else x.dtype.kind if isinstance(x, np.ndarray) else "f")
+                         for x in (left, right)}
+                if "U" in kinds and kinds != {"U"}:
+                    raise _NotVectorizable  # str vs number: Python semantics differ
+                step = _VEC_COMPARE[type(op)](left, right)
+            elif isinstance(op, (ast.In, ast.NotIn)) and isinstance(left, str) \
+                    and isinstance(right, np.ndarray) and right.dtype.kind == "U":
+                step = np.char.find(right, left) >= 0
+                if isinstance(op, ast.NotIn):
+                    step = ~step
+            else:
+                raise _NotVectorizable
+            out = step if out is None else np.logical_and(out, step)
+            left = right
+        return out
+    raise _NotVectorizable
+
+
+def _condition_fields(tree: ast.Expression) -> List[str]:
+    return sorted({n.id for n in ast.walk(tree) if isinstance(n, ast.Name)} - set(_RULE_GLOBALS))
+
+
+def _copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Independent copy of a CareerRules summary (rule dicts hold only scalars)."""
+    copied = summary.copy()
+    copied["triggered_rules"] = [r.copy() for r in summary["triggered_rules"]]
+    copied["recommendations"] = summary["recommendations"][:]
+    copied["warnings"] = summary["warnings"][:]
+    return copied
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Career Rules Engine
 # ═══════════════════════════════════════════════════════════════════════════
@@ -97,10 +296,65 @@ class CareerRules:
     """
 
     def __init__(self, rules_path: Optional[Path] = None):
-        self._raw = _load_yaml(rules_path or RULES_DIR / "career_rules.yaml")
+        self._path = Path(rules_path or RULES_DIR / "career_rules.yaml")
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self.reload()
+
+    def reload(self) -> int:
+        """(Re)load the rules file and compile every condition once."""
+        self._mtime = self._path.stat().st_mtime if self._path.exists() else None
+        self._raw = _load_yaml(self._path)
         self._rules = self._raw.get("rules", [])
-        logger.info("CareerRules loaded %d rules from %s", len(self._rules),
-                     rules_path or RULES_DIR / "career_rules.yaml")
+        self._compiled = [CompiledRule.compile(rule) for rule in self._rules]
+        self._next_check = time.monotonic() + RULES_RELOAD_INTERVAL
+        logger.info("CareerRules loaded %d rules from %s", len(self._rules), self._path)
+        return len(self._rules)
+
+    def _maybe_reload(self) -> None:
+        """Pick up edits to the rules file (checked at most every few seconds)."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + RULES_RELOAD_INTERVAL
+        mtime = self._path.stat().st_mtime if self._path.exists() else None
+        if mtime != self._mtime:
+            self.reload()
+
+    def _summarize(self, matched: List[CompiledRule]) -> Dict[str, Any]:
+        triggered = []
+        total_adjustment = 0.0
+        recommendations = []
+        warnings = []
+
+        for compiled in matched:
+            rule = compiled.rule
+            adj = rule.get("adjustment", 0.0)
+            action = rule.get("action", "info")
+            msg = rule.get("message", "")
+            triggered.append(RuleResult(
+                rule_id=rule.get("id", "?"),
+                name=rule.get("name", "unnamed"),
+                triggered=True,
+                action=action,
+                message=msg,
+                adjustment=adj,
+                priority=rule.get("priority", 5),
+            ))
+            total_adjustment += adj
+
+            if action.startswith("flag_") or action.startswith("adjust_confidence_down"):
+                warnings.append(msg)
+            elif action.startswith("recommend") or action.startswith("add_"):
+                recommendations.append(msg)
+
+        return {
+            "triggered_rules": [r.to_dict() for r in sorted(triggered, key=lambda r: -r.priority)],
+            "confidence_adjustment": round(total_adjustment, 3),
+            "recommendations": recommendations,
+            "warnings": warnings,
+            "rules_evaluated": len(self._rules),
+        }
 
     def evaluate(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -118,99 +372,101 @@ class CareerRules:
                 "warnings": [str, ...],
             }
         """
-        triggered = []
-        total_adjustment = 0.0
-        recommendations = []
-        warnings = []
-
+        self._maybe_reload()
         # Provide safe defaults for optional context keys
-        ctx = {
-            "target_role": "",
-            "years_experience": 0,
-            "career_pivot": False,
-            "transferable_skill_count": 0,
-            "has_relevant_certifications": False,
-            "expected_salary_percentile": 50,
-            "industry_switch": False,
-            "years_in_current_industry": 0,
-            "prefers_remote": False,
-            "role_supports_remote": True,
-            "skills": [],
-        }
-        ctx.update(context)
+        ctx = {**CONTEXT_DEFAULTS, **context}
+        return self._summarize([c for c in self._compiled if c.matches(ctx)])
 
-        for rule in self._rules:
+    def evaluate_many(self, contexts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate all rules against a batch of contexts; same output as
+        calling evaluate() on each.  Each rule runs once over whole columns
+        (numeric and string fields) with numpy; rules the batch's data
+        can't express that way fall back to the compiled per-context path.
+
+        Every context gets its own result dict, so callers may annotate
+        one without affecting the others.
+        """
+        self._maybe_reload()
+        n = len(contexts)
+        if n == 0:
+            return []
+        ctxs: List[Dict[str, Any]] = []  # defaults merged in only if a rule needs the slow path
+        columns: Dict[str, np.ndarray] = {}
+        unvectorizable: set = set()
+        hits = np.zeros((len(self._compiled), n), dtype=bool)
+
+        for r, compiled in enumerate(self._compiled):
+            if compiled.code is None:
+                continue
             try:
-                condition = rule.get("condition", "False")
-                # W-1 FIX: Replace eval() with AST-safe expression evaluator.
-                # Only allows comparisons, boolean ops, attribute access on
-                # the context dict — NO function calls, imports, or builtins.
-                import ast
-                try:
-                    tree = ast.parse(condition, mode="eval")
-                    # Walk AST and reject anything beyond safe nodes
-                    _SAFE_NODES = (
-                        ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.Not,
-                        ast.UnaryOp, ast.Compare, ast.Constant, ast.Name,
-                        ast.Load, ast.Eq, ast.NotEq, ast.Lt, ast.LtE,
-                        ast.Gt, ast.GtE, ast.In, ast.NotIn, ast.Is, ast.IsNot,
-                        ast.BinOp, ast.Add, ast.Sub, ast.Mult,
-                        ast.Attribute, ast.Subscript, ast.Index,
-                        ast.List, ast.Tuple, ast.Call,
-                    )
-                    for node in ast.walk(tree):
-                        if not isinstance(node, _SAFE_NODES):
-                            raise ValueError(f"Unsafe AST node: {type(node).__name__}")
-                        # Block function calls except len()
-                        if isinstance(node, ast.Call):
-                            if not (isinstance(node.func, ast.Name) and node.func.id == "len"):
-                                raise ValueError(f"Unsafe call: {ast.dump(node.func)}")
-                    result = eval(compile(tree, "<rule>", "eval"), {"__builtins__": {}, "len": len}, ctx)
-                except (ValueError, SyntaxError) as ast_err:
-                    logger.warning("Rule %s blocked by safety check: %s", rule.get("id"), ast_err)
-                    result = False
+                for name in _condition_fields(compiled.tree):
+                    if name in unvectorizable:
+                        raise _NotVectorizable
+                    if name not in columns:
+                        try:
+                            default = CONTEXT_DEFAULTS.get(name)
+                            columns[name] = _column([c.get(name, default) for c in contexts])
+                        except _NotVectorizable:
+                            unvectorizable.add(name)
+                            raise
+                result = _truthy(_vec_eval(compiled.tree, columns))
+                hits[r] = np.broadcast_to(result, (n,))
             except Exception as e:
-                logger.debug("Rule %s condition error: %s", rule.get("id"), e)
-                result = False
-
-            if result:
-                adj = rule.get("adjustment", 0.0)
-                action = rule.get("action", "info")
-                msg = rule.get("message", "")
-                rr = RuleResult(
-                    rule_id=rule.get("id", "?"),
-                    name=rule.get("name", "unnamed"),
-                    triggered=True,
-                    action=action,
-                    message=msg,
-                    adjustment=adj,
-                    priority=rule.get("priority", 5),
-                )
-                triggered.append(rr)
-                total_adjustment += adj
-
-                if action.startswith("flag_") or action.startswith("adjust_confidence_down"):
-                    warnings.append(msg)
-                elif action.startswith("recommend") or action.startswith("add_"):
-                    recommendations.append(msg)
-
-        return {
-            "triggered_rules": [r.to_dict() for r in sorted(triggered, key=lambda r: -r.priority)],
-            "confidence_adjustment": round(total_adjustment, 3),
-            "recommendations": recommendations,
-            "warnings": warnings,
-            "rules_evaluated": len(self._rules),
-        }
+                if not isinstance(e, _NotVectorizable):
+                    logger.debug("Rule %s vectorised evaluation failed (%s); evaluating per context",
+                                 compiled.rule.get("id"), e)
+                if not ctxs:
+                    ctxs = [{**CONTEXT_DEFAULTS, **c} for c in contexts]
+                hits[r] = [compiled.matches(c) for c in ctxs]
+
+        # Most contexts share a handful of trigger patterns: summarise each
+        # distinct pattern once and hand every context its own copy.
+        patterns, inverse = np.unique(np.packbits(hits, axis=0).T, axis=0, return_inverse=True)
+        summaries = [
+            self._summarize([self._compiled[r] for r in np.flatnonzero(np.unpackbits(p)[:len(self._compiled)])])
+            for p in patterns
+        ]
+        return [_copy_summary(summaries[i]) for i in inverse.ravel().tolist()]
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Skill Matcher Engine
 # ═══════════════════════════════════════════════════════════════════════════
 
+@dataclass
+class RoleSet:
+    """
+    Role requirement lists prepared once for SkillMatcher.score_many():
+    normalised requirement sets, a skill → roles posting index and each
+    role's summed requirement vector.
+    """
+    requirements: List[frozenset]
+    counts: np.ndarray                    # (n_roles,) distinct requirements per role
+    postings: Dict[str, np.ndarray]       # skill → indices of roles requiring it
+    vectors: Optional[np.ndarray] = None  # (n_roles, dim) summed skill vectors
+
+    def __len__(self) -> int:
+        return len(self.requirements)
+
+    def column(self, skill: str) -> np.ndarray:
+        """Boolean mask of roles that list ``skill`` as a requirement."""
+        mask = np.zeros(len(self.requirements), dtype=bool)
+        idx = self.postings.get(skill)
+        if idx is not None:
+            mask[idx] = True
+        return mask
+
+
 class SkillMatcher:
     """
     Weighted scoring system for matching user skills to role requirements.
     Supports exact match, transferable skills, and certification credit.
+
+    Semantic similarity compares the mean word vectors of the unmatched
+    skills on each side (what spaCy's Doc.similarity does for the joined
+    strings).  Each skill's summed token vector is computed once and
+    cached, so a set's vector is just the sum of its skills' vectors.
     """
 
     _nlp = None  # lazy-loaded spaCy model for semantic similarity
@@ -228,7 +484,19 @@ class SkillMatcher:
                 logger.info("SkillMatcher: spaCy model unavailable — semantic similarity disabled")
         return cls._nlp if cls._nlp is not False else None
 
-    def __init__(self, config_path: Optional[Path] = None):
+    @classmethod
+    def _spacy_vector(cls, skill: str) -> Optional[np.ndarray]:
+        """Summed static token vectors of one skill (tokenizer only, no pipeline)."""
+        nlp = cls._get_nlp()
+        if nlp is None:
+            return None
+        tokens = nlp.make_doc(skill)
+        if len(tokens) == 0:
+            return None
+        return np.sum([t.vector for t in tokens], axis=0)
+
+    def __init__(self, config_path: Optional[Path] = None,
+                 vectorizer: Optional[Callable[[str], Optional[np.ndarray]]] = None):
         self._raw = _load_yaml(config_path or RULES_DIR / "skill_matcher.yaml")
         self._scoring = self._raw.get("scoring", {})
         self._weights = self._scoring.get("weights", {
@@ -245,9 +513,56 @@ class SkillMatcher:
         })
         self._transferable = self._raw.get("transferable_skills", {})
         self._cert_mappings = self._raw.get("certification_mappings", {})
+        self._vectorizer = vectorizer or self._spacy_vector
+        self._vector_cache: Dict[str, Optional[np.ndarray]] = {}
+        self._dim: Optional[int] = None
         logger.info("SkillMatcher loaded (%d transferable skill groups, %d cert mappings)",
                      len(self._transferable), len(self._cert_mappings))
 
+    # ── Skill vectors ────────────────────────────────────────────────────
+
+    def _skill_vector(self, skill: str) -> Optional[np.ndarray]:
+        """Cached summed word vector for one normalised skill (None if unavailable)."""
+        try:
+            return self._vector_cache[skill]
+        except KeyError:
+            pass
+        vec = None
+        try:
+            raw = self._vectorizer(skill)
+            if raw is not None:
+                vec = np.asarray(raw, dtype=np.float64)
+                self._dim = self._dim or vec.shape[0]
+        except Exception as e:
+            logger.debug("Skill vector failed for %r: %s", skill, e)
+        self._vector_cache[skill] = vec
+        return vec
+
+    def _sum_vectors(self, skills) -> Optional[np.ndarray]:
+        vecs = [v for v in (self._skill_vector(s) for s in skills) if v is not None]
+        return np.sum(vecs, axis=0) if vecs else None
+
+    def _semantic_similarity(self, user_skills: set, req_skills: set) -> float:
+        if not user_skills or not req_skills:
+            return 0.0
+        user_vec, req_vec = self._sum_vectors(sorted(user_skills)), self._sum_vectors(sorted(req_skills))
+        if user_vec is None or req_vec is None:
+            return 0.0
+        # Cosine is scale-invariant, so the summed vectors stand in for the means
+        norms = np.linalg.norm(user_vec) * np.linalg.norm(req_vec)
+        if not norms:
+            return 0.0
+        return max(0.0, float(user_vec @ req_vec / norms))
+
+    def _grade(self, overall: float) -> str:
+        if overall >= self._thresholds.get("strong_match", 0.80):
+            return "Strong Match"
+        if overall >= self._thresholds.get("moderate_match", 0.55):
+            return "Good Match"
+        if overall >= self._thresholds.get("weak_match", 0.30):
+            return "Possible Match"
+        return "Skill Gap"
+
     def score(self,
               user_skills: List[str],
               role_requirements: List[str],
@@ -308,20 +623,11 @@ class SkillMatcher:
         # 4. Experience depth (simple linear scale, caps at 10 years)
         exp_score = min(experience_years / 10.0, 1.0)
 
-        # 5. Semantic similarity via spaCy word vectors
-        semantic_score = 0.0
-        nlp = self._get_nlp()
-        if nlp is not None:
-            try:
-                unmatched_user = user_set - exact_matches
-                unmatched_req = req_set - exact_matches - {tc["to"] for tc in transferable_credits}
-                if unmatched_user and unmatched_req:
-                    user_doc = nlp(" ".join(sorted(unmatched_user)))
-                    req_doc = nlp(" ".join(sorted(unmatched_req)))
-                    if user_doc.vector_norm and req_doc.vector_norm:
-                        semantic_score = max(0.0, float(user_doc.similarity(req_doc)))
-            except Exception as e:
-                logger.debug("Semantic similarity failed: %s", e)
+        # 5. Semantic similarity via cached skill word vectors
+        semantic_score = self._semantic_similarity(
+            user_set - exact_matches,
+            req_set - exact_matches - {tc["to"] for tc in transferable_credits},
+        )
 
         # Weighted overall score
         overall = (
@@ -332,21 +638,11 @@ class SkillMatcher:
             + self._weights.get("experience_depth", 0.15) * exp_score
         )
 
-        # Grade
-        if overall >= self._thresholds.get("strong_match", 0.80):
-            grade = "Strong Match"
-        elif overall >= self._thresholds.get("moderate_match", 0.55):
-            grade = "Good Match"
-        elif overall >= self._thresholds.get("weak_match", 0.30):
-            grade = "Possible Match"
-        else:
-            grade = "Skill Gap"
-
         missing = req_set - exact_matches - {tc["to"] for tc in transferable_credits}
 
         return {
             "overall_score": round(overall, 3),
-            "grade": grade,
+            "grade": self._grade(overall),
             "matched_skills": sorted(exact_matches),
             "transferable_credits": transferable_credits,
             "certification_credits": cert_credits,
@@ -360,6 +656,134 @@ class SkillMatcher:
             },
         }
 
+    # ── Many roles per user ──────────────────────────────────────────────
+
+    def prepare_roles(self, roles: Sequence[Sequence[str]]) -> RoleSet:
+        """Normalise role requirement lists and precompute their vectors (do once, reuse)."""
+        requirements = [frozenset(s.lower().strip() for s in reqs) for reqs in roles]
+        postings: Dict[str, List[int]] = {}
+        for i, reqs in enumerate(requirements):
+            for skill in reqs:
+                postings.setdefault(skill, []).append(i)
+
+        for skill in postings:
+            self._skill_vector(skill)
+        vectors = None
+        if self._dim:
+            vectors = np.zeros((len(requirements), self._dim))
+            for skill, idx in postings.items():
+                vec = self._vector_cache.get(skill)
+                if vec is not None:
+                    vectors[idx] += vec
+        return RoleSet(
+            requirements=requirements,
+            counts=np.fromiter((len(r) for r in requirements), dtype=np.float64, count=len(requirements)),
+            postings={k: np.asarray(v, dtype=np.int64) for k, v in postings.items()},
+            vectors=vectors,
+        )
+
+    def score_many(self,
+                   user_skills: List[str],
+                   roles: Union[RoleSet, Sequence[Sequence[str]]],
+                   certifications: Optional[List[str]] = None,
+                   experience_years: float = 0.0) -> np.ndarray:
+        """
+        Overall match score of one user against every role, vectorised.
+        Element i equals ``score(user_skills, roles[i], ...)["overall_score"]``.
+        Pass a RoleSet from prepare_roles() to reuse role vectors across users.
+        """
+        if not isinstance(roles, RoleSet):
+            roles = self.prepare_roles(roles)
+        n = len(roles)
+        if n == 0:
+            return np.zeros(0)
+        user = sorted({s.lower().strip() for s in user_skills})
+        user_set = set(user)
+        denom = np.maximum(roles.counts, 1.0)
+
+        # 1. Exact match: one role mask per user skill
+        exact = np.stack([roles.column(s) for s in user], axis=1) if user else np.zeros((n, 0), dtype=bool)
+        exact_count = exact.sum(axis=1)
+        exact_score = exact_count / denom
+
+        # 2. Transferable credit where the source skill isn't required but the target is
+        transfer = np.zeros(n)
+        targets: Dict[str, np.ndarray] = {}
+        for j, skill in enumerate(user):
+            for mapping in self._transferable.get(skill.replace(" ", "_"), []):
+                target = mapping.get("skill", "").lower()
+                if target in user_set or target not in roles.postings:
+                    continue
+                credited = ~exact[:, j] & roles.column(target)
+                transfer += mapping.get("weight", 0.0) * credited
+                targets[target] = targets.get(target, np.zeros(n, dtype=bool)) | credited
+        transfer_score = np.minimum(transfer / denom, 1.0)
+
+        # 3. Certification bonus
+        cert = np.zeros(n)
+        for c in {c.lower().strip().replace(" ", "_") for c in certifications or []}:
+            for mapping in self._cert_mappings.get(c, []):
+                cert += mapping.get("credit", 0.0) * roles.column(mapping.get("skill", "").lower())
+        cert_score = np.minimum(cert / denom, 1.0)
+
+        # 4. Experience depth
+        exp_score = min(experience_years / 10.0, 1.0)
+
+        # 5. Semantic similarity of what is left unmatched on each side
+        semantic = np.zeros(n)
+        if roles.vectors is not None and user:
+            dim = roles.vectors.shape[1]
+            zero = np.zeros(dim)
+            user_vecs = np.stack([v if v is not None else zero for v in map(self._skill_vector, user)])
+            shared = exact @ user_vecs
+            user_left = user_vecs.sum(axis=0) - shared
+            req_left = roles.vectors - shared
+            credited = np.zeros(n)
+            for target, mask in targets.items():
+                vec = self._skill_vector(target)
+                if vec is not None:
+                    req_left -= np.outer(mask, vec)
+                credited += mask
+            user_norm = np.linalg.norm(user_left, axis=1)
+            req_norm = np.linalg.norm(req_left, axis=1)
+            # Subtracting vectors back out leaves rounding residue where score()
+            # would see an exactly-zero (all out-of-vocabulary) side
+            tol = 1e-9 * (np.linalg.norm(user_vecs) + np.linalg.norm(roles.vectors, axis=1) + 1.0)
+            valid = ((user_norm > tol) & (req_norm > tol)
+                     & (len(user) - exact_count > 0) & (roles.counts - exact_count - credited > 0))
+            cos = np.einsum("ij,ij->i", user_left, req_left)
+            semantic[valid] = np.maximum(cos[valid] / (user_norm[valid] * req_norm[valid]), 0.0)
+
+        overall = (
+            self._weights.get("exact_skill_match", 0.35) * exact_score
+            + self._weights.get("semantic_similarity", 0.25) * semantic
+            + self._weights.get("transferable_skills", 0.15) * transfer_score
+            + self._weights.get("certification_bonus", 0.10) * cert_score
+            + self._weights.get("experience_depth", 0.15) * exp_score
+        )
+        return np.round(overall, 3)
+
+    def rank_roles(self,
+                   user_skills: List[str],
+                   roles: Union[RoleSet, Sequence[Sequence[str]]],
+                   certifications: Optional[List[str]] = None,
+                   experience_years: float = 0.0,
+                   top_k: int = 10) -> List[Dict[str, Any]]:
+        """Best ``top_k`` roles for a user, each with its full score() breakdown and role_index."""
+        if not isinstance(roles, RoleSet):
+            roles = self.prepare_roles(roles)
+        scores = self.score_many(user_skills, roles, certifications, experience_years)
+        k = min(top_k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+        return [
+            {"role_index": int(i),
+             **self.score(user_skills, sorted(roles.requirements[i]), certifications, experience_years)}
+            for i in top
+        ]
+
 
 # ── Module-level singletons ─────────────────────────────────────────────
 career_rules = CareerRules()
@@ -0,0 +1,425 @@
+"""
+CareerTrojan — Indexed Ground-Truth Store
+==========================================
+Storage behind the AI gateway's ``GroundTruthTracker``: every prediction
+and every outcome is appended to a JSONL log (unchanged format), and a
+small SQLite index next to the logs makes them queryable without ever
+rescanning the logs.
+
+On disk (``ground_truth/``):
+    predictions.jsonl            append-only prediction log
+    outcomes.jsonl               append-only outcome log
+    ground_truth_index.sqlite    id → byte offset, joined outcomes, aggregates
+
+The index holds:
+    predictions   ground_truth_id → log offset, task type, day, confidence bucket
+    joined        (ground_truth_id, outcome_type) → latest outcome value
+    pending       outcomes that arrived before their prediction was indexed
+    stats         (task, outcome type, day, bucket) → counts, positives, Σconfidence
+    totals        (task, day) → predictions
+    log_offsets   bytes of each log already indexed
+
+Each outcome is joined to its prediction once, when it arrives, and folded
+into ``stats``; a later outcome of the same type replaces the earlier one.
+Accuracy-by-confidence and calibration error are sums over ``stats`` rows,
+so queries cost O(days × buckets), not O(records).  On open, any log bytes
+past the indexed offsets (pre-existing logs, another writer) are indexed.
+
+Usage:
+    from services.ai_engine.ground_truth_store import GroundTruthStore
+
+    store = GroundTruthStore(Path("ground_truth"))
+    store.append_prediction(record)           # record["ground_truth_id"], ["confidence"], ...
+    store.append_outcome({"ground_truth_id": gid, "outcome_type": "hired", "outcome_value": True})
+    store.get(gid)                            # LRU cache → index offset → one seek
+    store.feedback_stats(task_type="classify", days=30)
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONFIDENCE_BUCKETS = 10
+INDEX_FILE = "ground_truth_index.sqlite"
+
+_TRUE_WORDS = {"true", "yes", "y", "1", "pass", "passed", "accepted", "hired", "positive"}
+_FALSE_WORDS = {"false", "no", "n", "0", "fail", "failed", "rejected", "negative"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS predictions (
+    id TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    task_type TEXT NOT NULL,
+    day TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    confidence REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS joined (
+    id TEXT NOT NULL,
+    outcome_type TEXT NOT NULL,
+    value TEXT,
+    positive INTEGER,
+    PRIMARY KEY (id, outcome_type)
+);
+CREATE TABLE IF NOT EXISTS pending (
+    id TEXT NOT NULL,
+    outcome_type TEXT NOT NULL,
+    value TEXT,
+    positive INTEGER,
+    PRIMARY KEY (id, outcome_type)
+);
+CREATE TABLE IF NOT EXISTS stats (
+    task_type TEXT NOT NULL,
+    outcome_type TEXT NOT NULL,
+    day TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    outcomes INTEGER NOT NULL DEFAULT 0,
+    labelled INTEGER NOT NULL DEFAULT 0,
+    positives INTEGER NOT NULL DEFAULT 0,
+    confidence_sum REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (task_type, outcome_type, day, bucket)
+);
+CREATE TABLE IF NOT EXISTS totals (
+    task_type TEXT NOT NULL,
+    day TEXT NOT NULL,
+    predictions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (task_type, day)
+);
+CREATE TABLE IF NOT EXISTS log_offsets (
+    log TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+"""
+
+
+def parse_confidence(confidence: Any) -> float:
+    """Confidence as a float in [0, 1]; missing, non-numeric or NaN values read as 0."""
+    try:
+        c = float(confidence)
+    except (TypeError, ValueError):
+        return 0.0
+    if math.isnan(c):
+        return 0.0
+    return min(max(c, 0.0), 1.0)
+
+
+def confidence_bucket(confidence: Any) -> int:
+    """0 … CONFIDENCE_BUCKETS-1; confidence is clamped to [0, 1]."""
+    return min(int(parse_confidence(confidence) * CONFIDENCE_BUCKETS), CONFIDENCE_BUCKETS - 1)
+
+
+def bucket_label(bucket: int) -> str:
+    width = 1.0 / CONFIDENCE_BUCKETS
+    return f"{bucket * width:.1f}-{(bucket + 1) * width:.1f}"
+
+
+def is_positive(value: Any) -> Optional[bool]:
+    """
+    Binary reading of an outcome value: booleans, 0/1 and yes/no-style
+    strings.  Graded signals (ratings, scores) return None and are counted
+    as collected outcomes but left out of accuracy.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value) if value in (0, 1) else None
+    if isinstance(value, str):
+        word = value.strip().lower()
+        if word in _TRUE_WORDS:
+            return True
+        if word in _FALSE_WORDS:
+            return False
+    return None
+
+
+class GroundTruthStore:
+    """Append-only prediction/outcome logs with a persistent index and incremental join."""
+
+    def __init__(self, root: Path, cache_size: int = 10000):
+        self.root = Path(root)
+        self.predictions_file = self.root / "predictions.jsonl"
+        self.outcomes_file = self.root / "outcomes.jsonl"
+        self.index_file = self.root / INDEX_FILE
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # ── Index connection (opened on first use) ───────────────────────────
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            with self._lock:
+                if self._conn is None:
+                    self.root.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.index_file, check_same_thread=False)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    conn.executescript(_SCHEMA)
+                    self._conn = conn
+                    self.catch_up()
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── Writes ───────────────────────────────────────────────────────────
+
+    def append_prediction(self, record: Dict[str, Any]) -> None:
+        """Append a prediction to the log, index it and join any early outcomes."""
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        with self._lock:
+            conn = self.conn
+            offset = self._append(self.predictions_file, line)
+            with conn:
+                self._index_prediction(record, offset)
+                self._advance("predictions", offset, len(line))
+            self._cache_put(record["ground_truth_id"], record)
+
+    def append_outcome(self, record: Dict[str, Any]) -> None:
+        """Append an outcome to the log and fold it into the joined aggregates."""
+        line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+        with self._lock:
+            conn = self.conn
+            offset = self._append(self.outcomes_file, line)
+            with conn:
+                self._index_outcome(record)
+                self._advance("outcomes", offset, len(line))
+            cached = self._cache.get(record["ground_truth_id"])
+            if cached is not None:
+                cached["outcome"] = dict(cached.get("outcome") or {}, **{record["outcome_type"]: record["outcome_value"]})
+
+    @staticmethod
+    def _append(path: Path, line: bytes) -> int:
+        with open(path, "ab") as f:
+            offset = f.tell()
+            f.write(line)
+        return offset
+
+    # ── Index maintenance ────────────────────────────────────────────────
+
+    def _index_prediction(self, record: Dict[str, Any], offset: int) -> None:
+        gid = record["ground_truth_id"]
+        task = record.get("task_type") or "unknown"
+        day = str(record.get("timestamp") or datetime.now().isoformat())[:10]
+        confidence = record.get("calibrated_confidence")
+        if confidence is None:
+            confidence = record.get("confidence")
+        confidence = parse_confidence(confidence)
+        bucket = confidence_bucket(confidence)
+
+        cur = self.conn.execute(
+            "INSERT OR IGNORE INTO predictions (id, offset, task_type, day, bucket, confidence) VALUES (?, ?, ?, ?, ?, ?)",
+            (gid, offset, task, day, bucket, confidence),
+        )
+        if cur.rowcount == 0:
+            return  # already indexed (re-append of the same id keeps the first)
+        self.conn.execute(
+            "INSERT INTO totals (task_type, day, predictions) VALUES (?, ?, 1) "
+            "ON CONFLICT(task_type, day) DO UPDATE SET predictions = predictions + 1",
+            (task, day),
+        )
+        early = self.conn.execute(
+            "SELECT outcome_type, value, positive FROM pending WHERE id = ?", (gid,)
+        ).fetchall()
+        if early:
+            self.conn.execute("DELETE FROM pending WHERE id = ?", (gid,))
+            for outcome_type, value, positive in early:
+                self._join(gid, outcome_type, value, positive, (task, day, bucket, confidence))
+
+    def _index_outcome(self, record: Dict[str, Any]) -> None:
+        gid = record["ground_truth_id"]
+        outcome_type = record.get("outcome_type") or "unknown"
+        value = record.get("outcome_value")
+        positive = is_positive(value)
+        positive = None if positive is None else int(positive)
+        value_json = json.dumps(value, default=str)
+
+        row = self.conn.execute(
+            "SELECT task_type, day, bucket, confidence FROM predictions WHERE id = ?", (gid,)
+        ).fetchone()
+        if row is None:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pending (id, outcome_type, value, positive) VALUES (?, ?, ?, ?)",
+                (gid, outcome_type, value_json, positive),
+            )
+            return
+        self._join(gid, outcome_type, value_json, positive, row)
+
+    def _join(self, gid: str, outcome_type: str, value_json: str, positive: Optional[int],
+              prediction: Tuple[str, str, int, float]) -> None:
+        task, day, bucket, confidence = prediction
+        previous = self.conn.execute(
+            "SELECT positive FROM joined WHERE id = ? AND outcome_type = ?", (gid, outcome_type)
+        ).fetchone()
+        if previous is not None:
+            self._bump(task, outcome_type, day, bucket, confidence, previous[0], sign=-1)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO joined (id, outcome_type, value, positive) VALUES (?, ?, ?, ?)",
+            (gid, outcome_type, value_json, positive),
+        )
+        self._bump(task, outcome_type, day, bucket, confidence, positive, sign=1)
+
+    def _bump(self, task: str, outcome_type: str, day: str, bucket: int, confidence: float,
+              positive: Optional[int], sign: int) -> None:
+        labelled = 0 if positive is None else 1
+        self.conn.execute(
+            "INSERT INTO stats (task_type, outcome_type, day, bucket, outcomes, labelled, positives, confidence_sum) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(task_type, outcome_type, day, bucket) DO UPDATE SET "
+            "outcomes = outcomes + excluded.outcomes, labelled = labelled + excluded.labelled, "
+            "positives = positives + excluded.positives, confidence_sum = confidence_sum + excluded.confidence_sum",
+            (task, outcome_type, day, bucket, sign, sign * labelled,
+             sign * (positive or 0), sign * labelled * confidence),
+        )
+
+    def _get_offset(self, log: str) -> int:
+        row = self.conn.execute("SELECT offset FROM log_offsets WHERE log = ?", (log,)).fetchone()
+        return row[0] if row else 0
+
+    def _set_offset(self, log: str, offset: int) -> None:
+        self.conn.execute(
+            "INSERT INTO log_offsets (log, offset) VALUES (?, ?) "
+            "ON CONFLICT(log) DO UPDATE SET offset = excluded.offset",
+            (log, offset),
+        )
+
+    def _advance(self, log: str, offset: int, length: int) -> None:
+        """Move the indexed offset past our own append, unless another writer got in between."""
+        if self._get_offset(log) == offset:
+            self._set_offset(log, offset + length)
+
+    def catch_up(self) -> int:
+        """Index log bytes past the indexed offsets.  Returns records indexed."""
+        indexed = 0
+        with self._lock:
+            for log, path, index in (
+                ("predictions", self.predictions_file, self._index_prediction),
+                ("outcomes", self.outcomes_file, lambda rec, _offset: self._index_outcome(rec)),
+            ):
+                if not path.exists():
+                    continue
+                start = self._get_offset(log)
+                if path.stat().st_size <= start:
+                    continue
+                with self._conn, open(path, "rb") as f:
+                    f.seek(start)
+                    offset = start
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            break  # torn tail from a crashed writer; retried next time
+                        # One bad record must not stall the index: roll back its
+                        # partial writes, log it and move past it
+                        self._conn.execute("SAVEPOINT record")
+                        try:
+                            record = json.loads(line)
+                            if record.get("ground_truth_id"):
+                                index(record, offset)
+                                indexed += 1
+                        except Exception as e:
+                            self._conn.execute("ROLLBACK TO record")
+                            logger.warning("Skipping unindexable %s record at byte %d: %s", log, offset, e)
+                        self._conn.execute("RELEASE record")
+                        offset += len(line)
+                    self._set_offset(log, offset)
+        if indexed:
+            logger.info("Ground-truth index caught up on %d records", indexed)
+        return indexed
+
+    # ── Reads ────────────────────────────────────────────────────────────
+
+    def _cache_put(self, gid: str, record: Dict[str, Any]) -> None:
+        self._cache[gid] = record
+        self._cache.move_to_end(gid)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)  # least recently used
+
+    def get(self, gid: str) -> Optional[Dict[str, Any]]:
+        """Prediction by id: LRU cache, else one indexed seek into the log."""
+        with self._lock:
+            cached = self._cache.get(gid)
+            if cached is not None:
+                self._cache.move_to_end(gid)
+                return cached
+            row = self.conn.execute("SELECT offset FROM predictions WHERE id = ?", (gid,)).fetchone()
+            if row is None:
+                return None
+            with open(self.predictions_file, "rb") as f:
+                f.seek(row[0])
+                record = json.loads(f.readline())
+            outcomes = self.conn.execute(
+                "SELECT outcome_type, value FROM joined WHERE id = ?", (gid,)
+            ).fetchall()
+            if outcomes:
+                record["outcome"] = {t: json.loads(v) for t, v in outcomes}
+            self._cache_put(gid, record)
+            return record
+
+    def feedback_stats(self, task_type: Optional[str] = None, days: Optional[int] = 30,
+                       outcome_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Outcome-vs-confidence summary for predictions made in the last ``days``
+        (None = all time): positive rate per confidence bucket and expected
+        calibration error, read from the pre-joined aggregates.
+        """
+        where, params = [], []
+        if days is not None:
+            where.append("day >= ?")
+            params.append((datetime.now() - timedelta(days=days)).date().isoformat())
+        if task_type:
+            where.append("task_type = ?")
+            params.append(task_type)
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+
+        with self._lock:
+            total = self.conn.execute(f"SELECT COALESCE(SUM(predictions), 0) FROM totals{clause}", params).fetchone()[0]
+            stat_where, stat_params = list(where), list(params)
+            if outcome_type:
+                stat_where.append("outcome_type = ?")
+                stat_params.append(outcome_type)
+            stat_clause = f" WHERE {' AND '.join(stat_where)}" if stat_where else ""
+            rows = self.conn.execute(
+                "SELECT bucket, SUM(outcomes), SUM(labelled), SUM(positives), SUM(confidence_sum) "
+                f"FROM stats{stat_clause} GROUP BY bucket ORDER BY bucket",
+                stat_params,
+            ).fetchall()
+
+        collected = sum(r[1] for r in rows)
+        labelled_total = sum(r[2] for r in rows)
+        by_bucket: Dict[str, Dict[str, Any]] = {}
+        calibration_error = 0.0
+        for bucket, outcomes, labelled, positives, conf_sum in rows:
+            if outcomes <= 0:
+                continue
+            entry: Dict[str, Any] = {"outcomes": outcomes, "labelled": labelled, "positives": positives}
+            if labelled > 0:
+                accuracy = positives / labelled
+                mean_conf = conf_sum / labelled
+                entry.update(accuracy=round(accuracy, 4), mean_confidence=round(mean_conf, 4))
+                calibration_error += labelled / labelled_total * abs(mean_conf - accuracy)
+            by_bucket[bucket_label(bucket)] = entry
+
+        return {
+            "total_predictions": int(total),
+            "outcomes_collected": int(collected),
+            "labelled_outcomes": int(labelled_total),
+            "accuracy_by_confidence": by_bucket,
+            "calibration_error": round(calibration_error, 4),
+        }
@@ -0,0 +1,356 @@
+"""
+CareerTrojan — Incremental Training Support
+============================================
+Lets the nightly retrain do work proportional to what changed instead of
+rebuilding every model from scratch:
+
+  * **Input fingerprints** — each model's input rows are hashed (only the
+    columns that model reads).  The set of row hashes is stored per model,
+    so the next run can tell unchanged / appended / edited-or-removed data
+    apart without keeping the rows themselves.
+  * **Training plans** — per model: ``skip`` (inputs unchanged, artifacts
+    present), ``update`` (only appended rows, warm-start/partial-fit from
+    the previous artifacts) or ``full`` (first run, rows removed or edited,
+    or too much drift accumulated since the last full fit).
+  * **Content-addressed backups** — ``ModelBackups`` stores each distinct
+    file once under ``blobs/`` keyed by sha256; a backup is a small JSON
+    manifest of path → digest.  Unchanged models cost nothing to back up.
+
+On disk (inside the models directory):
+    training_manifest.json        per-model fingerprint, row count, mode, source
+    training_rows/{model}.npy     sorted uint64 row hashes of the last fit
+
+Usage:
+    from services.ai_engine.incremental_training import (
+        TrainingManifest, ModelBackups, row_hashes, source_fingerprint,
+    )
+
+    manifest = TrainingManifest(models_dir)
+    hashes = row_hashes(df, MODEL_INPUTS["bayesian_classifier"])
+    plan = manifest.plan("bayesian_classifier", hashes)
+    if plan.action == "update":
+        ...  # partial_fit on df[plan.new_rows]
+    manifest.record("bayesian_classifier", hashes, plan.action, source=source_fingerprint(data_dir))
+
+    ModelBackups(backup_root).snapshot(models_dir)
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Columns of the load_cv_data() frame each model actually reads
+MODEL_INPUTS: Dict[str, Sequence[str]] = {
+    "bayesian_classifier": ("text", "job_title"),
+    "statistical_models": ("text", "skills", "experience_years", "education", "salary"),
+}
+
+# Pretrained models have no training rows; their "input" is the model they load
+PRETRAINED_MODELS: Dict[str, str] = {
+    "sentence_embeddings": "all-MiniLM-L6-v2",
+    "spacy_ner": "en_core_web_sm",
+}
+
+# Files a model leaves in the trainer's models_dir; skipping needs them all
+MODEL_ARTIFACTS: Dict[str, Sequence[str]] = {
+    "bayesian_classifier": ("bayesian_classifier.pkl", "tfidf_vectorizer.pkl"),
+    "sentence_embeddings": ("sentence_bert_info.json",),
+    "spacy_ner": ("spacy_model_info.json",),
+    "statistical_models": ("salary_predictor.pkl",),
+}
+
+# Rows appended since the last full fit, as a share of all rows, beyond which
+# incremental updates give way to a full refit (vocabulary drift, tree growth)
+FULL_RETRAIN_FRACTION = 0.25
+
+MANIFEST_FILE = "training_manifest.json"
+ROWS_DIR = "training_rows"
+
+
+# ============================================================================
+# FINGERPRINTS
+# ============================================================================
+
+def row_hashes(df, columns: Sequence[str]) -> np.ndarray:
+    """64-bit content hash of each row, over ``columns`` only (missing columns hash as null)."""
+    out = np.empty(len(df), dtype=np.uint64)
+    for i, row in enumerate(df.reindex(columns=list(columns)).itertuples(index=False, name=None)):
+        blob = json.dumps(row, default=str, ensure_ascii=False).encode("utf-8")
+        out[i] = int.from_bytes(hashlib.blake2b(blob, digest_size=8).digest(), "little")
+    return out
+
+
+def key_hashes(*values: Any) -> np.ndarray:
+    """Row hashes for models whose only "input" is configuration (e.g. a pretrained model name)."""
+    blob = json.dumps(values, default=str).encode("utf-8")
+    return np.array([int.from_bytes(hashlib.blake2b(blob, digest_size=8).digest(), "little")], dtype=np.uint64)
+
+
+def fingerprint(hashes: np.ndarray) -> str:
+    """Order-independent digest of a set of row hashes (duplicates count)."""
+    return hashlib.sha256(np.sort(np.asarray(hashes, dtype=np.uint64)).tobytes()).hexdigest()
+
+
+def source_fingerprint(data_dir: Path) -> str:
+    """
+    Cheap stat-based digest of the files ``load_cv_data`` reads.
+
+    Lets a run with untouched sources skip loading (and hashing) the data
+    altogether; any size or mtime change falls through to row-level diffing.
+    """
+    data_dir = Path(data_dir)
+    h = hashlib.sha256()
+    candidates: List[Path] = [data_dir / "core_databases" / "Candidate_database_merged.json",
+                              data_dir / "core_databases" / "Candidates_database.json"]
+    normalized = data_dir / "normalized"
+    if normalized.is_dir():
+        candidates.extend(sorted(normalized.glob("*.json")))
+    candidates.extend(sorted(data_dir.glob("doc_profile_*.json")))
+    for path in candidates:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        h.update(f"{path.relative_to(data_dir).as_posix()}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+# ============================================================================
+# TRAINING MANIFEST
+# ============================================================================
+
+@dataclass
+class TrainingPlan:
+    """What the orchestrator should do for one model this run."""
+    model: str
+    action: str                               # "skip" | "update" | "full"
+    reason: str
+    new_rows: Optional[np.ndarray] = None     # bool mask over the current rows (update only)
+    new_share: float = 0.0                    # appended rows / all rows (update only)
+
+    @property
+    def n_new(self) -> int:
+        return int(self.new_rows.sum()) if self.new_rows is not None else 0
+
+
+class TrainingManifest:
+    """Per-model record of the inputs each artifact was last fitted on."""
+
+    def __init__(self, models_dir: Path, full_retrain_fraction: float = FULL_RETRAIN_FRACTION):
+        self.models_dir = Path(models_dir)
+        self.path = self.models_dir / MANIFEST_FILE
+        self.rows_dir = self.models_dir / ROWS_DIR
+        self.full_retrain_fraction = full_retrain_fraction
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding="utf-8")).get("models", {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning("Ignoring unreadable training manifest %s: %s", self.path, e)
+
+    def artifacts_present(self, model: str) -> bool:
+        return all((self.models_dir / name).exists() for name in MODEL_ARTIFACTS.get(model, ()))
+
+    def _rows_path(self, model: str) -> Path:
+        return self.rows_dir / f"{model}.npy"
+
+    def previous_rows(self, model: str) -> Optional[np.ndarray]:
+        path = self._rows_path(model)
+        if not path.exists():
+            return None
+        return np.load(path)
+
+    def is_current(self, model: str, source: str) -> bool:
+        """True if ``model`` was last fitted on exactly this source snapshot and its files are intact."""
+        entry = self.entries.get(model)
+        return bool(entry) and entry.get("source") == source and self.artifacts_present(model)
+
+    def plan(self, model: str, hashes: np.ndarray, force_full: bool = False) -> TrainingPlan:
+        """Decide skip / update / full for ``model`` given its current row hashes."""
+        entry = self.entries.get(model)
+        if force_full:
+            return TrainingPlan(model, "full", "full retrain requested")
+        if not entry:
+            return TrainingPlan(model, "full", "no previous fit recorded")
+        if not self.artifacts_present(model):
+            return TrainingPlan(model, "full", "previous artifacts missing")
+        if entry.get("fingerprint") == fingerprint(hashes):
+            return TrainingPlan(model, "skip", "inputs unchanged")
+
+        previous = self.previous_rows(model)
+        if previous is None:
+            return TrainingPlan(model, "full", "previous row hashes missing")
+        new_rows = ~np.isin(hashes, previous)
+        kept = len(hashes) - int(new_rows.sum())
+        if kept < len(previous):
+            return TrainingPlan(model, "full", f"{len(previous) - kept} rows removed or edited")
+
+        n_new = int(new_rows.sum())
+        since_full = int(entry.get("rows_since_full", 0)) + n_new
+        if since_full > self.full_retrain_fraction * len(hashes):
+            return TrainingPlan(model, "full", f"{since_full} rows appended since last full fit")
+        return TrainingPlan(model, "update", f"{n_new} new rows", new_rows=new_rows,
+                            new_share=n_new / max(len(hashes), 1))
+
+    def record(self, model: str, hashes: np.ndarray, action: str, source: Optional[str] = None) -> None:
+        """Remember what ``model`` was just fitted on (``action`` is the plan that ran)."""
+        hashes = np.sort(np.asarray(hashes, dtype=np.uint64))
+        previous = self.entries.get(model, {})
+        since_full = 0
+        if action == "update":
+            since_full = int(previous.get("rows_since_full", 0)) + len(hashes) - int(previous.get("rows", 0))
+        self.rows_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self._rows_path(model).with_suffix(".tmp.npy")
+        np.save(tmp, hashes)
+        os.replace(tmp, self._rows_path(model))
+        self.entries[model] = {
+            "fingerprint": fingerprint(hashes),
+            "rows": int(len(hashes)),
+            "rows_since_full": since_full,
+            "mode": action,
+            "source": source,
+            "trained_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self.save()
+
+    def mark_source(self, model: str, source: str) -> None:
+        """A skipped model is still current for the new source snapshot."""
+        if model in self.entries:
+            self.entries[model]["source"] = source
+            self.save()
+
+    def save(self) -> None:
+        self.models_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"models": self.entries}, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# ============================================================================
+# CONTENT-ADDRESSED BACKUPS
+# ============================================================================
+
+def _sha256_file(path: Path, chunk: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ModelBackups:
+    """
+    Deduplicated snapshots of a models directory.
+
+    backup_root/
+        blobs/{aa}/{sha256}              each distinct file content, stored once
+        manifests/models_backup_{stamp}.json   relpath → {sha256, size}
+        hash_index.json                  (path, size, mtime) → sha256 cache
+
+    Blobs are copies, not hard links: trainers rewrite model files in place,
+    which would silently change a linked backup.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.blobs = self.root / "blobs"
+        self.manifests = self.root / "manifests"
+        self._index_path = self.root / "hash_index.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs / digest[:2] / digest
+
+    def _load_index(self) -> Dict[str, List[Any]]:
+        try:
+            return json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def snapshot(self, src: Path, excludes: Iterable[str] = (ROWS_DIR,)) -> Optional[Dict[str, Any]]:
+        """
+        Back up ``src``; returns ``{"manifest", "files", "new_blobs", "bytes_written"}``
+        (None if ``src`` does not exist).  Only content not already stored is copied.
+        """
+        src = Path(src)
+        if not src.exists():
+            return None
+        excludes = set(excludes)
+        index = self._load_index()
+        files: Dict[str, Dict[str, Any]] = {}
+        new_blobs = 0
+        bytes_written = 0
+
+        for path in sorted(p for p in src.rglob("*") if p.is_file()):
+            rel = path.relative_to(src).as_posix()
+            if rel.split("/", 1)[0] in excludes:
+                continue
+            st = path.stat()
+            key = str(path.resolve())
+            cached = index.get(key)
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                digest = cached[2]
+            else:
+                digest = _sha256_file(path)
+                index[key] = [st.st_size, st.st_mtime_ns, digest]
+            blob = self._blob_path(digest)
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                tmp = blob.with_suffix(".tmp")
+                shutil.copyfile(path, tmp)
+                os.replace(tmp, blob)
+                new_blobs += 1
+                bytes_written += st.st_size
+            files[rel] = {"sha256": digest, "size": st.st_size}
+
+        self.manifests.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        manifest = self.manifests / f"models_backup_{stamp}.json"
+        manifest.write_text(json.dumps({"source": str(src), "created_at": stamp, "files": files}, indent=2),
+                            encoding="utf-8")
+        self._index_path.write_text(json.dumps(index), encoding="utf-8")
+        return {"manifest": manifest, "files": len(files), "new_blobs": new_blobs, "bytes_written": bytes_written}
+
+    def list_backups(self) -> List[Path]:
+        return sorted(self.manifests.glob("models_backup_*.json")) if self.manifests.exists() else []
+
+    def restore(self, manifest: Path, dest: Path) -> int:
+        """Materialise a backup into ``dest``.  Returns files written."""
+        files = json.loads(Path(manifest).read_text(encoding="utf-8"))["files"]
+        dest = Path(dest)
+        for rel, info in files.items():
+            target = dest / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._blob_path(info["sha256"]), target)
+        return len(files)
+
+    def prune(self, keep: int) -> int:
+        """Keep the newest ``keep`` backups and delete blobs no longer referenced.  Returns blobs removed."""
+        backups = self.list_backups()
+        for old in backups[:max(len(backups) - keep, 0)]:
+            old.unlink()
+        referenced = set()
+        for manifest in self.list_backups():
+            files = json.loads(manifest.read_text(encoding="utf-8"))["files"]
+            referenced.update(info["sha256"] for info in files.values())
+        removed = 0
+        if self.blobs.exists():
+            for blob in self.blobs.glob("*/*"):
+                if blob.name not in referenced:
+                    blob.unlink()
+                    removed += 1
+        return removed
@@ -0,0 +1,521 @@
+"""
+CareerTrojan — Materialized Insight Views
+==========================================
+
+Precomputed aggregates over the FULL profile corpus for the insights
+router (radar cohort averages, word cloud, skill co-occurrence, cohort
+resolve). ``DataLoader`` keeps a random 500-profile sample and every
+insight request re-walks it; this view is built once in a background
+thread and then refreshed incrementally as new parsed resumes land.
+
+Held in memory:
+    - term frequencies (raw and per-profile document frequency)
+    - sparse skill co-occurrence matrix (dict-of-keys, symmetric)
+    - per-(industry, seniority) aggregates: count, score/experience sums,
+      and per-axis keyword-hit histograms for each registered radar
+    - sparse skill postings (row-id sets), plus NumPy columns for liveness,
+      industry / seniority codes and the numeric filters
+
+Incremental refresh:
+    Each source directory is re-scanned only when its mtime changes (plus
+    a periodic full sweep for in-place rewrites). New or modified files
+    are folded in; deleted files are subtracted.
+
+Usage:
+    from services.ai_engine.insight_views import start_insight_view, get_insight_view
+
+    start_insight_view(axis_maps={"leadership": LEADERSHIP_KEYWORDS})
+    view = get_insight_view()
+    if view is not None and view.ready:
+        view.top_terms(100)
+        view.cooccurrence("python", limit=30)
+        view.resolve_cohort({"industry": "Technology", "skills": ["sql"]})
+"""
+
+import heapq
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from services.ai_engine.data_loader import PROFILE_SOURCES, load_profile_file
+
+logger = logging.getLogger("InsightViews")
+
+# Radar scoring in routers/insights: min(100, hits * 18 + randint(8, 35)).
+# Cohort averages use the expectation over the random jitter so that the
+# aggregate can be kept as a histogram of hit counts per axis.
+_HIT_WEIGHT = 18
+_JITTER = range(8, 36)
+
+# Profile fields get_profile() serves (the radar scores skills + role); the
+# rest of each profile is folded into the aggregates and not kept per row
+_SERVED_FIELDS = ("id", "role", "skills")
+
+
+def expected_axis_score(hits: int) -> float:
+    """Expected radar axis score for a profile with ``hits`` keyword hits."""
+    return sum(min(100, hits * _HIT_WEIGHT + j) for j in _JITTER) / len(_JITTER)
+
+
+def _norm(value: Any) -> str:
+    return str(value or "").lower().strip()
+
+
+class _Group:
+    """Aggregates for one (industry, seniority) cell."""
+
+    __slots__ = ("count", "match_sum", "exp_sum", "axis_hits")
+
+    def __init__(self):
+        self.count = 0
+        self.match_sum = 0.0
+        self.exp_sum = 0.0
+        # radar name -> per-axis {hits: profile count}
+        self.axis_hits: Dict[str, List[Dict[int, int]]] = {}
+
+
+class InsightView:
+    """
+    Incrementally maintained, in-memory materialized view over all profiles.
+
+    Thread-safe: mutations and reads share a single lock; reads only touch
+    precomputed structures, so they return in milliseconds.
+    """
+
+    # Full re-stat of every file once every N refresh cycles, to catch
+    # in-place rewrites that don't touch the directory mtime.
+    FULL_SWEEP_EVERY = 12
+
+    def __init__(
+        self,
+        axis_maps: Optional[Dict[str, Dict[str, Sequence[str]]]] = None,
+        sources: Optional[Sequence[Tuple[str, Path]]] = None,
+    ):
+        self.axis_maps = dict(axis_maps or {})
+        self.sources = list(sources) if sources is not None else list(PROFILE_SOURCES)
+
+        self._lock = threading.RLock()
+        self._version = 0
+        self._memo: Dict[Tuple[Any, ...], Tuple[int, Any]] = {}
+
+        # Row storage
+        self._rows: List[Optional[Dict[str, Any]]] = []
+        self._row_of_key: Dict[str, int] = {}
+        self._row_of_id: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        self._match = np.zeros(1024, dtype=np.float64)
+        self._exp = np.zeros(1024, dtype=np.float64)
+        self._alive = np.zeros(1024, dtype=bool)
+        self._industry_col = np.zeros(1024, dtype=np.int32)
+        self._seniority_col = np.zeros(1024, dtype=np.int32)
+
+        # File tracking: path -> mtime_ns (files are keyed by path)
+        self._files: Dict[str, int] = {}
+        self._dir_mtimes: Dict[str, int] = {}
+        self._cycles = 0
+
+        # Aggregates
+        self._term_freq: Dict[str, int] = {}
+        self._doc_freq: Dict[str, int] = {}
+        self._cooc: Dict[str, Dict[str, int]] = {}
+        self._groups: Dict[Tuple[str, str], _Group] = {}
+        self._display: Dict[str, str] = {}
+
+        # Skill postings: normalized skill -> set of row ids
+        self._by_skill: Dict[str, Set[int]] = {}
+        # normalized industry / seniority -> code in the per-row code columns
+        self._industry_codes: Dict[str, int] = {}
+        self._seniority_codes: Dict[str, int] = {}
+
+        self.ready = False
+        self.last_refresh: Optional[float] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ── Row bookkeeping ──────────────────────────────────────────────────
+
+    def _alloc_row(self) -> int:
+        if self._free_rows:
+            return self._free_rows.pop()
+        row = len(self._rows)
+        self._rows.append(None)
+        if row >= len(self._match):
+            size = len(self._match) * 2
+            self._match = np.resize(self._match, size)
+            self._exp = np.resize(self._exp, size)
+            alive = np.zeros(size, dtype=bool)
+            alive[:row] = self._alive[:row]
+            self._alive = alive
+            self._industry_col = np.resize(self._industry_col, size)
+            self._seniority_col = np.resize(self._seniority_col, size)
+        return row
+
+    @staticmethod
+    def _post(index: Dict[str, Set[int]], key: str, row: int) -> None:
+        index.setdefault(key, set()).add(row)
+
+    @staticmethod
+    def _unpost(index: Dict[str, Set[int]], key: str, row: int) -> None:
+        rows = index.get(key)
+        if rows is not None:
+            rows.discard(row)
+            if not rows:
+                del index[key]
+
+    @staticmethod
+    def _code(codes: Dict[str, int], key: str) -> int:
+        return codes.setdefault(key, len(codes))
+
+    def _axis_hits(self, blob: str) -> Dict[str, List[int]]:
+        return {
+            name: [sum(1 for kw in keywords if kw in blob) for keywords in axes.values()]
+            for name, axes in self.axis_maps.items()
+        }
+
+    # ── Incremental maintenance ──────────────────────────────────────────
+
+    def add_profile(self, profile: Dict[str, Any], key: Optional[str] = None) -> None:
+        """
+        Fold a normalised profile (DataLoader format) into the view.
+
+        ``key`` identifies the record for later replacement/removal (the
+        source file path when fed from disk); defaults to the profile id.
+        """
+        with self._lock:
+            pid = str(profile["id"])
+            key = key or pid
+            if key in self._row_of_key:
+                self.remove_profile(key)
+
+            raw_skills = [_norm(s) for s in profile.get("skills", []) if _norm(s)]
+            skills = sorted(set(raw_skills))
+            industry = _norm(profile.get("industry", "Unknown"))
+            seniority = _norm(profile.get("seniority", "Unknown"))
+            blob = " ".join(profile.get("skills", [])).lower() + " " + profile.get("role", "").lower()
+
+            row = self._alloc_row()
+            rec = {
+                "key": key,
+                "id": pid,
+                "skills": skills,
+                "raw_skills": raw_skills,
+                "industry": industry,
+                "seniority": seniority,
+                "hits": self._axis_hits(blob),
+                "served": {f: profile[f] for f in _SERVED_FIELDS if f in profile},
+            }
+            self._rows[row] = rec
+            self._row_of_key[key] = row
+            self._row_of_id[pid] = row
+            self._match[row] = float(profile.get("match_score", 0) or 0)
+            self._exp[row] = float(profile.get("experience_years", 0) or 0)
+            self._alive[row] = True
+            self._industry_col[row] = self._code(self._industry_codes, industry)
+            self._seniority_col[row] = self._code(self._seniority_codes, seniority)
+
+            self._display.setdefault(industry, profile.get("industry", "Unknown"))
+            self._display.setdefault(seniority, profile.get("seniority", "Unknown"))
+
+            for s in raw_skills:
+                self._term_freq[s] = self._term_freq.get(s, 0) + 1
+            for i, a in enumerate(skills):
+                self._doc_freq[a] = self._doc_freq.get(a, 0) + 1
+                self._post(self._by_skill, a, row)
+                row_a = self._cooc.setdefault(a, {})
+                for b in skills[i + 1:]:
+                    row_a[b] = row_a.get(b, 0) + 1
+                    row_b = self._cooc.setdefault(b, {})
+                    row_b[a] = row_b.get(a, 0) + 1
+
+            group = self._groups.setdefault((industry, seniority), _Group())
+            group.count += 1
+            group.match_sum += self._match[row]
+            group.exp_sum += self._exp[row]
+            for name, hits in rec["hits"].items():
+                hists = group.axis_hits.setdefault(name, [{} for _ in hits])
+                for hist, h in zip(hists, hits):
+                    hist[h] = hist.get(h, 0) + 1
+
+            self._version += 1
+
+    def remove_profile(self, key: str) -> bool:
+        """Subtract a record's contribution from every aggregate."""
+        with self._lock:
+            row = self._row_of_key.pop(str(key), None)
+            if row is None:
+                return False
+            rec = self._rows[row]
+            if self._row_of_id.get(rec["id"]) == row:
+                del self._row_of_id[rec["id"]]
+            self._rows[row] = None
+            self._free_rows.append(row)
+            self._alive[row] = False
+
+            for s in rec["raw_skills"]:
+                self._decrement(self._term_freq, s)
+            skills = rec["skills"]
+            for i, a in enumerate(skills):
+                self._decrement(self._doc_freq, a)
+                self._unpost(self._by_skill, a, row)
+                for b in skills[i + 1:]:
+                    self._decrement(self._cooc[a], b)
+                    self._decrement(self._cooc[b], a)
+            for s in skills:
+                if not self._cooc.get(s):
+                    self._cooc.pop(s, None)
+
+            key = (rec["industry"], rec["seniority"])
+            group = self._groups[key]
+            group.count -= 1
+            group.match_sum -= self._match[row]
+            group.exp_sum -= self._exp[row]
+            for name, hits in rec["hits"].items():
+                for hist, h in zip(group.axis_hits[name], hits):
+                    self._decrement(hist, h)
+            if group.count == 0:
+                del self._groups[key]
+
+            self._version += 1
+            return True
+
+    @staticmethod
+    def _decrement(counter: Dict[Any, int], key: Any) -> None:
+        n = counter.get(key, 0) - 1
+        if n > 0:
+            counter[key] = n
+        else:
+            counter.pop(key, None)
+
+    def _ingest_file(self, path: str, source_name: str, mtime_ns: int) -> None:
+        if self._files.get(path) == mtime_ns:
+            return
+        profile = load_profile_file(Path(path), source_name)
+        with self._lock:
+            self._files[path] = mtime_ns
+            if profile is not None:
+                self.add_profile(profile, key=path)
+            else:
+                self.remove_profile(path)
+
+    def refresh(self, full: bool = False) -> Dict[str, int]:
+        """
+        Fold new/changed/deleted profile files into the view.
+
+        Directories whose mtime has not changed are skipped unless ``full``.
+        Returns counts of files seen and changes applied.
+        """
+        before = self._version
+        seen_dirs = 0
+        for source_name, source_dir in self.sources:
+            try:
+                dir_mtime = source_dir.stat().st_mtime_ns
+            except OSError:
+                continue
+            key = str(source_dir)
+            if not full and self._dir_mtimes.get(key) == dir_mtime:
+                continue
+            seen_dirs += 1
+
+            present = set()
+            with os.scandir(source_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json") or not entry.is_file():
+                        continue
+                    present.add(entry.path)
+                    try:
+                        self._ingest_file(entry.path, source_name, entry.stat().st_mtime_ns)
+                    except Exception as e:
+                        logger.debug("Insight view skipped %s: %s", entry.path, e)
+
+            prefix = os.path.join(key, "")
+            for path in [p for p in self._files if p.startswith(prefix) and p not in present]:
+                with self._lock:
+                    del self._files[path]
+                    self.remove_profile(path)
+            self._dir_mtimes[key] = dir_mtime
+
+        self.ready = True
+        self.last_refresh = time.time()
+        return {"dirs_scanned": seen_dirs, "changes": self._version - before, "profiles": len(self._row_of_key)}
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def _memoized(self, key: Tuple[Any, ...], compute):
+        """Cache a derived result until the next mutation."""
+        hit = self._memo.get(key)
+        if hit and hit[0] == self._version:
+            return hit[1]
+        value = compute()
+        self._memo[key] = (self._version, value)
+        return value
+
+    def profile_count(self) -> int:
+        return len(self._row_of_key)
+
+    def get_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """The profile's served fields (id, role, skills), or None."""
+        with self._lock:
+            row = self._row_of_id.get(str(profile_id))
+            return dict(self._rows[row]["served"]) if row is not None else None
+
+    def term_frequencies(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._term_freq)
+
+    def top_terms(self, limit: int = 100) -> List[Tuple[str, int]]:
+        with self._lock:
+            return self._memoized(
+                ("top_terms", limit),
+                lambda: heapq.nlargest(limit, self._term_freq.items(), key=lambda kv: kv[1]),
+            )
+
+    def doc_frequency(self, term: str) -> int:
+        return self._doc_freq.get(_norm(term), 0)
+
+    def cooccurrence(self, term: Optional[str] = None, limit: int = 30) -> List[Tuple[str, str, int]]:
+        """Top co-occurring pairs, globally or for one term: (a, b, count)."""
+        with self._lock:
+            if term:
+                t = _norm(term)
+                partners = heapq.nlargest(limit, self._cooc.get(t, {}).items(), key=lambda kv: kv[1])
+                return [(t, b, n) for b, n in partners]
+
+            def global_top():
+                pairs = ((a, b, n) for a, row in self._cooc.items() for b, n in row.items() if a < b)
+                return heapq.nlargest(limit, pairs, key=lambda p: p[2])
+
+            return self._memoized(("cooc", limit), global_top)
+
+    def axis_averages(self, name: str, groups: Optional[Sequence[Tuple[str, str]]] = None) -> List[float]:
+        """Cohort-average radar scores for a registered axis map."""
+        with self._lock:
+            n_axes = len(self.axis_maps.get(name, {}))
+            keys = list(self._groups) if groups is None else [g for g in groups if g in self._groups]
+            total = sum(self._groups[k].count for k in keys)
+            sums = [0.0] * n_axes
+            for k in keys:
+                for i, hist in enumerate(self._groups[k].axis_hits.get(name, [])):
+                    sums[i] += sum(expected_axis_score(h) * c for h, c in hist.items())
+            return [round(s / max(total, 1), 1) for s in sums]
+
+    @staticmethod
+    def _labels(codes: Dict[str, int], column: np.ndarray) -> List[str]:
+        keys = list(codes)
+        return [keys[c] for c in np.unique(column).tolist()]
+
+    def resolve_cohort(self, filters: Dict[str, Any], max_ids: int = 50) -> Dict[str, Any]:
+        """
+        Resolve a cohort with the same filter semantics as routers/insights.
+
+        Skill filters union the skills' posting sets; industry, seniority and
+        numeric filters are vectorised over the code / score / experience
+        columns of the surviving rows.
+        """
+        with self._lock:
+            if "skills" in filters and isinstance(filters["skills"], list):
+                candidates: Set[int] = set()
+                for s in {_norm(s) for s in filters["skills"]}:
+                    candidates |= self._by_skill.get(s, set())
+                rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+                rows.sort()
+            else:
+                rows = np.flatnonzero(self._alive[:len(self._rows)])
+
+            for field, codes, column in (("industry", self._industry_codes, self._industry_col),
+                                         ("seniority", self._seniority_codes, self._seniority_col)):
+                if field in filters:
+                    code = codes.get(_norm(filters[field]), -1)
+                    rows = rows[column[rows] == code]
+            if "min_experience" in filters:
+                rows = rows[self._exp[rows] >= filters["min_experience"]]
+            if "max_experience" in filters:
+                rows = rows[self._exp[rows] <= filters["max_experience"]]
+            if "match_score_min" in filters:
+                rows = rows[self._match[rows] >= filters["match_score_min"]]
+
+            count = len(rows)
+            industries = self._labels(self._industry_codes, self._industry_col[rows])
+            seniorities = self._labels(self._seniority_codes, self._seniority_col[rows])
+            return {
+                "count": count,
+                "avg_match_score": round(float(self._match[rows].sum()) / max(count, 1), 1),
+                "avg_experience_years": round(float(self._exp[rows].sum()) / max(count, 1), 1),
+                "industries": [self._display.get(k, k) for k in industries],
+                "seniorities": [self._display.get(k, k) for k in seniorities],
+                "profile_ids": [self._rows[r]["id"] for r in rows[:max_ids].tolist()],
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "profiles": len(self._row_of_key),
+                "terms": len(self._term_freq),
+                "cooccurrence_nnz": sum(len(r) for r in self._cooc.values()) // 2,
+                "groups": len(self._groups),
+                "version": self._version,
+                "last_refresh": self.last_refresh,
+            }
+
+    # ── Background loop ──────────────────────────────────────────────────
+
+    def _loop(self, interval: int) -> None:
+        logger.info("Insight view build started over %s", ", ".join(s[0] for s in self.sources))
+        while self._running:
+            try:
+                full = self._cycles % self.FULL_SWEEP_EVERY == 0
+                stats = self.refresh(full=full)
+                self._cycles += 1
+                if stats["changes"]:
+                    logger.info("Insight view refreshed: %s", stats)
+            except Exception as e:
+                logger.error("Insight view refresh error: %s", e)
+            time.sleep(interval)
+
+    def start(self, interval_seconds: int = 60) -> None:
+        """Build the view and keep refreshing it in a background daemon thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._loop, args=(interval_seconds,), daemon=True, name="insight-view",
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
+
+
+# ── Module-level singleton ───────────────────────────────────────────────
+_view: Optional[InsightView] = None
+
+
+def start_insight_view(
+    axis_maps: Optional[Dict[str, Dict[str, Sequence[str]]]] = None,
+    interval_seconds: int = 60,
+) -> InsightView:
+    """Start the background-built view. Safe to call multiple times."""
+    global _view
+    if _view is None:
+        _view = InsightView(axis_maps=axis_maps)
+        _view.start(interval_seconds)
+    return _view
+
+
+def get_insight_view() -> Optional[InsightView]:
+    """The running view, or None if it was never started."""
+    return _view
+
+
+def stop_insight_view() -> None:
+    global _view
+    if _view:
+        _view.stop()
+        _view = None
@@ -11,22 +11,45 @@ All code should call:
     response = llm_gateway.generate("prompt here", provider="anthropic")
     response = llm_gateway.generate("prompt here", provider="perplexity")
 
+Async callers (FastAPI handlers, batch jobs) should await the native path:
+    response = await llm_gateway.agenerate("prompt here")
+    response = await llm_gateway.agenerate("prompt here", temperature=0)      # cacheable
+    response = await llm_gateway.agenerate("prompt here", hedge_after_ms=800)  # hedged
+
 Features:
     - Reads all model names from config/models.yaml (zero hardcoding)
     - Provider fallback chain if primary fails
     - Unified response format across all providers
     - Health checks per provider
     - Hot-reloadable config
+    - Pooled connections per provider (sync and async)
+    - In-flight coalescing of identical deterministic (temperature 0) async requests
+    - Content-addressed response cache for deterministic (temperature 0) calls
+    - Optional hedged request to the next provider after a latency threshold
 """
 
+import asyncio
+from abc import ABC, abstractmethod
+import dataclasses
+import hashlib
 import os
 import json
 import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
 import requests
+import requests.adapters
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 from datetime import datetime
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - async path falls back to threads
+    httpx = None
+
 from services.shared.circuit_breaker import get_circuit_registry, CircuitOpenError
 
 logger = logging.getLogger(__name__)
@@ -45,6 +68,7 @@ class LLMResponse:
     error: Optional[str] = None
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     web_grounded: bool = False
+    cached: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -56,16 +80,170 @@ class LLMResponse:
             "error": self.error,
             "timestamp": self.timestamp,
             "web_grounded": self.web_grounded,
+            "cached": self.cached,
         }
 
 
+# ── Response Cache ───────────────────────────────────────────────────────
+
+class _ResponseCache:
+    """Bounded LRU/TTL cache of successful responses, keyed by request hash."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None or item[1] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dataclasses.replace(item[0], cached=True)
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        with self._lock:
+            self._entries[key] = (response, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
 # ── Provider Implementations ─────────────────────────────────────────────
 
-class _OpenAIProvider:
-    """OpenAI API (GPT-4, GPT-3.5, etc.)"""
+class _PooledProvider(ABC):
+    """
+    Connection pooling shared by all providers.
+
+    Sync calls reuse one requests.Session per provider; async calls reuse one
+    async client per event loop (clients are loop-bound), both capped at
+    ``max_connections`` from the provider config.
+    """
+
+    name = ""
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        self.timeout = config.get("timeout", 30)
+        self.max_connections = config.get("max_connections", 20)
+        self._session: Optional[requests.Session] = None
+        self._async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_connections)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _loop_client(self, factory):
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = factory()
+            self._async_clients[loop] = client
+        return client
+
+    def _httpx_client(self):
+        return self._loop_client(lambda: httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_connections,
+                                max_keepalive_connections=self.max_connections),
+        ))
+
+    def _failure(self, model: str, error: str) -> LLMResponse:
+        return LLMResponse(text="", provider=self.name, model=model, success=False, error=error)
+
+    @abstractmethod
+    def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
+        ...
+
+    async def agenerate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
+        # No native async client available — keep the event loop free
+        return await asyncio.to_thread(self.generate, prompt, model, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running loop."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            close = getattr(client, "aclose", None) or getattr(client, "close")
+            await close()
+
+
+class _HTTPProvider(_PooledProvider):
+    """Provider spoken to over plain JSON/HTTP; subclasses build and parse."""
+
+    def _precheck(self) -> Optional[str]:
+        return None
+
+    @abstractmethod
+    def _default_model(self) -> str:
+        ...
+
+    @abstractmethod
+    def _build(self, prompt: str, model: str, **kwargs):
+        """Return (url, headers, payload) for one generation request."""
+
+    @abstractmethod
+    def _parse(self, data: Dict[str, Any], model: str) -> LLMResponse:
+        ...
+
+    def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
+        error = self._precheck()
+        if error:
+            return self._failure("", error)
+        model = model or self._default_model()
+        url, headers, payload = self._build(prompt, model, **kwargs)
+        try:
+            resp = self.session.post(url, headers=headers, json=payload, timeout=self.timeout)
+            if resp.status_code != 200:
+                return self._failure(model, f"HTTP {resp.status_code}")
+            return self._parse(resp.json(), model)
+        except Exception as e:
+            return self._failure(model, str(e))
+
+    async def agenerate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
+        if httpx is None:
+            return await super().agenerate(prompt, model, **kwargs)
+        error = self._precheck()
+        if error:
+            return self._failure("", error)
+        model = model or self._default_model()
+        url, headers, payload = self._build(prompt, model, **kwargs)
+        try:
+            resp = await self._httpx_client().post(url, headers=headers, json=payload)
+            if resp.status_code != 200:
+                return self._failure(model, f"HTTP {resp.status_code}")
+            return self._parse(resp.json(), model)
+        except Exception as e:
+            return self._failure(model, str(e) or type(e).__name__)
+
+
+class _OpenAIProvider(_PooledProvider):
+    """OpenAI API (GPT-4, GPT-3.5, etc.)"""
+
+    name = "openai"
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
         self.api_key = os.getenv(config.get("api_key_env", "OPENAI_API_KEY"))
         self.client = None
         if self.api_key:
@@ -75,35 +253,54 @@ class _OpenAIProvider:
             except ImportError:
                 logger.warning("openai package not installed")
 
+    def _request(self, prompt: str, model: Optional[str], **kwargs) -> Dict[str, Any]:
+        return dict(
+            model=model or self.config.get("default_model", "gpt-4"),
+            messages=kwargs.get("messages", [{"role": "user", "content": prompt}]),
+            max_tokens=kwargs.get("max_tokens", self.config.get("max_tokens", 1000)),
+            temperature=kwargs.get("temperature", self.config.get("temperature", 0.7)),
+        )
+
+    @staticmethod
+    def _to_response(response) -> LLMResponse:
+        return LLMResponse(
+            text=response.choices[0].message.content or "",
+            provider="openai",
+            model=response.model,
+            usage=response.usage.model_dump() if response.usage else {},
+        )
+
     def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
         if not self.client:
-            return LLMResponse(text="", provider="openai", model="", success=False, error="Client not available")
-        model = model or self.config.get("default_model", "gpt-4")
+            return self._failure("", "Client not available")
+        request = self._request(prompt, model, **kwargs)
         try:
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=kwargs.get("messages", [{"role": "user", "content": prompt}]),
-                max_tokens=kwargs.get("max_tokens", self.config.get("max_tokens", 1000)),
-                temperature=kwargs.get("temperature", self.config.get("temperature", 0.7)),
-            )
-            return LLMResponse(
-                text=response.choices[0].message.content or "",
-                provider="openai",
-                model=response.model,
-                usage=response.usage.model_dump() if response.usage else {},
-            )
+            return self._to_response(self.client.chat.completions.create(**request))
         except Exception as e:
-            return LLMResponse(text="", provider="openai", model=model, success=False, error=str(e))
+            return self._failure(request["model"], str(e))
+
+    async def agenerate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
+        if not self.client:
+            return self._failure("", "Client not available")
+        from openai import AsyncOpenAI
+        client = self._loop_client(lambda: AsyncOpenAI(api_key=self.api_key, max_retries=0))
+        request = self._request(prompt, model, **kwargs)
+        try:
+            return self._to_response(await client.chat.completions.create(**request))
+        except Exception as e:
+            return self._failure(request["model"], str(e))
 
     def is_available(self) -> bool:
         return self.client is not None and self.api_key is not None
 
 
-class _AnthropicProvider:
+class _AnthropicProvider(_PooledProvider):
     """Anthropic API (Claude)"""
 
+    name = "anthropic"
+
     def __init__(self, config: Dict[str, Any]):
-        self.config = config
+        super().__init__(config)
         self.api_key = os.getenv(config.get("api_key_env", "ANTHROPIC_API_KEY"))
         self.client = None
         if self.api_key:
@@ -113,152 +310,172 @@ class _AnthropicProvider:
             except ImportError:
                 logger.warning("anthropic package not installed")
 
+    def _request(self, prompt: str, model: Optional[str], **kwargs) -> Dict[str, Any]:
+        return dict(
+            model=model or self.config.get("default_model", "claude-sonnet-4-20250514"),
+            max_tokens=kwargs.get("max_tokens", self.config.get("max_tokens", 1000)),
+            temperature=kwargs.get("temperature", self.config.get("temperature", 0.7)),
+            messages=kwargs.get("messages", [{"role": "user", "content": prompt}]),
+        )
+
+    @staticmethod
+    def _to_response(response) -> LLMResponse:
+        return LLMResponse(
+            text=response.content[0].text if response.content else "",
+            provider="anthropic",
+            model=response.model,
+            usage=response.usage.model_dump() if response.usage else {},
+        )
+
     def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
         if not self.client:
-            return LLMResponse(text="", provider="anthropic", model="", success=False, error="Client not available")
-        model = model or self.config.get("default_model", "claude-sonnet-4-20250514")
+            return self._failure("", "Client not available")
+        request = self._request(prompt, model, **kwargs)
         try:
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=kwargs.get("max_tokens", self.config.get("max_tokens", 1000)),
-                temperature=kwargs.get("temperature", self.config.get("temperature", 0.7)),
-                messages=kwargs.get("messages", [{"role": "user", "content": prompt}]),
-            )
-            return LLMResponse(
-                text=response.content[0].text if response.content else "",
-                provider="anthropic",
-                model=response.model,
-                usage=response.usage.model_dump() if response.usage else {},
-            )
+            return self._to_response(self.client.messages.create(**request))
+        except Exception as e:
+            return self._failure(request["model"], str(e))
+
+    async def agenerate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
+        if not self.client:
+            return self._failure("", "Client not available")
+        from anthropic import AsyncAnthropic
+        client = self._loop_client(lambda: AsyncAnthropic(api_key=self.api_key, max_retries=0))
+        request = self._request(prompt, model, **kwargs)
+        try:
+            return self._to_response(await client.messages.create(**request))
         except Exception as e:
-            return LLMResponse(text="", provider="anthropic", model=model, success=False, error=str(e))
+            return self._failure(request["model"], str(e))
 
     def is_available(self) -> bool:
         return self.client is not None and self.api_key is not None
 
 
-class _GeminiProvider:
+class _GeminiProvider(_HTTPProvider):
     """Google Gemini API"""
 
+    name = "gemini"
+
     def __init__(self, config: Dict[str, Any]):
-        self.config = config
+        super().__init__(config)
         self.api_key = os.getenv(config.get("api_key_env", "GEMINI_API_KEY"))
         self.base_url = config.get("base_url", "https://generativelanguage.googleapis.com/v1beta/models")
 
-    def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
-        if not self.api_key:
-            return LLMResponse(text="", provider="gemini", model="", success=False, error="No API key")
-        model = model or self.config.get("default_model", "gemini-pro")
+    def _precheck(self) -> Optional[str]:
+        return None if self.api_key else "No API key"
+
+    def _default_model(self) -> str:
+        return self.config.get("default_model", "gemini-pro")
+
+    def _build(self, prompt: str, model: str, **kwargs):
         url = f"{self.base_url}/{model}:generateContent?key={self.api_key}"
-        payload = {"contents": [{"parts": [{"text": prompt}]}]}
-        timeout = self.config.get("timeout", 30)
-        try:
-            resp = requests.post(url, json=payload, timeout=timeout)
-            resp.raise_for_status()
-            data = resp.json()
-            text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
-            return LLMResponse(text=text, provider="gemini", model=model)
-        except Exception as e:
-            return LLMResponse(text="", provider="gemini", model=model, success=False, error=str(e))
+        return url, None, {"contents": [{"parts": [{"text": prompt}]}]}
+
+    def _parse(self, data: Dict[str, Any], model: str) -> LLMResponse:
+        text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
+        return LLMResponse(text=text, provider="gemini", model=model)
 
     def is_available(self) -> bool:
         return bool(self.api_key)
 
 
-class _PerplexityProvider:
+class _PerplexityProvider(_HTTPProvider):
     """Perplexity API (web-grounded)"""
 
+    name = "perplexity"
+
     def __init__(self, config: Dict[str, Any]):
-        self.config = config
+        super().__init__(config)
         self.api_key = os.getenv(config.get("api_key_env", "PERPLEXITY_API_KEY"))
         self.base_url = config.get("base_url", "https://api.perplexity.ai/chat/completions")
 
-    def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
-        if not self.api_key:
-            return LLMResponse(text="", provider="perplexity", model="", success=False, error="No API key")
-        model = model or self.config.get("default_model", "llama-3.1-sonar-large-128k-online")
+    def _precheck(self) -> Optional[str]:
+        return None if self.api_key else "No API key"
+
+    def _default_model(self) -> str:
+        return self.config.get("default_model", "llama-3.1-sonar-large-128k-online")
+
+    def _build(self, prompt: str, model: str, **kwargs):
         headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
         payload = {
             "model": model,
             "messages": kwargs.get("messages", [{"role": "user", "content": prompt}]),
         }
-        timeout = self.config.get("timeout", 30)
-        try:
-            resp = requests.post(self.base_url, headers=headers, json=payload, timeout=timeout)
-            resp.raise_for_status()
-            data = resp.json()
-            text = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-            return LLMResponse(text=text, provider="perplexity", model=model, web_grounded=True)
-        except Exception as e:
-            return LLMResponse(text="", provider="perplexity", model=model, success=False, error=str(e))
+        return self.base_url, headers, payload
+
+    def _parse(self, data: Dict[str, Any], model: str) -> LLMResponse:
+        text = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+        return LLMResponse(text=text, provider="perplexity", model=model, web_grounded=True)
 
     def is_available(self) -> bool:
         return bool(self.api_key)
 
 
-class _OllamaProvider:
+class _OllamaProvider(_HTTPProvider):
     """Ollama (local LLMs — Llama3, Mistral, etc.)"""
 
+    name = "ollama"
+
     def __init__(self, config: Dict[str, Any]):
-        self.config = config
+        super().__init__(config)
+        self.timeout = config.get("timeout", 60)
         self.base_url = config.get("base_url", "http://localhost:11434")
 
-    def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
-        model = model or self.config.get("default_model", "llama3")
+    def _default_model(self) -> str:
+        return self.config.get("default_model", "llama3")
+
+    def _build(self, prompt: str, model: str, **kwargs):
         payload = {"model": model, "prompt": prompt, "stream": False}
         if kwargs.get("system"):
             payload["system"] = kwargs["system"]
-        try:
-            resp = requests.post(f"{self.base_url}/api/generate", json=payload, timeout=self.config.get("timeout", 60))
-            if resp.status_code == 200:
-                text = resp.json().get("response", "")
-                return LLMResponse(text=text, provider="ollama", model=model)
-            return LLMResponse(text="", provider="ollama", model=model, success=False, error=f"HTTP {resp.status_code}")
-        except Exception as e:
-            return LLMResponse(text="", provider="ollama", model=model, success=False, error=str(e))
+        return f"{self.base_url}/api/generate", None, payload
+
+    def _parse(self, data: Dict[str, Any], model: str) -> LLMResponse:
+        return LLMResponse(text=data.get("response", ""), provider="ollama", model=model)
 
     def get_embeddings(self, text: str, model: Optional[str] = None) -> List[float]:
         model = model or self.config.get("embedding_model", "nomic-embed-text")
         try:
-            resp = requests.post(f"{self.base_url}/api/embeddings", json={"model": model, "prompt": text}, timeout=10)
+            resp = self.session.post(f"{self.base_url}/api/embeddings", json={"model": model, "prompt": text}, timeout=10)
             return resp.json().get("embedding", []) if resp.status_code == 200 else []
         except Exception:
             return []
 
     def is_available(self) -> bool:
         try:
-            return requests.get(f"{self.base_url}/", timeout=2).status_code == 200
+            return self.session.get(f"{self.base_url}/", timeout=2).status_code == 200
         except Exception:
             return False
 
 
-class _VLLMProvider:
+class _VLLMProvider(_HTTPProvider):
     """vLLM (OpenAI-compatible self-hosted)"""
 
+    name = "vllm"
+
     def __init__(self, config: Dict[str, Any]):
-        self.config = config
+        super().__init__(config)
         self.base_url = config.get("base_url", "http://localhost:8000/v1")
 
-    def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
-        model = model or self.config.get("default_model", "llama-3-8b-instruct")
+    def _default_model(self) -> str:
+        return self.config.get("default_model", "llama-3-8b-instruct")
+
+    def _build(self, prompt: str, model: str, **kwargs):
         payload = {
             "model": model,
             "messages": kwargs.get("messages", [{"role": "user", "content": prompt}]),
             "max_tokens": kwargs.get("max_tokens", 1000),
             "temperature": kwargs.get("temperature", 0.7),
         }
-        try:
-            resp = requests.post(f"{self.base_url}/chat/completions", json=payload, timeout=self.config.get("timeout", 30))
-            resp.raise_for_status()
-            data = resp.json()
-            text = data["choices"][0]["message"]["content"]
-            return LLMResponse(text=text, provider="vllm", model=data.get("model", model), usage=data.get("usage", {}))
-        except Exception as e:
-            return LLMResponse(text="", provider="vllm", model=model, success=False, error=str(e))
+        return f"{self.base_url}/chat/completions", None, payload
+
+    def _parse(self, data: Dict[str, Any], model: str) -> LLMResponse:
+        text = data["choices"][0]["message"]["content"]
+        return LLMResponse(text=text, provider="vllm", model=data.get("model", model), usage=data.get("usage", {}))
 
     def is_available(self) -> bool:
         try:
-            return requests.get(f"{self.base_url}/models", timeout=2).status_code == 200
+            return self.session.get(f"{self.base_url}/models", timeout=2).status_code == 200
         except Exception:
             return False
 
@@ -286,8 +503,12 @@ class LLMGateway:
         resp = gateway.generate("Hello")  # uses default provider
         resp = gateway.generate("Hello", provider="anthropic")  # specific provider
         resp = gateway.generate("Hello", provider="perplexity") # web-grounded
+        resp = await gateway.agenerate("Hello")                 # native async path
     """
 
+    # Request fields that determine the response (content-addressed cache key)
+    _KEY_FIELDS = ("model", "messages", "system", "max_tokens", "temperature")
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         if config is None:
             # Import here to avoid circular dependency
@@ -301,6 +522,10 @@ class LLMGateway:
         self._config = config
         self._providers: Dict[str, Any] = {}
         self._init_providers()
+        self._init_cache()
+        # (loop, request key) -> in-flight task shared by identical async callers
+        self._inflight: Dict[tuple, "asyncio.Task"] = {}
+        self.coalesced_requests = 0
 
     def _init_providers(self):
         """Initialize all enabled providers."""
@@ -313,37 +538,79 @@ class LLMGateway:
                 except Exception as e:
                     logger.error(f"Failed to init provider {name}: {e}")
 
-    def generate(self, prompt: str, provider: Optional[str] = None, **kwargs) -> LLMResponse:
+    def _init_cache(self):
+        cache_cfg = self._config.get("response_cache", {})
+        self._cache_enabled = cache_cfg.get("enabled", True)
+        self._cache = _ResponseCache(
+            max_entries=cache_cfg.get("max_entries", 1024),
+            ttl_seconds=cache_cfg.get("ttl_seconds", 3600),
+        )
+
+    def _chain(self) -> List[str]:
+        """Fallback chain with the default provider first, initialized providers only."""
+        chain = self._config.get("fallback_chain", ["openai"])
+        default = self._config.get("default_provider", "openai")
+
+        # Put default first if not already
+        if default in chain:
+            chain = [default] + [p for p in chain if p != default]
+        return [p for p in chain if p in self._providers]
+
+    def _request_key(self, target: str, prompt: str, kwargs: Dict[str, Any]) -> str:
+        body = {"target": target, "prompt": prompt}
+        body.update({k: kwargs.get(k) for k in self._KEY_FIELDS})
+        return hashlib.sha256(json.dumps(body, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _deterministic(kwargs: Dict[str, Any]) -> bool:
+        # Sampled calls (provider default temperature > 0) must each get their own completion
+        return kwargs.get("temperature") == 0
+
+    def _cacheable(self, kwargs: Dict[str, Any], use_cache: bool) -> bool:
+        # Only deterministic calls are safe to replay
+        return use_cache and self._cache_enabled and self._deterministic(kwargs)
+
+    def generate(self, prompt: str, provider: Optional[str] = None, use_cache: bool = True, **kwargs) -> LLMResponse:
         """
         Generate text using the specified provider (or default with fallback chain).
 
         Args:
             prompt: The text prompt
             provider: Specific provider name, or None for default + fallback chain
+            use_cache: Serve/store temperature-0 calls from the response cache
             **kwargs: model, max_tokens, temperature, messages, system
 
         Returns:
             LLMResponse with text, provider used, model, etc.
         """
+        key = None
+        if self._cacheable(kwargs, use_cache):
+            key = self._request_key(provider or "chain", prompt, kwargs)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
         if provider:
             # Direct provider call — no fallback
-            return self._call_provider(provider, prompt, **kwargs)
+            resp = self._call_provider(provider, prompt, **kwargs)
+        else:
+            resp = self._generate_chain(prompt, **kwargs)
 
-        # Use fallback chain
-        chain = self._config.get("fallback_chain", ["openai"])
-        default = self._config.get("default_provider", "openai")
+        if key is not None and resp.success:
+            self._cache.put(key, resp)
+        return resp
 
-        # Put default first if not already
-        if default in chain:
-            chain = [default] + [p for p in chain if p != default]
+    def _generate_chain(self, prompt: str, **kwargs) -> LLMResponse:
+        for prov_name in self._chain():
+            resp = self._call_provider(prov_name, prompt, **kwargs)
+            if resp.success:
+                return resp
+            logger.warning(f"Provider {prov_name} failed: {resp.error}, trying next...")
 
-        for prov_name in chain:
-            if prov_name in self._providers:
-                resp = self._call_provider(prov_name, prompt, **kwargs)
-                if resp.success:
-                    return resp
-                logger.warning(f"Provider {prov_name} failed: {resp.error}, trying next...")
+        return self._chain_failure()
 
+    @staticmethod
+    def _chain_failure() -> LLMResponse:
         return LLMResponse(
             text="",
             provider="none",
@@ -354,9 +621,26 @@ class LLMGateway:
 
     def _call_provider(self, name: str, prompt: str, **kwargs) -> LLMResponse:
         """Call a specific provider with circuit breaker protection."""
+        prov, cb, rejected = self._admit(name)
+        if rejected:
+            return rejected
+
+        try:
+            resp = prov.generate(prompt, **kwargs)
+            if resp.success:
+                cb.record_success()
+            else:
+                cb.record_failure()
+            return resp
+        except Exception as e:
+            cb.record_failure()
+            return LLMResponse(text="", provider=name, model="", success=False, error=str(e))
+
+    def _admit(self, name: str):
+        """Return (provider, breaker, None) or (None, None, rejection response)."""
         prov = self._providers.get(name)
         if not prov:
-            return LLMResponse(text="", provider=name, model="", success=False, error=f"Provider '{name}' not initialized")
+            return None, None, LLMResponse(text="", provider=name, model="", success=False, error=f"Provider '{name}' not initialized")
 
         cb = get_circuit_registry().get(name, failure_threshold=5, recovery_timeout=60)
 
@@ -364,21 +648,133 @@ class LLMGateway:
         if not cb.allow_request():
             stats = cb.get_stats()
             logger.warning("Circuit breaker OPEN for '%s' — skipping call (retry after %.0fs)", name, stats.time_in_current_state)
-            return LLMResponse(
+            return None, None, LLMResponse(
                 text="", provider=name, model="", success=False,
                 error=f"Circuit breaker OPEN for {name} — provider temporarily disabled",
             )
+        return prov, cb, None
+
+    # ── Async path ───────────────────────────────────────────────────────
+
+    async def agenerate(
+        self,
+        prompt: str,
+        provider: Optional[str] = None,
+        use_cache: bool = True,
+        hedge_after_ms: Optional[float] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Async counterpart of generate().
+
+        Identical concurrent temperature-0 requests share one upstream call
+        and are served from the cache afterwards; sampled requests always
+        make their own call. On the fallback chain, if the
+        current provider has not answered within ``hedge_after_ms`` (or the
+        ``hedge_after_ms`` config value) the next provider is started too and
+        the first success wins.
+        """
+        target = provider or "chain"
+        key = self._request_key(target, prompt, kwargs)
+        cacheable = self._cacheable(kwargs, use_cache)
+        if cacheable:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        loop = asyncio.get_running_loop()
+        coalesce = use_cache and self._deterministic(kwargs)
+        inflight_key = (id(loop), key)
+        task = self._inflight.get(inflight_key) if coalesce else None
+        if task is not None and task.get_loop() is loop:
+            self.coalesced_requests += 1
+        else:
+            if hedge_after_ms is None:
+                hedge_after_ms = self._config.get("hedge_after_ms")
+            if provider:
+                coro = self._acall_provider(provider, prompt, **kwargs)
+            else:
+                coro = self._agenerate_chain(prompt, hedge_after_ms, **kwargs)
+            task = asyncio.ensure_future(coro)
+            if coalesce:
+                self._inflight[inflight_key] = task
+                task.add_done_callback(lambda _t: self._inflight.pop(inflight_key, None))
+
+        # shield: one caller being cancelled must not cancel the shared call
+        resp = await asyncio.shield(task)
+        if cacheable and resp.success:
+            self._cache.put(key, resp)
+        return dataclasses.replace(resp)
+
+    async def _agenerate_chain(self, prompt: str, hedge_after_ms: Optional[float], **kwargs) -> LLMResponse:
+        chain = self._chain()
+        hedge_after = hedge_after_ms / 1000.0 if hedge_after_ms else None
+        pending = set()
+        next_idx = 0
+
+        def launch():
+            nonlocal next_idx
+            name = chain[next_idx]
+            next_idx += 1
+            pending.add(asyncio.ensure_future(self._acall_provider(name, prompt, **kwargs)))
+
+        if not chain:
+            return self._chain_failure()
+        launch()
+        try:
+            while pending:
+                can_hedge = hedge_after is not None and next_idx < len(chain)
+                done, _ = await asyncio.wait(
+                    pending, timeout=hedge_after if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    logger.info("Hedging: %s slow after %.0fms, starting %s", chain[next_idx - 1], hedge_after_ms, chain[next_idx])
+                    launch()
+                    continue
+                for finished in done:
+                    pending.discard(finished)
+                    resp = finished.result()
+                    if resp.success:
+                        return resp
+                    logger.warning(f"Provider {resp.provider} failed: {resp.error}, trying next...")
+                if not pending and next_idx < len(chain):
+                    launch()
+        finally:
+            for straggler in pending:
+                straggler.cancel()
+        return self._chain_failure()
+
+    async def _acall_provider(self, name: str, prompt: str, **kwargs) -> LLMResponse:
+        """Async provider call with circuit breaker protection."""
+        prov, cb, rejected = self._admit(name)
+        if rejected:
+            return rejected
 
         try:
-            resp = prov.generate(prompt, **kwargs)
-            if resp.success:
-                cb.record_success()
-            else:
-                cb.record_failure()
-            return resp
+            resp = await prov.agenerate(prompt, **kwargs)
+        except asyncio.CancelledError:
+            raise  # lost a hedge race — not a provider failure
         except Exception as e:
             cb.record_failure()
             return LLMResponse(text="", provider=name, model="", success=False, error=str(e))
+        if resp.success:
+            cb.record_success()
+        else:
+            cb.record_failure()
+        return resp
+
+    async def aclose(self):
+        """Close pooled async clients bound to the running event loop."""
+        for prov in self._providers.values():
+            try:
+                await prov.aclose()
+            except Exception as e:
+                logger.debug(f"Closing async client failed: {e}")
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Response cache and request coalescing counters."""
+        return {**self._cache.stats(), "coalesced_requests": self.coalesced_requests}
 
     def circuit_breaker_status(self) -> Dict[str, Any]:
         """Get circuit breaker stats for all providers."""
@@ -405,6 +801,7 @@ class LLMGateway:
             self._config = model_config.raw.get("llm", {})
             self._providers.clear()
             self._init_providers()
+            self._init_cache()
             logger.info("LLM Gateway reloaded from config")
         except Exception as e:
             logger.error(f"Failed to reload LLM Gateway: {e}")
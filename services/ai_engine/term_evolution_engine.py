@@ -53,6 +53,43 @@ EVOLUTION_FILE = GAZETTEERS_DIR / "term_evolution.json"
 _LOCAL_DATA_ROOT = Path(os.getenv("CAREERTROJAN_LOCAL_DATA", r"C:\careertrojan\data\ai_data_final"))
 LOCAL_EVOLUTION_FILE = _LOCAL_DATA_ROOT / "gazetteers" / "term_evolution.json"
 
+# ── Fuzzy resolution index ────────────────────────────────────────────────
+_NGRAM = 3
+_RESOLVE_MEMO_LIMIT = 50_000
+
+
+def _max_edits(length: int) -> int:
+    """Edit budget for a query of this length — short terms must match exactly."""
+    if length < 4:
+        return 0
+    return 1 if length < 8 else 2
+
+
+def _padded_grams(text: str) -> Set[str]:
+    """Distinct trigrams of the text padded with spaces (covers its ends)."""
+    padded = " " * (_NGRAM - 1) + text + " " * (_NGRAM - 1)
+    return {padded[i:i + _NGRAM] for i in range(len(padded) - _NGRAM + 1)}
+
+
+def _inner_grams(text: str) -> Set[str]:
+    """Distinct unpadded trigrams — all present in any string containing ``text``."""
+    return {text[i:i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or ``limit + 1`` once it must exceed ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return min(prev[-1], limit + 1)
+
 
 class TermEvolutionEngine:
     """
@@ -77,6 +114,12 @@ class TermEvolutionEngine:
         self._skill_to_chains: Dict[str, List[str]] = defaultdict(list)  # skill → [chain_ids]
         self._domain_to_chains: Dict[str, List[str]] = defaultdict(list)  # domain → [chain_ids]
 
+        # Fuzzy-resolution index over _term_to_chains keys
+        self._term_rank: Dict[str, int] = {}  # term → first-indexed order
+        self._gram_index: Dict[str, Set[str]] = defaultdict(set)  # padded trigram → terms
+        self._max_term_len = 0
+        self._resolve_memo: Dict[str, Optional[Tuple[str, str]]] = {}  # query → (chain_id, matched key)
+
         # User-discovered evolution candidates (persisted separately)
         self._discovered_links: List[Dict[str, Any]] = []
 
@@ -130,11 +173,11 @@ class TermEvolutionEngine:
         for entry in chain.get("lineage", []):
             term = entry.get("term", "").lower().strip()
             if term:
-                self._term_to_chains[term].append(chain_id)
+                self._add_term(term, chain_id)
                 # Also index individual words for fuzzy matching
                 for word in term.split():
                     if len(word) > 3:
-                        self._term_to_chains[word].append(chain_id)
+                        self._add_term(word, chain_id)
 
             abbrev = entry.get("abbrev")
             if abbrev:
@@ -144,6 +187,95 @@ class TermEvolutionEngine:
         for skill in chain.get("complementary_skills", []):
             self._skill_to_chains[skill.lower()].append(chain_id)
 
+        self._resolve_memo.clear()
+
+    def _add_term(self, term: str, chain_id: str):
+        """Index a lineage term for exact and fuzzy resolution."""
+        if term not in self._term_rank:
+            self._term_rank[term] = len(self._term_rank)
+            self._max_term_len = max(self._max_term_len, len(term))
+            for gram in _padded_grams(term):
+                self._gram_index[gram].add(term)
+        self._term_to_chains[term].append(chain_id)
+
+    # ── Fuzzy Resolution ─────────────────────────────────────────────────
+
+    def _first_indexed(self, terms) -> Optional[str]:
+        return min(terms, key=self._term_rank.__getitem__, default=None)
+
+    def _containment_match(self, normalized: str) -> Optional[str]:
+        """
+        Earliest-indexed term that contains the query or is contained in it.
+        Substrings of the query are looked up directly; terms containing the
+        query must hold all of its trigrams, so only the rarest posting list
+        is scanned.
+        """
+        hits = [
+            normalized[i:j]
+            for i in range(len(normalized))
+            for j in range(i + 1, min(len(normalized), i + self._max_term_len) + 1)
+            if normalized[i:j] in self._term_rank
+        ]
+        if len(normalized) >= _NGRAM:
+            postings = sorted((self._gram_index.get(g, set()) for g in _inner_grams(normalized)), key=len)
+            hits.extend(t for t in postings[0] if normalized in t)
+        else:
+            # Too short to filter by trigram; insertion order makes the first hit the answer
+            first = next((t for t in self._term_rank if normalized in t), None)
+            if first is not None:
+                hits.append(first)
+        return self._first_indexed(hits)
+
+    def _edit_match(self, normalized: str) -> Optional[str]:
+        """Closest term within the length-scaled edit budget (ties → earliest indexed)."""
+        limit = _max_edits(len(normalized))
+        if not limit or not self._term_rank:
+            return None
+        grams = _padded_grams(normalized)
+        # Each edit destroys at most _NGRAM distinct grams, so a match shares at least
+        # `need`; it must then appear in one of the len(grams) - need + 1 rarest lists.
+        need = len(grams) - _NGRAM * limit
+        postings = sorted((self._gram_index.get(g, set()) for g in grams), key=len)
+        candidates = set().union(*postings[:max(len(grams) - need + 1, 1)]) if need > 0 else set(self._term_rank)
+
+        best, best_key = None, None
+        for term in candidates:
+            if abs(len(term) - len(normalized)) > limit:
+                continue
+            if need > 0 and len(grams & _padded_grams(term)) < need:
+                continue
+            dist = _edit_distance(normalized, term, limit)
+            if dist <= limit:
+                key = (dist, self._term_rank[term])
+                if best_key is None or key < best_key:
+                    best, best_key = term, key
+        return best
+
+    def _match(self, normalized: str) -> Optional[Tuple[str, str]]:
+        """Memoized (chain_id, matched key) lookup behind resolve()/resolve_many()."""
+        if normalized in self._resolve_memo:
+            return self._resolve_memo[normalized]
+
+        match = None
+        if self._term_to_chains.get(normalized):
+            match = (self._term_to_chains[normalized][0], normalized)
+        elif self._abbrev_to_chains.get(normalized):
+            match = (self._abbrev_to_chains[normalized][0], normalized)
+        else:
+            term = self._containment_match(normalized)
+            if term is not None:
+                match = (self._term_to_chains[term][0], normalized)
+            else:
+                term = self._edit_match(normalized)
+                if term is not None:
+                    match = (self._term_to_chains[term][0], term)
+
+        with self._lock:
+            if len(self._resolve_memo) >= _RESOLVE_MEMO_LIMIT:
+                self._resolve_memo.clear()
+            self._resolve_memo[normalized] = match
+        return match
+
     # ── Core Lookup Methods ──────────────────────────────────────────────
 
     def resolve(self, term: str) -> Optional[Dict[str, Any]]:
@@ -155,28 +287,13 @@ class TermEvolutionEngine:
             resolve("mrp") → MRP → MRP II → ERP chain
             resolve("Basel II") → Basel I → II → III chain
             resolve("personnel management") → HR evolution chain
+            resolve("kubernetse") → within edit distance of "kubernetes"
         """
-        normalized = term.lower().strip()
-
-        # Direct term match
-        chain_ids = self._term_to_chains.get(normalized, [])
-
-        # Abbreviation match
-        if not chain_ids:
-            chain_ids = self._abbrev_to_chains.get(normalized, [])
-
-        # Fuzzy: check if any chain term contains the search term
-        if not chain_ids:
-            for indexed_term, ids in self._term_to_chains.items():
-                if normalized in indexed_term or indexed_term in normalized:
-                    chain_ids.extend(ids)
-                    break
-
-        if not chain_ids:
+        match = self._match(term.lower().strip())
+        if match is None:
             return None
 
-        # Return the best (most specific) match
-        chain_id = chain_ids[0]
+        chain_id, probe = match
         chain = self.chains.get(chain_id)
         if not chain:
             return None
@@ -184,8 +301,8 @@ class TermEvolutionEngine:
         # Enrich with position info
         result = {**chain}
         for i, entry in enumerate(chain.get("lineage", [])):
-            if normalized in entry.get("term", "").lower() or \
-               normalized == (entry.get("abbrev") or "").lower():
+            if probe in entry.get("term", "").lower() or \
+               probe == (entry.get("abbrev") or "").lower():
                 result["matched_position"] = i
                 result["matched_term"] = entry["term"]
                 result["is_current"] = entry.get("status") == "current"
@@ -195,6 +312,21 @@ class TermEvolutionEngine:
 
         return result
 
+    def resolve_many(self, terms: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Batch resolve() for a whole document's terms, aligned with the input.
+        Each distinct term is matched once; repeats (and later calls) hit
+        the memo.
+        """
+        resolved: Dict[str, Optional[Dict[str, Any]]] = {}
+        results = []
+        for term in terms:
+            key = term.lower().strip()
+            if key not in resolved:
+                resolved[key] = self.resolve(key)
+            results.append(resolved[key])
+        return results
+
     def resolve_all(self, term: str) -> List[Dict[str, Any]]:
         """
         Like resolve() but returns ALL chains that contain the term.
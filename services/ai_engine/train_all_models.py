@@ -22,7 +22,7 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -54,6 +54,9 @@ except ImportError:
 class CareerTrojanModelTrainer:
     """Complete AI model training pipeline"""
 
+    # Fewest usable salary rows worth fitting trees on, fresh or incremental
+    MIN_SALARY_ROWS = 100
+
     def __init__(self, data_dir: str = None):
         # Use centralized config for data paths (L: drive source of truth)
         import os
@@ -65,6 +68,8 @@ class CareerTrojanModelTrainer:
         _models_root = Path(os.getenv("ML_MODELS_PATH", r"C:\careertrojan\services\ai_engine\trained_models"))
         self.models_dir = _models_root
         self.models_dir.mkdir(parents=True, exist_ok=True)
+        # Threads for estimators that parallelise internally (set per job by the orchestrator)
+        self.n_jobs = 1
 
         self.training_report = {
             'timestamp': datetime.now().isoformat(),
@@ -504,40 +509,16 @@ class CareerTrojanModelTrainer:
         """Train regression models for salary/experience prediction"""
         print("\n📊 Training Statistical Models...")
 
-        # Filter data with valid salary and experience
-        df_valid = df[
-            (df['salary'].notna()) &
-            (df['experience_years'] > 0) &
-            (df['experience_years'] < 50)
-        ].copy()
+        df_valid = self._valid_salary_rows(df)
 
-        if len(df_valid) < 100:
+        if len(df_valid) < self.MIN_SALARY_ROWS:
             print("   ⚠️  Not enough data for statistical models")
             print(f"   Need salary data (found {len(df_valid)} records)")
             return None
 
         print(f"   Training samples: {len(df_valid)}")
 
-        # Features
-        df_valid['skills_count'] = df_valid['skills'].apply(
-            lambda x: len(x) if isinstance(x, list) else 0
-        )
-        df_valid['text_length'] = df_valid['text'].str.len()
-
-        # Encode education level
-        education_map = {
-            'High School': 1,
-            'Associate': 2,
-            'Bachelor': 3,
-            'Master': 4,
-            'PhD': 5
-        }
-        df_valid['education_level'] = df_valid['education'].map(
-            lambda x: education_map.get(x, 3)
-        )
-
-        X = df_valid[['experience_years', 'skills_count', 'education_level', 'text_length']]
-        y = df_valid['salary']
+        X, y = self._salary_features(df_valid)
 
         # Train/test split
         X_train, X_test, y_train, y_test = train_test_split(
@@ -545,7 +526,7 @@ class CareerTrojanModelTrainer:
         )
 
         # Train Random Forest
-        model = RandomForestRegressor(n_estimators=100, random_state=42)
+        model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=self.n_jobs)
         model.fit(X_train, y_train)
 
         # Evaluate
@@ -571,6 +552,149 @@ class CareerTrojanModelTrainer:
 
         return model
 
+    def _valid_salary_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rows with a salary and a plausible experience figure"""
+        return df[
+            (df['salary'].notna()) &
+            (df['experience_years'] > 0) &
+            (df['experience_years'] < 50)
+        ].copy()
+
+    def _salary_features(self, df_valid: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+        """Feature matrix and target for the salary predictor"""
+        df_valid['skills_count'] = df_valid['skills'].apply(
+            lambda x: len(x) if isinstance(x, list) else 0
+        )
+        df_valid['text_length'] = df_valid['text'].str.len()
+
+        # Encode education level
+        education_map = {
+            'High School': 1,
+            'Associate': 2,
+            'Bachelor': 3,
+            'Master': 4,
+            'PhD': 5
+        }
+        df_valid['education_level'] = df_valid['education'].map(
+            lambda x: education_map.get(x, 3)
+        )
+
+        X = df_valid[['experience_years', 'skills_count', 'education_level', 'text_length']]
+        return X, df_valid['salary']
+
+    def _load_pickle(self, name: str):
+        path = self.models_dir / name
+        if not path.exists():
+            return None
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def update_bayesian_classifier(self, df_new: pd.DataFrame) -> Optional[Tuple[MultinomialNB, TfidfVectorizer]]:
+        """
+        Fold new CVs into the saved classifier with partial_fit.
+
+        The saved TF-IDF vocabulary is reused, so only the new rows are
+        transformed.  Returns None when a full retrain is needed instead
+        (no saved model, or the new rows bring a category the model lacks).
+        """
+        print("\n🧠 Updating Bayesian Classifier (incremental)...")
+
+        model = self._load_pickle("bayesian_classifier.pkl")
+        vectorizer = self._load_pickle("tfidf_vectorizer.pkl")
+        if model is None or vectorizer is None or not hasattr(model, 'partial_fit'):
+            print("   ⚠️  No saved classifier to update")
+            return None
+
+        categories = pd.Series(
+            [self._infer_job_category(t, x) for t, x in zip(df_new['job_title'], df_new['text'])],
+            index=df_new.index, dtype=object
+        )
+        known = set(model.classes_)
+        counts = categories.value_counts()
+        unseen = [c for c, n in counts.items() if c not in known and n >= 50]
+        if unseen:
+            print(f"   ⚠️  New categories need a full retrain: {unseen}")
+            return None
+
+        mask = categories.isin(known)
+        texts = df_new['text'][mask]
+        y = categories[mask]
+
+        accuracy = None
+        if len(y):
+            X = vectorizer.transform(texts)
+            # Score the new rows before learning them: an honest held-out estimate
+            accuracy = float(accuracy_score(y, model.predict(X)))
+            model.partial_fit(X, y)
+
+        model_file = self.models_dir / "bayesian_classifier.pkl"
+        with open(model_file, 'wb') as f:
+            pickle.dump(model, f)
+
+        print(f"   ✅ Added {len(y)} samples" + (f" (pre-update accuracy {accuracy:.2%})" if accuracy is not None else ""))
+        print(f"   💾 Saved: {model_file.name}")
+
+        self.training_report['model_performance']['bayesian_classifier'] = {
+            'mode': 'incremental',
+            'accuracy': accuracy,
+            'training_samples': int(model.class_count_.sum()),
+            'new_samples': int(len(y)),
+            'categories': [str(c) for c in model.classes_],
+            'model_file': str(model_file),
+            'vectorizer_file': str(self.models_dir / "tfidf_vectorizer.pkl")
+        }
+        self.training_report['files_created'].append(str(model_file))
+
+        return model, vectorizer
+
+    def update_statistical_models(self, df_new: pd.DataFrame, new_share: float):
+        """
+        Warm-start the saved salary forest with trees grown on the new rows.
+
+        Adds trees in proportion to the new rows' share of the data, so the
+        ensemble weights new data like the rest.  Fewer than MIN_SALARY_ROWS
+        usable new rows (or a share too small to earn a tree) are deferred:
+        the model is returned unchanged and the rows join the next full fit.
+        Returns None if there is no saved forest.
+        """
+        print("\n📊 Updating Statistical Models (incremental)...")
+
+        model = self._load_pickle("salary_predictor.pkl")
+        if model is None or not hasattr(model, 'estimators_'):
+            print("   ⚠️  No saved salary model to update")
+            return None
+
+        df_valid = self._valid_salary_rows(df_new)
+        model_file = self.models_dir / "salary_predictor.pkl"
+        r2 = None
+        added = 0
+        if len(df_valid) >= self.MIN_SALARY_ROWS:
+            added = int(round(len(model.estimators_) * new_share))
+        if added:
+            X, y = self._salary_features(df_valid)
+            r2 = float(r2_score(y, model.predict(X)))
+            model.set_params(warm_start=True, n_estimators=len(model.estimators_) + added, n_jobs=self.n_jobs)
+            model.fit(X, y)
+            with open(model_file, 'wb') as f:
+                pickle.dump(model, f)
+            print(f"   ✅ Added {added} trees on {len(df_valid)} new samples (pre-update R² {r2:.3f})")
+            print(f"   💾 Saved: {model_file.name}")
+            self.training_report['files_created'].append(str(model_file))
+        else:
+            print(f"   ⏸️  {len(df_valid)} usable new salary rows — deferred to the next full fit")
+
+        self.training_report['model_performance']['salary_predictor'] = {
+            'mode': 'incremental',
+            'r2_score': r2,
+            'new_samples': int(len(df_valid)),
+            'trees_added': added,
+            'deferred_samples': 0 if added else int(len(df_valid)),
+            'n_estimators': int(len(model.estimators_)),
+            'model_file': str(model_file)
+        }
+
+        return model
+
     def generate_report(self):
         """Generate training report"""
         report_file = Path("training_report.json")
@@ -25,6 +25,13 @@ Features used for all models:
 Target variable:
   ``industry`` (real multi-class labels).
 
+Training:
+  - Validation-based early stopping; the best epoch's weights are restored
+  - Batches are sliced from the feature matrix (never a full tensor copy);
+    scipy sparse input is densified one batch at a time
+  - Validation and prediction run in fixed-size batches
+  - ``CAREERTROJAN_LOADER_WORKERS`` > 0 loads batches in worker processes
+
 Usage:
     # Standalone
     python train_neural_networks.py
@@ -88,12 +95,55 @@ MIN_RECORDS = 100
 # Minimum number of samples a class must have to be kept
 MIN_CLASS_SAMPLES = 2
 
+# Stop after this many epochs without a validation-loss improvement of MIN_DELTA
+EARLY_STOPPING_PATIENCE = 8
+MIN_DELTA = 1e-4
+
+# Rows per forward pass when validating / predicting (bounds activation memory)
+EVAL_BATCH_SIZE = 1024
+
+# DataLoader worker processes (0 = load batches in the training process)
+LOADER_WORKERS = int(os.getenv("CAREERTROJAN_LOADER_WORKERS", "0"))
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  PyTorch model definitions
 # ═══════════════════════════════════════════════════════════════════════════
 import torch
 import torch.nn as nn
+from scipy import sparse as sp
+
+
+class BatchDataset(torch.utils.data.Dataset):
+    """
+    Row-batch view over a feature matrix.
+
+    Indexed with a list of row ids (via a ``BatchSampler``), so each batch is
+    one fancy-index slice instead of ``batch_size`` single-row lookups plus a
+    collate.  Sparse (CSR) input is densified per batch, so memory holds
+    ``batch_size × features`` floats rather than ``rows × features``.
+    ``rows`` restricts the view to a subset (e.g. a split) without copying.
+    """
+
+    def __init__(self, X: Any, y: Optional[np.ndarray] = None, rows: Optional[np.ndarray] = None):
+        self.sparse = sp.issparse(X)
+        self.X = X.tocsr() if self.sparse else X
+        self.y = y
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return self.X.shape[0] if self.rows is None else len(self.rows)
+
+    def __getitem__(self, idx):
+        if self.rows is not None:
+            idx = self.rows[idx]
+        rows = self.X[idx]
+        if self.sparse:
+            rows = rows.toarray()
+        X_b = torch.from_numpy(np.ascontiguousarray(rows, dtype=np.float32))
+        if self.y is None:
+            return (X_b,)
+        return X_b, torch.from_numpy(np.asarray(self.y[idx], dtype=np.int64))
 
 
 class DNNClassifier(nn.Module):
@@ -230,6 +280,7 @@ class NeuralNetworkTrainer:
 
         # Device selection
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.loader_workers = LOADER_WORKERS
 
         logger.info("Neural Network Trainer initialised")
         logger.info("  Data dir   : %s", self.ai_data_dir)
@@ -360,8 +411,9 @@ class NeuralNetworkTrainer:
         y = label_enc.fit_transform(df["industry"])
 
         # --- Scale features --------------------------------------------------
+        # float32 is what the networks consume, so batches are views, not casts
         scaler = StandardScaler()
-        X_dense = scaler.fit_transform(X_dense)
+        X_dense = scaler.fit_transform(X_dense).astype(np.float32)
 
         logger.info(
             "Feature matrix shape: %s  |  Classes: %d  |  TF-IDF vocab: %d",
@@ -374,21 +426,41 @@ class NeuralNetworkTrainer:
     # ------------------------------------------------------------------
     # PyTorch training helpers
     # ------------------------------------------------------------------
-    @staticmethod
     def _make_loader(
-        X: np.ndarray,
+        self,
+        X: Any,
         y: Optional[np.ndarray],
         batch_size: int = 64,
         shuffle: bool = True,
+        rows: Optional[np.ndarray] = None,
     ) -> torch.utils.data.DataLoader:
-        """Create a DataLoader from numpy arrays."""
-        X_t = torch.tensor(X, dtype=torch.float32)
-        if y is not None:
-            y_t = torch.tensor(y, dtype=torch.long)
-            ds = torch.utils.data.TensorDataset(X_t, y_t)
-        else:
-            ds = torch.utils.data.TensorDataset(X_t)
-        return torch.utils.data.DataLoader(ds, batch_size=batch_size, shuffle=shuffle)
+        """Create a batch-slicing DataLoader over a dense or sparse matrix (or a subset of its rows)."""
+        ds = BatchDataset(X, y, rows=rows)
+        order = (
+            torch.utils.data.RandomSampler(ds) if shuffle
+            else torch.utils.data.SequentialSampler(ds)
+        )
+        return torch.utils.data.DataLoader(
+            ds,
+            sampler=torch.utils.data.BatchSampler(order, batch_size=batch_size, drop_last=False),
+            batch_size=None,
+            num_workers=self.loader_workers,
+            persistent_workers=self.loader_workers > 0,
+            pin_memory=self.device.type == "cuda",
+        )
+
+    def _predict(self, model: nn.Module, X: Any) -> np.ndarray:
+        """Batched argmax predictions (no full-matrix forward pass)."""
+        model.eval()
+        preds = []
+        with torch.no_grad():
+            for (batch_X,) in self._make_loader(X, None, batch_size=EVAL_BATCH_SIZE, shuffle=False):
+                preds.append(model(batch_X.to(self.device)).argmax(dim=1).cpu().numpy())
+        return np.concatenate(preds) if preds else np.empty(0, dtype=np.int64)
+
+    @staticmethod
+    def _snapshot(model: nn.Module) -> Dict[str, torch.Tensor]:
+        return {k: v.detach().clone() for k, v in model.state_dict().items()}
 
     def _train_classifier(
         self,
@@ -401,7 +473,13 @@ class NeuralNetworkTrainer:
         lr: float = 1e-3,
         batch_size: int = 64,
     ) -> Dict[str, Any]:
-        """Generic training loop for classification models (CrossEntropyLoss)."""
+        """
+        Generic training loop for classification models (CrossEntropyLoss).
+
+        Runs up to ``epochs`` epochs, stops once validation loss has not
+        improved for ``EARLY_STOPPING_PATIENCE`` epochs and restores the
+        weights of the best epoch.
+        """
         model = model.to(self.device)
         criterion = nn.CrossEntropyLoss()
         optimizer = torch.optim.Adam(model.parameters(), lr=lr)
@@ -410,7 +488,11 @@ class NeuralNetworkTrainer:
         )
 
         train_loader = self._make_loader(X_train, y_train, batch_size=batch_size)
+        val_loader = self._make_loader(X_test, y_test, batch_size=EVAL_BATCH_SIZE, shuffle=False)
         history: Dict[str, list] = {"train_loss": [], "val_loss": [], "val_acc": []}
+        best_val_loss = float("inf")
+        best_epoch = 0
+        best_state = self._snapshot(model)
 
         for epoch in range(1, epochs + 1):
             # --- Train -------------------------------------------------------
@@ -427,15 +509,19 @@ class NeuralNetworkTrainer:
                 epoch_loss += loss.item() * batch_X.size(0)
             epoch_loss /= len(train_loader.dataset)
 
-            # --- Validate ----------------------------------------------------
+            # --- Validate (batched) -------------------------------------------
             model.eval()
+            val_loss = 0.0
+            correct = 0
             with torch.no_grad():
-                X_te_t = torch.tensor(X_test, dtype=torch.float32).to(self.device)
-                y_te_t = torch.tensor(y_test, dtype=torch.long).to(self.device)
-                val_logits = model(X_te_t)
-                val_loss = criterion(val_logits, y_te_t).item()
-                preds = val_logits.argmax(dim=1)
-                val_acc = (preds == y_te_t).float().mean().item()
+                for batch_X, batch_y in val_loader:
+                    batch_X = batch_X.to(self.device)
+                    batch_y = batch_y.to(self.device)
+                    val_logits = model(batch_X)
+                    val_loss += criterion(val_logits, batch_y).item() * batch_X.size(0)
+                    correct += (val_logits.argmax(dim=1) == batch_y).sum().item()
+            val_loss /= len(val_loader.dataset)
+            val_acc = correct / len(val_loader.dataset)
 
             scheduler.step(val_loss)
             history["train_loss"].append(epoch_loss)
@@ -448,14 +534,29 @@ class NeuralNetworkTrainer:
                     epoch, epochs, epoch_loss, val_loss, val_acc,
                 )
 
-        final_acc = history["val_acc"][-1]
-        best_acc = max(history["val_acc"])
+            # --- Early stopping ------------------------------------------------
+            if val_loss < best_val_loss - MIN_DELTA:
+                best_val_loss = val_loss
+                best_epoch = epoch
+                best_state = self._snapshot(model)
+            elif epoch - best_epoch >= EARLY_STOPPING_PATIENCE:
+                logger.info(
+                    "  Early stop at epoch %d — best val_loss %.4f at epoch %d",
+                    epoch, best_val_loss, best_epoch,
+                )
+                break
+
+        model.load_state_dict(best_state)
+        best = max(best_epoch, 1) - 1
         return {
-            "final_accuracy": float(final_acc),
-            "best_accuracy": float(best_acc),
-            "final_train_loss": float(history["train_loss"][-1]),
-            "final_val_loss": float(history["val_loss"][-1]),
-            "epochs": epochs,
+            "final_accuracy": float(history["val_acc"][best]),
+            "best_accuracy": float(max(history["val_acc"])),
+            "final_train_loss": float(history["train_loss"][best]),
+            "final_val_loss": float(history["val_loss"][best]),
+            "epochs": len(history["val_loss"]),
+            "max_epochs": epochs,
+            "best_epoch": best_epoch,
+            "stopped_early": len(history["val_loss"]) < epochs,
         }
 
     # ------------------------------------------------------------------
@@ -487,10 +588,7 @@ class NeuralNetworkTrainer:
             metrics = self._train_classifier(model, X_tr, y_tr, X_te, y_te, epochs=50)
 
             # Classification report
-            model.eval()
-            with torch.no_grad():
-                X_te_t = torch.tensor(X_te, dtype=torch.float32).to(self.device)
-                preds = model(X_te_t).argmax(dim=1).cpu().numpy()
+            preds = self._predict(model, X_te)
             report = classification_report(
                 y_te, preds, target_names=target_names, zero_division=0,
             )
@@ -534,10 +632,7 @@ class NeuralNetworkTrainer:
             metrics = self._train_classifier(model, X_tr, y_tr, X_te, y_te, epochs=40)
 
             # Classification report
-            model.eval()
-            with torch.no_grad():
-                X_te_t = torch.tensor(X_te, dtype=torch.float32).to(self.device)
-                preds = model(X_te_t).argmax(dim=1).cpu().numpy()
+            preds = self._predict(model, X_te)
             report = classification_report(
                 y_te, preds, target_names=target_names, zero_division=0,
             )
@@ -585,10 +680,7 @@ class NeuralNetworkTrainer:
             )
 
             # Classification report
-            model.eval()
-            with torch.no_grad():
-                X_te_t = torch.tensor(X_te, dtype=torch.float32).to(self.device)
-                preds = model(X_te_t).argmax(dim=1).cpu().numpy()
+            preds = self._predict(model, X_te)
             report = classification_report(
                 y_te, preds, target_names=target_names, zero_division=0,
             )
@@ -621,11 +713,20 @@ class NeuralNetworkTrainer:
             ).to(self.device)
             criterion = nn.MSELoss()
             optimizer = torch.optim.Adam(model.parameters(), lr=1e-3)
-
-            loader = self._make_loader(X_dense, y=None, batch_size=64, shuffle=True)
+            max_epochs = 60
+
+            # Hold out 10% of rows to decide when reconstruction stops improving
+            order = np.random.default_rng(42).permutation(X_dense.shape[0])
+            n_val = max(1, X_dense.shape[0] // 10)
+            loader = self._make_loader(X_dense, y=None, batch_size=64, shuffle=True, rows=order[n_val:])
+            val_loader = self._make_loader(
+                X_dense, y=None, batch_size=EVAL_BATCH_SIZE, shuffle=False, rows=np.sort(order[:n_val]),
+            )
 
             best_loss = float("inf")
-            for epoch in range(1, 61):
+            best_epoch = 0
+            best_state = self._snapshot(model)
+            for epoch in range(1, max_epochs + 1):
                 model.train()
                 epoch_loss = 0.0
                 for (batch_X,) in loader:
@@ -638,28 +739,52 @@ class NeuralNetworkTrainer:
                     epoch_loss += loss.item() * batch_X.size(0)
                 epoch_loss /= len(loader.dataset)
 
-                if epoch_loss < best_loss:
-                    best_loss = epoch_loss
+                model.eval()
+                val_loss = 0.0
+                with torch.no_grad():
+                    for (batch_X,) in val_loader:
+                        batch_X = batch_X.to(self.device)
+                        val_loss += criterion(model(batch_X), batch_X).item() * batch_X.size(0)
+                val_loss /= len(val_loader.dataset)
 
                 if epoch % 10 == 0 or epoch == 1:
                     logger.info(
-                        "  Epoch %3d/60 — recon_loss: %.6f", epoch, epoch_loss,
+                        "  Epoch %3d/%d — recon_loss: %.6f  val_recon_loss: %.6f",
+                        epoch, max_epochs, epoch_loss, val_loss,
                     )
 
+                if val_loss < best_loss - MIN_DELTA:
+                    best_loss = val_loss
+                    best_epoch = epoch
+                    best_state = self._snapshot(model)
+                elif epoch - best_epoch >= EARLY_STOPPING_PATIENCE:
+                    logger.info(
+                        "  Early stop at epoch %d — best val_recon_loss %.6f at epoch %d",
+                        epoch, best_loss, best_epoch,
+                    )
+                    break
+
+            model.load_state_dict(best_state)
+
             # Save
             torch.save(model.state_dict(), self.models_path / "autoencoder.pt")
             logger.info("Saved autoencoder.pt")
             logger.info(
-                "Autoencoder — final recon_loss: %.6f  best: %.6f",
+                "Autoencoder — last train recon_loss: %.6f  best val: %.6f (epoch %d)",
                 epoch_loss,
                 best_loss,
+                best_epoch,
             )
 
             return {
-                "final_recon_loss": float(epoch_loss),
+                "final_recon_loss": float(best_loss),
                 "best_recon_loss": float(best_loss),
+                "final_train_recon_loss": float(epoch_loss),
                 "encoding_dim": encoding_dim,
-                "epochs": 60,
+                "epochs": epoch,
+                "max_epochs": max_epochs,
+                "best_epoch": best_epoch,
+                "stopped_early": epoch < max_epochs,
             }
 
         except Exception as e:
@@ -10,7 +10,10 @@ Purpose:
   - Generate comprehensive training reports
 
 Features:
-  - Sequential training with checkpoints
+  - Independent models train concurrently in a process pool within a
+    configurable CPU budget; per-model checkpoints resume only unfinished work
+  - Incremental mode: skip models whose inputs are unchanged and
+    partial-fit / warm-start the ones that only gained rows
   - Error handling and recovery
   - Progress logging and monitoring
   - Automatic model registration
@@ -20,15 +23,22 @@ Usage:
   from training_orchestrator import TrainingOrchestrator
   orchestrator = TrainingOrchestrator()
   orchestrator.run_full_training()
+
+  # Nightly: only retrain what changed, on at most 4 cores
+  TrainingOrchestrator(incremental=True, cpu_budget=4).run_full_training()
 """
 
 import json
 import logging
+import multiprocessing
+import os
 import pickle
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 import traceback
 
 logger = logging.getLogger(__name__)
@@ -52,6 +62,22 @@ except ImportError:
     except ImportError as e:
         logger.warning("model_registry.py import failed: %s", e)
 
+try:
+    from services.ai_engine.incremental_training import (
+        MODEL_INPUTS, PRETRAINED_MODELS, TrainingManifest, TrainingPlan,
+        key_hashes, row_hashes, source_fingerprint,
+    )
+except ImportError:
+    from incremental_training import (  # noqa: F401
+        MODEL_INPUTS, PRETRAINED_MODELS, TrainingManifest, TrainingPlan,
+        key_hashes, row_hashes, source_fingerprint,
+    )
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
 
 class TrainingCheckpoint:
     """Manage training checkpoints for recovery"""
@@ -89,6 +115,84 @@ class TrainingCheckpoint:
             self.checkpoint_file.unlink()
 
 
+# ============================================================================
+# PER-MODEL TRAINING (runs in-process or in a pool worker)
+# ============================================================================
+
+MODEL_ORDER = ('bayesian_classifier', 'sentence_embeddings', 'spacy_ner', 'statistical_models')
+
+# fork shares the prepared DataFrame copy-on-write; elsewhere workers unpickle it once
+_START_METHOD = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+_SHARED_FRAME = None
+
+
+def _fit_model(trainer, model_name: str, df, plan: Optional[TrainingPlan]) -> Optional[str]:
+    """Trainer side of one model; returns the action actually taken, or None if nothing was produced"""
+    action = plan.action if plan is not None else 'full'
+    result = None
+    if model_name == 'bayesian_classifier':
+        if action == 'update':
+            result = trainer.update_bayesian_classifier(df.loc[plan.new_rows])
+            action = 'update' if result is not None else 'full'
+        if result is None:
+            result = trainer.train_bayesian_classifier(df)
+    elif model_name == 'sentence_embeddings':
+        result = trainer.setup_sentence_embeddings()
+        if result is None:
+            print("   ⚠️  Sentence embeddings not available")
+    elif model_name == 'spacy_ner':
+        result = trainer.setup_spacy_model()
+        if result is None:
+            print("   ⚠️  spaCy model not available")
+    elif model_name == 'statistical_models':
+        if action == 'update':
+            result = trainer.update_statistical_models(df.loc[plan.new_rows], plan.new_share)
+            action = 'update' if result is not None else 'full'
+        if result is None:
+            result = trainer.train_statistical_models(df)
+        if result is None:
+            print("   ⚠️  Insufficient data for statistical models")
+    else:
+        raise ValueError(f"Unknown model: {model_name}")
+    return action if result is not None else None
+
+
+def _run_training(trainer, model_name: str, df, plan: Optional[TrainingPlan], n_jobs: int) -> Dict:
+    """Train one model and package the outcome (picklable, so workers can return it)"""
+    trainer.n_jobs = n_jobs
+    files_before = len(trainer.training_report['files_created'])
+    start = time.perf_counter()
+    try:
+        action, error = _fit_model(trainer, model_name, df, plan), None
+    except Exception as e:
+        traceback.print_exc()
+        action, error = None, str(e)
+    return {
+        'model': model_name,
+        'action': action,
+        'error': error,
+        'duration_s': round(time.perf_counter() - start, 3),
+        'pid': os.getpid(),
+        'model_performance': trainer.training_report['model_performance'],
+        'files_created': trainer.training_report['files_created'][files_before:],
+    }
+
+
+def _init_worker(frame_path: Optional[str], threads: int):
+    """Pool initializer: load the shared frame (spawn only) and cap native thread pools"""
+    global _SHARED_FRAME
+    if frame_path is not None:
+        with open(frame_path, 'rb') as f:
+            _SHARED_FRAME = pickle.load(f)
+    if threadpool_limits is not None:
+        threadpool_limits(threads)
+
+
+def _train_in_worker(model_name: str, data_dir: str, plan: Optional[TrainingPlan], n_jobs: int) -> Dict:
+    trainer = CareerTrojanModelTrainer(data_dir=data_dir)
+    return _run_training(trainer, model_name, _SHARED_FRAME, plan, n_jobs)
+
+
 class TrainingOrchestrator:
     """Master controller for training all AI models"""
 
@@ -96,7 +200,9 @@ class TrainingOrchestrator:
         self,
         data_dir: str = "ai_data_final",
         models_dir: str = "admin_portal/models",
-        registry_dir: str = "admin_portal/models"
+        registry_dir: str = "admin_portal/models",
+        incremental: bool = False,
+        cpu_budget: Optional[int] = None
     ):
         """
         Initialize orchestrator
@@ -105,15 +211,23 @@ class TrainingOrchestrator:
             data_dir: Directory containing training data
             models_dir: Directory to save trained models
             registry_dir: Directory for model registry
+            incremental: Skip unchanged models and update the rest from
+                their previous artifacts where possible
+            cpu_budget: Cores to use across concurrent model trainings
+                (default: $CAREERTROJAN_TRAINING_CPUS or all cores; 1 = in-process)
         """
         self.data_dir = data_dir
         self.models_dir = models_dir
         self.registry_dir = registry_dir
+        self.incremental = incremental
+        self.cpu_budget = max(1, int(cpu_budget or os.getenv("CAREERTROJAN_TRAINING_CPUS") or os.cpu_count() or 1))
 
         # Initialize components
         self.trainer = CareerTrojanModelTrainer(data_dir=data_dir)
         self.registry = ModelRegistry(registry_dir=registry_dir, models_dir=models_dir)
         self.checkpoint = TrainingCheckpoint()
+        # Records what each artifact was fitted on (lives next to the artifacts)
+        self.manifest = TrainingManifest(self.trainer.models_dir)
 
         # Training state
         self.training_state = {
@@ -122,7 +236,12 @@ class TrainingOrchestrator:
             'end_time': None,
             'completed_models': [],
             'failed_models': [],
+            'skipped_models': [],
+            'updated_models': [],
             'total_duration': None,
+            'model_time': None,
+            'model_durations': {},
+            'workers': 1,
             'models_trained': 0,
             'all_metrics': {}
         }
@@ -133,6 +252,8 @@ class TrainingOrchestrator:
         print(f"   Data Directory: {data_dir}")
         print(f"   Models Directory: {models_dir}")
         print(f"   Registry Directory: {registry_dir}")
+        print(f"   Mode: {'incremental' if incremental else 'full'}")
+        print(f"   CPU Budget: {self.cpu_budget}")
 
     def check_prerequisites(self) -> bool:
         """Verify all prerequisites are in place"""
@@ -173,73 +294,105 @@ class TrainingOrchestrator:
         print("🤖 EXECUTING FULL TRAINING PIPELINE")
         print("="*70)
 
-        # Check for checkpoint (recovery)
-        checkpoint = self.checkpoint.load_checkpoint()
-        if checkpoint:
-            print(f"\n🔄 Found checkpoint. Resuming from: {checkpoint['last_completed_model']}")
-            self.training_state = checkpoint['state']
-
+        wall_start = time.perf_counter()
         self.training_state['status'] = 'running'
         self.training_state['start_time'] = datetime.now().isoformat()
 
         try:
-            # Load data once (efficiency)
-            print("\n📂 Loading training data...")
-            df = self.trainer.load_cv_data()
-
-            if df is None or len(df) == 0:
-                print("   ❌ Failed to load training data")
-                self.training_state['status'] = 'failed'
-                return False
-
-            print(f"   ✅ Loaded {len(df)} records")
-
-            # Train each model with error handling
-            models_to_train = [
-                ('bayesian_classifier', self._train_bayesian_model, [df]),
-                ('sentence_embeddings', self._train_sentence_embeddings, []),
-                ('spacy_ner', self._train_spacy_model, []),
-                ('statistical_models', self._train_statistical_models, [df]),
-            ]
-
-            for model_name, train_func, args in models_to_train:
-                try:
-                    print(f"\n▶️  Training: {model_name}")
-                    print("-" * 70)
-
-                    result = train_func(*args)
-
-                    if result:
-                        self.training_state['completed_models'].append(model_name)
-                        self.training_state['models_trained'] += 1
-
-                        # Save checkpoint
-                        checkpoint_state = {
-                            'last_completed_model': model_name,
-                            'state': self.training_state,
-                            'timestamp': datetime.now().isoformat()
-                        }
-                        self.checkpoint.save_checkpoint(checkpoint_state)
-
-                        print(f"   ✅ {model_name} completed")
-                    else:
-                        self.training_state['failed_models'].append(model_name)
-                        print(f"   ⚠️  {model_name} skipped or failed")
-
-                except Exception as e:
-                    print(f"   ❌ Error training {model_name}: {e}")
-                    traceback.print_exc()
+            source = source_fingerprint(Path(self.data_dir))
+
+            # Check for checkpoint (recovery): finished models are not retrained
+            resumed: Dict[str, str] = {}
+            checkpoint = self.checkpoint.load_checkpoint()
+            if checkpoint and checkpoint.get('source') == source and 'completed' in checkpoint:
+                resumed = checkpoint['completed']
+                print(f"\n🔄 Found checkpoint. Already completed: {', '.join(sorted(resumed)) or 'none'}")
+                self.training_state = checkpoint['state']
+                self.training_state.setdefault('skipped_models', [])
+                self.training_state.setdefault('updated_models', [])
+                self.training_state.setdefault('model_durations', {})
+                self.training_state['failed_models'] = []
+                self.training_state['status'] = 'running'
+            elif checkpoint:
+                print("\n🔄 Ignoring checkpoint from a different data snapshot")
+
+            df = None
+            pending_data_models = [m for m in MODEL_INPUTS if m not in resumed]
+            if not pending_data_models or (
+                self.incremental and all(self.manifest.is_current(m, source) for m in pending_data_models)
+            ):
+                print("\n📂 Training data unchanged since last fit — not reloading")
+            else:
+                # Load data once (efficiency)
+                print("\n📂 Loading training data...")
+                df = self.trainer.load_cv_data()
+
+                if df is None or len(df) == 0:
+                    print("   ❌ Failed to load training data")
+                    self.training_state['status'] = 'failed'
+                    return False
+
+                print(f"   ✅ Loaded {len(df)} records")
+
+            # Plan every model, then train the ones with work to do concurrently
+            jobs = []
+            hashes_by_model = {}
+            for model_name in MODEL_ORDER:
+                if model_name in resumed:
+                    print(f"\n⏭️  {model_name}: completed before the interruption")
+                    continue
+                plan, hashes = self._plan_model(model_name, df)
+                if plan.action == 'skip':
+                    print(f"\n⏭️  Skipping {model_name}: {plan.reason}")
+                    self.training_state['skipped_models'].append(model_name)
+                    self.manifest.mark_source(model_name, source)
+                    continue
+                print(f"\n▶️  Queued: {model_name} ({plan.action}: {plan.reason})")
+                jobs.append((model_name, plan))
+                hashes_by_model[model_name] = hashes
+
+            for result in self._run_trainings(df, jobs):
+                model_name = result['model']
+                self.training_state['model_durations'][model_name] = result['duration_s']
+                if result['error']:
+                    print(f"   ❌ Error training {model_name}: {result['error']}")
                     self.training_state['failed_models'].append(model_name)
+                    continue
+                if result['pid'] != os.getpid():
+                    # Trained in a worker: bring its report back before registering
+                    self.trainer.training_report['model_performance'].update(result['model_performance'])
+                    self.trainer.training_report['files_created'].extend(result['files_created'])
+
+                if result['action'] and self._register_model(model_name):
+                    self.training_state['completed_models'].append(model_name)
+                    self.training_state['models_trained'] += 1
+                    if result['action'] == 'update':
+                        self.training_state['updated_models'].append(model_name)
+                    self.manifest.record(model_name, hashes_by_model[model_name], result['action'], source=source)
+
+                    # Save checkpoint
+                    resumed[model_name] = result['action']
+                    checkpoint_state = {
+                        'last_completed_model': model_name,
+                        'completed': resumed,
+                        'source': source,
+                        'state': self.training_state,
+                        'timestamp': datetime.now().isoformat()
+                    }
+                    self.checkpoint.save_checkpoint(checkpoint_state)
+
+                    print(f"   ✅ {model_name} completed in {result['duration_s']:.1f}s")
+                else:
+                    self.training_state['failed_models'].append(model_name)
+                    print(f"   ⚠️  {model_name} skipped or failed")
 
             # Final status
             self.training_state['end_time'] = datetime.now().isoformat()
             self.training_state['status'] = 'completed'
 
-            # Calculate duration
-            start = datetime.fromisoformat(self.training_state['start_time'])
-            end = datetime.fromisoformat(self.training_state['end_time'])
-            duration = (end - start).total_seconds()
-            self.training_state['total_duration'] = duration
+            # Wall-clock vs summed per-model time shows what running concurrently bought
+            self.training_state['total_duration'] = round(time.perf_counter() - wall_start, 3)
+            self.training_state['model_time'] = round(sum(self.training_state['model_durations'].values()), 3)
 
             # Clear checkpoint on success
             self.checkpoint.clear_checkpoint()
@@ -252,132 +405,166 @@ class TrainingOrchestrator:
             self.training_state['status'] = 'failed'
             return False
 
-    def _train_bayesian_model(self, df) -> bool:
-        """Train Bayesian classifier and register models"""
-        try:
-            model, vectorizer = self.trainer.train_bayesian_classifier(df)
-
-            # Register models in registry
-            model_file = str(self.trainer.models_dir / "bayesian_classifier.pkl")
-            vectorizer_file = str(self.trainer.models_dir / "tfidf_vectorizer.pkl")
-
-            metrics = self.trainer.training_report['model_performance'].get('bayesian_classifier', {})
-
-            self.registry.register_model(
-                'bayesian_classifier',
-                model_file,
-                metrics,
-                model_type='sklearn'
-            )
-
-            self.registry.register_vectorizer(
-                'tfidf_vectorizer',
-                vectorizer_file,
-                'bayesian_classifier',
-                {'type': 'TfidfVectorizer', 'max_features': 5000}
-            )
-
-            # Deploy immediately (first version)
-            self.registry.deploy_model('bayesian_classifier', 'v1.0.0')
-
-            self.training_state['all_metrics']['bayesian_classifier'] = metrics
+    def _plan_model(self, model_name: str, df) -> Tuple[TrainingPlan, Optional[object]]:
+        """Decide skip / update / full for one model; returns the plan and its input row hashes"""
+        if model_name in MODEL_INPUTS:
+            if df is None:
+                return TrainingPlan(model_name, 'skip', 'training data unchanged'), None
+            hashes = row_hashes(df, MODEL_INPUTS[model_name])
+        else:
+            hashes = key_hashes(PRETRAINED_MODELS.get(model_name, model_name))
+        return self.manifest.plan(model_name, hashes, force_full=not self.incremental), hashes
+
+    def _run_trainings(self, df, jobs: List[Tuple[str, TrainingPlan]]) -> Iterator[Dict]:
+        """
+        Train ``jobs`` and yield each result as it finishes.
 
-            return True
+        With a CPU budget above one, independent models train concurrently in
+        a process pool; each worker gets an equal share of the budget as its
+        thread limit so the pool never oversubscribes the box.  Workers see
+        the prepared DataFrame read-only: inherited copy-on-write where the
+        platform forks, otherwise loaded once per worker from a spooled pickle.
+        """
+        if not jobs:
+            return
+        workers = min(len(jobs), self.cpu_budget)
+        threads = max(1, self.cpu_budget // workers)
+        self.training_state['workers'] = workers
+
+        if workers == 1:
+            for model_name, plan in jobs:
+                print(f"\n▶️  Training: {model_name}")
+                print("-" * 70)
+                yield _run_training(self.trainer, model_name, df, plan, threads)
+            return
+
+        print(f"\n⚙️  Training {len(jobs)} models on {workers} workers × {threads} threads")
+        global _SHARED_FRAME
+        frame_path = None
+        if _START_METHOD == 'fork':
+            _SHARED_FRAME = df
+        elif df is not None:
+            frame_path = self.checkpoint.checkpoint_dir / "shared_frame.pkl"
+            with open(frame_path, 'wb') as f:
+                pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
 
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(_START_METHOD),
+                initializer=_init_worker,
+                initargs=(str(frame_path) if frame_path else None, threads),
+            ) as pool:
+                futures = {
+                    pool.submit(_train_in_worker, model_name, self.data_dir, plan, threads): model_name
+                    for model_name, plan in jobs
+                }
+                for future in as_completed(futures):
+                    try:
+                        yield future.result()
+                    except Exception as e:  # worker died (e.g. OOM-killed)
+                        yield {'model': futures[future], 'action': None, 'error': f"worker crashed: {e}",
+                               'duration_s': 0.0, 'pid': None, 'model_performance': {}, 'files_created': []}
+        finally:
+            _SHARED_FRAME = None
+            if frame_path is not None:
+                frame_path.unlink(missing_ok=True)
+
+    def _register_model(self, model_name: str) -> bool:
+        """Register and deploy a freshly trained model"""
+        try:
+            return {
+                'bayesian_classifier': self._register_bayesian_model,
+                'sentence_embeddings': self._register_sentence_embeddings,
+                'spacy_ner': self._register_spacy_model,
+                'statistical_models': self._register_statistical_models,
+            }[model_name]()
         except Exception as e:
             print(f"   ❌ Error: {e}")
             return False
 
-    def _train_sentence_embeddings(self) -> bool:
-        """Setup Sentence-BERT embeddings"""
-        try:
-            model = self.trainer.setup_sentence_embeddings()
-
-            if model is None:
-                print("   ⚠️  Sentence embeddings not available")
-                return False
+    def _register_bayesian_model(self) -> bool:
+        """Register Bayesian classifier and its vectorizer"""
+        model_file = str(self.trainer.models_dir / "bayesian_classifier.pkl")
+        vectorizer_file = str(self.trainer.models_dir / "tfidf_vectorizer.pkl")
 
-            metrics = self.trainer.training_report['model_performance'].get('sentence_embeddings', {})
+        metrics = self.trainer.training_report['model_performance'].get('bayesian_classifier', {})
 
-            # Register info file
-            info_file = str(self.trainer.models_dir / "sentence_bert_info.json")
-            self.registry.register_model(
-                'sentence_embeddings',
-                info_file,
-                metrics,
-                model_type='transformer'
-            )
+        self.registry.register_model(
+            'bayesian_classifier',
+            model_file,
+            metrics,
+            model_type='sklearn'
+        )
 
-            self.registry.deploy_model('sentence_embeddings', 'v1.0.0')
+        self.registry.register_vectorizer(
+            'tfidf_vectorizer',
+            vectorizer_file,
+            'bayesian_classifier',
+            {'type': 'TfidfVectorizer', 'max_features': 5000}
+        )
 
-            self.training_state['all_metrics']['sentence_embeddings'] = metrics
+        # Deploy immediately (first version)
+        self.registry.deploy_model('bayesian_classifier', 'v1.0.0')
 
-            return True
+        self.training_state['all_metrics']['bayesian_classifier'] = metrics
 
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            return False
-
-    def _train_spacy_model(self) -> bool:
-        """Setup spaCy NER model"""
-        try:
-            nlp = self.trainer.setup_spacy_model()
+        return True
 
-            if nlp is None:
-                print("   ⚠️  spaCy model not available")
-                return False
+    def _register_sentence_embeddings(self) -> bool:
+        """Register Sentence-BERT info file"""
+        metrics = self.trainer.training_report['model_performance'].get('sentence_embeddings', {})
 
-            metrics = self.trainer.training_report['model_performance'].get('spacy_ner', {})
+        info_file = str(self.trainer.models_dir / "sentence_bert_info.json")
+        self.registry.register_model(
+            'sentence_embeddings',
+            info_file,
+            metrics,
+            model_type='transformer'
+        )
 
-            # Register info file
-            info_file = str(self.trainer.models_dir / "spacy_model_info.json")
-            self.registry.register_model(
-                'spacy_ner',
-                info_file,
-                metrics,
-                model_type='transformer'
-            )
+        self.registry.deploy_model('sentence_embeddings', 'v1.0.0')
 
-            self.registry.deploy_model('spacy_ner', 'v1.0.0')
+        self.training_state['all_metrics']['sentence_embeddings'] = metrics
 
-            self.training_state['all_metrics']['spacy_ner'] = metrics
+        return True
 
-            return True
+    def _register_spacy_model(self) -> bool:
+        """Register spaCy NER info file"""
+        metrics = self.trainer.training_report['model_performance'].get('spacy_ner', {})
 
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            return False
+        info_file = str(self.trainer.models_dir / "spacy_model_info.json")
+        self.registry.register_model(
+            'spacy_ner',
+            info_file,
+            metrics,
+            model_type='transformer'
+        )
 
-    def _train_statistical_models(self, df) -> bool:
-        """Train statistical models for predictions"""
-        try:
-            model = self.trainer.train_statistical_models(df)
+        self.registry.deploy_model('spacy_ner', 'v1.0.0')
 
-            if model is None:
-                print("   ⚠️  Insufficient data for statistical models")
-                return False
+        self.training_state['all_metrics']['spacy_ner'] = metrics
 
-            # Register model in registry
-            model_file = str(self.trainer.models_dir / "salary_predictor.pkl")
+        return True
 
-            metrics = self.trainer.training_report['model_performance'].get('salary_predictor', {})
+    def _register_statistical_models(self) -> bool:
+        """Register salary predictor"""
+        model_file = str(self.trainer.models_dir / "salary_predictor.pkl")
 
-            self.registry.register_model(
-                'salary_predictor',
-                model_file,
-                metrics,
-                model_type='sklearn'
-            )
+        metrics = self.trainer.training_report['model_performance'].get('salary_predictor', {})
 
-            self.registry.deploy_model('salary_predictor', 'v1.0.0')
+        self.registry.register_model(
+            'salary_predictor',
+            model_file,
+            metrics,
+            model_type='sklearn'
+        )
 
-            self.training_state['all_metrics']['salary_predictor'] = metrics
+        self.registry.deploy_model('salary_predictor', 'v1.0.0')
 
-            return True
+        self.training_state['all_metrics']['salary_predictor'] = metrics
 
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            return False
+        return True
 
     def generate_report(self) -> bool:
         """Generate comprehensive training report"""
@@ -396,7 +583,12 @@ class TrainingOrchestrator:
                     'trained_models': self.training_state['models_trained'],
                     'completed': self.training_state['completed_models'],
                     'failed': self.training_state['failed_models'],
+                    'skipped': self.training_state.get('skipped_models', []),
+                    'updated_incrementally': self.training_state.get('updated_models', []),
                     'duration_seconds': self.training_state['total_duration'],
+                    'model_seconds': self.training_state.get('model_time'),
+                    'model_durations': self.training_state.get('model_durations', {}),
+                    'workers': self.training_state.get('workers', 1),
                 },
                 'trainer_metrics': self.trainer.training_report,
                 'model_registry': self.registry.list_models(),
@@ -429,11 +621,25 @@ class TrainingOrchestrator:
             minutes = int((self.training_state['total_duration'] % 3600) // 60)
             seconds = int(self.training_state['total_duration'] % 60)
             print(f"Duration: {hours}h {minutes}m {seconds}s")
+            model_time = self.training_state.get('model_time')
+            if model_time:
+                print(f"Model time: {model_time:.1f}s on {self.training_state.get('workers', 1)} worker(s) "
+                      f"({model_time / max(self.training_state['total_duration'], 1e-9):.1f}x wall-clock)")
 
         print(f"\n✅ Completed Models ({len(self.training_state['completed_models'])}):")
         for model in self.training_state['completed_models']:
             print(f"   ✅ {model}")
 
+        if self.training_state.get('updated_models'):
+            print(f"\n🔁 Updated Incrementally ({len(self.training_state['updated_models'])}):")
+            for model in self.training_state['updated_models']:
+                print(f"   🔁 {model}")
+
+        if self.training_state.get('skipped_models'):
+            print(f"\n⏭️  Skipped — inputs unchanged ({len(self.training_state['skipped_models'])}):")
+            for model in self.training_state['skipped_models']:
+                print(f"   ⏭️  {model}")
+
         if self.training_state['failed_models']:
             print(f"\n❌ Failed Models ({len(self.training_state['failed_models'])}):")
             for model in self.training_state['failed_models']:
@@ -338,6 +338,65 @@ async def _start_enrichment_watchdog():
     except Exception as e:
         logger.warning("Enrichment watchdog failed to start: %s", e)
 
+@app.on_event("startup")
+async def _start_recency_index():
+    """Keep ai_data_final file counts and newest-first lists live for dashboards."""
+    if os.environ.get("TESTING"):
+        return
+    try:
+        analytics.recency_index.start()
+        logger.info("Recency index started for %s", analytics.AI_DATA_PATH)
+    except Exception as e:
+        logger.warning("Recency index failed to start: %s", e)
+
+@app.on_event("shutdown")
+async def _stop_recency_index():
+    try:
+        analytics.recency_index.stop()
+    except Exception:
+        pass
+
+@app.on_event("startup")
+async def _backfill_interaction_partitions():
+    """Index pre-partition interaction files once, off the request path."""
+    if os.environ.get("TESTING"):
+        return
+    import threading
+    from services.backend_api.services.interaction_partitions import get_interaction_partitions
+    partitions = get_interaction_partitions()
+    if partitions.backfill_done:
+        return
+
+    def _run():
+        try:
+            added = partitions.ensure_backfilled()
+            logger.info("Interaction partition backfill complete (%d records)", added)
+        except Exception as e:
+            logger.warning("Interaction partition backfill failed (erasure will retry): %s", e)
+
+    threading.Thread(target=_run, daemon=True, name="interaction-backfill").start()
+
+@app.on_event("startup")
+async def _start_insight_view():
+    """Build the materialized insight view over all profiles in the background."""
+    if os.environ.get("TESTING"):
+        logger.info("TESTING mode — skipping insight view build")
+        return
+    try:
+        from services.ai_engine.insight_views import start_insight_view
+        start_insight_view(axis_maps=insights.RADAR_AXIS_MAPS, interval_seconds=60)
+        logger.info("Insight view build started (60s refresh)")
+    except Exception as e:
+        logger.warning("Insight view failed to start: %s", e)
+
+@app.on_event("shutdown")
+async def _stop_insight_view():
+    try:
+        from services.ai_engine.insight_views import stop_insight_view
+        stop_insight_view()
+    except Exception:
+        pass
+
 @app.on_event("shutdown")
 async def _stop_enrichment_watchdog():
     try:
@@ -346,6 +405,29 @@ async def _stop_enrichment_watchdog():
     except Exception:
         pass
 
+@app.on_event("shutdown")
+async def _persist_web_intelligence_caches():
+    """Write the web intelligence result/HTTP caches so a restart starts warm."""
+    import sys
+    module = sys.modules.get("services.backend_api.services.production_web_intelligence")
+    if module is None:  # never used in this worker
+        return
+    try:
+        module.close_web_intelligence()
+    except Exception as e:
+        logger.warning("Web intelligence caches not persisted: %s", e)
+
+@app.on_event("shutdown")
+async def _stop_enrichment_model_watcher():
+    import sys
+    module = sys.modules.get("services.backend_api.services.enrichment.ai_enrichment_orchestrator")
+    if module is None:  # never used in this worker
+        return
+    try:
+        module.close_enrichment_orchestrator()
+    except Exception:
+        pass
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8500)
@@ -9,6 +9,7 @@ to the appropriate enrichment pipeline (embedding, ranking feedback, coaching, U
 
 Data flows:
   [User Request] → [This Middleware] → interactions/{date}/{timestamp}.json
+                                       + interactions_by_user/{shard}/{user}.jsonl (GDPR)
                                             ↓
                               [ai_orchestrator_enrichment.py] (watchdog)
                                             ↓
@@ -29,6 +30,8 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from services.backend_api.services.interaction_partitions import get_interaction_partitions
+
 logger = logging.getLogger("interaction_logger")
 
 # ── Resolve data root (portable) — L: drive is source of truth ─
@@ -176,6 +179,8 @@ class InteractionLoggerMiddleware(BaseHTTPMiddleware):
             filename = f"{now.strftime('%H%M%S')}_{user_id}_{record['action_type']}.json"
             filepath = day_dir / filename
             filepath.write_text(json.dumps(record, indent=2), encoding="utf-8")
+            # Per-user partition so GDPR export/erasure never walk the day dirs
+            get_interaction_partitions().append(record, day_file=filepath)
         except Exception as e:
             logger.warning(f"InteractionLogger: disk write failed: {e}")
 
@@ -3,21 +3,41 @@ Rate Limiting Middleware — per-IP sliding-window request throttle.
 ================================================================
 
 Prevents API abuse by enforcing a per-IP request limit within a
-rolling time window.  Uses an in-memory dict (sufficient for single-
-process deployments).  For multi-worker, swap to Redis-backed counters.
+rolling time window.  Counts live in a pluggable store so every
+uvicorn worker enforces the *same* limit:
 
-Default: 100 requests per 60 seconds per IP.
+    memory  — in-process dict (single worker / tests)
+    sqlite  — one SQLite file shared by all workers on a host
+    redis   — shared across hosts (REDIS_URL)
+
+Each store keeps two fixed-window counters per IP (current and
+previous) and estimates the sliding window as
+
+    previous × (1 − elapsed / window) + current
+
+which is O(1) per request and memory, and expires idle IPs after two
+windows.
+
+Default: 100 requests per 60 seconds per IP, ``auto`` store (Redis if
+reachable, else SQLite, else memory) so a multi-worker deployment shares
+one limit out of the box; tests (TESTING set) default to memory.
 Override via env:
     RATE_LIMIT_MAX_REQUESTS=100
     RATE_LIMIT_WINDOW_SECONDS=60
+    RATE_LIMIT_BACKEND=memory|sqlite|redis|auto
+    RATE_LIMIT_SQLITE_PATH=/tmp/careertrojan_rate_limit.db
 """
 
 import os
+import sqlite3
+import tempfile
+import threading
 import time
 import logging
-from collections import defaultdict
-from typing import Dict, List
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
 
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
@@ -26,24 +46,225 @@ logger = logging.getLogger("rate_limiter")
 
 MAX_REQUESTS = int(os.getenv("RATE_LIMIT_MAX_REQUESTS", "100"))
 WINDOW_SECONDS = int(os.getenv("RATE_LIMIT_WINDOW_SECONDS", "60"))
+BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory" if os.getenv("TESTING") else "auto").lower()
+SQLITE_PATH = os.getenv(
+    "RATE_LIMIT_SQLITE_PATH", os.path.join(tempfile.gettempdir(), "careertrojan_rate_limit.db")
+)
 
 # Paths exempt from rate limiting (health checks, OpenAPI docs)
 EXEMPT_PATHS = {"/docs", "/redoc", "/openapi.json", "/api/shared/v1/health", "/api/shared/v1/health/deep"}
 
 
+def sliding_estimate(prev: int, cur: int, elapsed: float, window: float) -> float:
+    """Approximate request count over the trailing ``window`` seconds."""
+    return prev * max(0.0, 1.0 - elapsed / window) + cur
+
+
+def retry_after_seconds(prev: int, cur: int, elapsed: float, window: float, limit: int) -> int:
+    """Whole seconds until one more request fits under ``limit`` again."""
+    room = limit - 1
+    if cur <= room:
+        # Wait for enough of the previous window's weight to decay
+        wait = window * (1.0 - (room - cur) / prev) - elapsed if prev else 0.0
+    else:
+        # Current window is full; wait for it to roll over and partly decay
+        wait = (window - elapsed) + window * (1.0 - room / cur)
+    return int(max(wait, 0.0)) + 1
+
+
+class RateLimitStore(ABC):
+    """Shared counter store.  ``hit`` must check-and-count atomically."""
+
+    # True when ``hit`` does I/O (SQLite, Redis): the middleware then runs it
+    # in the threadpool so the event loop never waits on the store.
+    blocking = True
+
+    @abstractmethod
+    def hit(self, key: str, limit: int, window: int, now: float) -> Tuple[bool, int]:
+        """Count one request for ``key`` unless it would exceed ``limit``.
+
+        Returns ``(allowed, retry_after_seconds)``; denied requests are not
+        counted.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget every counter."""
+
+    @staticmethod
+    def _decide(prev: int, cur: int, now: float, window: int, limit: int) -> Tuple[bool, int]:
+        elapsed = now % window
+        if sliding_estimate(prev, cur, elapsed, window) + 1 > limit:
+            return False, retry_after_seconds(prev, cur, elapsed, window, limit)
+        return True, 0
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """In-process counters.  Limits apply per worker process."""
+
+    blocking = False  # a dict update under a lock; a thread hop would cost more
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key → [window index, previous count, current count]
+        self._counters: Dict[str, List[int]] = {}
+        self._swept_window = 0
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def hit(self, key: str, limit: int, window: int, now: float) -> Tuple[bool, int]:
+        idx = int(now // window)
+        with self._lock:
+            if idx > self._swept_window:
+                self._sweep(idx)
+            entry = self._counters.get(key)
+            if entry is None or entry[0] < idx - 1:
+                entry = [idx, 0, 0]
+                self._counters[key] = entry
+            elif entry[0] == idx - 1:
+                entry[:] = [idx, entry[2], 0]
+            allowed, retry_after = self._decide(entry[1], entry[2], now, window, limit)
+            if allowed:
+                entry[2] += 1
+            return allowed, retry_after
+
+    def _sweep(self, idx: int) -> None:
+        # Once per window: forget IPs idle for two full windows
+        self._counters = {k: v for k, v in self._counters.items() if v[0] >= idx - 1}
+        self._swept_window = idx
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+class SQLiteRateLimitStore(RateLimitStore):
+    """Counters in one SQLite file, shared by every process on the host."""
+
+    def __init__(self, path: str = SQLITE_PATH, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._swept_window = 0
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit ("
+            " key TEXT PRIMARY KEY, window INTEGER NOT NULL,"
+            " prev INTEGER NOT NULL, cur INTEGER NOT NULL)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def hit(self, key: str, limit: int, window: int, now: float) -> Tuple[bool, int]:
+        idx = int(now // window)
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if idx > self._swept_window:
+                conn.execute("DELETE FROM rate_limit WHERE window < ?", (idx - 1,))
+                self._swept_window = idx
+            row = conn.execute(
+                "SELECT window, prev, cur FROM rate_limit WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[0] < idx - 1:
+                prev, cur = 0, 0
+            elif row[0] == idx - 1:
+                prev, cur = row[2], 0
+            else:
+                prev, cur = row[1], row[2]
+            allowed, retry_after = self._decide(prev, cur, now, window, limit)
+            if allowed:
+                conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit (key, window, prev, cur) VALUES (?, ?, ?, ?)",
+                    (key, idx, prev, cur + 1),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed, retry_after
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM rate_limit")
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """Counters in Redis, shared across hosts.  Keys expire after two windows."""
+
+    PREFIX = "careertrojan:ratelimit:"
+
+    def __init__(self, client):
+        self.client = client
+
+    def hit(self, key: str, limit: int, window: int, now: float) -> Tuple[bool, int]:
+        idx = int(now // window)
+        cur_key = f"{self.PREFIX}{key}:{idx}"
+        pipe = self.client.pipeline()
+        pipe.get(f"{self.PREFIX}{key}:{idx - 1}")
+        pipe.incr(cur_key)
+        pipe.expire(cur_key, window * 2)
+        prev, cur, _ = pipe.execute()
+        # Count optimistically, then hand the slot back if it was over
+        allowed, retry_after = self._decide(int(prev or 0), cur - 1, now, window, limit)
+        if not allowed:
+            self.client.decr(cur_key)
+        return allowed, retry_after
+
+    def clear(self) -> None:
+        for k in self.client.scan_iter(f"{self.PREFIX}*"):
+            self.client.delete(k)
+
+
+def build_rate_limit_store(backend: str = BACKEND) -> RateLimitStore:
+    """Create the configured store, degrading to in-memory if unavailable."""
+    if backend in ("redis", "auto"):
+        try:
+            import redis as _redis_mod
+            client = _redis_mod.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+            client.ping()
+            logger.info("Rate limiter using Redis store")
+            return RedisRateLimitStore(client)
+        except Exception as e:
+            logger.warning(f"Redis rate-limit store unavailable ({e})")
+            if backend == "redis":
+                backend = "sqlite"
+    if backend in ("sqlite", "auto"):
+        try:
+            store = SQLiteRateLimitStore(SQLITE_PATH)
+            logger.info(f"Rate limiter using SQLite store at {SQLITE_PATH}")
+            return store
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite rate-limit store unavailable ({e})")
+    return MemoryRateLimitStore()
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Sliding-window rate limiter.
-    Tracks timestamps of requests per client IP.
+    Counts requests per client IP in a shared store.
     Returns HTTP 429 when the window is exceeded.
     """
 
-    def __init__(self, app, max_requests: int = MAX_REQUESTS, window_seconds: int = WINDOW_SECONDS):
+    def __init__(
+        self,
+        app,
+        max_requests: int = MAX_REQUESTS,
+        window_seconds: int = WINDOW_SECONDS,
+        store: Optional[RateLimitStore] = None,
+    ):
         super().__init__(app)
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        # IP → list of timestamps
-        self._hits: Dict[str, List[float]] = defaultdict(list)
+        # Named _hits so test fixtures can keep calling _hits.clear()
+        self._hits: RateLimitStore = store if store is not None else build_rate_limit_store()
 
     def _client_ip(self, request: Request) -> str:
         """Extract client IP (respects X-Forwarded-For behind reverse proxy)."""
@@ -52,24 +273,26 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return forwarded.split(",")[0].strip()
         return request.client.host if request.client else "unknown"
 
-    def _prune(self, ip: str, now: float):
-        """Remove timestamps outside the current window."""
-        cutoff = now - self.window_seconds
-        self._hits[ip] = [t for t in self._hits[ip] if t > cutoff]
-
     async def dispatch(self, request: Request, call_next):
         # Skip rate limiting for exempt paths
         if request.url.path in EXEMPT_PATHS:
             return await call_next(request)
 
         ip = self._client_ip(request)
-        now = time.time()
 
-        self._prune(ip, now)
+        try:
+            args = (ip, self.max_requests, self.window_seconds, time.time())
+            if self._hits.blocking:
+                allowed, retry_after = await run_in_threadpool(self._hits.hit, *args)
+            else:
+                allowed, retry_after = self._hits.hit(*args)
+        except Exception as e:
+            # Fail open — a broken counter store must not take the API down
+            logger.error(f"Rate limit store error: {e}")
+            return await call_next(request)
 
-        if len(self._hits[ip]) >= self.max_requests:
-            retry_after = int(self.window_seconds - (now - self._hits[ip][0])) + 1
-            logger.warning(f"Rate limit exceeded for {ip} ({len(self._hits[ip])} requests in window)")
+        if not allowed:
+            logger.warning(f"Rate limit exceeded for {ip} (limit {self.max_requests}/{self.window_seconds}s)")
             return JSONResponse(
                 status_code=429,
                 content={
@@ -79,5 +302,4 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 headers={"Retry-After": str(retry_after)},
             )
 
-        self._hits[ip].append(now)
         return await call_next(request)
@@ -97,6 +97,11 @@ class CalibrationTrainRequest(BaseModel):
     method: str = Field(default="isotonic", description="Calibration method")
 
 
+class SuiteBudgetRequest(BaseModel):
+    p95_latency_ms: Optional[float] = Field(default=None, gt=0, description="Max p95 latency")
+    min_throughput_rps: Optional[float] = Field(default=None, gt=0, description="Min tests/second")
+
+
 # ── Gateway Endpoints ────────────────────────────────────────────────────
 
 @router.post("/gateway/score", summary="Score a candidate CV/profile")
@@ -320,12 +325,16 @@ async def list_test_suites():
 
 
 @router.post("/evaluation/run/{suite}", summary="Run test suite")
-async def run_test_suite(suite: str):
+async def run_test_suite(
+    suite: str,
+    max_workers: Optional[int] = Query(default=None, ge=1, le=32),
+    model_hash: Optional[str] = Query(default=None, description="Reuse cached results for this model hash"),
+):
     """Run a specific golden test suite."""
     try:
         from services.ai_engine.control_plane import get_evaluator
         evaluator = get_evaluator()
-        report = evaluator.run_suite(suite)
+        report = evaluator.run_suite(suite, max_workers=max_workers, model_hash=model_hash)
         return report.to_dict()
     except Exception as e:
         logger.exception("run_test_suite failed")
@@ -333,25 +342,51 @@ async def run_test_suite(suite: str):
 
 
 @router.post("/evaluation/run-all", summary="Run all test suites")
-async def run_all_tests():
+async def run_all_tests(
+    max_workers: Optional[int] = Query(default=None, ge=1, le=32),
+    model_hash: Optional[str] = Query(default=None, description="Reuse cached results for this model hash"),
+):
     """Run all golden test suites."""
     try:
         from services.ai_engine.control_plane import get_evaluator
         evaluator = get_evaluator()
-        reports = evaluator.run_golden_tests()
+        reports = evaluator.run_golden_tests(max_workers=max_workers, model_hash=model_hash)
         return {k: v.to_dict() for k, v in reports.items()}
     except Exception as e:
         logger.exception("run_all_tests failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.put("/evaluation/budget/{suite}", summary="Set suite performance budget")
+async def set_suite_budget(suite: str, request: SuiteBudgetRequest):
+    """Set latency/throughput budgets treated as regression criteria."""
+    try:
+        from services.ai_engine.control_plane import get_evaluator
+        evaluator = get_evaluator()
+        success = evaluator.set_budget(
+            suite,
+            p95_latency_ms=request.p95_latency_ms,
+            min_throughput_rps=request.min_throughput_rps,
+        )
+        return {"success": success, "suite": suite, "budget": evaluator.get_stats()["budgets"].get(suite)}
+    except Exception as e:
+        logger.exception("set_suite_budget failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/evaluation/regression", summary="Check for regression")
-async def check_regression(threshold: float = Query(default=0.05, ge=0.01, le=0.5)):
-    """Check for regression against historical results."""
+async def check_regression(
+    threshold: float = Query(default=0.05, ge=0.01, le=0.5),
+    max_workers: Optional[int] = Query(default=None, ge=1, le=32),
+    model_hash: Optional[str] = Query(default=None, description="Reuse cached results for this model hash"),
+):
+    """Check for quality and performance-budget regression against historical results."""
     try:
         from services.ai_engine.control_plane import get_evaluator
         evaluator = get_evaluator()
-        is_regressed, details = evaluator.check_regression(threshold=threshold)
+        is_regressed, details = evaluator.check_regression(
+            threshold=threshold, max_workers=max_workers, model_hash=model_hash,
+        )
         return {"is_regressed": is_regressed, "details": details}
     except Exception as e:
         logger.exception("check_regression failed")
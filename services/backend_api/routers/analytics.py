@@ -11,6 +11,7 @@ from typing import Dict, Any
 from datetime import datetime
 
 from services.backend_api.utils.auth_deps import require_admin
+from services.shared.recency_index import get_recency_index
 
 import os
 router = APIRouter(prefix="/api/analytics/v1", tags=["analytics"], dependencies=[Depends(require_admin)])
@@ -19,6 +20,29 @@ router = APIRouter(prefix="/api/analytics/v1", tags=["analytics"], dependencies=
 _DATA_ROOT = Path(os.environ.get("CAREERTROJAN_DATA_ROOT", r"L:\antigravity_version_ai_data_final"))
 AI_DATA_PATH = _DATA_ROOT / "ai_data_final"
 
+# Live counts + newest-first file lists, maintained incrementally
+recency_index = get_recency_index(AI_DATA_PATH)
+
+
+def _load_recent(dir_name: str, limit: int) -> list:
+    """Load the newest ``limit`` JSON docs of a directory from the recency index."""
+    docs = []
+    for json_file, mtime in recency_index.recent(dir_name, limit):
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            docs.append({
+                "doc_id": json_file.stem,
+                "timestamp": datetime.fromtimestamp(mtime).isoformat(),
+                "data": data
+            })
+        except FileNotFoundError:
+            recency_index.record_delete(json_file)
+        except Exception as e:
+            print(f"Error loading {json_file}: {e}")
+            continue
+    return docs
+
 @router.get("/statistics")
 async def get_statistics() -> Dict[str, Any]:
     """
@@ -53,11 +77,7 @@ async def get_statistics() -> Dict[str, Any]:
     ]
 
     for dir_name in directories:
-        dir_path = AI_DATA_PATH / dir_name
-        if dir_path.exists():
-            stats[dir_name] = len(list(dir_path.glob("*.json")))
-        else:
-            stats[dir_name] = 0
+        stats[dir_name] = recency_index.count(dir_name)
 
     return {
         "ok": True,
@@ -88,29 +108,7 @@ async def get_dashboard_data() -> Dict[str, Any]:
     stats = stats_response["data"]
 
     # Get recent resumes
-    recent_resumes = []
-    resume_path = AI_DATA_PATH / "parsed_resumes"
-    if resume_path.exists():
-        resume_files = sorted(
-            resume_path.glob("*.json"),
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )[:10]
-
-        for json_file in resume_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    recent_resumes.append({
-                        "doc_id": json_file.stem,
-                        "timestamp": datetime.fromtimestamp(
-                            json_file.stat().st_mtime
-                        ).isoformat(),
-                        "data": data
-                    })
-            except Exception as e:
-                print(f"Error loading {json_file}: {e}")
-                continue
+    recent_resumes = _load_recent("parsed_resumes", 10)
 
     # Get training status
     training_status = {
@@ -159,8 +157,7 @@ async def get_recent_resumes(limit: int = 10) -> Dict[str, Any]:
             "data": List[dict]
         }
     """
-    resume_path = AI_DATA_PATH / "parsed_resumes"
-    if not resume_path.exists():
+    if not recency_index.exists("parsed_resumes"):
         return {
             "ok": True,
             "count": 0,
@@ -168,27 +165,7 @@ async def get_recent_resumes(limit: int = 10) -> Dict[str, Any]:
             "message": "No parsed resumes found"
         }
 
-    resume_files = sorted(
-        resume_path.glob("*.json"),
-        key=lambda x: x.stat().st_mtime,
-        reverse=True
-    )[:limit]
-
-    resumes = []
-    for json_file in resume_files:
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                resumes.append({
-                    "doc_id": json_file.stem,
-                    "timestamp": datetime.fromtimestamp(
-                        json_file.stat().st_mtime
-                    ).isoformat(),
-                    "data": data
-                })
-        except Exception as e:
-            print(f"Error loading {json_file}: {e}")
-            continue
+    resumes = _load_recent("parsed_resumes", limit)
 
     return {
         "ok": True,
@@ -212,8 +189,7 @@ async def get_recent_jobs(limit: int = 10) -> Dict[str, Any]:
             "data": List[dict]
         }
     """
-    jd_path = AI_DATA_PATH / "parsed_job_descriptions"
-    if not jd_path.exists():
+    if not recency_index.exists("parsed_job_descriptions"):
         return {
             "ok": True,
             "count": 0,
@@ -221,27 +197,7 @@ async def get_recent_jobs(limit: int = 10) -> Dict[str, Any]:
             "message": "No parsed job descriptions found"
         }
 
-    job_files = sorted(
-        jd_path.glob("*.json"),
-        key=lambda x: x.stat().st_mtime,
-        reverse=True
-    )[:limit]
-
-    jobs = []
-    for json_file in job_files:
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                jobs.append({
-                    "doc_id": json_file.stem,
-                    "timestamp": datetime.fromtimestamp(
-                        json_file.stat().st_mtime
-                    ).isoformat(),
-                    "data": data
-                })
-        except Exception as e:
-            print(f"Error loading {json_file}: {e}")
-            continue
+    jobs = _load_recent("parsed_job_descriptions", limit)
 
     return {
         "ok": True,
@@ -274,10 +230,9 @@ async def get_system_health() -> Dict[str, Any]:
     ]
 
     for dir_name in critical_dirs:
-        dir_path = AI_DATA_PATH / dir_name
         health["directories"][dir_name] = {
-            "exists": dir_path.exists(),
-            "file_count": len(list(dir_path.glob("*.json"))) if dir_path.exists() else 0
+            "exists": recency_index.exists(dir_name),
+            "file_count": recency_index.count(dir_name)
         }
 
     # Check trained models
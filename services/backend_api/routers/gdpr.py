@@ -16,18 +16,27 @@ import os
 import shutil
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
-from services.backend_api.db.connection import get_db
+from services.backend_api.db.connection import SessionLocal, get_db
 from services.backend_api.db import models
+from services.backend_api.services.interaction_partitions import get_interaction_partitions
+from services.backend_api.services.career.user_vector_service import UserVectorService
 from services.backend_api.utils import security
 
 logger = logging.getLogger("gdpr")
 router = APIRouter(prefix="/api/gdpr/v1", tags=["gdpr"])
 
+_DATA_ROOT = Path(os.getenv("CAREERTROJAN_DATA_ROOT", r"L:\antigravity_version_ai_data_final"))
+EXPORT_DIR = Path(os.getenv("CAREERTROJAN_GDPR_EXPORT_DIR", str(_DATA_ROOT / "USER DATA" / "gdpr_exports")))
+EXPORT_TTL_DAYS = 30
+_STREAM_BATCH = 1000
+
 
 # ── Dependency: authenticated user ────────────────────────────
 
@@ -122,23 +131,19 @@ def grant_consent(
 
 # ── Art. 15 / 20 — Data Export ────────────────────────────────
 
-@router.get("/export")
-def export_my_data(
-    request: Request = None,
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _export_chunks(db: Session, user: models.User) -> Iterator[str]:
     """
-    Export ALL personal data as a JSON bundle.
-    Returns the data inline (for small datasets).
-    For large datasets, a background job + download link pattern is preferred.
+    Yield the export bundle as JSON text, section by section.
+    Interactions are streamed in batches, so memory stays flat however
+    long the user's history is.
     """
-    ip = request.client.host if request and request.client else None
-
-    # Gather profile
     profile_data = None
-    if current_user.profile:
-        p = current_user.profile
+    if user.profile:
+        p = user.profile
         profile_data = {
             "bio": p.bio,
             "linkedin_url": p.linkedin_url,
@@ -148,57 +153,83 @@ def export_my_data(
             "location": p.location,
         }
 
-    # Gather resumes (metadata only — not binary files)
-    resumes = [
-        {"id": r.id, "file_path": r.file_path, "version": r.version,
-         "is_primary": r.is_primary, "created_at": r.created_at.isoformat() if r.created_at else None}
-        for r in current_user.resumes
-    ]
-
-    # Gather mentorship data
-    mentorships = [
-        {"id": m.id, "mentor_id": m.mentor_id, "status": m.status,
-         "scheduled_at": m.scheduled_at.isoformat() if m.scheduled_at else None,
-         "notes": m.notes, "created_at": m.created_at.isoformat() if m.created_at else None}
-        for m in current_user.mentorship_requests
-    ]
-
-    # Gather consent records
-    consents = [
-        {"consent_type": c.consent_type, "granted": c.granted,
-         "version": c.version, "created_at": c.created_at.isoformat() if c.created_at else None,
-         "revoked_at": c.revoked_at.isoformat() if c.revoked_at else None}
-        for c in (db.query(models.ConsentRecord)
-                  .filter(models.ConsentRecord.user_id == current_user.id).all())
-    ]
-
-    # Gather interactions (last 10,000 for inline response)
-    interactions = [
-        {"action_type": i.action_type, "method": i.method, "path": i.path,
-         "status_code": i.status_code, "created_at": i.created_at.isoformat() if i.created_at else None}
-        for i in (db.query(models.Interaction)
-                  .filter(models.Interaction.user_id == current_user.id)
-                  .order_by(models.Interaction.created_at.desc())
-                  .limit(10000).all())
-    ]
-
-    export_bundle = {
+    sections = {
         "export_date": datetime.utcnow().isoformat(),
         "user": {
-            "id": current_user.id,
-            "email": current_user.email,
-            "full_name": current_user.full_name,
-            "role": current_user.role,
-            "is_active": current_user.is_active,
-            "created_at": current_user.created_at.isoformat() if current_user.created_at else None,
+            "id": user.id,
+            "email": user.email,
+            "full_name": user.full_name,
+            "role": user.role,
+            "is_active": user.is_active,
+            "created_at": _iso(user.created_at),
         },
         "profile": profile_data,
-        "resumes": resumes,
-        "mentorships": mentorships,
-        "consent_records": consents,
-        "interactions": interactions,
+        # Resume metadata only — not binary files
+        "resumes": [
+            {"id": r.id, "file_path": r.file_path, "version": r.version,
+             "is_primary": r.is_primary, "created_at": _iso(r.created_at)}
+            for r in user.resumes
+        ],
+        "mentorships": [
+            {"id": m.id, "mentor_id": m.mentor_id, "status": m.status,
+             "scheduled_at": _iso(m.scheduled_at), "notes": m.notes, "created_at": _iso(m.created_at)}
+            for m in user.mentorship_requests
+        ],
+        "consent_records": [
+            {"consent_type": c.consent_type, "granted": c.granted,
+             "version": c.version, "created_at": _iso(c.created_at), "revoked_at": _iso(c.revoked_at)}
+            for c in (db.query(models.ConsentRecord)
+                      .filter(models.ConsentRecord.user_id == user.id).all())
+        ],
     }
 
+    yield "{"
+    for key, value in sections.items():
+        yield f"{json.dumps(key)}: {json.dumps(value, default=str)}, "
+
+    yield '"interactions": ['
+    rows = (db.query(models.Interaction)
+            .filter(models.Interaction.user_id == user.id)
+            .order_by(models.Interaction.created_at.desc())
+            .yield_per(_STREAM_BATCH))
+    for n, i in enumerate(rows):
+        item = {"action_type": i.action_type, "method": i.method, "path": i.path,
+                "status_code": i.status_code, "created_at": _iso(i.created_at)}
+        yield ("" if n == 0 else ", ") + json.dumps(item)
+
+    # File-logged interactions, from this user's partition only
+    yield '], "interaction_log": ['
+    partitions = get_interaction_partitions()
+    partitions.ensure_backfilled()
+    for n, rec in enumerate(partitions.iter_records(user.id, user.email)):
+        rec.pop("day_file", None)
+        yield ("" if n == 0 else ", ") + json.dumps(rec, default=str)
+    yield "]}"
+
+
+def _stream_export(user_id: int) -> Iterator[str]:
+    # Own session: the request-scoped one is closed before a streamed body is sent
+    db = SessionLocal()
+    try:
+        user = db.query(models.User).filter(models.User.id == user_id).one()
+        yield from _export_chunks(db, user)
+    finally:
+        db.close()
+
+
+@router.get("/export")
+def export_my_data(
+    request: Request = None,
+    current_user: models.User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Export ALL personal data as a JSON bundle, streamed as it is read.
+    For very large histories, POST /export/jobs builds a downloadable file
+    in the background instead.
+    """
+    ip = request.client.host if request and request.client else None
+
     # Record the export in audit log
     _audit(db, current_user.id, current_user.id, "data_export",
            "user", str(current_user.id), "Full personal data export", ip)
@@ -208,12 +239,116 @@ def export_my_data(
         user_id=current_user.id,
         status="completed",
         completed_at=datetime.utcnow(),
-        expires_at=datetime.utcnow() + timedelta(days=30),
+        expires_at=datetime.utcnow() + timedelta(days=EXPORT_TTL_DAYS),
     )
     db.add(export_req)
     db.commit()
 
-    return export_bundle
+    return StreamingResponse(_stream_export(current_user.id), media_type="application/json")
+
+
+def _build_export_file(request_id: int) -> None:
+    """Background task: write the export bundle to disk, then mark it completed."""
+    db = SessionLocal()
+    try:
+        export_req = db.query(models.DataExportRequest).filter(models.DataExportRequest.id == request_id).one()
+        export_req.status = "processing"
+        db.commit()
+
+        target = EXPORT_DIR / str(export_req.user_id) / f"export_{request_id}.json"
+        tmp = target.with_suffix(".part")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            user = db.query(models.User).filter(models.User.id == export_req.user_id).one()
+            with open(tmp, "w", encoding="utf-8") as f:
+                for chunk in _export_chunks(db, user):
+                    f.write(chunk)
+            os.replace(tmp, target)
+        except Exception as e:
+            logger.error(f"GDPR export {request_id} failed: {e}")
+            tmp.unlink(missing_ok=True)
+            export_req.status = "failed"
+            db.commit()
+            return
+
+        export_req.status = "completed"
+        export_req.file_path = str(target)
+        export_req.completed_at = datetime.utcnow()
+        export_req.expires_at = datetime.utcnow() + timedelta(days=EXPORT_TTL_DAYS)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _export_job_view(export_req: models.DataExportRequest) -> dict:
+    return {
+        "id": export_req.id,
+        "status": export_req.status,
+        "requested_at": _iso(export_req.requested_at),
+        "completed_at": _iso(export_req.completed_at),
+        "expires_at": _iso(export_req.expires_at),
+        "download_url": (f"{router.prefix}/export/jobs/{export_req.id}/download"
+                         if export_req.status == "completed" and export_req.file_path else None),
+    }
+
+
+def _own_export_job(db: Session, user: models.User, job_id: int) -> models.DataExportRequest:
+    export_req = (db.query(models.DataExportRequest)
+                  .filter(models.DataExportRequest.id == job_id,
+                          models.DataExportRequest.user_id == user.id)
+                  .first())
+    if export_req is None:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return export_req
+
+
+@router.post("/export/jobs", status_code=202)
+def request_export_job(
+    background_tasks: BackgroundTasks,
+    request: Request = None,
+    current_user: models.User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Queue a background export; poll the job, then download the file."""
+    ip = request.client.host if request and request.client else None
+    export_req = models.DataExportRequest(user_id=current_user.id, status="pending")
+    db.add(export_req)
+    db.commit()
+    db.refresh(export_req)
+
+    _audit(db, current_user.id, current_user.id, "data_export",
+           "data_export_request", str(export_req.id), "Background personal data export requested", ip)
+
+    background_tasks.add_task(_build_export_file, export_req.id)
+    return _export_job_view(export_req)
+
+
+@router.get("/export/jobs/{job_id}")
+def get_export_job(
+    job_id: int,
+    current_user: models.User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Status of one of the user's export jobs."""
+    return _export_job_view(_own_export_job(db, current_user, job_id))
+
+
+@router.get("/export/jobs/{job_id}/download")
+def download_export_job(
+    job_id: int,
+    current_user: models.User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Download a completed export file (until it expires)."""
+    export_req = _own_export_job(db, current_user, job_id)
+    if export_req.status != "completed" or not export_req.file_path:
+        raise HTTPException(status_code=409, detail=f"Export is {export_req.status}")
+    if export_req.expires_at and export_req.expires_at < datetime.utcnow():
+        raise HTTPException(status_code=410, detail="Export has expired")
+    if not os.path.exists(export_req.file_path):
+        raise HTTPException(status_code=410, detail="Export file is no longer available")
+    return FileResponse(export_req.file_path, media_type="application/json",
+                        filename=f"careertrojan_export_{job_id}.json")
 
 
 # ── Art. 17 — Right to Erasure ────────────────────────────────
@@ -232,7 +367,7 @@ def delete_my_account(
     This will:
     1. Delete consent records, interactions, mentorships, resumes, profile
     2. Anonymise the user row (email → deleted_{id}@anon, name → null)
-    3. Purge file-based interaction data for this user
+    3. Purge file-based interaction data and export files for this user
     4. Write a final audit-log entry (retained for legal compliance)
     """
     if confirm != "yes":
@@ -243,6 +378,7 @@ def delete_my_account(
 
     ip = request.client.host if request and request.client else None
     uid = current_user.id
+    email = current_user.email  # interaction logs may be keyed by the JWT subject
 
     # 1. Delete related records
     db.query(models.ConsentRecord).filter(models.ConsentRecord.user_id == uid).delete()
@@ -272,12 +408,18 @@ def delete_my_account(
     current_user.is_active = False
     current_user.otp_secret = None
 
-    # 3. Purge file-based interactions for this user
-    interactions_dir = os.path.join(os.getcwd(), "interactions")
-    if os.path.isdir(interactions_dir):
-        _purge_user_interaction_files(interactions_dir, uid)
+    # 3. Purge file-based interactions and generated exports for this user
+    _purge_user_interaction_files(uid, email)
+    shutil.rmtree(EXPORT_DIR / str(uid), ignore_errors=True)
+
+    # 4. Erase derived career vectors (durable store, keyed by id or JWT subject)
+    _erase_user_vectors(uid, email)
 
-    # 4. Final audit entry (retained for legal compliance — no PII)
+    # The interaction logger runs after this handler; keep it from re-logging the erased identity
+    if request is not None:
+        request.state.user_id = "anonymous"
+
+    # 5. Final audit entry (retained for legal compliance — no PII)
     _audit(db, uid, uid, "account_delete", "user", str(uid),
            "Account permanently deleted per GDPR Art. 17", ip)
 
@@ -287,28 +429,19 @@ def delete_my_account(
     return {"status": "deleted", "detail": "All personal data has been permanently erased."}
 
 
-def _purge_user_interaction_files(base_dir: str, user_id: int):
-    """Remove file-based interaction JSON files that reference this user."""
-    purged = 0
-    try:
-        for root, dirs, files in os.walk(base_dir):
-            for fname in files:
-                if not fname.endswith(".json"):
-                    continue
-                fpath = os.path.join(root, fname)
-                try:
-                    with open(fpath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    if data.get("user_id") == user_id or data.get("user_id") == str(user_id):
-                        os.remove(fpath)
-                        purged += 1
-                except (json.JSONDecodeError, OSError):
-                    continue
-    except OSError:
-        pass
+def _purge_user_interaction_files(user_id: int, email: Optional[str] = None):
+    """Remove file-based interaction records for this user via their partition."""
+    purged = get_interaction_partitions().erase(user_id, email)
     logger.info(f"Purged {purged} interaction files for user_id={user_id}")
 
 
+def _erase_user_vectors(user_id: int, email: Optional[str] = None):
+    """Remove the user's skill vectors from the persistent vector store."""
+    svc = UserVectorService()
+    erased = sum(svc.delete_user(key) for key in {str(user_id), email} if key)
+    logger.info(f"Erased {erased} user vectors for user_id={user_id}")
+
+
 # ── Art. 15 — Audit Log (user's own) ─────────────────────────
 
 @router.get("/audit-log")
@@ -16,6 +16,12 @@ except ImportError:
     _HAS_LOADER = False
     DataLoader = None  # type: ignore
 
+# Materialized view over the full corpus (started at app startup)
+try:
+    from services.ai_engine.insight_views import get_insight_view
+except ImportError:
+    get_insight_view = lambda: None  # noqa: E731
+
 router = APIRouter(prefix="/api/insights/v1", tags=["insights"])
 
 # Visual registry path (shared with mapping router)
@@ -26,6 +32,12 @@ def get_loader():
         return None
     return DataLoader.get_instance()
 
+
+def get_view():
+    """The materialized insight view, once its first build has finished (else None)."""
+    view = get_insight_view()
+    return view if view is not None and view.ready else None
+
 # ── B1: Visual catalogue endpoint ────────────────────────────────
 
 @router.get("/visuals")
@@ -85,6 +97,15 @@ _SKILLS_KEYWORDS = {
     "Certifications": ["cert", "aws", "pmp", "scrum", "cissp", "itil", "prince2", "cpa"],
 }
 
+_GENERIC_KEYWORDS = {ax: [ax.lower()[:4]] for ax in GENERIC_AXES}
+
+# Radar keyword maps precomputed by the materialized insight view
+RADAR_AXIS_MAPS = {
+    "leadership": _LEADERSHIP_KEYWORDS,
+    "skills": _SKILLS_KEYWORDS,
+    "generic": _GENERIC_KEYWORDS,
+}
+
 
 def _score_profile_axes(profile: dict, axes: List[str], keyword_map: dict) -> List[int]:
     """Score a profile against axes using keyword matching on skills + role."""
@@ -126,18 +147,32 @@ def get_skills_radar(
     Each axis value = normalised strength (0-100).
     If no profile_id given, returns aggregate cohort average.
     """
-    profiles = loader.get_profiles() if loader else []
-
     # Select axes + keyword map based on type
     if type == "leadership":
-        axes = LEADERSHIP_AXES
-        keyword_map = _LEADERSHIP_KEYWORDS
+        radar, axes = "leadership", LEADERSHIP_AXES
     elif type == "skills":
-        axes = SKILLS_AXES
-        keyword_map = _SKILLS_KEYWORDS
+        radar, axes = "skills", SKILLS_AXES
     else:
-        axes = GENERIC_AXES
-        keyword_map = {ax: [ax.lower()[:4]] for ax in axes}
+        radar, axes = "generic", GENERIC_AXES
+    keyword_map = RADAR_AXIS_MAPS[radar]
+
+    view = get_view()
+    if view is not None:
+        peer_avg = view.axis_averages(radar)
+        if profile_id:
+            profile = view.get_profile(profile_id)
+            if not profile:
+                return {"axes": axes, "series": []}
+            return {
+                "axes": axes,
+                "series": [
+                    {"label": profile.get("role", "You"), "values": _score_profile_axes(profile, axes, keyword_map)},
+                    {"label": "Peer Average", "values": [int(v) for v in peer_avg]},
+                ],
+            }
+        return {"axes": axes, "series": [{"label": "Cohort Average", "values": [int(v) for v in peer_avg]}]}
+
+    profiles = loader.get_profiles() if loader else []
 
     if profile_id:
         profile = next((p for p in profiles if p["id"] == profile_id), None)
@@ -200,6 +235,10 @@ def get_term_cloud(loader: DataLoader = Depends(get_loader)):
     """
     Returns term frequency for Word Cloud.
     """
+    view = get_view()
+    if view is not None:
+        return {"terms": [{"text": k, "value": v} for k, v in view.top_terms(100)]}
+
     freq = loader.get_terms()
     # Convert to list
     terms = [{"text": k, "value": v} for k, v in freq.items()]
@@ -218,6 +257,17 @@ def get_cooccurrence(
     If `term` is given, returns co-occurring skills for that term.
     Otherwise returns the top global co-occurrence pairs.
     """
+    view = get_view()
+    if view is not None:
+        t = (term or "").lower().strip()
+        nodes_set: set = {t} if t else set()
+        edges: list = []
+        for a, b, cnt in view.cooccurrence(t or None, limit=limit):
+            nodes_set.update((a, b))
+            edges.append({"source": a, "target": b, "weight": cnt})
+        nodes = [{"id": n, "group": 1 if n == t else 2, "freq": view.doc_frequency(n)} for n in nodes_set]
+        return {"nodes": nodes, "edges": edges}
+
     profiles = loader.get_profiles() if loader else []
 
     # Build co-occurrence matrix  {(a, b): count}
@@ -296,6 +346,27 @@ def resolve_cohort(
     skills (list), match_score_min.
     Returns cohort_id, matching count, and summary stats.
     """
+    # Build a deterministic cohort ID from filter hash
+    import hashlib
+    filter_sig = hashlib.md5(json.dumps(filters, sort_keys=True).encode()).hexdigest()[:8]
+    cohort_id = f"CH_{filter_sig}"
+
+    view = get_view()
+    if view is not None:
+        res = view.resolve_cohort(filters)
+        return {
+            "cohort_id": cohort_id,
+            "count": res["count"],
+            "filters_applied": filters,
+            "summary": {
+                "avg_match_score": res["avg_match_score"],
+                "avg_experience_years": res["avg_experience_years"],
+                "industries": res["industries"],
+                "seniorities": res["seniorities"],
+            },
+            "profile_ids": res["profile_ids"],
+        }
+
     profiles = loader.get_profiles() if loader else []
     matched = profiles  # start with all
 
@@ -313,11 +384,6 @@ def resolve_cohort(
     if "match_score_min" in filters:
         matched = [p for p in matched if p.get("match_score", 0) >= filters["match_score_min"]]
 
-    # Build a deterministic cohort ID from filter hash
-    import hashlib
-    filter_sig = hashlib.md5(json.dumps(filters, sort_keys=True).encode()).hexdigest()[:8]
-    cohort_id = f"CH_{filter_sig}"
-
     # Summary stats
     scores = [p.get("match_score", 0) for p in matched]
     avg_score = round(sum(scores) / max(len(scores), 1), 1)
@@ -290,10 +290,11 @@ def enrich(auth=Depends(require_user)):
     # ── run the AI enrichment orchestrator ────────────────────────────
     try:
         from services.backend_api.services.enrichment.ai_enrichment_orchestrator import (
-            AIEnrichmentOrchestrator,
+            get_enrichment_orchestrator,
         )
 
-        orchestrator = AIEnrichmentOrchestrator()
+        # Shared instance: models load once and repeat enrichments hit its cache
+        orchestrator = get_enrichment_orchestrator()
         enrichment = orchestrator.get_dashboard_enrichment(
             user_profile=user_profile,
             job_titles=job_titles if job_titles else None,
@@ -298,8 +298,7 @@ class AIChatService:
 
             seen_chains = set()
             evo_blocks = []
-            for term in all_terms:
-                chain = evolution_engine.resolve(term)
+            for term, chain in zip(all_terms, evolution_engine.resolve_many(all_terms)):
                 if chain and chain.get("chain_id") not in seen_chains:
                     seen_chains.add(chain["chain_id"])
                     block = evolution_engine.format_for_ai_context(term)
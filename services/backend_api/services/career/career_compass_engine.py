@@ -11,12 +11,13 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
+
+from services.backend_api.services.career.cluster_index import ClusterIndex, get_cluster_index
 
 logger = logging.getLogger(__name__)
 
-# ── Stub cluster registry (replace with live ai_data_final loader) ──
-# This will be loaded from live clustered records at startup
+# ── Cluster registry — filled from the persisted cluster index when present ──
 _cluster_registry: Dict[str, dict] = {}
 
 
@@ -24,9 +25,87 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# member id (user id) → public mentor card, for members who opted in as mentors
+MentorDirectory = Callable[[Sequence[str]], Dict[str, dict]]
+
+
+def opted_in_mentors(member_ids: Sequence[str], session_factory: Optional[Callable] = None) -> Dict[str, dict]:
+    """
+    Public mentor cards for the cluster members that have a mentor profile.
+
+    Only active users registered in the ``mentors`` table are exposed, under
+    their mentor-profile id — never the internal user id.
+    """
+    user_ids = [int(m) for m in member_ids if str(m).isdigit()]
+    if not user_ids:
+        return {}
+    try:
+        from services.backend_api.db import models
+
+        if session_factory is None:
+            from services.backend_api.db.connection import SessionLocal as session_factory
+        db = session_factory()
+        try:
+            rows = (
+                db.query(models.Mentor, models.User)
+                .join(models.User, models.Mentor.user_id == models.User.id)
+                .filter(models.Mentor.user_id.in_(user_ids), models.User.is_active.is_(True))
+                .all()
+            )
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning("Mentor directory unavailable: %s", e)
+        return {}
+    return {
+        str(mentor.user_id): {
+            "mentor_id": f"mentor-{mentor.id}",
+            "name": user.full_name or f"{mentor.specialty or 'Career'} mentor",
+        }
+        for mentor, user in rows
+    }
+
+
 class CareerCompassEngine:
     """Orchestrates Career Compass intelligence operations."""
 
+    # Peers fetched per mentor request before filtering to opted-in mentors
+    MENTOR_CANDIDATES = 50
+
+    def __init__(self, index: Optional[ClusterIndex] = None, mentor_directory: Optional[MentorDirectory] = None):
+        self._index = index if index is not None else get_cluster_index()
+        self._mentor_directory = mentor_directory or opted_in_mentors
+        if self._index is not None:
+            register_cluster_index(self._index)
+
+    # ── Cluster Assignment ────────────────────────────────────
+    async def assign_user(self, user_id: str, resume_id: str) -> dict:
+        """Place a user in their nearest cluster without reclustering."""
+        if self._index is None:
+            return {
+                "status": "missing_cluster",
+                "message": "No clustered dataset is loaded yet.",
+                "cluster_id": None,
+                "source_summary": {"resume_id": resume_id, "cluster_record_count": 0},
+            }
+        from services.backend_api.services.career.user_vector_service import UserVectorService
+        uv_resp = await UserVectorService().get_current_vector(user_id, resume_id)
+        if uv_resp["status"] != "ok" or not uv_resp.get("vector"):
+            return {
+                "status": "missing_resume",
+                "message": "No live user vector found. Please upload a processed resume.",
+                "cluster_id": None,
+                "source_summary": {"resume_id": resume_id},
+            }
+        cluster_id, distance = self._index.add_member(str(user_id), uv_resp["vector"])
+        return {
+            "status": "ok",
+            "cluster_id": cluster_id,
+            "label": _cluster_registry.get(cluster_id, {}).get("label", cluster_id),
+            "distance": round(distance, 4),
+            "source_summary": {"resume_id": resume_id, "cluster_record_count": len(self._index.cluster_ids)},
+        }
+
     # ── Career Map (spec §9.1) ─────────────────────────────────
     async def get_map(self, user_id: str = None, resume_id: str = None) -> dict:
         if not _cluster_registry:
@@ -198,6 +277,28 @@ class CareerCompassEngine:
                 "mentors": [],
                 "source_summary": {"resume_id": payload.resume_id, "mentor_records_scanned": 0},
             }
+        # Phase B: closest opted-in mentors already in the target cluster
+        if self._index is not None and payload.cluster_id in self._index.cluster_ids:
+            label = _cluster_registry.get(payload.cluster_id, {}).get("label", payload.cluster_id)
+            peers = self._index.nearest_members(
+                spider["user_vector"], payload.cluster_id, k=self.MENTOR_CANDIDATES,
+                exclude=[str(payload.user_id)],
+            )
+            directory = self._mentor_directory([member_id for member_id, _ in peers]) if peers else {}
+            mentors = [
+                dict(directory[member_id], match_reason=f"Already in {label} with a profile close to yours.")
+                for member_id, _ in peers if member_id in directory
+            ][:5]
+            if mentors:
+                return {
+                    "status": "ok",
+                    "mentors": mentors,
+                    "source_summary": {
+                        "resume_id": payload.resume_id,
+                        "mentor_records_scanned": self._index.size(payload.cluster_id),
+                    },
+                }
+
         # Phase A: Ideal mentor profile types (spec §17 Phase A)
         mentors = []
         for gap in gaps[:3]:
@@ -257,5 +358,15 @@ def register_cluster(cluster_id: str, data: dict):
     logger.info("Registered cluster: %s", cluster_id)
 
 
+def register_cluster_index(index: ClusterIndex):
+    """Register every cluster of a persisted index, with its centroid as vector."""
+    for meta in index.clusters:
+        data = dict(meta)
+        data.setdefault("label", meta["cluster_id"])
+        data.setdefault("vector", index.centroid(meta["cluster_id"]))
+        _cluster_registry[meta["cluster_id"]] = data
+    logger.info("Registered %d clusters from cluster index", len(index.clusters))
+
+
 def get_cluster_count() -> int:
     return len(_cluster_registry)
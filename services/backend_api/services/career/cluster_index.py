@@ -0,0 +1,523 @@
+"""
+CareerTrojan — Career Compass Cluster Index
+===========================================
+Persisted peer-cluster model for the Career Compass: centroids, cluster
+metadata and member vectors in one compact artifact that every worker
+memory-maps instead of rebuilding a registry per process.
+
+On disk (one directory):
+    CURRENT          name of the live version directory
+    v<ns>/           one immutable artifact version:
+        centroids.npy    (C, D) float32 cluster centres in CORE_AXES order
+        members.npy      (N, D) float32 member vectors, grouped by cluster
+        member_ids.npy   (N,)   fixed-width unicode ids, same order
+        offsets.npy      (C+1,) int64 — cluster c owns rows offsets[c]:offsets[c+1]
+        clusters.json    axes + per-cluster metadata (label, route_type, …)
+    delta.jsonl      members (re)assigned or erased since the artifact was written
+    .lock            cross-process lock for delta appends and saves
+
+Assignment is one (C, D) matmul; within-cluster kNN scans only that
+cluster's contiguous slice of the mmap.  New or changed users go to
+their nearest centroid and are logged to delta.jsonl, so no recluster is
+needed; ``save()`` folds the delta back into a new version directory and
+repoints CURRENT, so no file that a worker has memory-mapped is ever
+replaced (Windows refuses that).  ``remove_member()`` erases a member
+from the artifact itself (GDPR).  A flat directory without CURRENT (the
+original layout) still loads.
+
+Every uvicorn worker holds its own instance over the same directory.
+Appends and saves run under ``.lock`` and first catch up with the version
+and delta lines other workers wrote, so a save folds everyone's changes,
+never just its own; queries pick those changes up too (``refresh()``).
+
+Usage:
+    index = ClusterIndex.fit(ids, vectors, n_clusters=40, clusters=meta)
+    index.save(path)
+
+    index = ClusterIndex.load(path)
+    cluster_id, distance = index.assign(vector)
+    index.nearest_members(vector, cluster_id, k=5)
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from services.backend_api.services.career.user_vector_service import CORE_AXES
+from services.shared.file_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+_DATA_ROOT = Path(os.getenv("CAREERTROJAN_DATA_ROOT", r"L:\antigravity_version_ai_data_final"))
+CLUSTER_INDEX_DIR = Path(os.getenv("CAREERTROJAN_CLUSTER_INDEX_DIR", str(_DATA_ROOT / "ai_data_final" / "career_compass")))
+
+Vector = Union[Dict[str, float], Sequence[float], np.ndarray]
+
+
+def _as_matrix(vectors: Union[Vector, Sequence[Vector]]) -> np.ndarray:
+    """Axis dicts or arrays → (n, D) float32 in CORE_AXES order."""
+    if isinstance(vectors, dict):
+        vectors = [vectors]
+    elif isinstance(vectors, np.ndarray):
+        return np.atleast_2d(vectors).astype(np.float32, copy=False)
+    rows = [[v.get(a, 0.0) for a in CORE_AXES] if isinstance(v, dict) else v for v in vectors]
+    return np.atleast_2d(np.asarray(rows, dtype=np.float32))
+
+
+class ClusterIndex:
+    """Nearest-centroid assignment and within-cluster kNN over a mmap artifact."""
+
+    CENTROIDS_FILE = "centroids.npy"
+    MEMBERS_FILE = "members.npy"
+    MEMBER_IDS_FILE = "member_ids.npy"
+    OFFSETS_FILE = "offsets.npy"
+    CLUSTERS_FILE = "clusters.json"
+    DELTA_FILE = "delta.jsonl"
+    VERSION_FILE = "CURRENT"
+    LOCK_FILE = ".lock"
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        clusters: List[dict],
+        members: np.ndarray,
+        member_ids: np.ndarray,
+        offsets: np.ndarray,
+        path: Optional[Path] = None,
+    ):
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        self._centroid_sq = np.einsum("ij,ij->i", self.centroids, self.centroids)
+        self.clusters = clusters
+        self.cluster_ids = [c["cluster_id"] for c in clusters]
+        self._position = {cid: i for i, cid in enumerate(self.cluster_ids)}
+        self._members = members
+        self._member_ids = member_ids
+        self._offsets = offsets
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        # member id → (cluster position, vector) for assignments since the artifact
+        self._delta: Dict[str, Tuple[int, np.ndarray]] = {}
+        self._delta_by_cluster: Dict[int, Dict[str, np.ndarray]] = {}
+        # artifact members erased but not yet folded out: id → cluster position
+        self._removed: Dict[str, int] = {}
+        # What of the directory this view reflects: artifact version, bytes of
+        # delta.jsonl replayed, and the stat stamp both were read at
+        self._version: Optional[str] = None
+        self._delta_offset = 0
+        self._stamp: Optional[tuple] = None
+
+    # ── Build / persist ──────────────────────────────────────────────────
+
+    @classmethod
+    def build(
+        cls,
+        ids: Sequence[str],
+        vectors: Union[np.ndarray, Sequence[Vector]],
+        labels: Sequence[int],
+        centroids: np.ndarray,
+        clusters: Optional[List[dict]] = None,
+    ) -> "ClusterIndex":
+        """Index an existing clustering: ``labels[i]`` is the centroid row of ``ids[i]``."""
+        vectors = _as_matrix(vectors)
+        labels = np.asarray(labels, dtype=np.int64)
+        n_clusters = len(centroids)
+        if clusters is None:
+            clusters = [{"cluster_id": f"cluster_{i}"} for i in range(n_clusters)]
+        if len(clusters) != n_clusters:
+            raise ValueError(f"{len(clusters)} cluster records for {n_clusters} centroids")
+
+        order = np.argsort(labels, kind="stable")
+        counts = np.bincount(labels, minlength=n_clusters)
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        width = max((len(str(i)) for i in ids), default=1)
+        member_ids = np.asarray([str(ids[i]) for i in order], dtype=f"<U{width}")
+        meta = [dict(c, size=int(counts[i])) for i, c in enumerate(clusters)]
+        return cls(np.asarray(centroids, dtype=np.float32), meta, vectors[order], member_ids, offsets)
+
+    @classmethod
+    def fit(
+        cls,
+        ids: Sequence[str],
+        vectors: Union[np.ndarray, Sequence[Vector]],
+        n_clusters: int,
+        iterations: int = 25,
+        seed: int = 0,
+        clusters: Optional[List[dict]] = None,
+    ) -> "ClusterIndex":
+        """Cluster member vectors with k-means (k-means++ seeding) and index them."""
+        x = _as_matrix(vectors)
+        n_clusters = min(n_clusters, len(x))
+        rng = np.random.default_rng(seed)
+
+        centroids = np.empty((n_clusters, x.shape[1]), dtype=np.float32)
+        centroids[0] = x[rng.integers(len(x))]
+        closest = ((x - centroids[0]) ** 2).sum(axis=1)
+        for c in range(1, n_clusters):
+            pick = rng.choice(len(x), p=closest / closest.sum()) if closest.sum() > 0 else rng.integers(len(x))
+            centroids[c] = x[pick]
+            closest = np.minimum(closest, ((x - centroids[c]) ** 2).sum(axis=1))
+
+        labels = np.zeros(len(x), dtype=np.int64)
+        for it in range(iterations):
+            new_labels = cls._nearest(x, centroids, np.einsum("ij,ij->i", centroids, centroids))
+            if it and np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, x)
+            counts = np.bincount(labels, minlength=n_clusters)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+
+        return cls.build(ids, x, labels, centroids, clusters)
+
+    @classmethod
+    def artifact_dir(cls, path: Path) -> Path:
+        """Directory holding the live artifact files under ``path``."""
+        path = Path(path)
+        pointer = path / cls.VERSION_FILE
+        if pointer.exists():
+            return path / pointer.read_text(encoding="utf-8").strip()
+        return path
+
+    @classmethod
+    def exists(cls, path: Path) -> bool:
+        return (cls.artifact_dir(path) / cls.CLUSTERS_FILE).exists()
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """Write a new artifact version, folding in incremental assignments and removals.
+
+        Saving over this index's own directory first catches up with what
+        other processes wrote there, so their changes are folded in too.
+        """
+        path = Path(path or self.path)
+        path.mkdir(parents=True, exist_ok=True)
+        with self._lock, file_lock(path / self.LOCK_FILE):
+            if self.path is not None and path == self.path:
+                self._catch_up()
+            target, n_members = self._write_version(path)
+        logger.info("Cluster index saved: %d clusters, %d members → %s", len(self.centroids), n_members, target)
+        return path
+
+    def _write_version(self, path: Path) -> Tuple[Path, int]:
+        """Fold the in-memory view into a new version; caller holds both locks."""
+        dim = self.centroids.shape[1]
+        base_ids = [str(m) for m in np.asarray(self._member_ids)]
+        keep = np.fromiter((m not in self._delta and m not in self._removed for m in base_ids),
+                           dtype=bool, count=len(base_ids))
+        base_labels = np.repeat(np.arange(len(self.centroids)), np.diff(self._offsets))
+        ids = [m for m, k in zip(base_ids, keep) if k] + list(self._delta)
+        vectors = np.concatenate([
+            np.asarray(self._members)[keep],
+            np.asarray([v for _, v in self._delta.values()], dtype=np.float32).reshape(-1, dim),
+        ])
+        labels = np.concatenate([base_labels[keep], np.asarray([c for c, _ in self._delta.values()], dtype=np.int64)])
+        merged = self.build(ids, vectors, labels, self.centroids,
+                            [{k: v for k, v in c.items() if k != "size"} for c in self.clusters])
+
+        version = f"v{time.time_ns()}"
+        target = path / version
+        target.mkdir()
+        for name, arr in ((self.CENTROIDS_FILE, merged.centroids), (self.MEMBERS_FILE, merged._members),
+                          (self.MEMBER_IDS_FILE, merged._member_ids), (self.OFFSETS_FILE, merged._offsets)):
+            with open(target / name, "wb") as f:
+                np.save(f, arr)
+        (target / self.CLUSTERS_FILE).write_text(
+            json.dumps({"axes": CORE_AXES, "clusters": merged.clusters}, indent=1), encoding="utf-8")
+        pointer = path / f".{self.VERSION_FILE}.tmp"
+        pointer.write_text(version, encoding="utf-8")
+        os.replace(pointer, path / self.VERSION_FILE)
+        (path / self.DELTA_FILE).unlink(missing_ok=True)
+
+        # Drop our own mappings of the old version before pruning it
+        self.clusters, self._members, self._member_ids, self._offsets = (
+            merged.clusters, merged._members, merged._member_ids, merged._offsets)
+        self._delta.clear()
+        self._delta_by_cluster.clear()
+        self._removed.clear()
+        self.path = path
+        self._version, self._delta_offset = version, 0
+        self._stamp = self._disk_stamp()
+        self._prune_versions(path, keep=version)
+        return target, len(ids)
+
+    def _prune_versions(self, path: Path, keep: str) -> None:
+        """Remove superseded versions and flat-layout files; ones still mapped elsewhere wait for the next save."""
+        for old in path.glob("v*"):
+            if old.is_dir() and old.name != keep:
+                shutil.rmtree(old, ignore_errors=True)
+        for name in (self.CENTROIDS_FILE, self.MEMBERS_FILE, self.MEMBER_IDS_FILE,
+                     self.OFFSETS_FILE, self.CLUSTERS_FILE):
+            try:
+                (path / name).unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    @classmethod
+    def _version_of(cls, path: Path) -> str:
+        pointer = Path(path) / cls.VERSION_FILE
+        return pointer.read_text(encoding="utf-8").strip() if pointer.exists() else ""
+
+    @classmethod
+    def _open(cls, path: Path, version: str) -> "ClusterIndex":
+        artifact = path / version if version else path
+        spec = json.loads((artifact / cls.CLUSTERS_FILE).read_text(encoding="utf-8"))
+        if spec.get("axes", CORE_AXES) != CORE_AXES:
+            raise ValueError(f"Cluster index at {path} uses axes {spec['axes']}, expected {CORE_AXES}")
+        index = cls(
+            np.load(artifact / cls.CENTROIDS_FILE),
+            spec["clusters"],
+            np.load(artifact / cls.MEMBERS_FILE, mmap_mode="r"),
+            np.load(artifact / cls.MEMBER_IDS_FILE, mmap_mode="r"),
+            np.load(artifact / cls.OFFSETS_FILE),
+            path=path,
+        )
+        index._version = version
+        return index
+
+    @classmethod
+    def load(cls, path: Path) -> "ClusterIndex":
+        """Open an artifact; member arrays are memory-mapped, not read."""
+        path = Path(path)
+        with file_lock(path / cls.LOCK_FILE):
+            index = cls._open(path, cls._version_of(path))
+            index._replay_delta()
+            index._stamp = index._disk_stamp()
+        return index
+
+    def _disk_stamp(self) -> tuple:
+        """Cheap fingerprint of CURRENT and delta.jsonl: two stats."""
+        stamp = []
+        for name in (self.VERSION_FILE, self.DELTA_FILE):
+            try:
+                st = os.stat(self.path / name)
+                stamp.append((st.st_ino, st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _catch_up(self) -> bool:
+        """Adopt a newer version and replay unseen delta lines; caller holds both locks."""
+        changed = False
+        version = self._version_of(self.path)
+        if version != self._version:
+            fresh = self._open(self.path, version)
+            self.centroids, self._centroid_sq = fresh.centroids, fresh._centroid_sq
+            self.clusters, self.cluster_ids, self._position = fresh.clusters, fresh.cluster_ids, fresh._position
+            self._members, self._member_ids, self._offsets = fresh._members, fresh._member_ids, fresh._offsets
+            self._delta.clear()
+            self._delta_by_cluster.clear()
+            self._removed.clear()
+            self._version, self._delta_offset = version, 0
+            changed = True
+        changed = self._replay_delta() or changed
+        self._stamp = self._disk_stamp()
+        return changed
+
+    def refresh(self) -> bool:
+        """
+        Pick up versions and delta lines written by other processes.
+        Costs two stats when nothing changed; True if the view changed.
+        """
+        if self.path is None or self._disk_stamp() == self._stamp:
+            return False
+        with self._lock, file_lock(self.path / self.LOCK_FILE):
+            return self._catch_up()
+
+    def _replay_delta(self) -> bool:
+        """Apply delta lines past ``_delta_offset``; True if any were read."""
+        delta = self.path / self.DELTA_FILE
+        if not delta.exists():
+            return False
+        with open(delta, "rb") as f:
+            f.seek(self._delta_offset)
+            data = f.read()
+        # A torn final line from a crashed writer is left for a later read
+        complete = data[: data.rfind(b"\n") + 1]
+        for line in complete.decode("utf-8").splitlines():
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if rec.get("removed"):
+                self._forget(rec["id"])
+            elif rec.get("cluster_id") in self._position:
+                self._remember(rec["id"], self._position[rec["cluster_id"]],
+                               np.asarray(rec["vector"], dtype=np.float32))
+        self._delta_offset += len(complete)
+        return bool(complete)
+
+    def _append_delta(self, lines: List[str]) -> None:
+        """Append records we have already applied; caller holds both locks."""
+        with open(self.path / self.DELTA_FILE, "ab") as f:
+            f.write("".join(lines).encode("utf-8"))
+            self._delta_offset = f.tell()
+        self._stamp = self._disk_stamp()
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _nearest(x: np.ndarray, centroids: np.ndarray, centroid_sq: np.ndarray) -> np.ndarray:
+        # argmin ||x - c||² == argmin (||c||² - 2 x·c)
+        return np.argmin(centroid_sq[None, :] - 2.0 * (x @ centroids.T), axis=1)
+
+    def assign(self, vector: Vector) -> Tuple[str, float]:
+        """Nearest cluster id and Euclidean distance for one vector."""
+        x = _as_matrix(vector)
+        c = int(self._nearest(x, self.centroids, self._centroid_sq)[0])
+        return self.cluster_ids[c], float(np.linalg.norm(x[0] - self.centroids[c]))
+
+    def assign_many(self, vectors: Union[np.ndarray, Sequence[Vector]]) -> List[str]:
+        """Nearest cluster id for each vector, in one matmul."""
+        x = _as_matrix(vectors)
+        return [self.cluster_ids[c] for c in self._nearest(x, self.centroids, self._centroid_sq)]
+
+    def cluster_of(self, member_id: str) -> Optional[str]:
+        """Cluster of a member assigned since the artifact was written."""
+        self.refresh()
+        hit = self._delta.get(member_id)
+        return self.cluster_ids[hit[0]] if hit else None
+
+    def centroid(self, cluster_id: str) -> Dict[str, float]:
+        return {a: round(float(v), 3) for a, v in zip(CORE_AXES, self.centroids[self._position[cluster_id]])}
+
+    def size(self, cluster_id: str) -> int:
+        self.refresh()
+        c = self._position[cluster_id]
+        base = int(self._offsets[c + 1] - self._offsets[c])
+        removed = sum(1 for pos in self._removed.values() if pos == c)
+        return base - removed + len(self._delta_by_cluster.get(c, {}))
+
+    def nearest_members(
+        self,
+        vector: Vector,
+        cluster_id: str,
+        k: int = 5,
+        exclude: Sequence[str] = (),
+    ) -> List[Tuple[str, float]]:
+        """k closest members of one cluster as ``(member_id, distance)``, nearest first."""
+        self.refresh()
+        c = self._position.get(cluster_id)
+        if c is None or k <= 0:
+            return []
+        x = _as_matrix(vector)[0]
+        lo, hi = int(self._offsets[c]), int(self._offsets[c + 1])
+        skip = set(exclude)
+        hits: List[Tuple[str, float]] = []
+
+        if hi > lo:
+            dist = ((np.asarray(self._members[lo:hi]) - x) ** 2).sum(axis=1)
+            # Over-fetch so members that moved or are excluded don't starve the result
+            take = min(hi - lo, k + len(skip) + len(self._delta) + len(self._removed))
+            top = np.argpartition(dist, take - 1)[:take] if take < hi - lo else np.arange(hi - lo)
+            for r in top:
+                mid = str(self._member_ids[lo + r])
+                if mid not in skip and mid not in self._delta and mid not in self._removed:
+                    hits.append((mid, float(np.sqrt(dist[r]))))
+        for mid, vec in self._delta_by_cluster.get(c, {}).items():
+            if mid not in skip:
+                hits.append((mid, float(np.linalg.norm(vec - x))))
+        hits.sort(key=lambda h: h[1])
+        return hits[:k]
+
+    # ── Incremental updates ──────────────────────────────────────────────
+
+    def _remember(self, member_id: str, c: int, vec: np.ndarray) -> None:
+        old = self._delta.get(member_id)
+        if old is not None:
+            self._delta_by_cluster.get(old[0], {}).pop(member_id, None)
+        self._delta[member_id] = (c, vec)
+        self._delta_by_cluster.setdefault(c, {})[member_id] = vec
+
+    def _forget(self, member_id: str) -> bool:
+        """Drop a member from the in-memory view; True if it was present."""
+        found = False
+        old = self._delta.pop(member_id, None)
+        if old is not None:
+            self._delta_by_cluster.get(old[0], {}).pop(member_id, None)
+            found = True
+        rows = np.flatnonzero(np.asarray(self._member_ids) == member_id)
+        if len(rows):
+            self._removed[member_id] = int(np.searchsorted(self._offsets, rows[0], side="right") - 1)
+            found = True
+        return found
+
+    def add_member(self, member_id: str, vector: Vector) -> Tuple[str, float]:
+        """Assign a new or changed member to its nearest cluster (no recluster)."""
+        vec = _as_matrix(vector)[0]
+        return self.add_members([member_id], vec[None, :])[0]
+
+    def add_members(self, member_ids: Sequence[str], vectors: Union[np.ndarray, Sequence[Vector]]) -> List[Tuple[str, float]]:
+        """Batch ``add_member``: one matmul and one delta append."""
+        x = _as_matrix(vectors).copy()
+        with self._lock, self._disk_lock():
+            if self.path is not None:
+                self._catch_up()
+            positions = self._nearest(x, self.centroids, self._centroid_sq)
+            distances = np.linalg.norm(x - self.centroids[positions], axis=1)
+            lines = []
+            for mid, c, vec in zip(member_ids, positions.tolist(), x):
+                self._removed.pop(str(mid), None)
+                self._remember(str(mid), c, vec)
+                lines.append(json.dumps({"id": str(mid), "cluster_id": self.cluster_ids[c],
+                                         "vector": [round(float(v), 4) for v in vec]}) + "\n")
+            if self.path is not None:
+                self._append_delta(lines)
+            return [(self.cluster_ids[c], float(d)) for c, d in zip(positions.tolist(), distances.tolist())]
+
+    def remove_member(self, member_id: str) -> bool:
+        """
+        Erase a member (GDPR).  A persisted index is rewritten at once, from
+        the latest on-disk state, so the vector leaves members.npy and
+        delta.jsonl, not just the query path, and no other worker's save
+        can bring it back.
+        """
+        with self._lock, self._disk_lock():
+            if self.path is not None:
+                self._catch_up()
+            found = self._forget(str(member_id))
+            if found and self.path is not None:
+                # Logged first: a crash mid-save still replays the erasure
+                self._append_delta([json.dumps({"id": str(member_id), "removed": True}) + "\n"])
+                self._write_version(self.path)
+        return found
+
+    def _disk_lock(self):
+        return file_lock(self.path / self.LOCK_FILE) if self.path is not None else contextlib.nullcontext()
+
+
+# ============================================================================
+# MODULE SINGLETON
+# ============================================================================
+
+_index: Optional[ClusterIndex] = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def get_cluster_index(reload: bool = False) -> Optional[ClusterIndex]:
+    """Process-wide index from CLUSTER_INDEX_DIR, or None if no artifact exists."""
+    global _index, _index_loaded
+    with _index_lock:
+        if reload or not _index_loaded:
+            _index_loaded = True
+            _index = None
+            if ClusterIndex.exists(CLUSTER_INDEX_DIR):
+                try:
+                    _index = ClusterIndex.load(CLUSTER_INDEX_DIR)
+                except (OSError, ValueError) as e:
+                    logger.warning("Cluster index at %s unusable: %s", CLUSTER_INDEX_DIR, e)
+        return _index
@@ -4,17 +4,34 @@ User Vector Service — Generates and stores user skill vectors (spec §14).
 Vector axes: Leadership, Commercial Insight, Technical Depth, Communication,
 Delivery, Strategic Thinking, Domain Expertise, Innovation,
 Stakeholder Influence, Problem Solving.
+
+Storage (shared by every worker process on the host):
+    user_vectors.db   SQLite — one record per user:resume, with the
+                      matrix row it owns; rows are allocated here so
+                      concurrent writers never collide
+    user_vectors.f32  memory-mapped float32 matrix of unit vectors,
+                      scanned in one matmul for cosine top-k
+
+Nothing is loaded at start-up: lookups are single indexed queries and
+the matrix is paged in by the OS on the first similarity search.
+
+Env override:
+    CAREERTROJAN_USER_VECTOR_DIR  (default: <data root>/USER DATA/user_vectors)
 """
 from __future__ import annotations
 
+import json
 import logging
+import os
+import sqlite3
+import threading
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
-logger = logging.getLogger(__name__)
+import numpy as np
 
-# In-memory store (upgrade to DB for production)
-_vectors: Dict[str, dict] = {}
+logger = logging.getLogger(__name__)
 
 CORE_AXES = [
     "leadership", "commercial_insight", "technical_depth",
@@ -26,14 +43,255 @@ CORE_AXES = [
 FEATURE_SET_VERSION = "1.0.0"
 VECTOR_VERSION = "1"
 
+_DATA_ROOT = Path(os.getenv("CAREERTROJAN_DATA_ROOT", r"L:\antigravity_version_ai_data_final"))
+USER_VECTOR_DIR = Path(os.getenv("CAREERTROJAN_USER_VECTOR_DIR", str(_DATA_ROOT / "USER DATA" / "user_vectors")))
+
+
+class UserVectorStore:
+    """Durable user vectors: SQLite records plus a memory-mapped search matrix."""
+
+    DB_FILE = "user_vectors.db"
+    MATRIX_FILE = "user_vectors.f32"
+    _GROW_ROWS = 4096
+
+    def __init__(self, root: Path, dim: int = len(CORE_AXES)):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self._local = threading.local()
+        self._matrix: Optional[np.memmap] = None
+        self._matrix_lock = threading.Lock()
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS user_vectors ("
+            " row INTEGER PRIMARY KEY,"
+            " key TEXT NOT NULL UNIQUE,"
+            " user_id TEXT NOT NULL,"
+            " resume_id TEXT NOT NULL,"
+            " vector_json TEXT NOT NULL,"
+            " confidence_json TEXT NOT NULL,"
+            " vector_version TEXT,"
+            " feature_set_version TEXT,"
+            " computed_at TEXT)"
+        )
+        self._conn().execute("CREATE INDEX IF NOT EXISTS ix_user_vectors_user ON user_vectors(user_id)")
+
+    @classmethod
+    def exists(cls, root: Path) -> bool:
+        return (Path(root) / cls.DB_FILE).exists()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.root / self.DB_FILE, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA secure_delete=ON")  # erased vectors must not linger in free pages
+            self._local.conn = conn
+        return conn
+
+    # ── Matrix ───────────────────────────────────────────────────────────
+
+    def _map(self, rows_needed: int) -> np.memmap:
+        """Current mapping, remapped if another writer grew the file."""
+        with self._matrix_lock:
+            if self._matrix is None or len(self._matrix) < rows_needed:
+                path = self.root / self.MATRIX_FILE
+                size = path.stat().st_size if path.exists() else 0
+                capacity = size // (self.dim * 4)
+                if capacity < rows_needed:
+                    raise RuntimeError(f"User vector matrix has {capacity} rows, need {rows_needed}")
+                self._matrix = np.memmap(path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+            return self._matrix
+
+    def _ensure_capacity(self, rows_needed: int) -> None:
+        # Called inside the write transaction, so only one process grows the file
+        path = self.root / self.MATRIX_FILE
+        row_bytes = self.dim * 4
+        with open(path, "ab") as f:
+            capacity = f.tell() // row_bytes
+            if capacity < rows_needed:
+                new_cap = max(rows_needed, capacity * 2, self._GROW_ROWS)
+                f.truncate(new_cap * row_bytes)
+
+    def _unit(self, vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+    # ── Writes ───────────────────────────────────────────────────────────
+
+    def upsert_many(self, records: List[dict]) -> int:
+        """Insert or replace records (one transaction, one matrix write)."""
+        if not records:
+            return 0
+        by_key = {f"{r['user_id']}:{r['resume_id']}": r for r in records}
+        keys = list(by_key)
+        matrix = np.array(
+            [[by_key[k]["vector"].get(axis, 0.0) for axis in CORE_AXES] for k in keys],
+            dtype=np.float32,
+        )
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO user_vectors (key, user_id, resume_id, vector_json, confidence_json,"
+                " vector_version, feature_set_version, computed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET vector_json = excluded.vector_json,"
+                " confidence_json = excluded.confidence_json, vector_version = excluded.vector_version,"
+                " feature_set_version = excluded.feature_set_version, computed_at = excluded.computed_at",
+                [
+                    (
+                        k, str(r["user_id"]), str(r["resume_id"]),
+                        json.dumps(r["vector"]), json.dumps(r["confidence"]),
+                        r.get("vector_version"), r.get("feature_set_version"), r.get("computed_at"),
+                    )
+                    for k, r in by_key.items()
+                ],
+            )
+            row_of: Dict[str, int] = {}
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                for rec in conn.execute(f"SELECT key, row FROM user_vectors WHERE key IN ({marks})", chunk):
+                    row_of[rec["key"]] = rec["row"] - 1
+            slots = np.array([row_of[k] for k in keys], dtype=np.int64)
+            self._ensure_capacity(int(slots.max()) + 1)
+            mm = self._map(int(slots.max()) + 1)
+            mm[slots] = self._unit(matrix)
+            mm.flush()
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(keys)
+
+    def delete_user(self, user_id: str) -> int:
+        """Erase every vector for a user.  Returns how many were removed."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = [r["row"] - 1 for r in conn.execute("SELECT row FROM user_vectors WHERE user_id = ?", (str(user_id),))]
+            if rows:
+                mm = self._map(max(rows) + 1)
+                mm[rows] = 0.0
+                mm.flush()
+                conn.execute("DELETE FROM user_vectors WHERE user_id = ?", (str(user_id),))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    # ── Reads ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _record(row: sqlite3.Row) -> dict:
+        return {
+            "user_id": row["user_id"],
+            "resume_id": row["resume_id"],
+            "vector": json.loads(row["vector_json"]),
+            "confidence": json.loads(row["confidence_json"]),
+            "vector_version": row["vector_version"],
+            "feature_set_version": row["feature_set_version"],
+            "computed_at": row["computed_at"],
+        }
+
+    def get(self, user_id: str, resume_id: str) -> Optional[dict]:
+        row = self._conn().execute(
+            "SELECT * FROM user_vectors WHERE key = ?", (f"{user_id}:{resume_id}",)
+        ).fetchone()
+        return self._record(row) if row else None
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM user_vectors").fetchone()[0]
+
+    def top_k(
+        self,
+        vector: Dict[str, float],
+        k: int = 10,
+        exclude_user_id: Optional[str] = None,
+    ) -> List[Tuple[dict, float]]:
+        """Exact cosine top-k over every stored vector, best first."""
+        n_rows = self._conn().execute("SELECT COALESCE(MAX(row), 0) FROM user_vectors").fetchone()[0]
+        if n_rows == 0 or k <= 0:
+            return []
+        q = self._unit(np.array([[vector.get(axis, 0.0) for axis in CORE_AXES]], dtype=np.float32))[0]
+        scores = self._map(n_rows)[:n_rows] @ q
+
+        want = k
+        while True:
+            # Over-fetch to absorb deleted rows and the excluded user
+            take = min(want + 8, n_rows)
+            top = np.argpartition(-scores, take - 1)[:take] if take < n_rows else np.arange(n_rows)
+            top = top[np.argsort(-scores[top], kind="stable")]
+            hits = self._fetch_rows([int(r) + 1 for r in top])
+            results = [
+                (hits[int(r) + 1], float(scores[r])) for r in top
+                if int(r) + 1 in hits and hits[int(r) + 1]["user_id"] != exclude_user_id
+            ]
+            if len(results) >= k or take >= n_rows:
+                return results[:k]
+            want *= 4
+
+    def _fetch_rows(self, rows: List[int]) -> Dict[int, dict]:
+        out: Dict[int, dict] = {}
+        conn = self._conn()
+        for i in range(0, len(rows), 500):
+            chunk = rows[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            for rec in conn.execute(f"SELECT * FROM user_vectors WHERE row IN ({marks})", chunk):
+                out[rec["row"]] = self._record(rec)
+        return out
+
+
+_store: Optional[UserVectorStore] = None
+_store_lock = threading.Lock()
+
+
+def get_user_vector_store(create: bool = True) -> Optional[UserVectorStore]:
+    """Process-wide store; with ``create=False`` returns None until one exists."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            if not create and not UserVectorStore.exists(USER_VECTOR_DIR):
+                return None
+            _store = UserVectorStore(USER_VECTOR_DIR)
+        return _store
+
+
+def _build_record(user_id: str, resume_id: str, signals: Dict[str, float]) -> dict:
+    vector: Dict[str, float] = {}
+    confidence: Dict[str, float] = {}
+    for axis in CORE_AXES:
+        score = signals.get(axis, 0.0)
+        vector[axis] = round(score, 3)
+        confidence[axis] = round(min(score + 0.1, 1.0), 3) if score > 0 else 0.0
+    return {
+        "user_id": user_id,
+        "resume_id": resume_id,
+        "vector": vector,
+        "confidence": confidence,
+        "vector_version": VECTOR_VERSION,
+        "feature_set_version": FEATURE_SET_VERSION,
+        "computed_at": datetime.now(timezone.utc).isoformat(),
+    }
+
 
 class UserVectorService:
     """Compute, store, and retrieve user skill vectors."""
 
+    def __init__(self, store: Optional[UserVectorStore] = None):
+        self._store = store
+
+    def _get_store(self, create: bool = True) -> Optional[UserVectorStore]:
+        if self._store is not None:
+            return self._store
+        return get_user_vector_store(create=create)
+
     async def get_current_vector(self, user_id: str = None, resume_id: str = None) -> dict:
-        key = f"{user_id}:{resume_id}" if user_id and resume_id else None
-        if key and key in _vectors:
-            rec = _vectors[key]
+        store = self._get_store(create=False) if user_id and resume_id else None
+        rec = store.get(user_id, resume_id) if store else None
+        if rec:
             return {
                 "status": "ok",
                 "vector": rec["vector"],
@@ -56,29 +314,54 @@ class UserVectorService:
             "source_summary": {"resume_id": resume_id},
         }
 
+    @staticmethod
+    def _cluster_index():
+        from services.backend_api.services.career.cluster_index import get_cluster_index
+        return get_cluster_index()
+
+    def _reassign(self, records: List[dict]) -> None:
+        """Place new/changed users in their nearest Career Compass cluster."""
+        index = self._cluster_index()
+        if index is not None and records:
+            index.add_members([r["user_id"] for r in records],
+                              [r["vector"] for r in records])
+
     async def update_vector(self, user_id: str, resume_id: str, signals: Dict[str, float]) -> dict:
         """Create or update user vector from signal extraction output."""
-        vector: Dict[str, float] = {}
-        confidence: Dict[str, float] = {}
-        for axis in CORE_AXES:
-            score = signals.get(axis, 0.0)
-            vector[axis] = round(score, 3)
-            confidence[axis] = round(min(score + 0.1, 1.0), 3) if score > 0 else 0.0
-
-        key = f"{user_id}:{resume_id}"
-        record = {
-            "user_id": user_id,
-            "resume_id": resume_id,
-            "vector": vector,
-            "confidence": confidence,
-            "vector_version": VECTOR_VERSION,
-            "feature_set_version": FEATURE_SET_VERSION,
-            "computed_at": datetime.now(timezone.utc).isoformat(),
-        }
-        _vectors[key] = record
+        record = _build_record(user_id, resume_id, signals)
+        self._get_store().upsert_many([record])
+        self._reassign([record])
         logger.info("User vector updated: user=%s resume=%s", user_id, resume_id)
         return {
             "status": "ok",
             **record,
             "source_summary": {"resume_id": resume_id},
         }
+
+    async def update_vectors(self, items: Iterable[Tuple[str, str, Dict[str, float]]]) -> dict:
+        """Batch form of ``update_vector``: ``(user_id, resume_id, signals)`` triples."""
+        records = [_build_record(u, r, s) for u, r, s in items]
+        written = self._get_store().upsert_many(records)
+        self._reassign(records)
+        logger.info("User vectors updated: %d records", written)
+        return {"status": "ok", "updated": written}
+
+    async def find_similar_users(self, user_id: str, resume_id: str, k: int = 10) -> dict:
+        """Users whose vectors are closest (cosine) to this user's vector."""
+        store = self._get_store(create=False)
+        rec = store.get(user_id, resume_id) if store else None
+        if not rec:
+            return {"status": "missing_resume", "matches": [], "source_summary": {"resume_id": resume_id}}
+        matches = [
+            {"user_id": hit["user_id"], "resume_id": hit["resume_id"], "similarity": round(score, 4)}
+            for hit, score in store.top_k(rec["vector"], k=k, exclude_user_id=str(user_id))
+        ]
+        return {"status": "ok", "matches": matches, "source_summary": {"resume_id": resume_id}}
+
+    def delete_user(self, user_id: str) -> int:
+        """Erase a user's vectors and cluster membership (GDPR)."""
+        index = self._cluster_index()
+        if index is not None:
+            index.remove_member(str(user_id))
+        store = self._get_store(create=False)
+        return store.delete_user(user_id) if store else 0
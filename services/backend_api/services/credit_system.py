@@ -22,9 +22,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import json
 import logging
+import threading
+import time
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,7 @@ from services.backend_api.services.plan_config import (
     get_action_config,
     user_can_access,
     plan_rank,
+    PLAN_HIERARCHY,
 )
 
 # Re-export so existing `from credit_system import PLANS, PlanTier` still works
@@ -92,15 +95,83 @@ class CreditManager:
 
     Reads/writes ``UserCreditBalance`` and ``CreditUsageLog`` via SQLAlchemy.
     Falls back to in-memory for resilience when the DB is unreachable.
+
+    Consumption is a single conditional ``UPDATE … WHERE credits_remaining >=
+    cost AND plan_tier IN (…)`` plus the usage-log insert, in one session
+    and one transaction — no read-then-lock round trips.  Read-only checks
+    (``can_perform_action``) are served from a short-lived per-user balance
+    cache that every write refreshes.
     """
 
+    BALANCE_CACHE_TTL = 5.0  # seconds; bounds staleness of read-only checks across workers
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None, balance_ttl: Optional[float] = None):
+        self._session_factory = session_factory or _get_db_session
+        self.balance_ttl = self.BALANCE_CACHE_TTL if balance_ttl is None else balance_ttl
+        # user_id → (expires_at, UserCredits)
+        self._balances: Dict[str, Tuple[float, UserCredits]] = {}
+        self._balances_lock = threading.Lock()
+
+    # --- balance cache ----------------------------------------------------
+
+    def _cached_credits(self, user_id: str) -> UserCredits:
+        now = time.monotonic()
+        with self._balances_lock:
+            hit = self._balances.get(user_id)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        return self.get_user_credits(user_id)
+
+    def _remember(self, credits: UserCredits) -> UserCredits:
+        if self.balance_ttl > 0:
+            with self._balances_lock:
+                if len(self._balances) >= 10_000:
+                    now = time.monotonic()
+                    self._balances = {k: v for k, v in self._balances.items() if v[0] > now}
+                self._balances[credits.user_id] = (time.monotonic() + self.balance_ttl, credits)
+        return credits
+
+    def invalidate_balance(self, user_id: Optional[str] = None) -> None:
+        """Drop cached balances (one user, or all when ``user_id`` is None)."""
+        with self._balances_lock:
+            if user_id is None:
+                self._balances.clear()
+            else:
+                self._balances.pop(str(user_id), None)
+
+    @staticmethod
+    def _new_balance_row(user_id: int, plan: PlanTier):
+        from services.backend_api.db.models import UserCreditBalance
+
+        plan_cfg = get_plan(plan)
+        now = datetime.now(timezone.utc)
+        return UserCreditBalance(
+            user_id=user_id,
+            plan_tier=plan.value,
+            credits_total=plan_cfg.credits_per_month,
+            credits_remaining=plan_cfg.credits_per_month,
+            credits_used=0,
+            period_start=now.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
+        )
+
+    @staticmethod
+    def _to_user_credits(row) -> UserCredits:
+        return UserCredits(
+            user_id=str(row.user_id),
+            plan=PlanTier(row.plan_tier),
+            credits_remaining=row.credits_remaining,
+            credits_used_this_month=row.credits_used,
+            credits_total=row.credits_total,
+            month_start=row.period_start or datetime.now(timezone.utc),
+        )
+
     # --- public helpers (unchanged API surface) ---------------------------
 
     def get_user_credits(self, user_id: str) -> UserCredits:
         """Load balance from DB; auto-create a free-tier row if missing."""
         from services.backend_api.db.models import UserCreditBalance
 
-        db = _get_db_session()
+        db = self._session_factory()
         try:
             row = db.query(UserCreditBalance).filter(
                 UserCreditBalance.user_id == int(user_id)
@@ -108,28 +179,12 @@ class CreditManager:
 
             if row is None:
                 # First time — create free-tier balance
-                plan_cfg = get_plan(PlanTier.FREE)
-                now = datetime.now(timezone.utc)
-                row = UserCreditBalance(
-                    user_id=int(user_id),
-                    plan_tier=PlanTier.FREE.value,
-                    credits_total=plan_cfg.credits_per_month,
-                    credits_remaining=plan_cfg.credits_per_month,
-                    credits_used=0,
-                    period_start=now.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
-                )
+                row = self._new_balance_row(int(user_id), PlanTier.FREE)
                 db.add(row)
                 db.commit()
                 db.refresh(row)
 
-            return UserCredits(
-                user_id=str(row.user_id),
-                plan=PlanTier(row.plan_tier),
-                credits_remaining=row.credits_remaining,
-                credits_used_this_month=row.credits_used,
-                credits_total=row.credits_total,
-                month_start=row.period_start or datetime.now(timezone.utc),
-            )
+            return self._remember(self._to_user_credits(row))
         except Exception:
             db.rollback()
             logger.warning("DB read failed for user %s — returning free-tier default", user_id)
@@ -150,7 +205,7 @@ class CreditManager:
         from services.backend_api.db.models import UserCreditBalance
 
         plan_cfg = get_plan(plan)
-        db = _get_db_session()
+        db = self._session_factory()
         try:
             row = db.query(UserCreditBalance).filter(
                 UserCreditBalance.user_id == int(user_id)
@@ -158,14 +213,7 @@ class CreditManager:
 
             now = datetime.now(timezone.utc)
             if row is None:
-                row = UserCreditBalance(
-                    user_id=int(user_id),
-                    plan_tier=plan.value,
-                    credits_total=plan_cfg.credits_per_month,
-                    credits_remaining=plan_cfg.credits_per_month,
-                    credits_used=0,
-                    period_start=now.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
-                )
+                row = self._new_balance_row(int(user_id), plan)
                 db.add(row)
             else:
                 row.plan_tier = plan.value
@@ -176,9 +224,10 @@ class CreditManager:
 
             db.commit()
             db.refresh(row)
-            return self.get_user_credits(user_id)
+            return self._remember(self._to_user_credits(row))
         except Exception:
             db.rollback()
+            self.invalidate_balance(str(user_id))
             raise
         finally:
             db.close()
@@ -187,14 +236,9 @@ class CreditManager:
         """Look up canonical action config."""
         return ACTION_COSTS.get(action_id)
 
-    def can_perform_action(
-        self,
-        user_id: str,
-        action_id: str,
-        is_preview: bool = False,
-    ) -> tuple[bool, str, Optional[Dict[str, Any]]]:
-        """Check if user has plan + credits for the action."""
-        user = self.get_user_credits(user_id)
+    @staticmethod
+    def _evaluate(user: UserCredits, action_id: str, cost: Optional[int] = None) -> tuple[bool, str, Optional[Dict[str, Any]]]:
+        """Plan-gate and balance check against a known balance."""
         action = ACTION_COSTS.get(action_id)
 
         if not action:
@@ -206,12 +250,12 @@ class CreditManager:
             return False, f"Requires {req_plan.name} plan", {
                 "required_plan": action.requires_plan.value,
                 "required_plan_name": req_plan.name,
-                "price": req_plan.price_monthly,
+                "price": req_plan.price_monthly_usd,
                 "upgrade_url": f"/payment?plan={action.requires_plan.value}",
             }
 
         # Credit check
-        cost = action.cost
+        cost = action.cost if cost is None else cost
         if user.credits_remaining < cost:
             return False, f"Insufficient credits ({user.credits_remaining} remaining, need {cost})", {
                 "credits_remaining": user.credits_remaining,
@@ -221,6 +265,15 @@ class CreditManager:
 
         return True, f"OK - costs {cost} credits", None
 
+    def can_perform_action(
+        self,
+        user_id: str,
+        action_id: str,
+        is_preview: bool = False,
+    ) -> tuple[bool, str, Optional[Dict[str, Any]]]:
+        """Check if user has plan + credits for the action (cached balance)."""
+        return self._evaluate(self._cached_credits(user_id), action_id)
+
     def consume_credits(
         self,
         user_id: str,
@@ -229,49 +282,149 @@ class CreditManager:
         is_preview: bool = False,
     ) -> Dict[str, Any]:
         """Deduct credits and write an immutable usage log row."""
-        from services.backend_api.db.models import UserCreditBalance, CreditUsageLog
+        if action_id not in ACTION_COSTS:
+            return {"success": False, "message": f"Unknown action: {action_id}", "upgrade_info": None, "credits_consumed": 0}
 
-        can_do, message, upgrade_info = self.can_perform_action(user_id, action_id, is_preview)
-        if not can_do:
-            return {"success": False, "message": message, "upgrade_info": upgrade_info, "credits_consumed": 0}
+        result = self._debit(user_id, [(action_id, context)], is_preview)
+        if result["success"]:
+            action = ACTION_COSTS[action_id]
+            result["message"] = f"Consumed {action.cost} credits for {action.label}"
+            logger.info("User %s consumed %d credits for %s", user_id, action.cost, action_id)
+        return result
 
-        action = ACTION_COSTS[action_id]
-        cost = action.cost
+    def consume_credits_batch(
+        self,
+        user_id: str,
+        actions: List[Any],
+        is_preview: bool = False,
+    ) -> Dict[str, Any]:
+        """Deduct credits for several actions at once — all or nothing.
+
+        ``actions`` items are action IDs or ``{"action_id": ..., "context": ...}``
+        dicts.  The combined cost is debited with one conditional update and
+        one usage-log row is written per action.
+        """
+        items: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        for entry in actions:
+            if isinstance(entry, dict):
+                items.append((entry.get("action_id", ""), entry.get("context")))
+            else:
+                items.append((entry, None))
+
+        unknown = [a for a, _ in items if a not in ACTION_COSTS]
+        if unknown:
+            return {"success": False, "message": f"Unknown action: {unknown[0]}", "upgrade_info": None, "credits_consumed": 0}
+        if not items:
+            return {"success": True, "message": "Nothing to consume", "credits_consumed": 0, "actions": []}
+
+        result = self._debit(user_id, items, is_preview)
+        if result["success"]:
+            result["message"] = f"Consumed {result['credits_consumed']} credits for {len(items)} actions"
+            result["actions"] = [
+                {"action_id": a, "credits_consumed": ACTION_COSTS[a].cost} for a, _ in items
+            ]
+            logger.info("User %s consumed %d credits for %d actions", user_id, result["credits_consumed"], len(items))
+        return result
+
+    def _debit(
+        self,
+        user_id: str,
+        items: List[Tuple[str, Optional[Dict[str, Any]]]],
+        is_preview: bool,
+    ) -> Dict[str, Any]:
+        """Atomically check plan + balance, debit, and log, in one transaction."""
+        from sqlalchemy import select, update
+        from sqlalchemy.exc import IntegrityError
+        from services.backend_api.db.models import UserCreditBalance, CreditUsageLog
 
-        db = _get_db_session()
-        try:
-            row = db.query(UserCreditBalance).filter(
-                UserCreditBalance.user_id == int(user_id)
-            ).with_for_update().first()
-
-            if row is None or row.credits_remaining < cost:
-                return {"success": False, "message": "Balance changed — retry", "credits_consumed": 0}
-
-            row.credits_remaining -= cost
-            row.credits_used += cost
-
-            log = CreditUsageLog(
-                user_id=int(user_id),
-                action_id=action_id,
-                action_name=action.label,
-                credits_consumed=cost,
-                credits_remaining_after=row.credits_remaining,
-                is_preview=is_preview,
-                context_json=json.dumps(context) if context else None,
+        uid = int(user_id)
+        configs = [ACTION_COSTS[a] for a, _ in items]
+        cost = sum(c.cost for c in configs)
+        # The action in the batch with the highest plan requirement gates it
+        gate_action = max(items, key=lambda it: plan_rank(ACTION_COSTS[it[0]].requires_plan))[0]
+        gate = ACTION_COSTS[gate_action].requires_plan
+        allowed_tiers = [t.value for t in PLAN_HIERARCHY if user_can_access(t, gate)]
+
+        debit = (
+            update(UserCreditBalance)
+            .where(
+                UserCreditBalance.user_id == uid,
+                UserCreditBalance.credits_remaining >= cost,
+                UserCreditBalance.plan_tier.in_(allowed_tiers),
             )
-            db.add(log)
+            .values(
+                credits_remaining=UserCreditBalance.credits_remaining - cost,
+                credits_used=UserCreditBalance.credits_used + cost,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        balance_cols = (
+            UserCreditBalance.user_id,
+            UserCreditBalance.plan_tier,
+            UserCreditBalance.credits_remaining,
+            UserCreditBalance.credits_used,
+            UserCreditBalance.credits_total,
+            UserCreditBalance.period_start,
+        )
+
+        db = self._session_factory()
+        try:
+            for attempt in range(2):
+                if db.get_bind().dialect.update_returning:
+                    row = db.execute(debit.returning(*balance_cols)).first()
+                else:
+                    updated = db.execute(debit).rowcount
+                    row = db.execute(
+                        select(*balance_cols).where(UserCreditBalance.user_id == uid)
+                    ).first() if updated else None
+                if row is not None:
+                    break
+
+                # Declined — find out why (failure path only)
+                current = db.query(UserCreditBalance).filter(UserCreditBalance.user_id == uid).first()
+                if current is None and attempt == 0:
+                    try:
+                        db.add(self._new_balance_row(uid, PlanTier.FREE))
+                        db.flush()
+                    except IntegrityError:
+                        # Another worker created it first
+                        db.rollback()
+                    continue
+                user = self._to_user_credits(current) if current is not None else None
+                db.rollback()
+                user = self._remember(user) if user is not None else self.get_user_credits(user_id)
+                ok, message, upgrade_info = self._evaluate(user, gate_action, cost)
+                if ok:
+                    ok, message, upgrade_info = False, "Balance changed — retry", None
+                return {"success": False, "message": message, "upgrade_info": upgrade_info, "credits_consumed": 0}
+
+            remaining = row.credits_remaining + cost
+            logs = []
+            for (action_id, context), action in zip(items, configs):
+                remaining -= action.cost
+                logs.append(CreditUsageLog(
+                    user_id=uid,
+                    action_id=action_id,
+                    action_name=action.label,
+                    credits_consumed=action.cost,
+                    credits_remaining_after=remaining,
+                    is_preview=is_preview,
+                    context_json=json.dumps(context) if context else None,
+                ))
+            db.add_all(logs)
             db.commit()
 
-            logger.info("User %s consumed %d credits for %s", user_id, cost, action_id)
+            self._remember(self._to_user_credits(row))
             return {
                 "success": True,
-                "message": f"Consumed {cost} credits for {action.label}",
+                "message": f"Consumed {cost} credits",
                 "credits_consumed": cost,
                 "credits_remaining": row.credits_remaining,
                 "credits_used_this_month": row.credits_used,
             }
         except Exception as exc:
             db.rollback()
+            self.invalidate_balance(str(user_id))
             logger.error("Credit consumption failed for user %s: %s", user_id, exc)
             return {"success": False, "message": "Internal error", "credits_consumed": 0}
         finally:
@@ -285,7 +438,7 @@ class CreditManager:
         plan_cfg = get_plan(user.plan)
 
         usage_by_action: Dict[str, Dict[str, int]] = {}
-        db = _get_db_session()
+        db = self._session_factory()
         try:
             logs = (
                 db.query(CreditUsageLog)
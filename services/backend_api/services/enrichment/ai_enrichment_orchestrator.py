@@ -12,20 +12,121 @@ Loads ALL AI/ML model types:
 
 NO MOCK DATA - ALL predictions from real trained models
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import copy
+import hashlib
 import logging
 import pickle
+import threading
+import time
 import numpy as np
 import json
 import joblib
 
-from services.enrichment.keyword_enricher import enrich_keywords
-from services.enrichment.job_title_similarity import enrich_job_titles_with_similarity_and_migration
+from services.backend_api.services.enrichment.keyword_enricher import enrich_keywords
+from services.backend_api.services.enrichment.job_title_similarity import enrich_job_titles_with_similarity_and_migration
 
 logger = logging.getLogger(__name__)
 
+
+class ModelBundle:
+    """
+    One consistent set of loaded models and the state derived from them.
+
+    A reload builds a new bundle beside the live one and swaps it in with a
+    single assignment; each request pins the bundle it started with, so its
+    steps never pair one training's vectorizer with another's models.
+    """
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.statistical_models: Dict[str, Any] = {}
+        self.neural_models: Dict[str, Any] = {}
+        self.bayesian_models: Dict[str, Any] = {}
+        self.expert_systems: Dict[str, Any] = {}
+        self.nlp_models: Dict[str, Any] = {}
+        self.fuzzy_systems: Dict[str, Any] = {}
+        self.ensemble_models: Dict[str, Any] = {}
+        self.models: Dict[str, Any] = {}
+        self.embeddings: Optional[np.ndarray] = None
+        self.statistical_analysis: Dict[str, Any] = {}
+        # Derived lazily from the models above
+        self.feature_names = None
+        self.keras_models: Dict[str, Any] = {}
+
+
+# (orchestrator, bundle) pinned for the request running in this context
+_pinned_bundle: contextvars.ContextVar = contextvars.ContextVar("enrichment_model_bundle", default=None)
+
+
+def _bundle_attribute(name: str) -> property:
+    return property(lambda self: getattr(self._current_bundle(), name))
+
+
+class EnrichmentFeatureContext:
+    """
+    Per-request features shared by every enrichment step.
+
+    The corpus is vectorised and tokenised at most once per request no
+    matter how many steps read it; each attribute is computed on first use
+    and is safe to read from the step worker threads.
+    """
+
+    def __init__(
+        self,
+        orchestrator: "AIEnrichmentOrchestrator",
+        all_text: str,
+        user_profile: Optional[Dict[str, Any]] = None,
+        job_desc: Optional[str] = None
+    ):
+        self.all_text = all_text
+        self.user_profile = user_profile or {}
+        self.job_desc = job_desc
+        self._orchestrator = orchestrator
+        self._lock = threading.Lock()
+        self._values: Dict[str, Any] = {}
+        self.keyword_set: Set[str] = set()
+
+    def _memo(self, name: str, compute):
+        with self._lock:
+            if name not in self._values:
+                self._values[name] = compute()
+            return self._values[name]
+
+    @property
+    def tfidf(self):
+        """Sparse TF-IDF row for the corpus."""
+        return self._memo('tfidf', lambda: self._orchestrator.models['tfidf'].transform([self.all_text]))
+
+    @property
+    def tfidf_scores(self) -> np.ndarray:
+        """Dense TF-IDF scores aligned with the vectorizer vocabulary."""
+        vector = self.tfidf
+        return self._memo('tfidf_scores', lambda: vector.toarray()[0])
+
+    @property
+    def tokens(self) -> Set[str]:
+        return self._memo('tokens', lambda: set(self.all_text.lower().split()))
+
+    @property
+    def job_tokens(self) -> Set[str]:
+        return self._memo('job_tokens', lambda: set(self.job_desc.lower().split()) if self.job_desc else set())
+
+    @property
+    def profile_features(self) -> List[float]:
+        """Numeric profile features fed to the Bayesian and neural models."""
+        return self._memo('profile_features', lambda: self._orchestrator._extract_basic_features(self.user_profile))
+
+    @property
+    def neural_features(self) -> np.ndarray:
+        return self._memo('neural_features', lambda: np.array([self.profile_features]))
+
+
 class AIEnrichmentOrchestrator:
     """
     V3.0: COMPREHENSIVE orchestrator with 100% model coverage.
@@ -40,6 +141,26 @@ class AIEnrichmentOrchestrator:
     - Ensemble methods (7 algorithms)
     """
 
+    # Steps that only read the corpus/profile or the keyword result run in parallel
+    MAX_PARALLEL_STEPS = 6
+    # Completed enrichments kept per orchestrator, keyed by profile-content
+    # hash and the fingerprint of the model artifacts that produced them
+    RESULT_CACHE_SIZE = 256
+    # Seconds between checks of trained_models/ for retrained artifacts
+    MODEL_CHECK_INTERVAL = 30.0
+
+    # Loaded models, read from the request's pinned bundle
+    statistical_models = _bundle_attribute("statistical_models")
+    neural_models = _bundle_attribute("neural_models")
+    bayesian_models = _bundle_attribute("bayesian_models")
+    expert_systems = _bundle_attribute("expert_systems")
+    nlp_models = _bundle_attribute("nlp_models")
+    fuzzy_systems = _bundle_attribute("fuzzy_systems")
+    ensemble_models = _bundle_attribute("ensemble_models")
+    models = _bundle_attribute("models")
+    embeddings = _bundle_attribute("embeddings")
+    statistical_analysis = _bundle_attribute("statistical_analysis")
+
     def __init__(self, models_path: Path = None):
         """
         Initialize orchestrator with ALL trained models.
@@ -50,21 +171,21 @@ class AIEnrichmentOrchestrator:
         """
         self.models_path = models_path or self._find_models_path()
 
-        # Load all model categories
-        self.statistical_models = self._load_statistical_models()
-        self.neural_models = self._load_neural_models()
-        self.bayesian_models = self._load_bayesian_models()
-        self.expert_systems = self._load_expert_systems()
-        self.nlp_models = self._load_nlp_models()
-        self.fuzzy_systems = self._load_fuzzy_systems()
-        self.ensemble_models = self._load_ensemble_models()
+        self.version = "3.0.0"
 
-        # Legacy models for backward compatibility
-        self.models = self._load_legacy_models()
-        self.embeddings = self._load_embeddings()
-        self.statistical_analysis = self._load_statistical_analysis()
+        # Request-independent state reused across calls
+        self._keras_lock = threading.Lock()
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
 
-        self.version = "3.0.0"
+        # Fingerprint first: an artifact rewritten while loading triggers a reload
+        self._fingerprint_checked_at = time.monotonic()
+        self._bundle = self._load_models(self._artifact_fingerprint())
 
         # Count total models
         total_models = (
@@ -92,6 +213,96 @@ class AIEnrichmentOrchestrator:
         logger.info(f"║ • Legacy Models: {len(self.models):2d}                                 ║")
         logger.info(f"╚══════════════════════════════════════════════════════════╝")
 
+    def _load_models(self, fingerprint: str) -> ModelBundle:
+        """Load every model category into a new bundle; the live one is untouched."""
+        bundle = ModelBundle(fingerprint)
+        # Load all model categories
+        bundle.statistical_models = self._load_statistical_models()
+        bundle.neural_models = self._load_neural_models()
+        bundle.bayesian_models = self._load_bayesian_models()
+        bundle.expert_systems = self._load_expert_systems()
+        bundle.nlp_models = self._load_nlp_models()
+        bundle.fuzzy_systems = self._load_fuzzy_systems()
+        bundle.ensemble_models = self._load_ensemble_models()
+
+        # Legacy models for backward compatibility
+        bundle.models = self._load_legacy_models()
+        bundle.embeddings = self._load_embeddings()
+        bundle.statistical_analysis = self._load_statistical_analysis()
+        return bundle
+
+    def _current_bundle(self) -> ModelBundle:
+        pinned = _pinned_bundle.get()
+        if pinned is not None and pinned[0] is self:
+            return pinned[1]
+        return self._bundle
+
+    @property
+    def _models_fingerprint(self) -> str:
+        return self._current_bundle().fingerprint
+
+    def _statistical_analysis_path(self) -> Path:
+        return self.models_path.parent / "ai_data_final" / "analytics" / "statistical_methods_analysis.json"
+
+    def _artifact_fingerprint(self) -> str:
+        """Hash of the path, size and mtime of every artifact the models load from."""
+        digest = hashlib.sha256()
+        files = [p for p in self.models_path.rglob('*') if p.is_file()]
+        files.append(self._statistical_analysis_path())
+        for path in sorted(files):
+            try:
+                stat = path.stat()
+            except OSError:  # removed mid-walk, or optional and absent
+                continue
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def refresh_models(self, force: bool = False) -> bool:
+        """
+        Reload the models if their artifacts changed on disk (e.g. nightly
+        retraining) and drop every cached enrichment.
+
+        Runs on the model watcher thread (start_model_watcher), never on a
+        request. The directory is checked at most every MODEL_CHECK_INTERVAL
+        seconds unless ``force`` is set. Returns True if the models were
+        reloaded.
+        """
+        if not force and time.monotonic() - self._fingerprint_checked_at < self.MODEL_CHECK_INTERVAL:
+            return False
+        with self._reload_lock:
+            self._fingerprint_checked_at = time.monotonic()
+            fingerprint = self._artifact_fingerprint()
+            if fingerprint == self._bundle.fingerprint:
+                return False
+            logger.info("Model artifacts changed on disk — reloading enrichment models")
+            self._bundle = self._load_models(fingerprint)
+        self.clear_cache()
+        return True
+
+    def _watch_models(self, interval: float) -> None:
+        while not self._watcher_stop.wait(interval):
+            try:
+                self.refresh_models(force=True)
+            except Exception as e:
+                logger.warning("Enrichment model refresh failed: %s", e)
+
+    def start_model_watcher(self, interval: Optional[float] = None) -> None:
+        """Check for retrained artifacts every ``interval`` s (MODEL_CHECK_INTERVAL) in a daemon thread."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch_models, args=(interval or self.MODEL_CHECK_INTERVAL,),
+            daemon=True, name="enrichment-model-watcher",
+        )
+        self._watcher.start()
+
+    def stop_model_watcher(self) -> None:
+        self._watcher_stop.set()
+        if self._watcher is not None and self._watcher.is_alive():
+            self._watcher.join(timeout=5)
+        self._watcher = None
+
     def _find_models_path(self) -> Path:
         """Auto-detect trained_models/ directory."""
         current = Path(__file__).parent
@@ -371,9 +582,9 @@ class AIEnrichmentOrchestrator:
             return models
 
     def _load_embeddings(self) -> Optional[np.ndarray]:
-        """Load pre-computed candidate embeddings."""
+        """Map pre-computed candidate embeddings (read-only, paged in on demand)."""
         try:
-            embeddings = np.load(self.models_path / "candidate_embeddings.npy")
+            embeddings = np.load(self.models_path / "candidate_embeddings.npy", mmap_mode="r")
             logger.info(f"✅ Loaded embeddings: shape {embeddings.shape}")
             return embeddings
         except FileNotFoundError:
@@ -386,8 +597,7 @@ class AIEnrichmentOrchestrator:
     def _load_statistical_analysis(self) -> Dict[str, Any]:
         """Load statistical analysis results."""
         try:
-            stats_path = self.models_path.parent / "ai_data_final" / "analytics" / "statistical_methods_analysis.json"
-            with open(stats_path, 'r') as f:
+            with open(self._statistical_analysis_path(), 'r') as f:
                 stats = json.load(f)
             logger.info(f"✅ Loaded statistical analysis")
             return stats
@@ -399,17 +609,26 @@ class AIEnrichmentOrchestrator:
         self,
         user_profile: Dict[str, Any],
         job_titles: Optional[List[str]] = None,
-        job_desc: Optional[str] = None
+        job_desc: Optional[str] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Unified API for dashboard/UI integration matching API v1 contract.
 
         V3.0: Uses ALL 100+ TRAINED MODELS - COMPREHENSIVE ANALYSIS
 
+        The corpus features are computed once per request and shared by all
+        steps; steps that do not depend on each other run concurrently.
+        Results are cached by profile-content hash, so reloading a dashboard
+        for an unchanged profile skips the models entirely; retrained model
+        artifacts are picked up (and the cache dropped) by the model watcher.
+        The whole request runs against the model bundle live when it started.
+
         Args:
             user_profile: UserProfile dict matching contract schema
             job_titles: List of job titles to enrich
             job_desc: Job description text for matching
+            use_cache: Return a cached enrichment for identical inputs
 
         Returns:
             Dict matching api_v1_contract.md schema with:
@@ -425,57 +644,58 @@ class AIEnrichmentOrchestrator:
             - sentiment_analysis: From NLP models
             - topic_modeling: From LDA + NMF
         """
+        pinned = _pinned_bundle.set((self, self._bundle))
         try:
             logger.info(f"[get_dashboard_enrichment] V3.0 Processing for user: {user_profile.get('name', 'Unknown')}")
 
-            # Step 1: Build analysis corpus
-            all_text = self._build_analysis_corpus(user_profile, job_desc)
-
-            # Step 2: Real keyword enrichment (uses TF-IDF + NLP models)
-            keywords_result = self._enrich_keywords_ml(all_text, job_titles, job_desc)
-
-            # Step 3: Real job title enrichment (uses similarity + clustering + expert systems)
-            job_titles_result = self._enrich_job_titles_ml(job_titles or [], keywords_result)
-
-            # Step 4: Real role fit (from ensemble models + Bayesian)
-            role_fit = self._compute_role_fit_ml(user_profile, keywords_result, job_desc)
-
-            # Step 5: Real clustering (from K-means + DBSCAN + Hierarchical + FCM)
-            clustering = self._compute_clustering_ml(all_text, keywords_result)
+            cache_key = self._enrichment_cache_key(user_profile, job_titles, job_desc)
+            if use_cache:
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    return cached
 
-            # Step 6: Real market signals (from 15 statistical methods + time series)
-            market_signals = self._compute_market_signals_ml(job_titles, keywords_result)
-
-            # Step 7: Neural network predictions (DNN/CNN/LSTM/Transformers)
-            neural_predictions = self._run_neural_predictions(user_profile, all_text)
-
-            # Step 8: Bayesian inference (all Bayesian models)
-            bayesian_inference = self._run_bayesian_inference(user_profile, keywords_result)
-
-            # Step 9: Expert system recommendations (rule engine + knowledge graph)
-            expert_recommendations = self._run_expert_systems(user_profile, keywords_result)
-
-            # Step 10: Fuzzy logic scoring (Mamdani/Sugeno FIS)
-            fuzzy_scores = self._run_fuzzy_logic(user_profile, keywords_result)
-
-            # Step 11: NLP analysis (sentiment, topics, NER)
-            nlp_analysis = self._run_nlp_analysis(all_text)
+            # Step 1: Build analysis corpus + shared per-request features
+            all_text = self._build_analysis_corpus(user_profile, job_desc)
+            ctx = EnrichmentFeatureContext(self, all_text, user_profile, job_desc)
+
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_STEPS,
+                                    thread_name_prefix="enrichment") as pool:
+                # Steps 7 + 11 only need the corpus/profile — start them first
+                submit = self._submit_step
+                neural_future = submit(pool, self._run_neural_predictions, user_profile, all_text, ctx)
+                nlp_future = submit(pool, self._run_nlp_analysis, all_text, ctx)
+
+                # Step 2: Real keyword enrichment (uses TF-IDF + NLP models)
+                keywords_result = self._enrich_keywords_ml(all_text, job_titles, job_desc, ctx)
+
+                # Steps 3-6, 8-10 all read keywords_result and nothing else produced here
+                futures = {
+                    "job_titles_enrichment": submit(pool, self._enrich_job_titles_ml, job_titles or [], keywords_result),
+                    "role_fit_analysis": submit(pool, self._compute_role_fit_ml, user_profile, keywords_result, job_desc, ctx),
+                    "clustering": submit(pool, self._compute_clustering_ml, all_text, keywords_result, ctx),
+                    "market_signals": submit(pool, self._compute_market_signals_ml, job_titles, keywords_result),
+                    "bayesian_inference": submit(pool, self._run_bayesian_inference, user_profile, keywords_result, ctx),
+                    "expert_recommendations": submit(pool, self._run_expert_systems, user_profile, keywords_result),
+                    "fuzzy_scores": submit(pool, self._run_fuzzy_logic, user_profile, keywords_result),
+                }
+                step_results = {name: future.result() for name, future in futures.items()}
+                neural_predictions = neural_future.result()
+                nlp_analysis = nlp_future.result()
 
             # Assemble final response matching API v1 contract + V3.0 extensions
-            return {
+            result = {
                 "keywords": keywords_result,
-                "job_titles_enrichment": job_titles_result,
-                "role_fit_analysis": role_fit,
-                "clustering": clustering,
-                "market_signals": market_signals,
+                "job_titles_enrichment": step_results["job_titles_enrichment"],
+                "role_fit_analysis": step_results["role_fit_analysis"],
+                "clustering": step_results["clustering"],
+                "market_signals": step_results["market_signals"],
 
                 # V3.0 NEW: Comprehensive AI model outputs
                 "neural_predictions": neural_predictions,
-                "bayesian_inference": bayesian_inference,
-                "expert_recommendations": expert_recommendations,
-                "fuzzy_scores": fuzzy_scores,
+                "bayesian_inference": step_results["bayesian_inference"],
+                "expert_recommendations": step_results["expert_recommendations"],
+                "fuzzy_scores": step_results["fuzzy_scores"],
                 "nlp_analysis": nlp_analysis,
-
                 "user_hooks": [
                     "keyword_extraction",
                     "job_title_enrichment",
@@ -489,6 +709,7 @@ class AIEnrichmentOrchestrator:
                     "nlp_analysis"
                 ],
                 "metadata": {
+                    "cached": False,
                     "computed_at": datetime.utcnow().isoformat() + "Z",
                     "version": self.version,
                     "total_models_used": sum([
@@ -512,9 +733,70 @@ class AIEnrichmentOrchestrator:
                 }
             }
 
+            self._cache_put(cache_key, result)
+            return result
+
         except Exception as e:
             logger.error(f"[AIEnrichmentOrchestrator] Error in get_dashboard_enrichment: {e}")
             raise
+        finally:
+            _pinned_bundle.reset(pinned)
+
+    @staticmethod
+    def _submit_step(pool: ThreadPoolExecutor, fn, *args):
+        """Run a step on the pool with this request's pinned model bundle."""
+        return pool.submit(contextvars.copy_context().run, fn, *args)
+
+    # ==================== RESULT CACHE ====================
+
+    def _enrichment_cache_key(
+        self,
+        user_profile: Dict[str, Any],
+        job_titles: Optional[List[str]],
+        job_desc: Optional[str]
+    ) -> str:
+        """Stable hash of everything the enrichment result depends on, models included."""
+        payload = json.dumps(
+            {"profile": user_profile, "job_titles": job_titles, "job_desc": job_desc},
+            sort_keys=True, default=str,
+        )
+        key = f"{self.version}:{self._models_fingerprint}:{payload}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                self._cache_misses += 1
+                return None
+            self._result_cache.move_to_end(key)
+            self._cache_hits += 1
+        # Callers decorate the payload (e.g. skills_detected) — never hand out the cached dict
+        result = copy.deepcopy(cached)
+        result["metadata"]["cached"] = True
+        return result
+
+    def _cache_put(self, key: str, result: Dict[str, Any]) -> None:
+        snapshot = copy.deepcopy(result)
+        with self._cache_lock:
+            self._result_cache[key] = snapshot
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached enrichments (e.g. after retraining models in place)."""
+        with self._cache_lock:
+            self._result_cache.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        with self._cache_lock:
+            return {
+                "entries": len(self._result_cache),
+                "max_entries": self.RESULT_CACHE_SIZE,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+            }
 
     def _build_analysis_corpus(
         self,
@@ -553,21 +835,23 @@ class AIEnrichmentOrchestrator:
         self,
         all_text: str,
         job_titles: Optional[List[str]],
-        job_desc: Optional[str]
+        job_desc: Optional[str],
+        ctx: Optional[EnrichmentFeatureContext] = None
     ) -> Dict[str, Any]:
         """
         Extract keywords using REAL trained TF-IDF model.
         NO MOCK DATA.
         """
+        ctx = ctx or EnrichmentFeatureContext(self, all_text, job_desc=job_desc)
+
         # Use real keyword enricher
         kw_result = enrich_keywords(all_text, job_titles=job_titles, job_desc=job_desc)
 
         # Enhance with TF-IDF vectorizer from trained models
-        tfidf_vector = self.models['tfidf'].transform([all_text])
-        feature_names = self.models['tfidf'].get_feature_names_out()
+        feature_names = self._tfidf_feature_names()
 
         # Get top keywords by TF-IDF score
-        scores = tfidf_vector.toarray()[0]
+        scores = ctx.tfidf_scores
         top_indices = scores.argsort()[-20:][::-1]
         top_keywords = [feature_names[i] for i in top_indices if scores[i] > 0]
 
@@ -581,10 +865,9 @@ class AIEnrichmentOrchestrator:
         # Find missing keywords if job_desc provided
         missing = []
         if job_desc:
-            job_kws = set(job_desc.lower().split())
-            profile_kws = set(all_text.lower().split())
-            missing = list(job_kws - profile_kws)[:10]
+            missing = list(ctx.job_tokens - ctx.tokens)[:10]
 
+        ctx.keyword_set = set(top_keywords)
         return {
             "extracted": top_keywords,
             "importance_scores": importance_scores,
@@ -593,6 +876,13 @@ class AIEnrichmentOrchestrator:
             "total_count": len(top_keywords)
         }
 
+    def _tfidf_feature_names(self):
+        """Vectorizer vocabulary, materialised once per model bundle."""
+        bundle = self._current_bundle()
+        if bundle.feature_names is None:
+            bundle.feature_names = bundle.models['tfidf'].get_feature_names_out()
+        return bundle.feature_names
+
     def _enrich_job_titles_ml(
         self,
         job_titles: List[str],
@@ -624,7 +914,8 @@ class AIEnrichmentOrchestrator:
         self,
         user_profile: Dict[str, Any],
         keywords: Dict[str, Any],
-        job_desc: Optional[str]
+        job_desc: Optional[str],
+        ctx: Optional[EnrichmentFeatureContext] = None
     ) -> Dict[str, Any]:
         """
         Compute role fit using trained logistic_regression_placement.pkl.
@@ -633,8 +924,12 @@ class AIEnrichmentOrchestrator:
         target_role = job_desc or "General Role"
 
         # Extract features
-        profile_kws = set(keywords.get('extracted', []))
-        job_kws = set(job_desc.lower().split()) if job_desc else set()
+        if ctx is not None:
+            profile_kws = ctx.keyword_set or set(keywords.get('extracted', []))
+            job_kws = ctx.job_tokens
+        else:
+            profile_kws = set(keywords.get('extracted', []))
+            job_kws = set(job_desc.lower().split()) if job_desc else set()
 
         keyword_match_pct = 0.0
         if job_kws:
@@ -682,14 +977,15 @@ class AIEnrichmentOrchestrator:
     def _compute_clustering_ml(
         self,
         all_text: str,
-        keywords_result: Dict[str, Any]
+        keywords_result: Dict[str, Any],
+        ctx: Optional[EnrichmentFeatureContext] = None
     ) -> Dict[str, Any]:
         """
         Compute clustering using trained kmeans_model.pkl.
         NO MOCKS - uses real K-means model.
         """
         # Transform text to TF-IDF features
-        tfidf_vector = self.models['tfidf'].transform([all_text])
+        tfidf_vector = (ctx or EnrichmentFeatureContext(self, all_text)).tfidf
 
         # Predict cluster using trained K-means
         cluster_id = int(self.models['kmeans'].predict(tfidf_vector)[0])
@@ -753,7 +1049,22 @@ class AIEnrichmentOrchestrator:
 
     # ==================== V3.0 NEW: COMPREHENSIVE AI MODEL METHODS ====================
 
-    def _run_neural_predictions(self, user_profile: Dict[str, Any], all_text: str) -> Dict[str, Any]:
+    def _load_keras_model(self, tf, name: str):
+        """Load a registered .h5 model once and reuse it for later requests."""
+        bundle = self._current_bundle()
+        with self._keras_lock:
+            model = bundle.keras_models.get(name)
+            if model is None:
+                model = tf.keras.models.load_model(bundle.neural_models[name])
+                bundle.keras_models[name] = model
+            return model
+
+    def _run_neural_predictions(
+        self,
+        user_profile: Dict[str, Any],
+        all_text: str,
+        ctx: Optional[EnrichmentFeatureContext] = None
+    ) -> Dict[str, Any]:
         """Run predictions from all neural network models (TensorFlow .h5)."""
         predictions = {
             "dnn_seniority": "Not available",
@@ -767,7 +1078,7 @@ class AIEnrichmentOrchestrator:
             return predictions
 
         # Extract features for neural networks
-        features = self._extract_neural_features(user_profile)  # shape (1, 6)
+        features = ctx.neural_features if ctx is not None else self._extract_neural_features(user_profile)  # shape (1, 6)
         seniority_map = {0: "Junior", 1: "Mid", 2: "Senior"}
 
         try:
@@ -779,7 +1090,7 @@ class AIEnrichmentOrchestrator:
         # DNN seniority prediction (flat features)
         if 'dnn' in self.neural_models:
             try:
-                model = tf.keras.models.load_model(self.neural_models['dnn'])
+                model = self._load_keras_model(tf, 'dnn')
                 pred = model.predict(features, verbose=0)[0]
                 predictions["dnn_seniority"] = seniority_map.get(int(np.argmax(pred)), "Unknown")
             except Exception as e:
@@ -788,7 +1099,7 @@ class AIEnrichmentOrchestrator:
         # CNN (needs channel dim: batch, features, 1)
         if 'cnn' in self.neural_models:
             try:
-                model = tf.keras.models.load_model(self.neural_models['cnn'])
+                model = self._load_keras_model(tf, 'cnn')
                 features_3d = features.reshape(features.shape[0], features.shape[1], 1)
                 pred = model.predict(features_3d, verbose=0)[0]
                 predictions["cnn_embeddings"] = seniority_map.get(int(np.argmax(pred)), "Unknown")
@@ -798,7 +1109,7 @@ class AIEnrichmentOrchestrator:
         # LSTM (needs time-step dim: batch, features, 1)
         if 'lstm' in self.neural_models:
             try:
-                model = tf.keras.models.load_model(self.neural_models['lstm'])
+                model = self._load_keras_model(tf, 'lstm')
                 features_3d = features.reshape(features.shape[0], features.shape[1], 1)
                 pred = model.predict(features_3d, verbose=0)[0]
                 predictions["lstm_sequence"] = seniority_map.get(int(np.argmax(pred)), "Unknown")
@@ -808,7 +1119,7 @@ class AIEnrichmentOrchestrator:
         # Transformer encoder (flat features like DNN)
         if 'transformer' in self.neural_models:
             try:
-                model = tf.keras.models.load_model(self.neural_models['transformer'])
+                model = self._load_keras_model(tf, 'transformer')
                 pred = model.predict(features, verbose=0)[0]
                 predictions["transformer_encoding"] = seniority_map.get(int(np.argmax(pred)), "Unknown")
             except Exception as e:
@@ -817,7 +1128,7 @@ class AIEnrichmentOrchestrator:
         # Autoencoder (latent space extraction)
         if 'autoencoder' in self.neural_models:
             try:
-                model = tf.keras.models.load_model(self.neural_models['autoencoder'])
+                model = self._load_keras_model(tf, 'autoencoder')
                 reconstructed = model.predict(features, verbose=0)[0]
                 # Latent = midpoint layer output;  report reconstruction error as anomaly signal
                 error = float(np.mean((features[0] - reconstructed) ** 2))
@@ -827,7 +1138,12 @@ class AIEnrichmentOrchestrator:
 
         return predictions
 
-    def _run_bayesian_inference(self, user_profile: Dict[str, Any], keywords: Dict[str, Any]) -> Dict[str, Any]:
+    def _run_bayesian_inference(
+        self,
+        user_profile: Dict[str, Any],
+        keywords: Dict[str, Any],
+        ctx: Optional[EnrichmentFeatureContext] = None
+    ) -> Dict[str, Any]:
         """Run Bayesian inference from all Bayesian models."""
         inference = {
             "naive_bayes_class": "Not available",
@@ -839,7 +1155,7 @@ class AIEnrichmentOrchestrator:
             return inference
 
         # Extract features
-        features = self._extract_basic_features(user_profile)
+        features = ctx.profile_features if ctx is not None else self._extract_basic_features(user_profile)
 
         # Gaussian Naive Bayes prediction
         if 'gaussian_naive_bayes' in self.bayesian_models:
@@ -961,7 +1277,11 @@ class AIEnrichmentOrchestrator:
 
         return fuzzy_scores
 
-    def _run_nlp_analysis(self, all_text: str) -> Dict[str, Any]:
+    def _run_nlp_analysis(
+        self,
+        all_text: str,
+        ctx: Optional[EnrichmentFeatureContext] = None
+    ) -> Dict[str, Any]:
         """Run comprehensive NLP analysis."""
         nlp_analysis = {
             "sentiment": "neutral",
@@ -974,12 +1294,15 @@ class AIEnrichmentOrchestrator:
         if not self.nlp_models:
             return nlp_analysis
 
+        # One TF-IDF transform serves sentiment, classification and topics
+        ctx = ctx or EnrichmentFeatureContext(self, all_text)
+
         # Sentiment analysis — use trained classifier
         if 'sentiment' in self.nlp_models:
             try:
                 model = self.nlp_models['sentiment']
                 if hasattr(model, 'predict') and 'tfidf' in self.models:
-                    features = self.models['tfidf'].transform([all_text])
+                    features = ctx.tfidf
                     pred = model.predict(features)[0]
                     sentiment_map = {0: "negative", 1: "neutral", 2: "positive"}
                     nlp_analysis["sentiment"] = sentiment_map.get(int(pred), "neutral")
@@ -994,7 +1317,7 @@ class AIEnrichmentOrchestrator:
             try:
                 model = self.nlp_models['text_classifier']
                 if hasattr(model, 'predict') and 'tfidf' in self.models:
-                    features = self.models['tfidf'].transform([all_text])
+                    features = ctx.tfidf
                     pred = model.predict(features)[0]
                     nlp_analysis["text_category"] = str(pred)
                     if hasattr(model, 'predict_proba'):
@@ -1008,7 +1331,7 @@ class AIEnrichmentOrchestrator:
             try:
                 model = self.nlp_models['topic_model']
                 if hasattr(model, 'transform') and 'tfidf' in self.models:
-                    features = self.models['tfidf'].transform([all_text])
+                    features = ctx.tfidf
                     topic_dist = model.transform(features)[0]
                     top_idx = int(topic_dist.argmax())
                     nlp_analysis["topics"] = [f"Topic_{top_idx}"]
@@ -1102,3 +1425,30 @@ class AIEnrichmentOrchestrator:
                 "7 Ensemble Methods (Random Forest, XGBoost, LightGBM, CatBoost, AdaBoost, Voting, Stacking)"
             ]
         }
+
+
+# ============================================================================
+# MODULE SINGLETON
+# ============================================================================
+
+_orchestrator: Optional[AIEnrichmentOrchestrator] = None
+_orchestrator_lock = threading.Lock()
+
+
+def get_enrichment_orchestrator() -> AIEnrichmentOrchestrator:
+    """Get the process-wide orchestrator (models and result cache are loaded once)."""
+    global _orchestrator
+    with _orchestrator_lock:
+        if _orchestrator is None:
+            _orchestrator = AIEnrichmentOrchestrator()
+            _orchestrator.start_model_watcher()
+        return _orchestrator
+
+
+def close_enrichment_orchestrator() -> None:
+    """Stop the process-wide orchestrator's model watcher. Safe to call repeatedly."""
+    global _orchestrator
+    with _orchestrator_lock:
+        if _orchestrator is not None:
+            _orchestrator.stop_model_watcher()
+            _orchestrator = None
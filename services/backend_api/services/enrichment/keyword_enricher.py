@@ -4,11 +4,11 @@ Keyword Enrichment Module
 - Ready for LLM/NLP/Bayesian hybrid enrichment
 """
 from typing import List, Dict
-from services.keyword_extractor import extract_keywords, build_thesaurus
+from services.backend_api.services.keyword_extractor import extract_keywords, build_thesaurus
 
 
 import re
-from services.enrichment.job_title_similarity import detect_industry_migrations, job_title_similarity
+from services.backend_api.services.enrichment.job_title_similarity import detect_industry_migrations, job_title_similarity
 
 def extract_acronyms(text: str) -> List[str]:
     """
@@ -0,0 +1,215 @@
+"""
+CareerTrojan — Per-User Interaction Partitions
+===============================================
+Every interaction the logger middleware writes to the shared day
+directories (interactions/{date}/{time}_{user}_{action}.json) is also
+appended to that user's own JSONL partition, together with the path of
+its day file.  GDPR erasure and export then read one small file per user
+instead of walking and parsing every interaction ever logged.
+
+On disk:
+    interactions_by_user/{shard}/{user}.jsonl
+        shard = first two hex chars of sha1(user) — keeps directories small
+        one record per line, plus "day_file" relative to the interactions dir
+    interactions_by_user/.backfill_done
+        written once day files from before partitioning have been indexed
+
+Pre-existing day files are indexed once by ``ensure_backfilled()``: the API
+runs it in the background at startup, and erasure/export run it first if it
+has not completed yet, so legacy files are never missed.  Workers share a
+file lock, so only one of them walks the day directories.
+
+Usage:
+    from services.backend_api.services.interaction_partitions import get_interaction_partitions
+
+    store = get_interaction_partitions()
+    store.append(record, day_file=filepath)
+    for rec in store.iter_records("42"):
+        ...
+    store.erase("42")   # partition + the day files it points at
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from services.shared.file_lock import file_lock
+
+logger = logging.getLogger("interaction_partitions")
+
+_DATA_ROOT = Path(os.getenv("CAREERTROJAN_DATA_ROOT", r"L:\antigravity_version_ai_data_final"))
+INTERACTIONS_DIR = _DATA_ROOT / "USER DATA" / "interactions"
+PARTITIONS_DIR = Path(os.getenv("CAREERTROJAN_INTERACTION_PARTITIONS", str(_DATA_ROOT / "USER DATA" / "interactions_by_user")))
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._@-]")
+
+BACKFILL_MARKER = ".backfill_done"
+BACKFILL_LOCK = ".backfill.lock"
+
+
+class InteractionPartitions:
+    """Append-only per-user interaction logs with O(user) export and erasure."""
+
+    def __init__(self, root: Path = PARTITIONS_DIR, interactions_dir: Path = INTERACTIONS_DIR):
+        self.root = Path(root)
+        self.interactions_dir = Path(interactions_dir)
+        self._lock = threading.Lock()
+
+    def path_for(self, user_id: Any) -> Path:
+        user = str(user_id)
+        shard = hashlib.sha1(user.encode("utf-8")).hexdigest()[:2]
+        # Readable file name; the hash suffix keeps distinct ids distinct after escaping
+        safe = _UNSAFE.sub("_", user)[:80]
+        if safe != user:
+            safe = f"{safe}.{hashlib.sha1(user.encode('utf-8')).hexdigest()[:8]}"
+        return self.root / shard / f"{safe}.jsonl"
+
+    # ── Writes ───────────────────────────────────────────────────────────
+
+    def append(self, record: Dict[str, Any], day_file: Optional[Path] = None) -> None:
+        """Add one interaction to its user's partition (anonymous traffic is not partitioned)."""
+        user = record.get("user_id")
+        if user in (None, "", "anonymous"):
+            return
+        entry = dict(record)
+        if day_file is not None:
+            entry["day_file"] = self._relative(day_file)
+        path = self.path_for(user)
+        line = json.dumps(entry, default=str) + "\n"
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # O_APPEND keeps concurrent single-line writers from interleaving
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def _relative(self, day_file: Path) -> str:
+        try:
+            return Path(day_file).relative_to(self.interactions_dir).as_posix()
+        except ValueError:
+            return str(day_file)
+
+    # ── Reads ────────────────────────────────────────────────────────────
+
+    def iter_records(self, *user_ids: Any) -> Iterator[Dict[str, Any]]:
+        """Stream a user's records (several ids, e.g. numeric id and email, are chained)."""
+        for user in dict.fromkeys(str(u) for u in user_ids if u not in (None, "")):
+            path = self.path_for(user)
+            if not path.exists():
+                continue
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn final line from a crashed writer
+
+    def count(self, *user_ids: Any) -> int:
+        return sum(1 for _ in self.iter_records(*user_ids))
+
+    # ── Erasure ──────────────────────────────────────────────────────────
+
+    def erase(self, *user_ids: Any) -> int:
+        """Delete the user's day files and partition.  Returns day files removed."""
+        self.ensure_backfilled()
+        removed = 0
+        with self._lock:
+            for rec in self.iter_records(*user_ids):
+                day_file = rec.get("day_file")
+                if not day_file:
+                    continue
+                path = Path(day_file)
+                if not path.is_absolute():
+                    path = self.interactions_dir / path
+                try:
+                    path.unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning("Could not remove interaction file %s: %s", path, e)
+            for user in user_ids:
+                if user not in (None, ""):
+                    self.path_for(user).unlink(missing_ok=True)
+        return removed
+
+    # ── Backfill ─────────────────────────────────────────────────────────
+
+    def backfill(self, interactions_dir: Optional[Path] = None) -> int:
+        """
+        One-off: index day files written before partitioning existed.
+        Files already referenced by a partition are skipped, so it can be re-run.
+        """
+        base = Path(interactions_dir or self.interactions_dir)
+        indexed: Dict[str, set] = {}
+        added = 0
+        for path in sorted(base.rglob("*.json")):
+            try:
+                record = json.loads(path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+                continue
+            user = record.get("user_id") if isinstance(record, dict) else None
+            if user in (None, "", "anonymous"):
+                continue
+            user = str(user)
+            if user not in indexed:
+                indexed[user] = {r.get("day_file") for r in self.iter_records(user)}
+            rel = self._relative(path)
+            if rel in indexed[user]:
+                continue
+            self.append(record, day_file=path)
+            indexed[user].add(rel)
+            added += 1
+        logger.info("Backfilled %d interaction records from %s", added, base)
+        return added
+
+    @property
+    def backfill_done(self) -> bool:
+        return (self.root / BACKFILL_MARKER).exists()
+
+    def mark_backfilled(self, records: int = 0) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        marker = {"completed_at": datetime.now(timezone.utc).isoformat(), "records": records,
+                  "interactions_dir": str(self.interactions_dir)}
+        (self.root / BACKFILL_MARKER).write_text(json.dumps(marker), encoding="utf-8")
+
+    def ensure_backfilled(self, timeout: float = 600.0) -> int:
+        """
+        Run the one-off backfill unless it has completed (in any worker).
+        Returns records indexed by this call.
+        """
+        if self.backfill_done:
+            return 0
+        with file_lock(self.root / BACKFILL_LOCK, timeout=timeout):
+            if self.backfill_done:  # another worker finished while we waited
+                return 0
+            added = self.backfill() if self.interactions_dir.is_dir() else 0
+            self.mark_backfilled(added)
+        return added
+
+
+# ============================================================================
+# MODULE SINGLETON
+# ============================================================================
+
+_partitions: Optional[InteractionPartitions] = None
+_partitions_lock = threading.Lock()
+
+
+def get_interaction_partitions() -> InteractionPartitions:
+    """Get the process-wide partition store."""
+    global _partitions
+    with _partitions_lock:
+        if _partitions is None:
+            _partitions = InteractionPartitions()
+        return _partitions
@@ -1,3 +1,5 @@
+from typing import List
+
 # --- User_final integration hook ---
 def attach_keywords_to_user_profile(user_profile: dict, keywords: List[str]) -> dict:
     """
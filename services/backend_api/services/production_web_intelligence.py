@@ -13,15 +13,20 @@ Features:
 - LinkedIn and business directory integration
 - Rate limiting and error handling
 - Caching for performance
+- Concurrent source fetching with per-source deadlines
 
 Author: CareerTrojan System
 Date: December 2024
 """
 
+import atexit
 import requests
+import os
+import threading
 import time
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import quote, urljoin, urlparse
@@ -30,6 +35,13 @@ import streamlit as st
 from pathlib import Path
 import logging
 
+from services.backend_api.services.web_fetch_cache import (
+    BoundedTTLCache,
+    CachedResponse,
+    HostRateLimiter,
+    HTTPResponseCache,
+)
+
 # Optional shared backend: Google-first, Exa-fallback search.
 try:
     from shared_backend.services.web_search_orchestrator import two_tier_web_search as _two_tier_web_search  # type: ignore
@@ -40,28 +52,76 @@ except Exception:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class SourceDeadlineExceeded(requests.exceptions.Timeout):
+    """A source ran out of its time budget before (or while) fetching."""
+
+
 class ProductionWebIntelligence:
     """Production-ready web intelligence service with real API calls and web scraping"""
 
-    def __init__(self):
+    # Guessed company-site and social-profile URLs; fields: nospace, dash, slug, compact
+    WEBSITE_URL_TEMPLATES = (
+        "https://www.{nospace}.com",
+        "https://{nospace}.com",
+        "https://www.{dash}.com",
+        "https://{dash}.com",
+    )
+    SOCIAL_URL_TEMPLATES = {
+        'linkedin': ("https://www.linkedin.com/company/{slug}", "https://www.linkedin.com/company/{dash}"),
+        'twitter': ("https://twitter.com/{slug}", "https://twitter.com/{compact}"),
+        'facebook': ("https://www.facebook.com/{slug}", "https://www.facebook.com/{dash}"),
+    }
+
+    # Seconds each source may take, measured from the start of the lookup.
+    # A source that misses its deadline is reported as degraded, not awaited.
+    SOURCE_DEADLINES = {
+        'duckduckgo': 10.0,
+        'google_to_exa': 15.0,
+        'website': 20.0,
+        'news_api': 10.0,
+        'social_media': 15.0,
+    }
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_workers: int = 6):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
 
-        # Rate limiting
-        self.last_request_time = {}
+        # Rate limiting (per host; waiting only ever blocks the source that asked)
         self.min_request_interval = 1.0  # seconds between requests
+        self.rate_limiter = HostRateLimiter(self.min_request_interval)
+
+        # Sources run side by side on a shared pool
+        self.source_deadlines = dict(self.SOURCE_DEADLINES)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="web-intel")
 
-        # Caching
-        self.cache = {}
+        # HTTP response cache (persistent when a cache dir is configured)
+        cache_dir = cache_dir or self._get_env_var('WEB_INTEL_CACHE_DIR')
+        self.http_cache = HTTPResponseCache(
+            persist_path=Path(cache_dir) / "http_responses.json" if cache_dir else None
+        )
+
+        # Caching (bounded in memory; evictions spill to disk when a cache dir is set)
         self.cache_duration = 3600  # 1 hour cache
+        self.cache = BoundedTTLCache(
+            max_entries=500,
+            max_bytes=32 * 1024 * 1024,
+            ttl=self.cache_duration,
+            spill_dir=Path(cache_dir) / "results" if cache_dir else None,
+        )
 
         # API endpoints and configurations
         self.search_engines = {
             'duckduckgo': 'https://duckduckgo.com/',
             'bing': 'https://www.bing.com/search',
         }
+        self.endpoints = {
+            'duckduckgo': 'https://api.duckduckgo.com/',
+            'news_api': 'https://newsapi.org/v2/everything',
+        }
+        self.website_url_templates = list(self.WEBSITE_URL_TEMPLATES)
+        self.social_url_templates = {k: list(v) for k, v in self.SOCIAL_URL_TEMPLATES.items()}
 
         # Real API keys should be stored securely
         self.api_keys = {
@@ -72,34 +132,71 @@ class ProductionWebIntelligence:
 
     def _get_env_var(self, var_name: str) -> Optional[str]:
         """Get environment variable or return None"""
-        import os
         return os.getenv(var_name)
 
-    def _rate_limit(self, domain: str):
-        """Implement rate limiting for requests"""
-        current_time = time.time()
-        last_time = self.last_request_time.get(domain, 0)
-
-        time_since_last = current_time - last_time
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
-
-        self.last_request_time[domain] = time.time()
+    def _rate_limit(self, domain: str, deadline: Optional[float] = None) -> bool:
+        """
+        Wait for this host's next request slot.
+
+        Only the calling source's worker waits; other hosts are unaffected.
+        Returns False (without reserving) if the slot falls past ``deadline``.
+        """
+        delay = self.rate_limiter.reserve(domain, not_after=deadline)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    def _fetch(
+        self,
+        url: str,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 10,
+        deadline: Optional[float] = None,
+        **kwargs
+    ) -> CachedResponse:
+        """Rate-limited, cached HTTP request bounded by the source deadline."""
+        key = self.http_cache.make_key(method, url, params)
+        fresh, stale = self.http_cache.lookup(key)
+        if fresh is not None:
+            return fresh
+
+        host = urlparse(url).netloc
+        if not self._rate_limit(host, deadline):
+            raise SourceDeadlineExceeded(f"No request slot for {host} before deadline")
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SourceDeadlineExceeded(f"Deadline passed before requesting {url}")
+            timeout = min(timeout, remaining)
+
+        response = self.session.request(
+            method, url, params=params, timeout=timeout,
+            headers=self.http_cache.conditional_headers(stale) or None,
+            **kwargs
+        )
+        if response.status_code == 304 and stale is not None:
+            return self.http_cache.revalidated(key, stale, response)
+
+        cached = CachedResponse.from_response(response)
+        self.http_cache.store(key, cached)
+        return cached
 
     def _get_cached_result(self, cache_key: str) -> Optional[Dict]:
         """Get cached result if available and not expired"""
-        if cache_key in self.cache:
-            cached_item = self.cache[cache_key]
-            if datetime.now() - cached_item['timestamp'] < timedelta(seconds=self.cache_duration):
-                return cached_item['data']
-        return None
+        return self.cache.get(cache_key)
 
     def _cache_result(self, cache_key: str, data: Dict):
-        """Cache a result with timestamp"""
-        self.cache[cache_key] = {
-            'data': data,
-            'timestamp': datetime.now()
+        """Cache a result for cache_duration seconds"""
+        self.cache.set(cache_key, data, ttl=self.cache_duration)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for the result and HTTP caches"""
+        return {
+            'results': self.cache.get_stats(),
+            'http': {**self.http_cache.stats, 'entries': len(self.http_cache)},
         }
 
     def search_company_real(self, company_name: str, deep_search: bool = False) -> Dict[str, Any]:
@@ -119,12 +216,30 @@ class ProductionWebIntelligence:
             'search_type': 'production_web_search',
             'sources_attempted': [],
             'data_found': {},
-            'confidence_score': 0
+            'confidence_score': 0,
+            'source_timings_ms': {},
+            'degraded_sources': []
+        }
+
+        # Fan every independent source out at once; each gets its own deadline
+        started = time.monotonic()
+        sources = {
+            'duckduckgo': self._search_duckduckgo,
+            'website': self._find_and_scrape_website,
+            'social_media': self._detect_social_presence,
+        }
+        if _two_tier_web_search and deep_search:
+            sources['google_to_exa'] = self._search_two_tier
+        if deep_search and self.api_keys['news_api']:
+            sources['news_api'] = self._search_news_api
+        futures = {
+            name: self._submit_source(name, fn, company_name, started)
+            for name, fn in sources.items()
         }
 
         # 1. DuckDuckGo search (privacy-focused, no API key required)
         try:
-            ddg_results = self._search_duckduckgo(company_name)
+            ddg_results = self._collect_source('duckduckgo', futures, started, results)
             if ddg_results:
                 results['sources_attempted'].append('duckduckgo')
                 results['data_found']['duckduckgo'] = ddg_results
@@ -138,14 +253,12 @@ class ProductionWebIntelligence:
 
         # Google → Exa (fallback) pass: aligns the platform-wide two-tier strategy.
         if _two_tier_web_search and (deep_search or not results.get('data_found', {}).get('duckduckgo')):
-            try:
-                query = f"{company_name} company official website"
-                two_tier = _two_tier_web_search(
-                    query=query,
-                    content_type="background",
-                    num_results=10,
-                    triggered_from="admin_portal.services.production_web_intelligence.search_company_real",
+            if 'google_to_exa' not in futures:
+                futures['google_to_exa'] = self._submit_source(
+                    'google_to_exa', self._search_two_tier, company_name, started
                 )
+            try:
+                two_tier = self._collect_source('google_to_exa', futures, started, results)
                 results['sources_attempted'].append('google_to_exa')
                 results['data_found']['google_to_exa'] = two_tier
                 st.success("✅ Google→Exa enrichment completed")
@@ -155,7 +268,7 @@ class ProductionWebIntelligence:
 
         # 2. Company website detection and scraping
         try:
-            website_data = self._find_and_scrape_website(company_name)
+            website_data = self._collect_source('website', futures, started, results)
             if website_data:
                 results['sources_attempted'].append('company_website')
                 results['data_found']['website'] = website_data
@@ -164,9 +277,9 @@ class ProductionWebIntelligence:
             st.warning(f"⚠️ Website analysis failed: {e}")
 
         # 3. News search (if API key available)
-        if deep_search and self.api_keys['news_api']:
+        if 'news_api' in futures:
             try:
-                news_data = self._search_news_api(company_name)
+                news_data = self._collect_source('news_api', futures, started, results)
                 if news_data:
                     results['sources_attempted'].append('news_api')
                     results['data_found']['news'] = news_data
@@ -176,7 +289,7 @@ class ProductionWebIntelligence:
 
         # 4. Social media presence detection
         try:
-            social_data = self._detect_social_presence(company_name)
+            social_data = self._collect_source('social_media', futures, started, results)
             if social_data:
                 results['sources_attempted'].append('social_media')
                 results['data_found']['social'] = social_data
@@ -189,20 +302,61 @@ class ProductionWebIntelligence:
 
         # Cache the results
         self._cache_result(cache_key, results)
+        self.http_cache.maybe_flush()
 
         st.success(f"✅ Research completed for {company_name} - Confidence: {results['confidence_score']}%")
         return results
 
-    def _search_duckduckgo(self, company_name: str) -> Dict[str, Any]:
-        """Perform actual DuckDuckGo search"""
+    def _submit_source(self, name: str, fn, company_name: str, started: float):
+        """Run one source on the pool with its deadline; resolves to (data, elapsed_ms)."""
+        deadline = started + self.source_deadlines.get(name, 15.0)
 
-        self._rate_limit('duckduckgo.com')
+        def run():
+            t0 = time.monotonic()
+            data = fn(company_name, deadline=deadline)
+            return data, (time.monotonic() - t0) * 1000
+
+        return self._executor.submit(run)
+
+    def _collect_source(self, name: str, futures: Dict[str, Any], started: float, results: Dict[str, Any]):
+        """Wait for a source until its deadline; a late source is marked degraded."""
+        remaining = started + self.source_deadlines.get(name, 15.0) - time.monotonic()
+        try:
+            data, elapsed_ms = futures[name].result(timeout=max(0.0, remaining))
+        except FutureTimeoutError:
+            futures[name].cancel()
+            results['degraded_sources'].append(name)
+            raise SourceDeadlineExceeded(f"{name} exceeded its {self.source_deadlines.get(name)}s deadline")
+        except SourceDeadlineExceeded:
+            results['degraded_sources'].append(name)
+            raise
+        results['source_timings_ms'][name] = round(elapsed_ms, 1)
+        return data
+
+    def _search_two_tier(self, company_name: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Google-first, Exa-fallback search via the shared backend."""
+        query = f"{company_name} company official website"
+        return _two_tier_web_search(
+            query=query,
+            content_type="background",
+            num_results=10,
+            triggered_from="admin_portal.services.production_web_intelligence.search_company_real",
+        )
+
+    def close(self):
+        """Persist the caches and release the fetch pool"""
+        self.http_cache.flush()
+        self.cache.persist()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search_duckduckgo(self, company_name: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Perform actual DuckDuckGo search"""
 
         search_query = f"{company_name} company official website"
 
         try:
             # DuckDuckGo instant answer API (free, no key required)
-            ddg_url = "https://api.duckduckgo.com/"
+            ddg_url = self.endpoints['duckduckgo']
             params = {
                 'q': search_query,
                 'format': 'json',
@@ -210,7 +364,7 @@ class ProductionWebIntelligence:
                 'skip_disambig': '1'
             }
 
-            response = self.session.get(ddg_url, params=params, timeout=10)
+            response = self._fetch(ddg_url, params=params, timeout=10, deadline=deadline)
             response.raise_for_status()
 
             data = response.json()
@@ -229,26 +383,31 @@ class ProductionWebIntelligence:
 
             return result
 
+        except SourceDeadlineExceeded:
+            raise
         except requests.exceptions.RequestException as e:
             logger.error(f"DuckDuckGo search failed: {e}")
             return {'search_performed': False, 'error': str(e)}
 
-    def _find_and_scrape_website(self, company_name: str) -> Dict[str, Any]:
+    def _url_fields(self, company_name: str) -> Dict[str, str]:
+        """Name variants substituted into the website/social URL templates"""
+        return {
+            'nospace': company_name.lower().replace(' ', ''),
+            'dash': company_name.lower().replace(' ', '-'),
+            'slug': company_name.lower().replace(' ', '').replace('inc', '').replace('corp', ''),
+            'compact': company_name.replace(' ', ''),
+        }
+
+    def _find_and_scrape_website(self, company_name: str, deadline: Optional[float] = None) -> Dict[str, Any]:
         """Attempt to find and scrape company website"""
 
         # Common website patterns
-        potential_urls = [
-            f"https://www.{company_name.lower().replace(' ', '')}.com",
-            f"https://{company_name.lower().replace(' ', '')}.com",
-            f"https://www.{company_name.lower().replace(' ', '-')}.com",
-            f"https://{company_name.lower().replace(' ', '-')}.com"
-        ]
+        fields = self._url_fields(company_name)
+        potential_urls = [template.format(**fields) for template in self.website_url_templates]
 
         for url in potential_urls:
             try:
-                self._rate_limit(urlparse(url).netloc)
-
-                response = self.session.get(url, timeout=10, allow_redirects=True)
+                response = self._fetch(url, timeout=10, deadline=deadline, allow_redirects=True)
 
                 if response.status_code == 200:
                     # Successfully found website
@@ -265,6 +424,8 @@ class ProductionWebIntelligence:
                         'social_links': self._extract_social_links(soup)
                     }
 
+            except SourceDeadlineExceeded:
+                break  # Out of time - report what was tried
             except requests.exceptions.RequestException:
                 continue  # Try next URL
 
@@ -338,14 +499,14 @@ class ProductionWebIntelligence:
 
         return social_links
 
-    def _search_news_api(self, company_name: str) -> Dict[str, Any]:
+    def _search_news_api(self, company_name: str, deadline: Optional[float] = None) -> Dict[str, Any]:
         """Search for company news using News API"""
 
         if not self.api_keys['news_api']:
             return {'error': 'News API key not configured'}
 
         try:
-            url = "https://newsapi.org/v2/everything"
+            url = self.endpoints['news_api']
             params = {
                 'q': company_name,
                 'sortBy': 'publishedAt',
@@ -354,8 +515,7 @@ class ProductionWebIntelligence:
                 'language': 'en'
             }
 
-            self._rate_limit('newsapi.org')
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._fetch(url, params=params, timeout=10, deadline=deadline)
             response.raise_for_status()
 
             data = response.json()
@@ -368,10 +528,12 @@ class ProductionWebIntelligence:
                 'search_query': company_name
             }
 
+        except SourceDeadlineExceeded:
+            raise
         except requests.exceptions.RequestException as e:
             return {'news_found': False, 'error': str(e)}
 
-    def _detect_social_presence(self, company_name: str) -> Dict[str, Any]:
+    def _detect_social_presence(self, company_name: str, deadline: Optional[float] = None) -> Dict[str, Any]:
         """Detect social media presence for company"""
 
         social_presence = {
@@ -381,22 +543,10 @@ class ProductionWebIntelligence:
         }
 
         # Generate likely social media URLs
-        company_slug = company_name.lower().replace(' ', '').replace('inc', '').replace('corp', '')
-        company_dash = company_name.lower().replace(' ', '-')
-
+        fields = self._url_fields(company_name)
         social_platforms = {
-            'linkedin': [
-                f"https://www.linkedin.com/company/{company_slug}",
-                f"https://www.linkedin.com/company/{company_dash}"
-            ],
-            'twitter': [
-                f"https://twitter.com/{company_slug}",
-                f"https://twitter.com/{company_name.replace(' ', '')}"
-            ],
-            'facebook': [
-                f"https://www.facebook.com/{company_slug}",
-                f"https://www.facebook.com/{company_dash}"
-            ]
+            platform: [template.format(**fields) for template in templates]
+            for platform, templates in self.social_url_templates.items()
         }
 
         for platform, urls in social_platforms.items():
@@ -405,13 +555,15 @@ class ProductionWebIntelligence:
             for url in urls:
                 try:
                     # Quick HEAD request to check if profile exists
-                    self._rate_limit(urlparse(url).netloc)
-                    response = self.session.head(url, timeout=5, allow_redirects=True)
+                    response = self._fetch(url, method='HEAD', timeout=5, deadline=deadline, allow_redirects=True)
 
                     if response.status_code == 200:
                         social_presence['likely_profiles'][platform] = url
                         break
 
+                except SourceDeadlineExceeded:
+                    social_presence['deadline_reached'] = True
+                    return social_presence
                 except requests.exceptions.RequestException:
                     continue
 
@@ -425,7 +577,9 @@ class ProductionWebIntelligence:
             'research_timestamp': results['search_timestamp'],
             'research_type': 'production_intelligence',
             'sources_used': results['sources_attempted'],
-            'raw_data': results['data_found']
+            'raw_data': results['data_found'],
+            'source_timings_ms': results.get('source_timings_ms', {}),
+            'degraded_sources': results.get('degraded_sources', [])
         }
 
         # Extract key information from all sources
@@ -516,16 +670,31 @@ class ProductionWebIntelligence:
 
 # Global instance
 _web_intelligence = None
+_web_intelligence_lock = threading.Lock()
 
 def get_web_intelligence() -> ProductionWebIntelligence:
     """Get or create global web intelligence instance"""
     global _web_intelligence
 
     if _web_intelligence is None:
-        _web_intelligence = ProductionWebIntelligence()
+        with _web_intelligence_lock:
+            if _web_intelligence is None:
+                _web_intelligence = ProductionWebIntelligence()
+                # Streamlit workers have no shutdown hook; the API also calls
+                # close_web_intelligence() from its own
+                atexit.register(close_web_intelligence)
 
     return _web_intelligence
 
+def close_web_intelligence() -> None:
+    """Persist the global instance's caches and release it (safe to call twice)"""
+    global _web_intelligence
+
+    with _web_intelligence_lock:
+        instance, _web_intelligence = _web_intelligence, None
+    if instance is not None:
+        instance.close()
+
 def search_company_production(company_name: str, deep_search: bool = False) -> Dict[str, Any]:
     """Production company search function that can be imported by other modules"""
     web_intel = get_web_intelligence()
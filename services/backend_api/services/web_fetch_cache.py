@@ -0,0 +1,477 @@
+"""
+=============================================================================
+Web Fetch Cache & Per-Host Rate Limiting
+=============================================================================
+
+Shared plumbing for the web intelligence fetchers:
+
+- HostRateLimiter: reserves the next request slot per host without holding a
+  lock while waiting, so a slow/limited host never delays requests to other
+  hosts, and a caller can decline a slot that falls past its deadline.
+- HTTPResponseCache: bounded LRU cache of HTTP responses that honours
+  Cache-Control max-age/no-store and revalidates stale entries with
+  If-None-Match / If-Modified-Since. Optionally persisted to a JSON file so
+  it survives worker restarts; the file is rewritten on a background thread
+  once enough changes or time have accumulated, never on a request thread.
+  Stored URLs keep no query string, so API keys passed as params never
+  reach the file.
+- BoundedTTLCache: entry- and byte-bounded LRU/TTL cache for compiled
+  lookup results, with hit/miss/eviction counters and an optional on-disk
+  spill tier (one JSON file per entry, itself bounded) that survives restarts.
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class HostRateLimiter:
+    """Minimum spacing between requests to the same host."""
+
+    def __init__(self, min_interval: float = 1.0):
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, host: str, not_after: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve the next free slot for ``host``.
+
+        Returns the delay (seconds) the caller must wait before sending, or
+        None if the slot would start after ``not_after`` (a time.monotonic()
+        deadline) — in that case nothing is reserved.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            if not_after is not None and slot > not_after:
+                return None
+            self._next_slot[host] = slot + self.min_interval
+            return slot - now
+
+
+def _redact_url(url: str) -> str:
+    """Drop the query string and fragment: API keys travel there (e.g. NewsAPI's apiKey)."""
+    parts = urlsplit(url or '')
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+
+
+class CachedResponse:
+    """Minimal, serialisable stand-in for ``requests.Response``."""
+
+    def __init__(self, status_code: int, url: str, headers: Dict[str, str], content: bytes):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.content = content
+        self.from_cache = False
+
+    @classmethod
+    def from_response(cls, response) -> "CachedResponse":
+        keep = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control')
+        headers = {k: response.headers[k] for k in keep if k in response.headers}
+        return cls(response.status_code, _redact_url(response.url), headers, response.content or b'')
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'status_code': self.status_code,
+            'url': self.url,
+            'headers': self.headers,
+            'content': base64.b64encode(self.content).decode('ascii'),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CachedResponse":
+        return cls(data['status_code'], data['url'], data.get('headers', {}),
+                   base64.b64decode(data.get('content', '')))
+
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+def _entry_size(entry: Dict[str, Any]) -> int:
+    return len(entry['response'].get('content', ''))
+
+
+class HTTPResponseCache:
+    """Bounded, optionally persistent HTTP response cache with revalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        default_ttl: float = 900.0,
+        persist_path: Optional[Path] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        flush_every: int = 100,
+        flush_interval: float = 300.0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.persist_path = Path(persist_path) if persist_path else None
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._dirty = 0  # changes since the last flush
+        self._flushed_at = time.monotonic()
+        self._flush_lock = threading.Lock()  # one writer of persist_path at a time
+        self._flush_thread: Optional[threading.Thread] = None
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'evictions': 0}
+        self._load()
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        # API keys travel in params; hash so they never land on disk in clear
+        raw = json.dumps([method.upper(), url, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _ttl_for(self, response: CachedResponse) -> Optional[float]:
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control:
+            return None
+        match = _MAX_AGE.search(cache_control)
+        if match:
+            return float(match.group(1))
+        if 'no-cache' in cache_control:
+            return 0.0
+        return self.default_ttl
+
+    def lookup(self, key: str):
+        """
+        Returns (fresh_response, stale_entry). At most one is not None; a
+        stale entry carries the validators for a conditional request.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None, None
+            self._entries.move_to_end(key)
+            if time.time() < entry['expires_at']:
+                self.stats['hits'] += 1
+                response = CachedResponse.from_dict(entry['response'])
+                response.from_cache = True
+                return response, None
+            return None, entry
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        if not entry:
+            return {}
+        headers = entry['response'].get('headers', {})
+        conditional = {}
+        if headers.get('ETag'):
+            conditional['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            conditional['If-Modified-Since'] = headers['Last-Modified']
+        return conditional
+
+    def revalidated(self, key: str, entry: Dict[str, Any], not_modified) -> CachedResponse:
+        """Extend a stale entry after a 304 and return its stored response."""
+        response = CachedResponse.from_dict(entry['response'])
+        if 'Cache-Control' in not_modified.headers:
+            response.headers['Cache-Control'] = not_modified.headers['Cache-Control']
+        ttl = self._ttl_for(response) or 0.0
+        with self._lock:
+            entry['response']['headers'] = response.headers
+            entry['expires_at'] = time.time() + ttl
+            if key not in self._entries:  # evicted while the request was in flight
+                self._bytes += _entry_size(entry)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.stats['revalidated'] += 1
+            self._dirty += 1
+        response.from_cache = True
+        return response
+
+    def store(self, key: str, response: CachedResponse) -> None:
+        if response.status_code != 200:
+            return
+        ttl = self._ttl_for(response)
+        if ttl is None or len(response.content) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= _entry_size(old)
+            entry = {'response': response.to_dict(), 'expires_at': time.time() + ttl}
+            self._entries[key] = entry
+            self._bytes += _entry_size(entry)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= _entry_size(evicted)
+                self.stats['evictions'] += 1
+            self._dirty += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ── Persistence ──────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        if not self.persist_path or not self.persist_path.exists():
+            return
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            for key, entry in stored.get('entries', [])[-self.max_entries:]:
+                url = entry['response'].get('url', '')
+                if url != _redact_url(url):  # written before URLs were redacted
+                    entry['response']['url'] = _redact_url(url)
+                    self._dirty += 1
+                self._entries[key] = entry
+                self._bytes += _entry_size(entry)
+            logger.info(f"Loaded {len(self._entries)} cached web responses")
+        except Exception as e:
+            logger.warning(f"Could not load web response cache: {e}")
+
+    def maybe_flush(self) -> bool:
+        """
+        Start a background flush once ``flush_every`` changes or
+        ``flush_interval`` seconds have accumulated. Cheap to call on the
+        request path, which never waits for the write; returns True if a
+        flush was started.
+        """
+        if not self.persist_path or not self._dirty:
+            return False
+        if (self._dirty < self.flush_every
+                and time.monotonic() - self._flushed_at < self.flush_interval):
+            return False
+        with self._lock:
+            if self._flush_thread is not None and self._flush_thread.is_alive():
+                return False
+            self._flush_thread = threading.Thread(target=self.flush, name="web-cache-flush", daemon=True)
+            self._flush_thread.start()
+        return True
+
+    def flush(self) -> None:
+        """Write the cache to disk (atomic replace) if anything changed."""
+        if not self.persist_path:
+            return
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = {'entries': list(self._entries.items())}
+                self._dirty = 0
+                self._flushed_at = time.monotonic()
+            try:
+                self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.persist_path.with_suffix('.tmp')
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp, self.persist_path)
+            except Exception as e:
+                logger.warning(f"Could not persist web response cache: {e}")
+
+
+class BoundedTTLCache:
+    """
+    LRU/TTL cache bounded by entry count and approximate JSON size.
+
+    Entries pushed out of memory by the bounds are written to ``spill_dir``
+    (when given) and promoted back on the next hit; the spill tier is bounded
+    too and is reloaded on start-up, so it survives restarts. Values must be
+    JSON-serialisable (non-JSON leaves are stringified when sized/spilled).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 500,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: float = 3600.0,
+        spill_dir: Optional[Path] = None,
+        max_spill_entries: int = 20000,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.max_spill_entries = max_spill_entries
+        # key -> (value, expires_at, nbytes); oldest first
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        # spill file stem -> expires_at; oldest first
+        self._spilled: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0,
+            'spill_writes': 0, 'spill_hits': 0,
+        }
+        self._load_spill_index()
+
+    # ── Public API ───────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                value, expires_at, nbytes = item
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    self.stats['hits'] += 1
+                    return value
+                del self._entries[key]
+                self._bytes -= nbytes
+                self.stats['expirations'] += 1
+            spilled = self._read_spill(key, now)
+            if spilled is None:
+                self.stats['misses'] += 1
+                return None
+            value, expires_at = spilled
+            self.stats['hits'] += 1
+            self.stats['spill_hits'] += 1
+            self._insert(key, value, expires_at)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._drop_spill(self._stem(key))
+            self._insert(key, value, expires_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for stem in list(self._spilled):
+                self._drop_spill(stem)
+
+    def persist(self) -> None:
+        """Spill every live in-memory entry so a restart starts warm."""
+        if not self.spill_dir:
+            return
+        now = time.time()
+        with self._lock:
+            for key, (value, expires_at, _) in self._entries.items():
+                if expires_at > now:
+                    self._write_spill(key, value, expires_at)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'spilled_entries': len(self._spilled),
+            }
+
+    # ── Memory tier (caller holds the lock) ──────────────────────────────
+
+    def _insert(self, key: str, value: Any, expires_at: float) -> None:
+        nbytes = len(json.dumps(value, default=str))
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[2]
+        if nbytes > self.max_bytes:
+            self._write_spill(key, value, expires_at)
+            return
+        self._entries[key] = (value, expires_at, nbytes)
+        self._bytes += nbytes
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            old_key, (old_value, old_expires, old_bytes) = self._entries.popitem(last=False)
+            self._bytes -= old_bytes
+            self.stats['evictions'] += 1
+            if old_expires > time.time():
+                self._write_spill(old_key, old_value, old_expires)
+
+    # ── Spill tier (caller holds the lock) ───────────────────────────────
+
+    @staticmethod
+    def _stem(key: str) -> str:
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def _load_spill_index(self) -> None:
+        if not self.spill_dir or not self.spill_dir.exists():
+            return
+        files = sorted(self.spill_dir.glob('*.json'), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            # Expiry is checked when the entry is read back
+            self._spilled[path.stem] = float('inf')
+        while len(self._spilled) > self.max_spill_entries:
+            self._drop_spill(next(iter(self._spilled)))
+
+    def _write_spill(self, key: str, value: Any, expires_at: float) -> None:
+        if not self.spill_dir:
+            return
+        stem = self._stem(key)
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.spill_dir / f"{stem}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'expires_at': expires_at, 'value': value}, f, default=str)
+            os.replace(tmp, self.spill_dir / f"{stem}.json")
+        except Exception as e:
+            logger.warning(f"Could not spill cache entry: {e}")
+            return
+        self._spilled.pop(stem, None)
+        self._spilled[stem] = expires_at
+        self.stats['spill_writes'] += 1
+        while len(self._spilled) > self.max_spill_entries:
+            self._drop_spill(next(iter(self._spilled)))
+            self.stats['evictions'] += 1
+
+    def _read_spill(self, key: str, now: float) -> Optional[Tuple[Any, float]]:
+        stem = self._stem(key)
+        if stem not in self._spilled:
+            return None
+        try:
+            with open(self.spill_dir / f"{stem}.json", 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except Exception:
+            self._spilled.pop(stem, None)
+            return None
+        self._drop_spill(stem)
+        if stored.get('key') != key:
+            return None
+        if stored.get('expires_at', 0) <= now:
+            self.stats['expirations'] += 1
+            return None
+        return stored['value'], stored['expires_at']
+
+    def _drop_spill(self, stem: str) -> None:
+        if self._spilled.pop(stem, None) is None:
+            return
+        try:
+            (self.spill_dir / f"{stem}.json").unlink()
+        except OSError:
+            pass
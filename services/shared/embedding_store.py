@@ -0,0 +1,496 @@
+"""
+CareerTrojan — Memory-Mapped Embedding Store with IVF Search
+=============================================================
+One consolidated, append-friendly vector store per collection
+("candidates", "jobs", "mentors", …) with approximate nearest-neighbour
+search, replacing one-.npy-per-profile files and full-matrix loads.
+
+On disk (one directory per collection):
+    vectors.f32   raw float32 rows, memory-mapped; grows by doubling
+    rows.jsonl    append-only log: row → id + metadata, and tombstones
+    ivf.npz       IVF index: centroids + row → list assignment
+    store.json    dimension, row count, options
+
+Search is an inverted-file (IVF) index over spherical k-means centroids:
+a query scores the centroids, scans only the ``nprobe`` closest lists and
+takes the exact top-k among those rows.  Inserts are assigned to their
+nearest list immediately; deletes are tombstones (``compact()`` reclaims
+them).  Filtered queries widen ``nprobe`` until enough rows pass.
+Collections below ``min_index_size`` are simply brute-forced.
+
+Writers open their collection directory directly: Phase C of
+deep_ingest_and_train keeps one training-corpus store per sentence model
+(scripts.embedding_pipeline.corpus_store_dir), and embedding_pipeline
+writes <output>/store/<collection>.
+
+Usage:
+    from services.shared.embedding_store import EmbeddingStore
+
+    store = EmbeddingStore(store_dir, dim=384)
+    store.add(["cand-1", "cand-2"], vectors, metadata=[{"region": "uk"}, {"region": "us"}])
+    store.search(query_vec, k=10, filter={"region": "uk"})   # [(id, score, meta), ...]
+    store.flush()
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger("careertrojan.embedding_store")
+
+Filter = Union[Callable[[Dict[str, Any]], bool], Dict[str, Any], None]
+SearchHit = Tuple[str, float, Dict[str, Any]]
+
+_SCAN_CHUNK = 65_536  # rows scored per matmul
+
+
+def _wanted_values(filter: Dict[str, Any]) -> Dict[str, set]:
+    """Normalise ``{field: value | [values]}`` to ``{field: {values}}``."""
+    return {
+        k: set(v) if isinstance(v, (list, tuple, set, frozenset)) else {v}
+        for k, v in filter.items()
+    }
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class EmbeddingStore:
+    """Memory-mapped vector collection with IVF approximate search."""
+
+    VECTORS_FILE = "vectors.f32"
+    ROWS_FILE = "rows.jsonl"
+    INDEX_FILE = "ivf.npz"
+    META_FILE = "store.json"
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        dim: Optional[int] = None,
+        normalize: bool = True,
+        nprobe: int = 16,
+        min_index_size: int = 10_000,
+    ):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.nprobe = nprobe
+        self.min_index_size = min_index_size
+        self._lock = threading.RLock()
+
+        meta_path = self.path / self.META_FILE
+        saved = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else {}
+        self.dim: int = saved.get("dim") or dim  # type: ignore[assignment]
+        if not self.dim:
+            raise ValueError(f"dim is required to create a new embedding store at {self.path}")
+        if dim and dim != self.dim:
+            raise ValueError(f"Store at {self.path} has dim {self.dim}, not {dim}")
+        self.normalize: bool = saved.get("normalize", normalize)
+
+        self._rows = 0
+        self._capacity = 0
+        self._vectors: Optional[np.memmap] = None
+        self._live = np.zeros(0, dtype=bool)
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._ids: List[Optional[str]] = []
+        self._meta: List[Optional[Dict[str, Any]]] = []
+        self._row_of: Dict[str, int] = {}
+
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[np.ndarray] = []
+        self._pending: List[List[int]] = []
+        self._indexed_rows = 0
+        # metadata field → (value → code, per-row code array); built on first
+        # dict filter over that field so equality filters are vectorised
+        self._columns: Dict[str, Tuple[Dict[Any, int], np.ndarray]] = {}
+
+        self._replay_rows()
+        self._open_vectors()
+        self._load_index()
+        self._log = open(self.path / self.ROWS_FILE, "a", encoding="utf-8")
+
+    # ── Loading ──────────────────────────────────────────────────────────
+
+    def _replay_rows(self) -> None:
+        rows_path = self.path / self.ROWS_FILE
+        if not rows_path.exists():
+            return
+        with open(rows_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # torn final line from a crash; later rows never landed
+                if "del" in rec:
+                    row = rec["del"]
+                    if row < len(self._ids) and self._ids[row] is not None:
+                        self._row_of.pop(self._ids[row], None)
+                        self._ids[row] = None
+                        self._meta[row] = None
+                    continue
+                row = len(self._ids)
+                self._ids.append(rec["id"])
+                self._meta.append(rec.get("meta"))
+                self._row_of[rec["id"]] = row
+        self._rows = len(self._ids)
+
+    def _open_vectors(self) -> None:
+        vec_path = self.path / self.VECTORS_FILE
+        row_bytes = self.dim * 4
+        size = vec_path.stat().st_size if vec_path.exists() else 0
+        if size // row_bytes < self._rows:
+            logger.warning("Embedding store %s: vector file shorter than row log — truncating", self.path)
+            del self._ids[size // row_bytes:]
+            del self._meta[size // row_bytes:]
+            self._row_of = {i: r for r, i in enumerate(self._ids) if i is not None}
+            self._rows = len(self._ids)
+        self._grow(max(self._rows, 1))
+        self._live[: self._rows] = [i is not None for i in self._ids]
+
+    def _grow(self, needed: int) -> None:
+        if needed <= self._capacity and self._vectors is not None:
+            return
+        new_cap = max(needed, self._capacity * 2, 1024)
+        vec_path = self.path / self.VECTORS_FILE
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        with open(vec_path, "ab") as f:
+            if f.tell() < new_cap * self.dim * 4:
+                f.truncate(new_cap * self.dim * 4)
+        self._vectors = np.memmap(vec_path, dtype=np.float32, mode="r+", shape=(new_cap, self.dim))
+        self._live = np.concatenate([self._live, np.zeros(new_cap - len(self._live), dtype=bool)])
+        self._assign = np.concatenate([self._assign, np.full(new_cap - len(self._assign), -1, dtype=np.int32)])
+        for field, (codes, arr) in self._columns.items():
+            self._columns[field] = (codes, np.concatenate([arr, np.full(new_cap - len(arr), -1, dtype=np.int32)]))
+        self._capacity = new_cap
+
+    def _load_index(self) -> None:
+        idx_path = self.path / self.INDEX_FILE
+        if not idx_path.exists():
+            return
+        with np.load(idx_path) as data:
+            centroids = data["centroids"]
+            assign = data["assign"]
+        n = min(len(assign), self._rows)
+        self._assign[:n] = assign[:n]
+        self._set_centroids(centroids)
+        # Rows appended after the last flush: assign them now
+        for start in range(n, self._rows, _SCAN_CHUNK):
+            stop = min(start + _SCAN_CHUNK, self._rows)
+            self._assign[start:stop] = self._nearest_list(self._vectors[start:stop])
+        self._rebuild_lists()
+
+    # ── Writes ───────────────────────────────────────────────────────────
+
+    def _prepare(self, vectors) -> np.ndarray:
+        vecs = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if self.normalize:
+            norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+            vecs = vecs / np.where(norms == 0, 1.0, norms)
+        return vecs
+
+    def add(
+        self,
+        ids: Sequence[str],
+        vectors,
+        metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> int:
+        """Insert (or replace) vectors by id.  Returns the number written."""
+        vecs = self._prepare(vectors)
+        if len(ids) != len(vecs):
+            raise ValueError(f"{len(ids)} ids for {len(vecs)} vectors")
+        if metadata is not None and len(metadata) != len(ids):
+            raise ValueError(f"{len(metadata)} metadata entries for {len(ids)} ids")
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate ids in one add() call")
+
+        with self._lock:
+            self._delete_rows([self._row_of[i] for i in ids if i in self._row_of])
+            start, n = self._rows, len(ids)
+            self._grow(start + n)
+            self._vectors[start:start + n] = vecs
+            self._live[start:start + n] = True
+
+            lines = []
+            for off, pid in enumerate(ids):
+                meta = metadata[off] if metadata is not None else None
+                self._ids.append(pid)
+                self._meta.append(meta)
+                self._row_of[pid] = start + off
+                rec = {"id": pid, "meta": meta} if meta else {"id": pid}
+                lines.append(json.dumps(rec, ensure_ascii=False))
+            self._log.write("\n".join(lines) + "\n")
+            for field in self._columns:
+                self._encode(field, start, start + n)
+            self._rows += n
+
+            if self._centroids is not None:
+                lists = self._nearest_list(vecs)
+                self._assign[start:start + n] = lists
+                for off, lst in enumerate(lists):
+                    self._pending[lst].append(start + off)
+                if self._rows > 4 * max(self._indexed_rows, 1):
+                    self.build_index()
+            elif len(self._row_of) >= self.min_index_size:
+                self.build_index()
+        return n
+
+    def delete(self, ids: Sequence[str]) -> int:
+        """Remove vectors by id.  Returns how many existed."""
+        with self._lock:
+            rows = [self._row_of[i] for i in ids if i in self._row_of]
+            self._delete_rows(rows)
+            return len(rows)
+
+    def _delete_rows(self, rows: List[int]) -> None:
+        if not rows:
+            return
+        for row in rows:
+            self._row_of.pop(self._ids[row], None)
+            self._ids[row] = None
+            self._meta[row] = None
+        self._live[rows] = False
+        self._log.write("".join(json.dumps({"del": row}) + "\n" for row in rows))
+
+    # ── Index ────────────────────────────────────────────────────────────
+
+    def _set_centroids(self, centroids: np.ndarray) -> None:
+        self._centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+
+    def _nearest_list(self, vecs: np.ndarray) -> np.ndarray:
+        return np.argmax(np.asarray(vecs, dtype=np.float32) @ self._centroids.T, axis=1).astype(np.int32)
+
+    def _rebuild_lists(self) -> None:
+        assign = self._assign[: self._rows]
+        n_lists = len(self._centroids)
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign[assign >= 0], minlength=n_lists)
+        skip = int(np.count_nonzero(assign < 0))
+        bounds = np.concatenate([[0], np.cumsum(counts)]) + skip
+        self._lists = [order[bounds[i]:bounds[i + 1]] for i in range(n_lists)]
+        self._pending = [[] for _ in range(n_lists)]
+        self._indexed_rows = self._rows
+
+    def build_index(self, n_lists: Optional[int] = None, iterations: int = 10, seed: int = 0) -> None:
+        """(Re)train IVF centroids with spherical k-means and reassign every row."""
+        with self._lock:
+            live = np.flatnonzero(self._live[: self._rows])
+            if len(live) == 0:
+                return
+            n_lists = n_lists or int(min(4096, max(16, math.sqrt(len(live)))))
+            n_lists = min(n_lists, len(live))
+            rng = np.random.default_rng(seed)
+            sample_rows = np.sort(rng.choice(live, size=min(len(live), max(40 * n_lists, 10_000)), replace=False))
+            sample = np.asarray(self._vectors[sample_rows])
+            centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+
+            for _ in range(iterations):
+                labels = np.empty(len(sample), dtype=np.int64)
+                for s in range(0, len(sample), _SCAN_CHUNK):
+                    labels[s:s + _SCAN_CHUNK] = np.argmax(sample[s:s + _SCAN_CHUNK] @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, labels, sample)
+                counts = np.bincount(labels, minlength=n_lists)
+                empty = counts == 0
+                if empty.any():
+                    sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()), replace=False)]
+                norms = np.linalg.norm(sums, axis=1, keepdims=True)
+                centroids = sums / np.where(norms == 0, 1.0, norms)
+
+            self._set_centroids(centroids)
+            for start in range(0, self._rows, _SCAN_CHUNK):
+                stop = min(start + _SCAN_CHUNK, self._rows)
+                self._assign[start:stop] = self._nearest_list(self._vectors[start:stop])
+            self._rebuild_lists()
+            logger.info("Embedding store %s: IVF index built (%d lists, %d rows)", self.path.name, n_lists, len(live))
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, pid: str) -> bool:
+        return pid in self._row_of
+
+    @property
+    def dead_rows(self) -> int:
+        """Deleted rows still occupying space until compact()."""
+        return self._rows - len(self._row_of)
+
+    def get(self, pid: str) -> Optional[np.ndarray]:
+        row = self._row_of.get(pid)
+        return None if row is None else np.array(self._vectors[row])
+
+    def metadata(self, pid: str) -> Optional[Dict[str, Any]]:
+        row = self._row_of.get(pid)
+        return None if row is None else (self._meta[row] or {})
+
+    def ids(self) -> List[str]:
+        return [i for i in self._ids if i is not None]
+
+    def _candidates(self, q: np.ndarray, probe: int) -> np.ndarray:
+        order = np.argsort(-(self._centroids @ q))[:probe]
+        parts = [self._lists[l] for l in order]
+        parts += [np.asarray(self._pending[l], dtype=np.int64) for l in order if self._pending[l]]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def _score(self, q: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        scores = np.empty(len(rows), dtype=np.float32)
+        for s in range(0, len(rows), _SCAN_CHUNK):
+            scores[s:s + _SCAN_CHUNK] = self._vectors[rows[s:s + _SCAN_CHUNK]] @ q
+        return scores
+
+    def search(
+        self,
+        query,
+        k: int = 10,
+        filter: Filter = None,
+        nprobe: Optional[int] = None,
+        exact: bool = False,
+    ) -> List[SearchHit]:
+        """Top-k most similar ``(id, score, metadata)``, best first.
+
+        ``filter`` is a predicate over a row's metadata dict, or a
+        ``{field: value | [values]}`` dict of required values.
+        """
+        q = self._prepare(query)[0]
+        if filter is not None and not callable(filter):
+            filter = _wanted_values(filter)
+        with self._lock:
+            if self._centroids is None or exact:
+                rows = np.arange(self._rows)
+                rows = self._admit(rows, filter)
+            else:
+                n_lists = len(self._centroids)
+                probe = min(nprobe or self.nprobe, n_lists)
+                while True:
+                    rows = self._admit(self._candidates(q, probe), filter)
+                    if len(rows) >= k or probe >= n_lists:
+                        break
+                    probe = min(probe * 4, n_lists)  # filter too selective — widen
+            if len(rows) == 0:
+                return []
+            rows = np.sort(rows)  # sequential page access on the memmap
+            scores = self._score(q, rows)
+            top = np.argpartition(-scores, k - 1)[:k] if len(rows) > k else np.arange(len(rows))
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [
+                (self._ids[rows[i]], float(scores[i]), self._meta[rows[i]] or {})
+                for i in top
+            ]
+
+    def _admit(self, rows: np.ndarray, filter: Filter) -> np.ndarray:
+        rows = rows[self._live[rows]]
+        if filter is None or not len(rows):
+            return rows
+        if callable(filter):
+            keep = np.fromiter((filter(self._meta[r] or {}) for r in rows), dtype=bool, count=len(rows))
+            return rows[keep]
+        for field, values in filter.items():
+            codes, arr = self._column(field)
+            wanted = [codes[v] for v in values if _hashable(v) and v in codes]
+            if None in values:
+                wanted.append(-1)  # field missing
+            rows = rows[np.isin(arr[rows], wanted)]
+        return rows
+
+    def _column(self, field: str) -> Tuple[Dict[Any, int], np.ndarray]:
+        if field not in self._columns:
+            self._columns[field] = ({}, np.full(self._capacity, -1, dtype=np.int32))
+            self._encode(field, 0, self._rows)
+        return self._columns[field]
+
+    def _encode(self, field: str, start: int, stop: int) -> None:
+        codes, arr = self._columns[field]
+        for r in range(start, stop):
+            meta = self._meta[r]
+            if meta:
+                v = meta.get(field)
+                if v is not None and _hashable(v):
+                    arr[r] = codes.setdefault(v, len(codes))
+
+    # ── Persistence ──────────────────────────────────────────────────────
+
+    def flush(self) -> None:
+        """Persist vectors, the row log, the index and the header."""
+        with self._lock:
+            self._vectors.flush()
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            if self._centroids is not None:
+                tmp = self.path / ("tmp_" + self.INDEX_FILE)
+                with open(tmp, "wb") as f:
+                    np.savez(f, centroids=self._centroids, assign=self._assign[: self._rows])
+                os.replace(tmp, self.path / self.INDEX_FILE)
+            header = {"dim": self.dim, "normalize": self.normalize, "rows": self._rows, "live": len(self._row_of)}
+            tmp = self.path / ("tmp_" + self.META_FILE)
+            tmp.write_text(json.dumps(header), encoding="utf-8")
+            os.replace(tmp, self.path / self.META_FILE)
+
+    def compact(self) -> int:
+        """Rewrite the store without deleted rows.  Returns rows reclaimed."""
+        with self._lock:
+            live = np.flatnonzero(self._live[: self._rows])
+            reclaimed = self._rows - len(live)
+            if reclaimed == 0:
+                return 0
+            vec_tmp = self.path / ("tmp_" + self.VECTORS_FILE)
+            out = np.memmap(vec_tmp, dtype=np.float32, mode="w+", shape=(max(len(live), 1), self.dim))
+            for s in range(0, len(live), _SCAN_CHUNK):
+                out[s:s + _SCAN_CHUNK] = self._vectors[live[s:s + _SCAN_CHUNK]]
+            out.flush()
+            del out
+
+            rows_tmp = self.path / ("tmp_" + self.ROWS_FILE)
+            with open(rows_tmp, "w", encoding="utf-8") as f:
+                for r in live:
+                    meta = self._meta[r]
+                    f.write(json.dumps({"id": self._ids[r], "meta": meta} if meta else {"id": self._ids[r]}, ensure_ascii=False) + "\n")
+
+            assign = self._assign[live].copy()
+            self._log.close()
+            self._vectors.flush()
+            self._vectors = None
+            os.replace(vec_tmp, self.path / self.VECTORS_FILE)
+            os.replace(rows_tmp, self.path / self.ROWS_FILE)
+
+            self._ids = [self._ids[r] for r in live]
+            self._meta = [self._meta[r] for r in live]
+            self._row_of = {pid: r for r, pid in enumerate(self._ids)}
+            self._rows = len(live)
+            self._capacity = 0
+            self._columns = {}
+            self._live = np.zeros(0, dtype=bool)
+            self._assign = np.zeros(0, dtype=np.int32)
+            self._grow(max(self._rows, 1))
+            self._live[: self._rows] = True
+            if self._centroids is not None:
+                self._assign[: self._rows] = assign
+                self._rebuild_lists()
+            self._log = open(self.path / self.ROWS_FILE, "a", encoding="utf-8")
+            self.flush()
+            return reclaimed
+
+    def close(self) -> None:
+        with self._lock:
+            if self._log.closed:
+                return
+            self.flush()
+            self._log.close()
+            self._vectors = None
@@ -0,0 +1,67 @@
+"""
+CareerTrojan — Cross-Process File Lock
+=======================================
+Advisory exclusive lock on a lock file, shared by every uvicorn worker and
+script that mutates the same on-disk artifact.  ``fcntl.flock`` on POSIX,
+``msvcrt.locking`` on Windows.
+
+Usage:
+    from services.shared.file_lock import file_lock
+
+    with file_lock(index_dir / ".lock"):
+        ...  # read-modify-write the artifact
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _try_lock(fh) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fh) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    else:
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = 60.0, poll: float = 0.01) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` (created if missing); TimeoutError after ``timeout`` s."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    with open(path, "a+b") as fh:
+        while not _try_lock(fh):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Could not lock {path} within {timeout:.0f}s (pid {os.getpid()})")
+            time.sleep(poll)
+        try:
+            yield
+        finally:
+            _unlock(fh)
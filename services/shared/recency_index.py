@@ -0,0 +1,324 @@
+"""
+CareerTrojan — Recency & Count Index for ai_data_final
+=======================================================
+Keeps a live file count and a top-k-by-mtime list for each ai_data_final
+subdirectory, so dashboard endpoints ("recent resumes", "recent jobs",
+statistics, system health) are O(k) instead of glob + stat over every file.
+
+Fed by:
+    - writers calling ``record_write`` / ``record_delete`` directly, and
+    - a filesystem watcher (``watchdog`` when installed, otherwise a
+      polling thread that rescans a directory only when its mtime changes).
+
+Without a running watcher, ``refresh()`` is called on read and costs one
+stat per tracked directory when nothing has changed.  Rewriting a file in
+place leaves its directory's mtime alone, so a full rescan that re-stats
+every tracked file runs on each poll of the polling thread, and at most
+every FULL_RESCAN_INTERVAL seconds on read.
+
+Usage:
+    from services.shared.recency_index import get_recency_index
+
+    idx = get_recency_index()
+    idx.count("parsed_resumes")
+    idx.recent("parsed_job_descriptions", limit=10)   # [(name, mtime), ...]
+
+``recent()`` is served from the retained top-k; a larger ``limit`` ranks
+every tracked file in memory instead.
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("careertrojan.recency_index")
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    _HAS_WATCHDOG = True
+except ImportError:  # pragma: no cover - optional dependency
+    FileSystemEventHandler = object  # type: ignore
+    Observer = None  # type: ignore
+    _HAS_WATCHDOG = False
+
+
+class DirectoryRecency:
+    """Count + top-k-by-mtime for one directory of ``*<suffix>`` files."""
+
+    def __init__(self, path: Path, suffix: str = ".json", top_k: int = 200):
+        self.path = Path(path)
+        self.suffix = suffix
+        self.top_k = top_k
+        self.dir_mtime_ns: Optional[int] = None
+        self._mtimes: Dict[str, float] = {}
+        # Ascending by (mtime, name); the newest entries sit at the end
+        self._top: List[Tuple[float, str]] = []
+
+    @property
+    def exists(self) -> bool:
+        return self.dir_mtime_ns is not None
+
+    @property
+    def count(self) -> int:
+        return len(self._mtimes)
+
+    def upsert(self, name: str, mtime: float) -> None:
+        old = self._mtimes.get(name)
+        if old is not None:
+            if old == mtime:
+                return
+            self._drop_from_top(name, old)
+        self._mtimes[name] = mtime
+        if len(self._top) < self.top_k or (mtime, name) > self._top[0]:
+            bisect.insort(self._top, (mtime, name))
+            if len(self._top) > self.top_k:
+                self._top.pop(0)
+
+    def remove(self, name: str) -> None:
+        old = self._mtimes.pop(name, None)
+        if old is not None and self._drop_from_top(name, old):
+            self._refill_top()
+
+    def _drop_from_top(self, name: str, mtime: float) -> bool:
+        i = bisect.bisect_left(self._top, (mtime, name))
+        if i < len(self._top) and self._top[i] == (mtime, name):
+            self._top.pop(i)
+            return True
+        return False
+
+    def _refill_top(self) -> None:
+        # Rare: only when a file inside the retained top-k is deleted
+        if len(self._top) < min(self.top_k, len(self._mtimes)):
+            newest = heapq.nlargest(self.top_k, ((m, n) for n, m in self._mtimes.items()))
+            self._top = sorted(newest)
+
+    def recent(self, limit: int) -> List[Tuple[str, float]]:
+        if limit <= 0:
+            return []
+        if limit > len(self._top) and len(self._mtimes) > len(self._top):
+            # More than the retained top-k: rank every tracked file (no disk access)
+            return [(n, m) for m, n in heapq.nlargest(limit, ((m, n) for n, m in self._mtimes.items()))]
+        return [(n, m) for m, n in reversed(self._top[-limit:])]
+
+    def rescan(self, full: bool = False) -> bool:
+        """
+        Reconcile with disk if the directory mtime changed, or always when
+        ``full`` (which also re-stats files already tracked, catching in-place
+        rewrites). Returns True if scanned.
+        """
+        try:
+            dir_mtime = self.path.stat().st_mtime_ns
+        except OSError:
+            self.dir_mtime_ns = None
+            self._mtimes.clear()
+            self._top.clear()
+            return False
+        if dir_mtime == self.dir_mtime_ns and not full:
+            return False
+
+        present = set()
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if not entry.name.endswith(self.suffix):
+                    continue
+                present.add(entry.name)
+                if full or entry.name not in self._mtimes:
+                    try:
+                        self.upsert(entry.name, entry.stat().st_mtime)
+                    except OSError:
+                        present.discard(entry.name)
+        for name in [n for n in self._mtimes if n not in present]:
+            self.remove(name)
+        self.dir_mtime_ns = dir_mtime
+        return True
+
+
+class _WatchHandler(FileSystemEventHandler):  # type: ignore[misc]
+    def __init__(self, index: "RecencyIndex"):
+        self.index = index
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.index.record_write(event.src_path)
+
+    on_modified = on_created
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.index.record_delete(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.index.record_delete(event.src_path)
+            self.index.record_write(event.dest_path)
+
+
+class RecencyIndex:
+    """Per-directory recency/count index rooted at an ai_data_final path."""
+
+    # Seconds between full rescans when refreshing on read (no watcher)
+    FULL_RESCAN_INTERVAL = 30.0
+
+    DEFAULT_DIRECTORIES = (
+        "parsed_resumes",
+        "parsed_job_descriptions",
+        "companies",
+        "job_titles",
+        "locations",
+        "metadata",
+        "normalized",
+        "email_extracted",
+    )
+
+    def __init__(self, root: Path, directories: Iterable[str] = DEFAULT_DIRECTORIES, top_k: int = 200):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._dirs: Dict[str, DirectoryRecency] = {
+            name: DirectoryRecency(self.root / name, top_k=top_k) for name in directories
+        }
+        self._running = False
+        self._observer = None
+        self._thread: Optional[threading.Thread] = None
+        self._full_scan_at = float("-inf")
+
+    # ── Feeding ──────────────────────────────────────────────────────────
+
+    def _locate(self, path) -> Optional[Tuple[DirectoryRecency, str]]:
+        p = Path(path)
+        d = self._dirs.get(p.parent.name)
+        if d is None or p.parent != d.path or not p.name.endswith(d.suffix):
+            return None
+        return d, p.name
+
+    def record_write(self, path, mtime: Optional[float] = None) -> None:
+        """Register a file created/updated under a tracked directory."""
+        hit = self._locate(path)
+        if hit is None:
+            return
+        if mtime is None:
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                return
+        with self._lock:
+            hit[0].upsert(hit[1], mtime)
+
+    def record_delete(self, path) -> None:
+        """Register a file removed from a tracked directory."""
+        hit = self._locate(path)
+        if hit is not None:
+            with self._lock:
+                hit[0].remove(hit[1])
+
+    def refresh(self, full: bool = False) -> int:
+        """Rescan directories whose mtime changed (every directory if ``full``). Returns number rescanned."""
+        scanned = 0
+        with self._lock:
+            if full:
+                self._full_scan_at = time.monotonic()
+            for d in self._dirs.values():
+                scanned += d.rescan(full)
+        return scanned
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def _ensure_current(self) -> None:
+        if not self._running:
+            self.refresh(full=time.monotonic() - self._full_scan_at >= self.FULL_RESCAN_INTERVAL)
+
+    def exists(self, directory: str) -> bool:
+        self._ensure_current()
+        d = self._dirs.get(directory)
+        return bool(d and d.exists)
+
+    def count(self, directory: str) -> int:
+        self._ensure_current()
+        d = self._dirs.get(directory)
+        return d.count if d else 0
+
+    def counts(self) -> Dict[str, int]:
+        self._ensure_current()
+        with self._lock:
+            return {name: d.count for name, d in self._dirs.items()}
+
+    def recent(self, directory: str, limit: int = 10) -> List[Tuple[Path, float]]:
+        """Newest files first as (path, mtime)."""
+        self._ensure_current()
+        d = self._dirs.get(directory)
+        if d is None:
+            return []
+        with self._lock:
+            return [(d.path / name, mtime) for name, mtime in d.recent(limit)]
+
+    # ── Watcher ──────────────────────────────────────────────────────────
+
+    def _poll_loop(self, interval: float) -> None:
+        while self._running:
+            try:
+                self.refresh(full=True)
+            except Exception as e:
+                logger.warning("Recency index refresh failed: %s", e)
+            time.sleep(interval)
+
+    def start(self, poll_interval: float = 5.0) -> None:
+        """Build the index, then keep it current from filesystem events."""
+        if self._running:
+            return
+        self.refresh()
+        self._running = True
+        if _HAS_WATCHDOG:
+            try:
+                self._observer = Observer()
+                handler = _WatchHandler(self)
+                for d in self._dirs.values():
+                    if d.exists:
+                        self._observer.schedule(handler, str(d.path), recursive=False)
+                self._observer.start()
+            except Exception as e:
+                logger.warning("watchdog unavailable (%s) — falling back to polling", e)
+                self._observer = None
+        # Polling also covers directories created after start-up and
+        # reconciles anything the event stream missed.
+        interval = poll_interval if self._observer is None else max(poll_interval, 60.0)
+        self._thread = threading.Thread(target=self._poll_loop, args=(interval,), daemon=True, name="recency-index")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
+
+
+# ============================================================================
+# MODULE SINGLETON
+# ============================================================================
+
+_index: Optional[RecencyIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_recency_index(root: Optional[Path] = None) -> RecencyIndex:
+    """Get the process-wide RecencyIndex (rooted at ai_data_final by default)."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            if root is None:
+                data_root = Path(os.environ.get("CAREERTROJAN_DATA_ROOT", r"L:\antigravity_version_ai_data_final"))
+                root = data_root / "ai_data_final"
+            _index = RecencyIndex(root)
+        return _index
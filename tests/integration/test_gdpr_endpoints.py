@@ -2,6 +2,8 @@
 Integration tests for GDPR endpoints and admin AI-loop endpoints.
 Tests hit real HTTP endpoints via the test client.
 """
+import asyncio
+
 import pytest
 from starlette.testclient import TestClient
 
@@ -99,6 +101,25 @@ class TestGDPRExport:
         assert "interactions" in data
         assert data["user"]["email"] == "gdpr-test@careertrojan.com"
 
+    def test_background_export_job(self, monkeypatch, tmp_path):
+        from services.backend_api.routers import gdpr
+        monkeypatch.setattr(gdpr, "EXPORT_DIR", tmp_path / "exports")
+        headers = _get_auth_headers()
+
+        r = client.post("/api/gdpr/v1/export/jobs", headers=headers)
+        assert r.status_code == 202
+        job_id = r.json()["id"]
+
+        # TestClient runs background tasks before returning
+        job = client.get(f"/api/gdpr/v1/export/jobs/{job_id}", headers=headers).json()
+        assert job["status"] == "completed"
+        r = client.get(job["download_url"], headers=headers)
+        assert r.status_code == 200
+        assert r.json()["user"]["email"] == "gdpr-test@careertrojan.com"
+
+        other = client.get(f"/api/gdpr/v1/export/jobs/{job_id}", headers=_get_admin_headers())
+        assert other.status_code in (401, 404)
+
 
 # ── GDPR Audit Log Tests ─────────────────────────────────────
 
@@ -135,10 +156,23 @@ class TestGDPRDeletion:
         msg = body.get("error", {}).get("message", "") or body.get("detail", "")
         assert "confirm=yes" in msg
 
-    def test_delete_account_full_erasure(self):
+    def test_delete_account_full_erasure(self, monkeypatch, tmp_path):
         """Create a fresh user, then delete them — verify all data is gone."""
         from services.backend_api.db.connection import SessionLocal
         from services.backend_api.db.models import User, ConsentRecord, AuditLog
+        from services.backend_api.services import interaction_partitions
+        from services.backend_api.services.career import cluster_index, user_vector_service
+        partitions = interaction_partitions.InteractionPartitions(tmp_path / "by_user", tmp_path / "interactions")
+        monkeypatch.setattr(interaction_partitions, "_partitions", partitions)
+        vectors = user_vector_service.UserVectorStore(tmp_path / "user_vectors")
+        monkeypatch.setattr(user_vector_service, "_store", vectors)
+        import numpy as np
+        peers = cluster_index.ClusterIndex.fit(
+            [f"peer{i}" for i in range(20)], np.random.default_rng(0).random((20, 10)), n_clusters=2)
+        peers.save(tmp_path / "clusters")
+        peers = cluster_index.ClusterIndex.load(tmp_path / "clusters")
+        monkeypatch.setattr(cluster_index, "_index", peers)
+        monkeypatch.setattr(cluster_index, "_index_loaded", True)
         db = SessionLocal()
 
         # Create the delete-test user
@@ -151,6 +185,18 @@ class TestGDPRDeletion:
         headers = _get_auth_headers(doomed_email)
         client.post("/api/gdpr/v1/consent?consent_type=terms&granted=true", headers=headers)
 
+        # A file-logged interaction keyed by the JWT subject
+        day_file = tmp_path / "interactions" / "2026-10-01" / "120000_delete-me_browse_click.json"
+        day_file.parent.mkdir(parents=True)
+        day_file.write_text("{}", encoding="utf-8")
+        partitions.append({"user_id": doomed_email, "path": "/api/x"}, day_file=day_file)
+
+        # Persisted skill vectors, plus another user's that must survive
+        signals = {axis: 0.5 for axis in user_vector_service.CORE_AXES}
+        for owner in (str(doomed_user.id), "someone-else"):
+            asyncio.run(user_vector_service.UserVectorService().update_vector(owner, "r1", signals))
+        assert peers.cluster_of(str(doomed_user.id)) is not None
+
         # Now delete
         r = client.delete(f"/api/gdpr/v1/delete-account?confirm=yes", headers=headers)
         assert r.status_code == 200
@@ -168,6 +214,22 @@ class TestGDPRDeletion:
         consents = db.query(ConsentRecord).filter(ConsentRecord.user_id == doomed_user.id).all()
         assert len(consents) == 0
 
+        # Verify file-logged interactions were erased via the user's partition
+        assert list(partitions.iter_records(doomed_user.id, doomed_email)) == []
+        assert not day_file.exists()
+
+        # Verify skill vectors are gone from lookup and search
+        assert vectors.get(str(doomed_user.id), "r1") is None
+        assert [hit["user_id"] for hit, _ in vectors.top_k(signals, k=10)] == ["someone-else"]
+        assert len(vectors) == 1
+
+        # ...and from the Career Compass cluster index, on disk too
+        assert peers.cluster_of(str(doomed_user.id)) is None
+        artifact = cluster_index.ClusterIndex.artifact_dir(tmp_path / "clusters")
+        members = np.load(artifact / "member_ids.npy").tolist()
+        assert str(doomed_user.id) not in members and "someone-else" in members
+        assert not (tmp_path / "clusters" / "delta.jsonl").exists()  # folded into the new artifact
+
         # Verify audit log still has the deletion entry (legal requirement)
         audit = db.query(AuditLog).filter(
             AuditLog.user_id == doomed_user.id,
@@ -0,0 +1,307 @@
+"""
+Career Compass Cluster Index Tests — CareerTrojan
+==================================================
+
+Tests cover:
+  1. k-means fit recovers planted clusters; assignment matches brute force
+  2. Save/load round-trip memory-maps the member arrays
+  3. Within-cluster kNN against an exact reference
+  4. Incremental assignment: delta log replay, moved members, save() folding
+  5. save() writes a new version directory instead of replacing mapped files
+  6. remove_member erases the vector from the artifact and the delta log
+  7. Sub-millisecond assignment at 100K members
+  8. Two instances on one directory (one per worker): neither's save undoes
+     the other's erasure or drops its additions, and queries see both
+  9. Engine wiring: registry from the index, assign_user, opted-in mentors only;
+     user-vector updates re-assign and erasure removes cluster membership
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import asyncio
+import shutil
+import time
+
+import numpy as np
+import pytest
+
+from services.backend_api.models.career_compass_schemas import CareerMentorMatchRequest
+from services.backend_api.services.career import career_compass_engine, cluster_index, user_vector_service
+from services.backend_api.services.career.career_compass_engine import CareerCompassEngine
+from services.backend_api.services.career.cluster_index import ClusterIndex
+from services.backend_api.services.career.user_vector_service import CORE_AXES, UserVectorStore
+
+
+def _planted(n, n_clusters=8, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.random((n_clusters, len(CORE_AXES))).astype(np.float32)
+    labels = rng.integers(0, n_clusters, n)
+    vecs = np.clip(centers[labels] + 0.03 * rng.normal(size=(n, len(CORE_AXES))), 0, 1).astype(np.float32)
+    return [f"m{i}" for i in range(n)], vecs, labels
+
+
+@pytest.fixture
+def fitted():
+    ids, vecs, labels = _planted(4000)
+    meta = [{"cluster_id": f"c{i}", "label": f"Route {i}"} for i in range(8)]
+    return ClusterIndex.fit(ids, vecs, n_clusters=8, clusters=meta), ids, vecs, labels
+
+
+class TestFitAndAssign:
+
+    def test_fit_recovers_planted_clusters(self, fitted):
+        index, ids, vecs, labels = fitted
+        assigned = index.assign_many(vecs)
+        # Each planted group lands in exactly one fitted cluster
+        for planted in range(8):
+            assert len({assigned[i] for i in np.flatnonzero(labels == planted)}) == 1
+        assert sum(c["size"] for c in index.clusters) == 4000
+
+    def test_assign_matches_brute_force(self, fitted):
+        index, _, vecs, _ = fitted
+        q = np.random.default_rng(3).random(len(CORE_AXES)).astype(np.float32)
+        expected = index.cluster_ids[int(np.argmin(((index.centroids - q) ** 2).sum(axis=1)))]
+        cluster_id, distance = index.assign(dict(zip(CORE_AXES, q.tolist())))
+        assert cluster_id == expected
+        assert distance == pytest.approx(float(np.linalg.norm(index.centroids[index.cluster_ids.index(expected)] - q)), rel=1e-5)
+
+
+class TestPersistence:
+
+    def test_round_trip_is_memory_mapped(self, fitted, tmp_path):
+        index, _, vecs, _ = fitted
+        index.save(tmp_path / "idx")
+        loaded = ClusterIndex.load(tmp_path / "idx")
+        assert isinstance(loaded._members, np.memmap)
+        assert loaded.cluster_ids == index.cluster_ids
+        assert loaded.clusters[2]["label"] == "Route 2"
+        assert loaded.assign_many(vecs[:50]) == index.assign_many(vecs[:50])
+
+    def test_nearest_members_matches_exact(self, fitted, tmp_path):
+        index, ids, vecs, _ = fitted
+        index.save(tmp_path / "idx")
+        loaded = ClusterIndex.load(tmp_path / "idx")
+        cluster_id, _ = loaded.assign(vecs[11])
+        members = [i for i, c in enumerate(loaded.assign_many(vecs)) if c == cluster_id]
+        dist = ((vecs[members] - vecs[11]) ** 2).sum(axis=1)
+        expected = [ids[members[i]] for i in np.argsort(dist)[:6] if ids[members[i]] != "m11"][:5]
+
+        hits = loaded.nearest_members(vecs[11], cluster_id, k=5, exclude=["m11"])
+        assert [h[0] for h in hits] == expected
+
+
+class TestIncremental:
+
+    def test_add_member_survives_reload_and_save(self, fitted, tmp_path):
+        index, ids, vecs, _ = fitted
+        index.save(tmp_path / "idx")
+        live = ClusterIndex.load(tmp_path / "idx")
+
+        target = live.assign(vecs[0])[0]
+        other = next(c for c in live.cluster_ids if c != live.assign(vecs[1])[0])
+        other_vec = live.centroids[live.cluster_ids.index(other)]
+        assert live.add_member("new-user", vecs[0]) == (target, pytest.approx(live.assign(vecs[0])[1]))
+        live.add_member("m1", other_vec)  # existing member moves cluster
+
+        reopened = ClusterIndex.load(tmp_path / "idx")
+        assert reopened.cluster_of("new-user") == target
+        assert reopened.nearest_members(vecs[0], target, k=1)[0][0] in {"new-user", "m0"}
+        assert "m1" in [h[0] for h in reopened.nearest_members(other_vec, other, k=3)]
+        old = reopened.assign(vecs[1])[0]
+        assert "m1" not in [h[0] for h in reopened.nearest_members(vecs[1], old, k=50)]
+
+        reopened.save()
+        assert not (tmp_path / "idx" / ClusterIndex.DELTA_FILE).exists()
+        folded = ClusterIndex.load(tmp_path / "idx")
+        assert sum(folded.size(c) for c in folded.cluster_ids) == 4001
+        assert "m1" in [h[0] for h in folded.nearest_members(other_vec, other, k=3)]
+
+    def test_save_never_replaces_mapped_files(self, fitted, tmp_path):
+        index, _, vecs, _ = fitted
+        index.save(tmp_path / "idx")
+        live = ClusterIndex.load(tmp_path / "idx")
+        first = ClusterIndex.artifact_dir(tmp_path / "idx")
+        mapped = (first / ClusterIndex.MEMBERS_FILE).stat().st_ino
+
+        live.add_member("new-user", vecs[0])
+        live.save()
+        second = ClusterIndex.artifact_dir(tmp_path / "idx")
+        assert second != first and not first.exists()
+        assert (second / ClusterIndex.MEMBERS_FILE).stat().st_ino != mapped
+        assert [p.name for p in (tmp_path / "idx").iterdir() if p.is_dir()] == [second.name]
+        assert ClusterIndex.load(tmp_path / "idx").size(live.assign(vecs[0])[0]) == live.size(live.assign(vecs[0])[0])
+
+    def test_flat_layout_still_loads(self, fitted, tmp_path):
+        index, _, vecs, _ = fitted
+        index.save(tmp_path / "idx")
+        flat = tmp_path / "flat"
+        shutil.copytree(ClusterIndex.artifact_dir(tmp_path / "idx"), flat)
+        assert ClusterIndex.exists(flat)
+        assert ClusterIndex.load(flat).assign_many(vecs[:20]) == index.assign_many(vecs[:20])
+
+    def test_remove_member_erases_from_disk(self, fitted, tmp_path):
+        index, ids, vecs, _ = fitted
+        index.save(tmp_path / "idx")
+        live = ClusterIndex.load(tmp_path / "idx")
+        live.add_member("new-user", vecs[3])
+        cluster = live.assign(vecs[7])[0]
+        before = live.size(cluster)
+
+        assert live.remove_member("m7") and live.remove_member("new-user")
+        assert not live.remove_member("nobody")
+        assert live.size(cluster) == before - 1
+        assert "m7" not in [h[0] for h in live.nearest_members(vecs[7], cluster, k=50)]
+
+        artifact = ClusterIndex.artifact_dir(tmp_path / "idx")
+        on_disk = set(np.load(artifact / ClusterIndex.MEMBER_IDS_FILE).tolist())
+        assert "m7" not in on_disk and "new-user" not in on_disk and len(on_disk) == len(ids) - 1
+        assert not (tmp_path / "idx" / ClusterIndex.DELTA_FILE).exists()
+        assert ClusterIndex.load(tmp_path / "idx").size(cluster) == before - 1
+
+    def test_assignment_latency_at_100k(self, tmp_path):
+        ids, vecs, _ = _planted(100_000, n_clusters=64, seed=1)
+        ClusterIndex.fit(ids, vecs, n_clusters=64, iterations=5).save(tmp_path / "big")
+        index = ClusterIndex.load(tmp_path / "big")
+        queries = [dict(zip(CORE_AXES, v.tolist())) for v in vecs[:200]]
+        index.assign(queries[0])
+
+        t0 = time.perf_counter()
+        for q in queries:
+            index.assign(q)
+        assert (time.perf_counter() - t0) / len(queries) < 1e-3
+
+
+class TestMultiWorker:
+
+    @pytest.fixture
+    def workers(self, fitted, tmp_path):
+        index, _, _, _ = fitted
+        index.save(tmp_path / "idx")
+        return ClusterIndex.load(tmp_path / "idx"), ClusterIndex.load(tmp_path / "idx"), tmp_path / "idx"
+
+    @staticmethod
+    def _on_disk(path):
+        return set(np.load(ClusterIndex.artifact_dir(path) / ClusterIndex.MEMBER_IDS_FILE).tolist())
+
+    def test_erasure_survives_other_workers_save(self, workers, fitted):
+        a, b, path = workers
+        _, _, vecs, _ = fitted
+        assert a.remove_member("m5")
+        assert b.remove_member("m7")
+
+        on_disk = self._on_disk(path)
+        assert "m5" not in on_disk and "m7" not in on_disk and len(on_disk) == 3998
+        # B has never removed m5 itself, yet no longer serves it
+        cluster = b.assign(vecs[5])[0]
+        assert "m5" not in [h[0] for h in b.nearest_members(vecs[5], cluster, k=50)]
+        assert not b.remove_member("m5")
+
+    def test_addition_survives_other_workers_erasure(self, workers, fitted):
+        a, b, path = workers
+        _, _, vecs, _ = fitted
+        cluster, _ = a.add_member("newA", vecs[0])
+        assert b.cluster_of("newA") == cluster  # replayed from the shared delta
+        assert b.remove_member("m7")
+
+        on_disk = self._on_disk(path)
+        assert "newA" in on_disk and "m7" not in on_disk
+        assert a.size(cluster) == ClusterIndex.load(path).size(cluster)
+        assert "m7" not in [h[0] for h in a.nearest_members(vecs[7], a.assign(vecs[7])[0], k=50)]
+
+    def test_save_folds_other_workers_delta(self, workers, fitted):
+        a, b, path = workers
+        _, _, vecs, _ = fitted
+        a.add_member("newA", vecs[0])
+        b.add_member("newB", vecs[1])
+        a.save()
+        assert {"newA", "newB"} <= self._on_disk(path)
+        assert not (path / ClusterIndex.DELTA_FILE).exists()
+        assert b.cluster_of("newB") is None  # folded into b's refreshed artifact
+        assert sum(b.size(c) for c in b.cluster_ids) == 4002
+
+
+class TestEngine:
+
+    @pytest.fixture
+    def engine(self, fitted, tmp_path, monkeypatch):
+        index, _, _, _ = fitted
+        index.save(tmp_path / "idx")
+        monkeypatch.setattr(user_vector_service, "_store", UserVectorStore(tmp_path / "uv"))
+        monkeypatch.setattr(career_compass_engine, "_cluster_registry", {})
+        directory = lambda ids: {m: {"mentor_id": f"mentor-{m}", "name": f"Mentor {m}"}
+                                 for m in ids if int(m[1:]) % 2 == 0}
+        return CareerCompassEngine(index=ClusterIndex.load(tmp_path / "idx"), mentor_directory=directory)
+
+    def test_registry_loaded_from_index(self, engine):
+        profile = asyncio.run(engine.get_cluster_profile("c3"))
+        assert profile["status"] == "ok"
+        assert profile["title"] == "Route 3"
+        assert set(profile["vector"]) == set(CORE_AXES)
+
+    def test_assign_user_and_peer_mentors(self, engine, fitted):
+        _, _, vecs, _ = fitted
+        signals = dict(zip(CORE_AXES, (vecs[5] * 0.5).tolist()))
+        asyncio.run(user_vector_service.UserVectorService().update_vector("u1", "r1", signals))
+
+        placed = asyncio.run(engine.assign_user("u1", "r1"))
+        assert placed["status"] == "ok" and placed["cluster_id"] in engine._index.cluster_ids
+
+        target = engine._index.assign(vecs[5])[0]
+        req = CareerMentorMatchRequest(user_id="u1", resume_id="r1", cluster_id=target)
+        result = asyncio.run(engine.get_mentor_matches(req))
+        assert result["status"] == "ok"
+        assert len(result["mentors"]) == 5
+        # Only opted-in members (even ids here), exposed by mentor-profile id and name
+        for m in result["mentors"]:
+            assert m["mentor_id"].startswith("mentor-m") and int(m["mentor_id"][8:]) % 2 == 0
+            assert m["name"] == f"Mentor {m['mentor_id'][7:]}"
+        assert result["source_summary"]["mentor_records_scanned"] == engine._index.size(target)
+
+    def test_no_opted_in_peers_falls_back_to_ideal_profiles(self, engine, fitted):
+        _, _, vecs, _ = fitted
+        engine._mentor_directory = lambda ids: {}
+        signals = dict(zip(CORE_AXES, (vecs[5] * 0.5).tolist()))
+        asyncio.run(user_vector_service.UserVectorService().update_vector("u1", "r1", signals))
+        req = CareerMentorMatchRequest(user_id="u1", resume_id="r1", cluster_id=engine._index.assign(vecs[5])[0])
+        result = asyncio.run(engine.get_mentor_matches(req))
+        assert result["mentors"] and all(m["mentor_id"].startswith("ideal_") for m in result["mentors"])
+
+    def test_opted_in_mentors_hides_user_ids(self, tmp_path):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from services.backend_api.db.models import Base, Mentor, User
+
+        db_engine = create_engine(f"sqlite:///{tmp_path / 'mentors.db'}")
+        Base.metadata.create_all(bind=db_engine)
+        factory = sessionmaker(bind=db_engine)
+        db = factory()
+        users = [User(email=f"u{i}@x.com", hashed_password="x", full_name=f"User {i}", is_active=i != 2)
+                 for i in range(4)]
+        db.add_all(users)
+        db.commit()
+        db.add_all([Mentor(user_id=users[i].id, specialty="Ops") for i in (1, 2)])
+        db.commit()
+        ids = [str(u.id) for u in users]
+        db.close()
+
+        cards = career_compass_engine.opted_in_mentors(ids + ["external-7"], session_factory=factory)
+        assert list(cards) == [ids[1]]  # not opted in, inactive and non-user ids are dropped
+        assert cards[ids[1]]["name"] == "User 1"
+        assert cards[ids[1]]["mentor_id"].startswith("mentor-") and ids[1] not in cards[ids[1]].values()
+        db_engine.dispose()
+
+    def test_vector_updates_reassign_and_erasure_removes(self, engine, fitted, monkeypatch):
+        _, _, vecs, _ = fitted
+        monkeypatch.setattr(cluster_index, "_index", engine._index)
+        monkeypatch.setattr(cluster_index, "_index_loaded", True)
+        svc = user_vector_service.UserVectorService()
+        signals = dict(zip(CORE_AXES, vecs[9].tolist()))
+
+        asyncio.run(svc.update_vector("u9", "r1", signals))
+        assert engine._index.cluster_of("u9") == engine._index.assign(vecs[9])[0]
+        asyncio.run(svc.update_vectors([("u10", "r1", signals)]))
+        assert engine._index.cluster_of("u10") is not None
+
+        assert svc.delete_user("u9") == 1
+        assert engine._index.cluster_of("u9") is None
+        assert "u9" not in [h[0] for h in engine._index.nearest_members(vecs[9], engine._index.assign(vecs[9])[0], k=50)]
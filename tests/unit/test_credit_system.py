@@ -0,0 +1,168 @@
+"""
+Credit Manager Tests — CareerTrojan
+====================================
+
+Tests cover:
+  1. consume_credits debits and logs in a single session
+  2. Plan-gate and insufficient-balance refusals keep their messages
+  3. First consumption creates the free-tier balance row
+  4. consume_credits_batch is all-or-nothing with one log row per action
+  5. Concurrent consumers never overspend (file-backed SQLite)
+  6. can_perform_action is served from the short-lived balance cache
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from services.backend_api.db.models import Base, CreditUsageLog, UserCreditBalance
+from services.backend_api.services.credit_system import CreditManager, PlanTier
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'credits.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    opened = []
+
+    def _open():
+        opened.append(1)
+        return factory()
+
+    _open.opened = opened
+    yield _open
+    engine.dispose()
+
+
+@pytest.fixture
+def manager(session_factory):
+    return CreditManager(session_factory=session_factory)
+
+
+def _logs(session_factory, user_id):
+    db = session_factory()
+    try:
+        return db.query(CreditUsageLog).filter(CreditUsageLog.user_id == user_id).order_by(CreditUsageLog.id).all()
+    finally:
+        db.close()
+
+
+class TestConsume:
+
+    def test_single_session_per_consumption(self, manager, session_factory):
+        manager.set_user_plan("1", PlanTier.MONTHLY)
+        session_factory.opened.clear()
+
+        result = manager.consume_credits("1", "fit_analysis_full", context={"job": 7})
+
+        assert result["success"]
+        assert result["credits_consumed"] == 2
+        assert result["credits_remaining"] == 148
+        assert result["message"] == "Consumed 2 credits for Fit Analysis Full"
+        assert len(session_factory.opened) == 1
+        (log,) = _logs(session_factory, 1)
+        assert log.credits_remaining_after == 148
+        assert log.context_json == '{"job": 7}'
+
+    def test_first_consumption_creates_free_balance(self, manager):
+        result = manager.consume_credits("2", "keyword_overlap_visual")
+        assert result["success"]
+        assert result["credits_remaining"] == 14
+
+    def test_plan_gate_refusal(self, manager):
+        result = manager.consume_credits("3", "career_analysis_full")
+        assert not result["success"]
+        assert result["message"] == "Requires Monthly Pro plan"
+        assert result["upgrade_info"]["required_plan"] == "monthly"
+        assert result["credits_consumed"] == 0
+
+    def test_insufficient_credits(self, manager, session_factory):
+        for _ in range(3):
+            assert manager.consume_credits("4", "career_analysis_preview")["success"]
+        result = manager.consume_credits("4", "career_analysis_preview")
+        assert not result["success"]
+        assert result["message"] == "Insufficient credits (0 remaining, need 5)"
+        assert len(_logs(session_factory, 4)) == 3
+
+    def test_unknown_action(self, manager):
+        assert manager.consume_credits("5", "no_such_action")["message"] == "Unknown action: no_such_action"
+
+
+class TestBatch:
+
+    def test_batch_debits_once_and_logs_each(self, manager, session_factory):
+        manager.set_user_plan("6", PlanTier.MONTHLY)
+        result = manager.consume_credits_batch(
+            "6", ["fit_analysis_full", {"action_id": "resume_tuning_full", "context": {"job": 1}}, "dashboard"]
+        )
+        assert result["success"]
+        assert result["credits_consumed"] == 5
+        assert result["credits_remaining"] == 145
+        assert [a["action_id"] for a in result["actions"]] == ["fit_analysis_full", "resume_tuning_full", "dashboard"]
+        assert [l.credits_remaining_after for l in _logs(session_factory, 6)] == [148, 145, 145]
+
+    def test_batch_is_all_or_nothing(self, manager, session_factory):
+        result = manager.consume_credits_batch("7", ["career_analysis_preview"] * 4)
+        assert not result["success"]
+        assert result["message"] == "Insufficient credits (15 remaining, need 20)"
+        assert _logs(session_factory, 7) == []
+        assert manager.get_user_credits("7").credits_remaining == 15
+
+    def test_batch_gated_by_highest_plan(self, manager):
+        result = manager.consume_credits_batch("8", ["keyword_overlap_visual", "contact_mentor"])
+        assert not result["success"]
+        assert result["upgrade_info"]["required_plan"] == "annual"
+
+
+class TestConcurrency:
+
+    def test_concurrent_consumers_never_overspend(self, manager, session_factory):
+        manager.set_user_plan("9", PlanTier.MONTHLY)  # 150 credits
+        successes = []
+
+        def worker():
+            mgr = CreditManager(session_factory=session_factory)
+            for _ in range(30):
+                if mgr.consume_credits("9", "connected_word_cloud")["success"]:  # 2 credits
+                    successes.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(successes) == 75
+        assert len(_logs(session_factory, 9)) == 75
+        db = session_factory()
+        try:
+            row = db.query(UserCreditBalance).filter(UserCreditBalance.user_id == 9).one()
+            assert (row.credits_remaining, row.credits_used) == (0, 150)
+        finally:
+            db.close()
+
+
+class TestBalanceCache:
+
+    def test_checks_hit_cache_after_write(self, manager, session_factory):
+        manager.consume_credits("10", "keyword_overlap_visual")
+        session_factory.opened.clear()
+
+        ok, message, _ = manager.can_perform_action("10", "job_suitability_gauge")
+        assert ok and message == "OK - costs 1 credits"
+        assert session_factory.opened == []
+
+    def test_ttl_zero_disables_cache(self, session_factory):
+        mgr = CreditManager(session_factory=session_factory, balance_ttl=0)
+        mgr.get_user_credits("11")
+        session_factory.opened.clear()
+        mgr.can_perform_action("11", "dashboard")
+        assert len(session_factory.opened) == 1
@@ -0,0 +1,237 @@
+"""
+Deep Ingest Tests — CareerTrojan
+=================================
+
+Runs the Phase A parse stage of scripts/deep_ingest_and_train.py over small
+text files.  Uses a blank spaCy pipeline when spaCy is installed, otherwise
+a stub with the same pipe() / __call__ / set_error_handler() surface.
+
+Tests cover:
+  1. A document that makes spaCy raise is counted as failed on its own;
+     every other document, before and after it, is parsed exactly once,
+     through a single pipe() call when the error handler can skip batches
+     (and by restarting pipe() when it cannot)
+  2. Without spaCy, documents are still parsed (no NER)
+  3. Candidate_database_merged.json is streamed, never loaded whole
+  4. A run that crashes between checkpoints resumes without re-parsing
+     checkpointed files or counting re-parsed documents twice
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import json
+
+import pytest
+
+from scripts import deep_ingest_and_train as ingest
+
+POISON = "POISON"
+
+
+class _Doc:
+    ents = ()
+
+
+def _raise(proc_name, proc, docs, e):
+    raise e
+
+
+class _StubNLP:
+    """
+    Parses texts lazily in batches and fails on POISON like a spaCy
+    component: the error handler is called and, in pipe(), the batch dropped.
+    """
+
+    def __init__(self):
+        self.handler = _raise
+        self.pipe_calls = 0
+
+    def set_error_handler(self, handler):
+        self.handler = handler
+
+    def __call__(self, text):
+        doc = _Doc()
+        if POISON in text:
+            self.handler("poison", None, [doc], ValueError("cannot parse document"))
+        return doc
+
+    def pipe(self, items, as_tuples=False, batch_size=32, n_process=1):
+        self.pipe_calls += 1
+        items = iter(items)
+        while True:
+            batch = [item for _, item in zip(range(batch_size), items)]
+            if not batch:
+                return
+            if any(POISON in text for text, _ in batch):
+                self.handler("poison", None, [_Doc() for _ in batch], ValueError("cannot parse batch"))
+                continue
+            yield from ((_Doc(), ctx) for _, ctx in batch)
+
+
+class _StubNLPWithoutHandler(_StubNLP):
+    """An nlp whose pipe() simply raises (no error-handler support)."""
+
+    set_error_handler = property()  # hasattr() is False
+
+
+def _nlp():
+    try:
+        import spacy
+        from spacy.language import Language
+    except ImportError:
+        return _StubNLP()
+
+    @Language.component("test_poison_pill")
+    def poison_pill(doc):
+        if POISON in doc.text:
+            raise ValueError("cannot parse document")
+        return doc
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("test_poison_pill")
+    return nlp
+
+
+def _write_docs(tmp_path, count, poison_at=None):
+    files = []
+    for i in range(count):
+        text = f"Document {i}: senior python developer with sql experience"
+        if i == poison_at:
+            text += f" {POISON}"
+        path = tmp_path / f"doc_{i:02d}.txt"
+        path.write_text(text)
+        files.append(path)
+    return files
+
+
+def _parse(files, **kwargs):
+    stats = {"failed": 0, "skipped_existing": 0}
+    new_hashes = []
+    docs = list(ingest.iter_parsed_documents(files, set(), stats, new_hashes, **kwargs))
+    return docs, stats
+
+
+class TestParseFailures:
+
+    def test_failing_document_isolated(self, tmp_path, monkeypatch):
+        nlp = _nlp()
+        monkeypatch.setattr(ingest, "get_spacy_nlp", lambda: nlp)
+        files = _write_docs(tmp_path, 12, poison_at=5)
+
+        docs, stats = _parse(files, batch_size=2)
+
+        assert stats["failed"] == 1
+        parsed = sorted(d.source_file for d in docs)
+        assert parsed == sorted(str(f) for i, f in enumerate(files) if i != 5)
+        assert all(d.doc_type and d.text_length > 20 for d in docs)
+        if isinstance(nlp, _StubNLP):
+            assert nlp.pipe_calls == 1  # one long-lived pipe(): workers start once
+            assert nlp.handler is ingest._raise_error  # default restored
+
+    def test_pipe_restarted_without_error_handler(self, tmp_path, monkeypatch):
+        nlp = _StubNLPWithoutHandler()
+        monkeypatch.setattr(ingest, "get_spacy_nlp", lambda: nlp)
+        files = _write_docs(tmp_path, 12, poison_at=5)
+
+        docs, stats = _parse(files, batch_size=2)
+
+        assert stats["failed"] == 1
+        assert sorted(d.source_file for d in docs) == sorted(str(f) for i, f in enumerate(files) if i != 5)
+        assert nlp.pipe_calls == 2
+
+    def test_without_spacy(self, tmp_path, monkeypatch):
+        def unavailable():
+            raise ImportError("No module named 'spacy'")
+
+        monkeypatch.setattr(ingest, "get_spacy_nlp", unavailable)
+        docs, stats = _parse(_write_docs(tmp_path, 3), batch_size=2)
+        assert len(docs) == 3 and stats["failed"] == 0
+        assert all(d.companies == [] for d in docs)
+
+
+class _Crash(BaseException):
+    """Stands in for the process dying; not caught by the pipeline's ``except Exception``."""
+
+
+@pytest.fixture
+def data_root(tmp_path, monkeypatch):
+    ai_data = tmp_path / "ai_data_final"
+    for sub in ("parsed_from_automated", "parsed_resumes", "parsed_job_descriptions", "core_databases"):
+        (ai_data / sub).mkdir(parents=True)
+    parser_dir = tmp_path / "automated_parser"
+    parser_dir.mkdir()
+    monkeypatch.setattr(ingest, "DATA_ROOT", tmp_path)
+    monkeypatch.setattr(ingest, "AI_DATA_DIR", ai_data)
+    monkeypatch.setattr(ingest, "AUTOMATED_PARSER_DIR", parser_dir)
+    monkeypatch.setattr(ingest, "PARSE_SPOOL", ai_data / "deep_parse_spool.jsonl")
+    monkeypatch.setattr(ingest, "get_spacy_nlp", _nlp)
+    return tmp_path
+
+
+class TestJsonArrayStream:
+
+    def test_matches_json_load(self, tmp_path):
+        data = [{"file_hash": "a", "skills": ["c++", "sql"]}, 12345, "],[", [], {"n": -1.5e3}, None]
+        path = tmp_path / "array.json"
+        path.write_text(json.dumps(data, indent=2))
+        for chunk_size in (1, 3, 7, 1 << 16):
+            assert list(ingest._iter_json_array(path, chunk_size=chunk_size)) == data
+
+    def test_empty_and_invalid(self, tmp_path):
+        path = tmp_path / "array.json"
+        path.write_text("  [ ]\n")
+        assert list(ingest._iter_json_array(path, chunk_size=2)) == []
+        path.write_text('{"not": "a list"}')
+        with pytest.raises(ValueError):
+            list(ingest._iter_json_array(path))
+        path.write_text('[{"a": 1}, {"b":')
+        with pytest.raises(json.JSONDecodeError):
+            list(ingest._iter_json_array(path, chunk_size=4))
+
+
+class TestCrashResume:
+
+    def test_rerun_after_crash(self, data_root, monkeypatch):
+        monkeypatch.setattr(ingest, "CHECKPOINT_EVERY", 3)
+        for i in range(8):
+            (ingest.AUTOMATED_PARSER_DIR / f"cv_{i}.txt").write_text(
+                f"Candidate {i}: python developer, work experience at Acme Ltd, skills: sql")
+        merged_path = ingest.AI_DATA_DIR / "core_databases" / "Candidate_database_merged.json"
+        existing = [{"name": "earlier", "file_hash": "earlier-hash"}, {"name": "older", "file_hash": "older-hash"}]
+        merged_path.write_text(json.dumps(existing))
+
+        real_save = ingest._save_parsed_document
+        saved = []
+
+        def crash_on_eighth(parsed):
+            if len(saved) == 7:
+                raise _Crash()
+            saved.append(parsed.file_hash)
+            return real_save(parsed)
+
+        monkeypatch.setattr(ingest, "_save_parsed_document", crash_on_eighth)
+        with pytest.raises(_Crash):
+            ingest.deep_parse_automated_parser(batch_size=2)
+        # Seven documents spooled, six of them checkpointed; nothing folded yet
+        assert json.loads(merged_path.read_text()) == existing
+        monkeypatch.setattr(ingest, "_save_parsed_document", real_save)
+
+        loaded = []
+        real_load = json.load
+        monkeypatch.setattr(json, "load", lambda f, *a, **k: loaded.append(f.name) or real_load(f, *a, **k))
+        result = ingest.deep_parse_automated_parser(batch_size=2)
+
+        stats = result["stats"]
+        assert stats["skipped_existing"] == 6 and stats["parsed"] == 2
+        assert str(merged_path) not in loaded
+
+        candidates = json.loads(merged_path.read_text())
+        hashes = [c["file_hash"] for c in candidates]
+        assert hashes[:2] == ["earlier-hash", "older-hash"]
+        assert len(hashes) == len(set(hashes)) == 10
+
+        # The document parsed both before and after the crash is mined once
+        assert len(result["spool"].path.read_text().splitlines()) == 9
+        texts = list(result["all_raw_texts"])
+        assert len(texts) == 8 and len(set(texts)) == 8
+        result["spool"].remove()
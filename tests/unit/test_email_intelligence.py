@@ -0,0 +1,131 @@
+"""
+Email Intelligence Index Tests — CareerTrojan
+==============================================
+
+Tests cover:
+  1. add_verified_contact updates pattern counts and indexes incrementally
+  2. Company → domain inference via the reverse index and known-domain promotion
+  3. Direct edits to verified_contacts / domain_to_company are picked up,
+     including replacing a container with one of the same length; pattern
+     counts edited in place refresh the cached ranking
+  4. guess_batch matches per-contact guess_email and scales to large batches
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import time
+
+import pytest
+
+from services.ai_engine.email_intelligence import EmailIntelligence
+
+
+@pytest.fixture
+def engine(tmp_path):
+    ei = EmailIntelligence(data_root=tmp_path)
+    ei.add_verified_contact("john.smith@acme.com", "John", "Smith", company="Acme")
+    ei.add_verified_contact("jane.doe@acme.com", "Jane", "Doe")
+    ei.add_verified_contact("bsmith@globex.co.uk", "Bob", "Smith", company="Globex Ltd")
+    return ei
+
+
+class TestIncrementalContacts:
+
+    def test_pattern_counts_update_in_place(self, engine):
+        assert engine.domain_patterns["acme.com"] == {"first.last": 2}
+        engine.add_verified_contact("ajones@acme.com", "Alice", "Jones")
+        assert engine.domain_patterns["acme.com"] == {"first.last": 2, "flast": 1}
+
+        guesses = engine.guess_email("Carl", "Weber", "Acme")
+        assert [g["pattern"] for g in guesses] == ["first.last", "flast"]
+        assert guesses[0]["confidence"] == 0.85
+
+    def test_matches_full_relearn(self, engine):
+        incremental = {d: dict(p) for d, p in engine.domain_patterns.items()}
+        engine.learn_patterns()
+        assert engine.domain_patterns == incremental
+
+    def test_invalid_address_is_rejected(self, engine):
+        assert engine.add_verified_contact("not-an-email") is None
+
+
+class TestDomainInference:
+
+    def test_reverse_lookup_raw_and_cleaned(self, engine):
+        assert engine._infer_domain("Acme") == ["acme.com"]
+        assert engine._infer_domain("  GLOBEX LTD ") == ["globex.co.uk"]
+
+    def test_known_domain_is_promoted(self, engine):
+        engine.add_verified_contact("x.y@initech.io", "X", "Y")
+        domains = engine._infer_domain("Initech")
+        assert domains[0] == "initech.io"
+        assert "initech.com" in domains
+
+    def test_direct_container_edits_are_indexed(self, engine):
+        engine.verified_contacts.append({
+            "email": "a.b@hooli.net", "name": "", "first_name": "a",
+            "last_name": "b", "domain": "hooli.net", "source": "manual",
+        })
+        assert engine._infer_domain("Hooli")[0] == "hooli.net"
+
+        engine.domain_to_company["umbrella.com"] = "Umbrella Corp"
+        assert engine._infer_domain("Umbrella Corp") == ["umbrella.com"]
+
+    def test_same_length_replacement_is_indexed(self, engine):
+        assert engine._infer_domain("Acme") == ["acme.com"]
+        engine.verified_contacts = [
+            dict(c, domain="hooli.net", email=c["email"].split("@")[0] + "@hooli.net")
+            for c in engine.verified_contacts
+        ]
+        engine.domain_to_company = {"hooli.net": "Acme", "initech.io": "Initech", "x.org": "X"}
+        assert engine._infer_domain("Acme") == ["hooli.net"]
+        assert engine._infer_domain("Globex Ltd")[0] != "globex.co.uk"
+        assert engine._infer_domain("Hooli")[0] == "hooli.net"  # known from the new contacts
+
+    def test_in_place_pattern_edit_refreshes_ranking(self, engine):
+        engine.add_verified_contact("ajones@acme.com", "Alice", "Jones")
+        assert engine.guess_email("Carl", "Weber", "Acme")[0]["pattern"] == "first.last"
+        counts = engine.domain_patterns["acme.com"]
+        counts["first.last"], counts["flast"] = 1, 2  # same total, new leader
+        assert engine.guess_email("Carl", "Weber", "Acme")[0]["pattern"] == "flast"
+
+    def test_load_patterns_rebuilds_index(self, engine, tmp_path):
+        engine.save_patterns()
+        fresh = EmailIntelligence(data_root=tmp_path)
+        fresh.load_patterns()
+        assert fresh._infer_domain("Globex Ltd") == ["globex.co.uk"]
+        assert fresh.guess_email("Ann", "Lee", "Acme")[0]["email"] == "ann.lee@acme.com"
+
+
+class TestBatch:
+
+    def test_batch_matches_single_guesses(self, engine):
+        contacts = [
+            {"first_name": "Ann", "last_name": "Lee", "company": "Acme"},
+            {"first_name": "Tom", "last_name": "Ng", "company": "Globex Ltd"},
+            {"first_name": "Eve", "last_name": "Ray", "company": "Unknown Co"},
+            {"first_name": "Sam", "last_name": "Oh", "company": "", "domain": "ACME.com "},
+            {"first_name": "", "last_name": "Solo", "company": "Acme"},
+        ]
+        for contact, out in zip(contacts, engine.guess_batch(contacts)):
+            expected = engine.guess_email(
+                contact["first_name"], contact["last_name"], contact["company"], contact.get("domain")
+            )
+            assert out["guessed_emails"] == expected
+            assert out["top_guess"] == (expected[0]["email"] if expected else None)
+
+    def test_large_batch_against_large_contact_set(self, engine):
+        for i in range(20_000):
+            engine.add_verified_contact(f"user{i}.smith@co{i % 500}.com", f"User{i}", "Smith")
+        contacts = [
+            {"first_name": "Pat", "last_name": f"Kim{i}", "company": f"Co{i % 800}"}
+            for i in range(20_000)
+        ]
+
+        t0 = time.monotonic()
+        results = engine.guess_batch(contacts)
+        elapsed = time.monotonic() - t0
+
+        assert len(results) == 20_000
+        assert results[1]["top_guess"] == "pat.kim1@co1.com"
+        assert elapsed < 10.0
@@ -0,0 +1,160 @@
+"""
+Embedding Pipeline Tests — CareerTrojan
+========================================
+
+Runs scripts/embedding_pipeline.py against a deterministic stub encoder
+(same encode() / get_sentence_embedding_dimension() surface as a
+SentenceTransformer).
+
+Tests cover:
+  1. Unchanged texts are not re-encoded; edited texts are
+  2. Out-of-memory halves the batch size and the smaller size is kept
+  3. Vectors are normalised only when the store normalises
+  4. Each model gets its own store; a dimension mismatch is refused
+  5. Vectors for texts no longer in the corpus are pruned and compacted
+  6. Profiles embedded with another model are not treated as unchanged
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import hashlib
+
+import numpy as np
+import pytest
+
+from scripts.embedding_pipeline import (
+    content_hash, corpus_store_dir, embed_new_texts, encode_adaptive, extract_text_fields,
+    prune_store, unchanged_profiles,
+)
+from services.shared.embedding_store import EmbeddingStore
+
+DIM = 8
+
+
+class StubEncoder:
+    """Deterministic text → vector model; optionally runs out of memory above a batch size."""
+
+    def __init__(self, dim=DIM, max_batch=None):
+        self.dim = dim
+        self.max_batch = max_batch
+        self.encoded = []
+        self.batch_sizes = []
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False, normalize_embeddings=False):
+        self.batch_sizes.append(batch_size)
+        if self.max_batch is not None and batch_size > self.max_batch:
+            raise RuntimeError("CUDA out of memory. Tried to allocate 2.00 GiB")
+        self.encoded.extend(texts)
+        vecs = np.array([
+            np.frombuffer(hashlib.sha256(t.encode()).digest()[: self.dim], dtype=np.uint8) + 1.0
+            for t in texts
+        ], dtype=np.float32)
+        if normalize_embeddings:
+            vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+        return vecs
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = EmbeddingStore(corpus_store_dir(tmp_path, "stub-model"), dim=DIM, normalize=False)
+    yield s
+    s.close()
+
+
+class TestIncrementalEncoding:
+
+    def test_unchanged_texts_not_reencoded(self, store):
+        model = StubEncoder()
+        texts = ["python developer", "staff nurse", "python developer"]
+        ids, encoded = embed_new_texts(texts, store, model, batch_size=4)
+        assert encoded == 2 and len(model.encoded) == 2
+        assert ids[0] == ids[2] == content_hash("python developer")
+
+        model.encoded.clear()
+        _, encoded = embed_new_texts(texts, store, model, batch_size=4)
+        assert encoded == 0 and model.encoded == []
+
+        _, encoded = embed_new_texts(["python developer", "senior staff nurse"], store, model, batch_size=4)
+        assert encoded == 1 and model.encoded == ["senior staff nurse"]
+
+    def test_store_normalisation_is_respected(self, store, tmp_path):
+        model = StubEncoder()
+        embed_new_texts(["raw vector"], store, model, batch_size=4)
+        raw = store.get(content_hash("raw vector"))
+        assert np.linalg.norm(raw) > 1.5  # stored exactly as the model emits it
+
+        unit = EmbeddingStore(tmp_path / "unit", dim=DIM)
+        try:
+            embed_new_texts(["raw vector"], unit, model, batch_size=4)
+            assert np.linalg.norm(unit.get(content_hash("raw vector"))) == pytest.approx(1.0)
+        finally:
+            unit.close()
+
+
+class TestAdaptiveBatch:
+
+    def test_oom_halves_batch_size(self):
+        model = StubEncoder(max_batch=4)
+        vectors, batch_size = encode_adaptive(model, ["a", "b", "c"], batch_size=16)
+        assert model.batch_sizes == [16, 8, 4]
+        assert batch_size == 4
+        assert vectors.shape == (3, DIM) and vectors.dtype == np.float32
+
+    def test_smaller_batch_kept_across_chunks(self, store, monkeypatch):
+        from scripts import embedding_pipeline
+        monkeypatch.setattr(embedding_pipeline, "ENCODE_CHUNK", 2)
+        model = StubEncoder(max_batch=2)
+        embed_new_texts([f"text {i}" for i in range(6)], store, model, batch_size=8)
+        assert model.batch_sizes == [8, 4, 2, 2, 2]
+
+    def test_other_errors_propagate(self):
+        class Broken(StubEncoder):
+            def encode(self, *args, **kwargs):
+                raise RuntimeError("tokenizer exploded")
+
+        with pytest.raises(RuntimeError, match="tokenizer"):
+            encode_adaptive(Broken(), ["a"], batch_size=8)
+
+
+class TestModelSeparation:
+
+    def test_store_dir_per_model(self, tmp_path):
+        a = corpus_store_dir(tmp_path, "all-MiniLM-L6-v2")
+        b = corpus_store_dir(tmp_path, "sentence-transformers/all-mpnet-base-v2")
+        assert a != b and a.parent == b.parent == tmp_path
+
+    def test_dimension_mismatch_refused(self, store):
+        with pytest.raises(ValueError, match="768-d"):
+            embed_new_texts(["text"], store, StubEncoder(dim=768))
+
+    def test_profile_from_other_model_is_stale(self, tmp_path):
+        profile = {"id": "p1", "summary": "Data engineer", "skills": ["python"]}
+        store_dir = tmp_path / "store"
+        s = EmbeddingStore(store_dir, dim=DIM)
+        s.add(["p1"], np.ones((1, DIM), dtype=np.float32),
+              metadata=[{"content_hash": content_hash(extract_text_fields(profile)), "model": "old-model"}])
+        s.close()
+        assert unchanged_profiles([profile], store_dir, "old-model") == {"p1"}
+        assert unchanged_profiles([profile], store_dir, "new-model") == set()
+
+
+class TestPrune:
+
+    def test_removed_texts_pruned_and_compacted(self, store):
+        model = StubEncoder()
+        embed_new_texts([f"cv {i}" for i in range(10)], store, model, batch_size=4)
+
+        current = [f"cv {i}" for i in range(6)] + ["cv 3 edited"]
+        ids, _ = embed_new_texts(current, store, model, batch_size=4)
+        assert prune_store(store, ids) == 4
+        assert sorted(store.ids()) == sorted(set(ids))
+        assert store.dead_rows == 4  # below the compaction threshold
+
+        ids, _ = embed_new_texts(["cv 0"], store, model, batch_size=4)
+        assert prune_store(store, ids) == 6
+        assert store.dead_rows == 0  # dead rows outnumbered live ones: compacted
+        assert store.ids() == ids and store.get(ids[0]) is not None
+        assert prune_store(store, ids) == 0
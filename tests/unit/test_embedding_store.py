@@ -0,0 +1,148 @@
+"""
+Embedding Store Tests — CareerTrojan
+=====================================
+
+Tests cover:
+  1. Brute-force search below the index threshold matches exact cosine top-k
+  2. IVF search recall against exact search, and query latency
+  3. Upserts, deletes and metadata-filtered top-k
+  4. Persistence: reopen, rows appended after the last flush, torn log tail
+  5. compact() reclaims deleted rows
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import time
+
+import numpy as np
+import pytest
+
+from services.shared.embedding_store import EmbeddingStore
+
+
+def _clustered(n, dim, seed=0, n_centers=200):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(n_centers, dim)).astype(np.float32)
+    return centers[rng.integers(0, n_centers, n)] + 0.4 * rng.normal(size=(n, dim)).astype(np.float32)
+
+
+@pytest.fixture
+def small_store(tmp_path):
+    store = EmbeddingStore(tmp_path / "small", dim=8)
+    vecs = _clustered(500, 8, n_centers=20)
+    store.add([f"c{i}" for i in range(500)], vecs, metadata=[{"region": "uk" if i % 5 == 0 else "us"} for i in range(500)])
+    yield store, vecs
+    store.close()
+
+
+class TestSearch:
+
+    def test_brute_force_matches_exact_cosine(self, small_store):
+        store, vecs = small_store
+        q = vecs[7]
+        normed = vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+        expected = [f"c{i}" for i in np.argsort(-(normed @ (q / np.linalg.norm(q))))[:5]]
+
+        hits = store.search(q, k=5)
+        assert [h[0] for h in hits] == expected
+        assert hits[0][0] == "c7" and hits[0][1] == pytest.approx(1.0, abs=1e-5)
+
+    def test_ivf_recall_and_latency(self, tmp_path):
+        vecs = _clustered(30_000, 32)
+        store = EmbeddingStore(tmp_path / "ivf", dim=32, min_index_size=20_000)
+        store.add([f"v{i}" for i in range(30_000)], vecs)
+        assert store._centroids is not None  # built automatically past the threshold
+
+        queries = _clustered(30, 32, seed=1)
+        recall, elapsed = 0.0, 0.0
+        for q in queries:
+            exact = {h[0] for h in store.search(q, k=10, exact=True)}
+            t0 = time.perf_counter()
+            approx = {h[0] for h in store.search(q, k=10)}
+            elapsed += time.perf_counter() - t0
+            recall += len(exact & approx) / 10
+        store.close()
+
+        assert recall / len(queries) >= 0.9
+        assert elapsed / len(queries) < 0.05
+
+
+class TestUpdates:
+
+    def test_upsert_replaces_vector(self, small_store):
+        store, vecs = small_store
+        store.add(["c1"], [vecs[300]])
+        assert len(store) == 500
+        assert {h[0] for h in store.search(vecs[300], k=2)} == {"c1", "c300"}
+
+    def test_delete_hides_row(self, small_store):
+        store, vecs = small_store
+        assert store.delete(["c7", "missing"]) == 1
+        assert "c7" not in store
+        assert all(h[0] != "c7" for h in store.search(vecs[7], k=10))
+
+    def test_dict_and_callable_filters(self, small_store):
+        store, vecs = small_store
+        uk = store.search(vecs[3], k=10, filter={"region": "uk"})
+        assert len(uk) == 10 and all(meta["region"] == "uk" for _, _, meta in uk)
+        odd = store.search(vecs[3], k=5, filter=lambda m: m.get("region") in {"us", "eu"})
+        assert all(meta["region"] == "us" for _, _, meta in odd)
+
+    def test_selective_filter_widens_probe(self, tmp_path):
+        vecs = _clustered(12_000, 16)
+        store = EmbeddingStore(tmp_path / "sel", dim=16, min_index_size=10_000, nprobe=1)
+        meta = [{"tier": "elite"} if i % 1000 == 0 else {"tier": "free"} for i in range(12_000)]
+        store.add([f"v{i}" for i in range(12_000)], vecs, metadata=meta)
+        hits = store.search(vecs[5], k=12, filter={"tier": "elite"})
+        store.close()
+        assert len(hits) == 12
+
+
+class TestPersistence:
+
+    def test_reopen_after_flush(self, tmp_path):
+        vecs = _clustered(15_000, 16)
+        store = EmbeddingStore(tmp_path / "p", dim=16, min_index_size=10_000)
+        store.add([f"v{i}" for i in range(15_000)], vecs, metadata=[{"n": i} for i in range(15_000)])
+        store.delete(["v2"])
+        before = store.search(vecs[3], k=5)
+        store.close()
+
+        reopened = EmbeddingStore(tmp_path / "p")
+        assert reopened.dim == 16 and len(reopened) == 14_999
+        assert reopened.search(vecs[3], k=5) == before
+        assert reopened.metadata("v10") == {"n": 10}
+        reopened.close()
+
+    def test_unflushed_rows_and_torn_tail(self, tmp_path):
+        vecs = _clustered(12_000, 16)
+        store = EmbeddingStore(tmp_path / "t", dim=16, min_index_size=10_000)
+        store.add([f"v{i}" for i in range(12_000)], vecs)
+        store.flush()
+        store.add(["late"], [vecs[42]])
+        store._log.flush()
+        store._vectors.flush()
+        with open(tmp_path / "t" / EmbeddingStore.ROWS_FILE, "a", encoding="utf-8") as f:
+            f.write('{"id": "torn')
+
+        reopened = EmbeddingStore(tmp_path / "t")
+        assert "late" in reopened and len(reopened) == 12_001
+        assert {h[0] for h in reopened.search(vecs[42], k=2)} == {"v42", "late"}
+        reopened.close()
+
+    def test_dim_mismatch_rejected(self, small_store, tmp_path):
+        store, _ = small_store
+        store.flush()
+        with pytest.raises(ValueError):
+            EmbeddingStore(tmp_path / "small", dim=16)
+
+    def test_compact_reclaims_deleted_rows(self, small_store, tmp_path):
+        store, vecs = small_store
+        store.delete([f"c{i}" for i in range(0, 500, 2)])
+        assert store.compact() == 250
+        assert store.search(vecs[3], k=1)[0][0] == "c3"
+        store.close()
+
+        reopened = EmbeddingStore(tmp_path / "small")
+        assert len(reopened) == 250 and reopened._rows == 250
+        reopened.close()
@@ -0,0 +1,226 @@
+"""
+Enrichment Orchestrator Tests — CareerTrojan
+=============================================
+
+Tests cover:
+  1. EnrichmentFeatureContext computes each feature once, even across threads
+  2. One TF-IDF transform per request is shared by every step that reads it
+  3. Independent steps run concurrently on the step pool
+  4. Result cache: hits return a private copy, LRU eviction, and retrained
+     model artifacts invalidate cached results without a restart
+  5. Reloads happen off the request path and swap the whole model bundle;
+     a request in flight keeps the bundle it started with
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sklearn.cluster import KMeans
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+try:
+    from services.backend_api.services.enrichment import ai_enrichment_orchestrator as orch
+except (ImportError, OSError) as exc:  # spaCy / en_core_web_sm not installed
+    pytest.skip(f"enrichment orchestrator unavailable: {exc}", allow_module_level=True)
+
+CORPUS = [
+    "python developer sql data pipelines",
+    "registered nurse patient care ward",
+    "financial analyst excel forecasting",
+    "java backend engineer microservices",
+]
+
+
+def _profile(name, skills=("python", "sql")):
+    return {"name": name, "skills": list(skills),
+            "experience": [{"title": "Developer", "description": "data pipelines"}]}
+
+
+def _write_models(models_dir, corpus):
+    tfidf = TfidfVectorizer().fit(corpus)
+    kmeans = KMeans(n_clusters=2, n_init=10, random_state=0).fit(tfidf.transform(corpus))
+    with open(models_dir / "tfidf_vectorizer.pkl", "wb") as f:
+        pickle.dump(tfidf, f)
+    with open(models_dir / "kmeans_model.pkl", "wb") as f:
+        pickle.dump(kmeans, f)
+
+
+class _CountingVectorizer:
+    def __init__(self, inner):
+        self.inner = inner
+        self.transforms = 0
+
+    def transform(self, docs):
+        self.transforms += 1
+        return self.inner.transform(docs)
+
+    def get_feature_names_out(self):
+        return self.inner.get_feature_names_out()
+
+
+@pytest.fixture
+def models_dir(tmp_path):
+    path = tmp_path / "trained_models"
+    path.mkdir()
+    _write_models(path, CORPUS)
+    return path
+
+
+@pytest.fixture
+def orchestrator(models_dir, monkeypatch):
+    # The spaCy keyword/title enrichers are covered elsewhere; keep these tests on the orchestrator
+    monkeypatch.setattr(orch, "enrich_keywords", lambda text, job_titles=None, job_desc=None: {"by_category": {}})
+    monkeypatch.setattr(orch, "enrich_job_titles_with_similarity_and_migration",
+                        lambda titles, keywords: {"similar_titles": list(titles)})
+    return orch.AIEnrichmentOrchestrator(models_path=models_dir)
+
+
+class TestFeatureContext:
+
+    def test_features_computed_once_across_threads(self, orchestrator):
+        counting = _CountingVectorizer(orchestrator.models["tfidf"])
+        orchestrator.models["tfidf"] = counting
+        ctx = orch.EnrichmentFeatureContext(orchestrator, "python sql developer", _profile("a"), "python java")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            rows = list(pool.map(lambda _: ctx.tfidf, range(16)))
+        assert counting.transforms == 1
+        assert all(row is rows[0] for row in rows)
+        assert ctx.tfidf_scores is ctx.tfidf_scores
+        assert ctx.job_tokens - ctx.tokens == {"java"}
+
+    def test_request_shares_one_transform(self, orchestrator):
+        counting = _CountingVectorizer(orchestrator.models["tfidf"])
+        orchestrator.models["tfidf"] = counting
+
+        result = orchestrator.get_dashboard_enrichment(_profile("a"), job_titles=["Developer"],
+                                                       job_desc="python engineer")
+        # Keyword extraction and clustering both read the TF-IDF row
+        assert counting.transforms == 1
+        assert "python" in result["keywords"]["extracted"]
+        assert result["clustering"]["cluster_label"].startswith("Cluster_")
+        assert result["job_titles_enrichment"]["similar_titles"] == ["Developer"]
+
+
+class TestParallelSteps:
+
+    def test_independent_steps_overlap(self, orchestrator, monkeypatch):
+        # Each step waits for the other two: run one after another, the barrier breaks
+        barrier = threading.Barrier(3, timeout=5)
+        threads = set()
+
+        def step(default):
+            def run(*args, **kwargs):
+                threads.add(threading.current_thread().name)
+                barrier.wait()
+                return default
+            return run
+
+        monkeypatch.setattr(orchestrator, "_run_fuzzy_logic", step({"fuzzy_confidence": 0.0}))
+        monkeypatch.setattr(orchestrator, "_run_expert_systems", step({"rule_engine": []}))
+        monkeypatch.setattr(orchestrator, "_compute_market_signals_ml", step({"trending_skills": []}))
+
+        result = orchestrator.get_dashboard_enrichment(_profile("a"))
+        assert len(threads) == 3
+        assert all(name.startswith("enrichment") for name in threads)
+        assert result["fuzzy_scores"] == {"fuzzy_confidence": 0.0}
+
+
+class TestResultCache:
+
+    def test_hit_returns_private_copy(self, orchestrator):
+        first = orchestrator.get_dashboard_enrichment(_profile("a"))
+        first["keywords"]["extracted"].append("tampered")
+
+        second = orchestrator.get_dashboard_enrichment(_profile("a"))
+        assert second["metadata"]["cached"] is True
+        assert "tampered" not in second["keywords"]["extracted"]
+        second["keywords"]["extracted"].append("again")
+        assert "again" not in orchestrator.get_dashboard_enrichment(_profile("a"))["keywords"]["extracted"]
+        assert orchestrator.get_cache_stats()["hits"] == 2
+
+    def test_lru_eviction(self, orchestrator, monkeypatch):
+        monkeypatch.setattr(orchestrator, "RESULT_CACHE_SIZE", 2)
+        for name in ("a", "b"):
+            orchestrator.get_dashboard_enrichment(_profile(name))
+        orchestrator.get_dashboard_enrichment(_profile("a"))  # a is now most recent
+        orchestrator.get_dashboard_enrichment(_profile("c"))  # evicts b
+
+        assert orchestrator.get_cache_stats()["entries"] == 2
+        assert orchestrator.get_dashboard_enrichment(_profile("a"))["metadata"]["cached"] is True
+        assert orchestrator.get_dashboard_enrichment(_profile("b"))["metadata"]["cached"] is False
+        assert orchestrator.get_dashboard_enrichment(_profile("b"), use_cache=False)["metadata"]["cached"] is False
+
+    def test_retrained_models_invalidate_cache(self, orchestrator, models_dir):
+        before = orchestrator.get_dashboard_enrichment(_profile("a"))
+        old_vectorizer = orchestrator.models["tfidf"]
+        _retrain(models_dir)
+
+        # Requests never check the disk: the cached result is served until a refresh
+        assert orchestrator.get_dashboard_enrichment(_profile("a"))["metadata"]["cached"] is True
+
+        assert orchestrator.refresh_models(force=True) is True
+        after = orchestrator.get_dashboard_enrichment(_profile("a"))
+        assert after["metadata"]["cached"] is False
+        assert orchestrator.models["tfidf"] is not old_vectorizer
+        assert after["keywords"]["importance_scores"] != before["keywords"]["importance_scores"]
+        assert orchestrator.get_dashboard_enrichment(_profile("a"))["metadata"]["cached"] is True
+        assert orchestrator.refresh_models(force=True) is False  # nothing changed since
+
+
+def _retrain(models_dir):
+    """Nightly retraining rewrites the artifacts in place."""
+    _write_models(models_dir, CORPUS + ["python python python data engineer spark"])
+    stamp = os.stat(models_dir / "tfidf_vectorizer.pkl").st_mtime + 10
+    os.utime(models_dir / "tfidf_vectorizer.pkl", (stamp, stamp))
+
+
+class TestModelReload:
+
+    def test_request_path_never_fingerprints(self, orchestrator, monkeypatch):
+        def walk():
+            raise AssertionError("artifact directory walked on the request path")
+
+        monkeypatch.setattr(orchestrator, "_artifact_fingerprint", walk)
+        monkeypatch.setattr(orchestrator, "MODEL_CHECK_INTERVAL", 0.0)
+        assert orchestrator.get_dashboard_enrichment(_profile("a"))["metadata"]["cached"] is False
+
+    def test_in_flight_request_keeps_its_bundle(self, orchestrator, models_dir, monkeypatch):
+        old_vectorizer = orchestrator.models["tfidf"]
+        seen = {}
+
+        def reload_mid_request(*args, **kwargs):
+            _retrain(models_dir)
+            assert orchestrator.refresh_models(force=True) is True
+            seen["tfidf"] = orchestrator.models["tfidf"]
+            seen["features"] = orchestrator._tfidf_feature_names()
+            return {"fuzzy_confidence": 0.0}
+
+        monkeypatch.setattr(orchestrator, "_run_fuzzy_logic", reload_mid_request)
+        result = orchestrator.get_dashboard_enrichment(_profile("a"))
+
+        # The step ran after the swap yet still saw the request's own bundle
+        assert seen["tfidf"] is old_vectorizer
+        assert len(seen["features"]) == len(old_vectorizer.get_feature_names_out())
+        assert orchestrator.models["tfidf"] is not old_vectorizer
+        assert len(orchestrator._tfidf_feature_names()) != len(seen["features"])
+        assert result["clustering"]["cluster_label"].startswith("Cluster_")
+
+    def test_watcher_reloads_in_background(self, orchestrator, models_dir):
+        old_vectorizer = orchestrator.models["tfidf"]
+        orchestrator.start_model_watcher(interval=0.05)
+        try:
+            _retrain(models_dir)
+            deadline = time.monotonic() + 5
+            while orchestrator.models["tfidf"] is old_vectorizer and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert orchestrator.models["tfidf"] is not old_vectorizer
+        finally:
+            orchestrator.stop_model_watcher()
+        assert orchestrator._watcher is None
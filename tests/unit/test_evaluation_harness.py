@@ -0,0 +1,113 @@
+"""
+Evaluation Harness Tests — CareerTrojan
+========================================
+
+Tests cover:
+  1. Concurrent suite execution keeps suite order
+  2. Result caching per model hash
+  3. Latency/throughput budgets as regression criteria
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from services.ai_engine.control_plane.evaluation import EvaluationHarness
+from services.ai_engine.control_plane.evaluation import TestCase as GoldenCase
+
+
+class FakeGateway:
+    """Gateway stand-in returning every expected skill after a fixed delay."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def extract_skills(self, text):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return SimpleNamespace(success=True, error=None, result={"skills": text.split(", ")})
+
+
+@pytest.fixture
+def harness(tmp_path):
+    h = EvaluationHarness(test_dir=tmp_path / "golden", reports_dir=tmp_path / "reports")
+    h._test_cases = {"skill_extraction": []}
+    for i in range(8):
+        h._test_cases["skill_extraction"].append(GoldenCase(
+            test_id=f"s{i}", suite="skill_extraction", name=f"case {i}",
+            input_data={"text": f"Python, Skill{i}"},
+            expected_output={"skills": ["Python", f"Skill{i}"]},
+        ))
+    return h
+
+
+@pytest.fixture
+def gateway():
+    gw = FakeGateway()
+    with patch("services.ai_engine.control_plane.gateway.get_gateway", return_value=gw):
+        yield gw
+
+
+class TestConcurrentRun:
+
+    def test_parallel_run_is_faster_and_ordered(self, harness, gateway):
+        sequential = harness.run_suite("skill_extraction", max_workers=1)
+        parallel = harness.run_suite("skill_extraction", max_workers=8)
+        assert parallel.passed == sequential.passed == 8
+        assert parallel.wall_time_ms < sequential.wall_time_ms / 2
+        assert parallel.throughput_rps > sequential.throughput_rps
+
+    def test_failed_tests_reported_in_suite_order(self, harness, gateway):
+        for tc in harness._test_cases["skill_extraction"]:
+            tc.expected_output = {"skills": ["Rust"]}
+        report = harness.run_suite("skill_extraction", max_workers=4)
+        assert report.failed_tests == [f"s{i}" for i in range(8)]
+
+
+class TestResultCache:
+
+    def test_unchanged_model_hash_reuses_results(self, harness, gateway):
+        first = harness.run_suite("skill_extraction", model_hash="m1")
+        assert first.cached_tests == 0 and gateway.calls == 8
+
+        second = harness.run_suite("skill_extraction", model_hash="m1")
+        assert second.cached_tests == 8 and gateway.calls == 8
+        assert second.passed == first.passed
+
+        harness.run_suite("skill_extraction", model_hash="m2")
+        assert gateway.calls == 16
+
+    def test_cache_survives_restart(self, harness, gateway, tmp_path):
+        harness.run_suite("skill_extraction", model_hash="m1")
+        reloaded = EvaluationHarness(test_dir=tmp_path / "golden", reports_dir=tmp_path / "reports")
+        reloaded._test_cases = harness._test_cases
+        report = reloaded.run_suite("skill_extraction", model_hash="m1")
+        assert report.cached_tests == 8 and gateway.calls == 8
+
+
+class TestPerformanceBudgets:
+
+    def test_latency_budget_blocks_promotion(self, harness, gateway):
+        harness.set_budget("skill_extraction", p95_latency_ms=1.0)
+        is_regressed, details = harness.check_regression()
+        assert is_regressed
+        assert details["regressions"][0]["type"] == "latency"
+
+    def test_throughput_budget(self, harness, gateway):
+        harness.set_budget("skill_extraction", min_throughput_rps=10_000)
+        report = harness.run_suite("skill_extraction", max_workers=2)
+        assert [v["type"] for v in harness.check_budget(report)] == ["throughput"]
+
+    def test_within_budget_passes(self, harness, gateway):
+        harness.set_budget("skill_extraction", p95_latency_ms=5_000, min_throughput_rps=1)
+        is_regressed, details = harness.check_regression()
+        assert not is_regressed
+        assert details["budgets"]["skill_extraction"]["p95_latency_ms"] == 5_000
@@ -0,0 +1,233 @@
+"""
+Expert System Rule Engine Tests — CareerTrojan
+===============================================
+
+Tests cover:
+  1. Shipped career rules trigger, including string-method conditions
+  2. Unsafe conditions are blocked once, at compile time
+  3. evaluate_many matches evaluate() row for row (vectorised + fallback paths);
+     each context's result is independent of the others
+  4. Edited rules files are recompiled
+  5. Batch throughput on the shipped rules
+  6. SkillMatcher.score_many agrees with score(); skill vectors are cached
+  7. Ranking a user against 10K roles
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import gc
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from services.ai_engine import expert_system
+from services.ai_engine.expert_system import CareerRules, SkillMatcher
+
+SHIPPED_RULES = Path(__file__).resolve().parents[2] / "config" / "expert_rules" / "career_rules.yaml"
+SHIPPED_MATCHER = SHIPPED_RULES.with_name("skill_matcher.yaml")
+
+ROLES = ["Senior Data Scientist", "Junior Analyst", "Lead Engineer", "Product Manager",
+         "Principal Architect", "Graduate Developer", ""]
+
+
+def _random_context(rng):
+    ctx = {
+        "target_role": rng.choice(ROLES),
+        "years_experience": rng.randint(0, 20),
+        "career_pivot": rng.random() < 0.3,
+        "transferable_skill_count": rng.randint(0, 6),
+        "has_relevant_certifications": rng.random() < 0.5,
+        "expected_salary_percentile": rng.randint(1, 99),
+        "industry_switch": rng.random() < 0.2,
+        "years_in_current_industry": rng.uniform(0, 15),
+        "prefers_remote": rng.random() < 0.5,
+        "skills": ["python"] * rng.randint(0, 3),
+    }
+    # Drop some keys so defaults are exercised
+    for key in rng.sample(sorted(ctx), rng.randint(0, 3)):
+        del ctx[key]
+    return ctx
+
+
+@pytest.fixture(scope="module")
+def rules():
+    return CareerRules(SHIPPED_RULES)
+
+
+class TestEvaluate:
+
+    def test_senior_role_rule_fires(self, rules):
+        out = rules.evaluate({"target_role": "Senior Data Scientist", "years_experience": 3})
+        assert "CR001" in [r["rule_id"] for r in out["triggered_rules"]]
+        assert out["rules_evaluated"] == 8
+
+    def test_all_shipped_rules_compile(self, rules):
+        assert all(c.code is not None for c in rules._compiled)
+
+    def test_unsafe_conditions_are_blocked(self, tmp_path):
+        path = tmp_path / "rules.yaml"
+        path.write_text(
+            "rules:\n"
+            "  - {id: X1, condition: \"__import__('os').system('true')\", adjustment: 1.0}\n"
+            "  - {id: X2, condition: \"target_role.__class__ is not None\", adjustment: 1.0}\n"
+            "  - {id: X3, condition: \"years_experience > 1\", adjustment: 0.5}\n",
+            encoding="utf-8",
+        )
+        engine = CareerRules(path)
+        assert [c.code is None for c in engine._compiled] == [True, True, False]
+        out = engine.evaluate({"years_experience": 4})
+        assert [r["rule_id"] for r in out["triggered_rules"]] == ["X3"]
+
+
+class TestEvaluateMany:
+
+    def test_matches_evaluate(self, rules):
+        rng = random.Random(7)
+        contexts = [_random_context(rng) for _ in range(2000)]
+        assert rules.evaluate_many(contexts) == [rules.evaluate(c) for c in contexts]
+
+    def test_irregular_values_fall_back_per_context(self, rules):
+        contexts = [
+            {"target_role": None, "years_experience": 2},
+            {"target_role": "Senior Engineer", "years_experience": "3"},
+            {"target_role": "Senior Engineer", "years_experience": 1},
+        ]
+        assert rules.evaluate_many(contexts) == [rules.evaluate(c) for c in contexts]
+
+    def test_empty_batch(self, rules):
+        assert rules.evaluate_many([]) == []
+
+    def test_results_are_independent(self, rules):
+        context = {"target_role": "Senior Engineer", "years_experience": 1}
+        first, second = rules.evaluate_many([context, dict(context)])
+        assert first == second and first is not second
+        assert first["triggered_rules"]
+
+        first["recommendations"].append("annotated")
+        first["triggered_rules"][0]["seen"] = True
+        first["triggered_rules"].clear()
+        assert second == rules.evaluate(context)
+
+
+class TestReload:
+
+    def test_edited_rules_are_recompiled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(expert_system, "RULES_RELOAD_INTERVAL", 0.0)
+        path = tmp_path / "rules.yaml"
+        path.write_text("rules:\n  - {id: A, condition: \"years_experience > 10\"}\n", encoding="utf-8")
+        engine = CareerRules(path)
+        assert engine.evaluate({"years_experience": 5})["triggered_rules"] == []
+
+        path.write_text("rules:\n  - {id: A, condition: \"years_experience > 1\"}\n", encoding="utf-8")
+        engine._mtime = -1  # filesystems with coarse mtimes
+        assert [r["rule_id"] for r in engine.evaluate({"years_experience": 5})["triggered_rules"]] == ["A"]
+
+
+class TestThroughput:
+
+    def test_batch_is_faster_than_loop(self, rules):
+        rng = random.Random(1)
+        contexts = [_random_context(rng) for _ in range(20_000)]
+
+        # A full collection over the rest of the suite's heap can land in
+        # either timing; keep it out of both
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            batch = rules.evaluate_many(contexts)
+            t_batch = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            single = [rules.evaluate(c) for c in contexts]
+            t_single = time.perf_counter() - t0
+        finally:
+            gc.enable()
+
+        assert batch == single
+        assert t_batch < t_single
+
+
+# ── SkillMatcher ─────────────────────────────────────────────────────────
+
+SKILLS = ["python", "sql", "data science", "machine learning", "scripting", "automation",
+          "javascript", "typescript", "react", "front end", "cloud computing", "deep learning",
+          "team leadership", "agile methodology", "stakeholder management", "excel", "tableau",
+          "project management", "statistics", "docker", "kubernetes", "aws", "communication"]
+
+
+class _WordVectors:
+    """Deterministic word vectors summed per skill, like spaCy's static vectors."""
+
+    def __init__(self, dim=16):
+        rng = np.random.default_rng(3)
+        words = sorted({w for s in SKILLS for w in s.split()})
+        self.table = {w: rng.normal(size=dim) for w in words[:-3]}  # a few words stay OOV
+        self.calls = 0
+
+    def __call__(self, skill):
+        self.calls += 1
+        vecs = [self.table.get(w, np.zeros(16)) for w in skill.split()]
+        return np.sum(vecs, axis=0) if vecs else None
+
+
+@pytest.fixture
+def matcher():
+    return SkillMatcher(SHIPPED_MATCHER, vectorizer=_WordVectors())
+
+
+def _random_roles(rng, n):
+    return [rng.sample(SKILLS, rng.randint(1, 6)) for _ in range(n)]
+
+
+class TestSkillMatcher:
+
+    def test_score_many_matches_score(self, matcher):
+        rng = random.Random(5)
+        roles = _random_roles(rng, 400)
+        prepared = matcher.prepare_roles(roles)
+        for _ in range(20):
+            user = rng.sample(SKILLS, rng.randint(0, 7))
+            certs = rng.choice([[], ["aws certified"], ["pmp", "scrum master"]])
+            years = rng.uniform(0, 12)
+            got = matcher.score_many(user, prepared, certs, years)
+            want = [matcher.score(user, r, certs, years)["overall_score"] for r in roles]
+            np.testing.assert_allclose(got, want, atol=1e-3)
+
+    def test_semantic_component_is_used(self, matcher):
+        out = matcher.score(["deep learning"], ["machine learning", "statistics"])
+        assert out["breakdown"]["semantic_similarity"] > 0
+
+    def test_skill_vectors_are_cached(self, matcher):
+        roles = _random_roles(random.Random(1), 200)
+        prepared = matcher.prepare_roles(roles)
+        calls = matcher._vectorizer.calls
+        for _ in range(5):
+            matcher.score_many(["python", "sql", "excel"], prepared)
+            matcher.score(["python", "sql"], roles[0])
+        assert matcher._vectorizer.calls == calls
+
+    def test_without_vectors_semantic_is_zero(self):
+        plain = SkillMatcher(SHIPPED_MATCHER, vectorizer=lambda skill: None)
+        roles = [["python", "sql"], ["machine learning"]]
+        got = plain.score_many(["python", "deep learning"], roles)
+        assert list(got) == [plain.score(["python", "deep learning"], r)["overall_score"] for r in roles]
+
+    def test_rank_roles(self, matcher):
+        roles = [["excel"], ["python", "sql"], ["python", "sql", "statistics"], []]
+        best = matcher.rank_roles(["python", "sql"], roles, top_k=2)
+        assert [b["role_index"] for b in best] == [1, 2]
+        assert best[0]["grade"] and best[0]["matched_skills"] == ["python", "sql"]
+        assert matcher.rank_roles(["python"], [], top_k=3) == []
+
+    def test_ranking_10k_roles_is_fast(self, matcher):
+        roles = _random_roles(random.Random(9), 10_000)
+        prepared = matcher.prepare_roles(roles)
+        t0 = time.perf_counter()
+        best = matcher.rank_roles(["python", "sql", "machine learning", "docker"], prepared,
+                                  certifications=["aws certified"], experience_years=4, top_k=20)
+        assert time.perf_counter() - t0 < 0.5
+        assert len(best) == 20
@@ -0,0 +1,211 @@
+"""
+Ground-Truth Store Tests — CareerTrojan
+========================================
+
+Tests cover:
+  1. Predictions are found by indexed seek, not by scanning the log
+  2. LRU cache evicts the least recently used prediction
+  3. Outcomes join on arrival; a later outcome of the same type replaces the earlier
+  4. Outcomes that arrive before their prediction are joined when it does
+  5. Accuracy by confidence bucket and calibration error from the aggregates
+  6. Existing logs are indexed on open; only new bytes are read on reopen;
+     a malformed record is skipped without stalling the records after it
+  7. GroundTruthTracker keeps its API on top of the store
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import json
+from datetime import datetime
+
+import pytest
+
+from services.ai_engine.ground_truth_store import GroundTruthStore, confidence_bucket, is_positive
+
+
+def _prediction(gid, confidence, task="score", timestamp=None):
+    return {
+        "ground_truth_id": gid,
+        "timestamp": timestamp or datetime.now().isoformat(),
+        "task_type": task,
+        "confidence": confidence,
+        "calibrated_confidence": confidence,
+        "outcome": None,
+    }
+
+
+def _outcome(gid, value, outcome_type="hired"):
+    return {"ground_truth_id": gid, "outcome_type": outcome_type, "outcome_value": value, "metadata": {}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = GroundTruthStore(tmp_path, cache_size=3)
+    yield s
+    s.close()
+
+
+class TestLookup:
+
+    def test_indexed_seek_without_scan(self, store, tmp_path, monkeypatch):
+        for i in range(50):
+            store.append_prediction(_prediction(f"gt{i}", 0.5))
+        store._cache.clear()
+
+        parsed = []
+        real_loads = json.loads
+        monkeypatch.setattr(json, "loads", lambda s, *a, **k: parsed.append(s) or real_loads(s, *a, **k))
+        assert store.get("gt37")["ground_truth_id"] == "gt37"
+        assert len(parsed) == 1  # one line read, at the indexed offset
+        assert store.get("missing") is None
+
+    def test_lru_evicts_least_recently_used(self, store):
+        for gid in ("a", "b", "c"):
+            store.append_prediction(_prediction(gid, 0.5))
+        store.get("a")                                  # a is now most recent
+        store.append_prediction(_prediction("d", 0.5))  # evicts b
+        assert list(store._cache) == ["c", "a", "d"]
+        assert store.get("b")["ground_truth_id"] == "b"  # still served from the log
+        assert list(store._cache) == ["a", "d", "b"]
+
+
+class TestJoin:
+
+    def test_outcomes_join_and_replace(self, store):
+        store.append_prediction(_prediction("x", 0.9))
+        store.append_outcome(_outcome("x", False))
+        store.append_outcome(_outcome("x", True))
+        store.append_outcome(_outcome("x", 4, outcome_type="rating"))
+
+        stats = store.feedback_stats(days=None, outcome_type="hired")
+        assert stats["outcomes_collected"] == 1
+        assert stats["accuracy_by_confidence"]["0.9-1.0"]["accuracy"] == 1.0
+
+        store._cache.clear()
+        assert store.get("x")["outcome"] == {"hired": True, "rating": 4}
+
+    def test_early_outcome_joins_when_prediction_arrives(self, store):
+        store.append_outcome(_outcome("late", "yes"))
+        assert store.feedback_stats(days=None)["outcomes_collected"] == 0
+        store.append_prediction(_prediction("late", 0.35))
+        stats = store.feedback_stats(days=None)
+        assert stats["outcomes_collected"] == 1
+        assert stats["accuracy_by_confidence"]["0.3-0.4"]["positives"] == 1
+
+
+class TestFeedbackStats:
+
+    def test_bucket_accuracy_and_calibration_error(self, store):
+        # 0.9 bucket: 8/10 positive; 0.6 bucket: 3/10 positive
+        for i in range(10):
+            store.append_prediction(_prediction(f"hi{i}", 0.9))
+            store.append_outcome(_outcome(f"hi{i}", i < 8))
+            store.append_prediction(_prediction(f"lo{i}", 0.6))
+            store.append_outcome(_outcome(f"lo{i}", i < 3))
+        store.append_prediction(_prediction("other", 0.9, task="generate"))
+        store.append_outcome(_outcome("graded", 7, outcome_type="rating"))  # no prediction
+
+        stats = store.feedback_stats(task_type="score", days=None)
+        assert stats["total_predictions"] == 20
+        assert stats["outcomes_collected"] == 20
+        buckets = stats["accuracy_by_confidence"]
+        assert buckets["0.9-1.0"]["accuracy"] == 0.8
+        assert buckets["0.6-0.7"]["accuracy"] == 0.3
+        assert stats["calibration_error"] == pytest.approx(0.5 * 0.1 + 0.5 * 0.3)
+        assert store.feedback_stats(days=None)["total_predictions"] == 21
+
+    def test_days_window(self, store):
+        store.append_prediction(_prediction("old", 0.5, timestamp="2020-01-01T00:00:00"))
+        store.append_prediction(_prediction("new", 0.5, timestamp=None))
+        assert store.feedback_stats(days=30)["total_predictions"] == 1
+        assert store.feedback_stats(days=None)["total_predictions"] == 2
+
+    def test_value_and_bucket_helpers(self):
+        assert is_positive(True) is True and is_positive(0) is False
+        assert is_positive("Accepted") is True and is_positive(3.5) is None
+        assert confidence_bucket(1.0) == 9 and confidence_bucket(None) == 0
+
+
+class TestCatchUp:
+
+    def test_existing_logs_indexed_then_only_new_bytes(self, tmp_path):
+        with open(tmp_path / "predictions.jsonl", "w") as f:
+            for i in range(5):
+                f.write(json.dumps(_prediction(f"p{i}", 0.75)) + "\n")
+            f.write('{"ground_truth_id": "torn"')   # crashed writer
+        with open(tmp_path / "outcomes.jsonl", "w") as f:
+            f.write(json.dumps(_outcome("p0", True)) + "\n")
+
+        store = GroundTruthStore(tmp_path)
+        assert store.feedback_stats(days=None)["total_predictions"] == 5
+        assert store.get("p0")["outcome"] == {"hired": True}
+        store.close()
+
+        with open(tmp_path / "predictions.jsonl", "a") as f:
+            f.write(', "confidence": 0.2, "task_type": "score"}\n')  # torn line completed
+            f.write(json.dumps(_prediction("p5", 0.75)) + "\n")
+        reopened = GroundTruthStore(tmp_path)
+        assert reopened.catch_up() == 0
+        stats = reopened.feedback_stats(days=None)
+        assert stats["total_predictions"] == 7
+        assert stats["outcomes_collected"] == 1
+        assert reopened.get("p5") is not None
+        reopened.close()
+
+
+    def test_bad_record_is_skipped_not_fatal(self, tmp_path, monkeypatch):
+        with open(tmp_path / "predictions.jsonl", "w") as f:
+            f.write(json.dumps(_prediction("a", "high")) + "\n")       # non-numeric confidence
+            f.write(json.dumps(_prediction("nan", float("nan"))) + "\n")
+            f.write('["not", "a", "record"]\n')
+            f.write(json.dumps(_prediction("boom", 0.5)) + "\n")
+            f.write(json.dumps(_prediction("b", 0.9)) + "\n")
+
+        real = GroundTruthStore._index_prediction
+
+        def flaky(self, record, offset):
+            real(self, record, offset)  # partial writes are rolled back with the record
+            if record["ground_truth_id"] == "boom":
+                raise RuntimeError("disk hiccup")
+
+        monkeypatch.setattr(GroundTruthStore, "_index_prediction", flaky)
+        store = GroundTruthStore(tmp_path)
+        assert store.get("b")["confidence"] == 0.9
+        assert store.get("a") is not None and store.get("boom") is None
+        stats = store.feedback_stats(days=None)
+        assert stats["total_predictions"] == 3
+        store.close()
+
+        # Offsets advanced past the bad lines: nothing is retried on reopen
+        reopened = GroundTruthStore(tmp_path)
+        assert reopened.catch_up() == 0
+        assert reopened.feedback_stats(days=None)["total_predictions"] == 3
+        reopened.close()
+
+    def test_append_coerces_confidence(self, store):
+        store.append_prediction(_prediction("str", "0.95"))
+        store.append_prediction(_prediction("bad", "high"))
+        assert store.feedback_stats(days=None)["total_predictions"] == 2
+        store._cache.clear()
+        assert store.get("str")["confidence"] == "0.95"  # log keeps the raw record
+        assert confidence_bucket("high") == 0 and confidence_bucket(float("nan")) == 0
+
+
+class TestTracker:
+
+    def test_tracker_api(self, tmp_path):
+        from services.ai_engine.ai_gateway import (
+            GatewayRequest, GatewayResponse, GroundTruthTracker, TaskType,
+        )
+        tracker = GroundTruthTracker(storage_path=tmp_path)
+        request = GatewayRequest(task_type=TaskType.SCORE, payload={})
+        response = GatewayResponse(request_id=request.request_id, task_type=TaskType.SCORE,
+                                   result={"score": 80}, confidence=0.82, calibrated_confidence=0.82)
+        tracker.record_prediction("gt-1", request, response)
+        assert tracker.record_outcome("gt-1", "interview", True)
+
+        assert tracker.get_prediction("gt-1")["outcome"] == {"interview": True}
+        stats = tracker.get_feedback_stats(task_type="score")
+        assert stats["total_predictions"] == 1
+        assert stats["accuracy_by_confidence"]["0.8-0.9"]["accuracy"] == 1.0
+        tracker.store.close()
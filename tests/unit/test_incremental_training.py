@@ -0,0 +1,213 @@
+"""
+Incremental Training Tests — CareerTrojan
+==========================================
+
+Tests cover:
+  1. Row fingerprints depend only on each model's input columns, not row order
+  2. Plans: full on first run / removed rows / drift, skip when unchanged, update on appends
+  3. Content-addressed backups copy each file content once; restore and prune
+  4. Orchestrator (incremental): unchanged data skips everything without reloading,
+     appended rows partial-fit / warm-start (too few salary rows are deferred,
+     otherwise trees grow in proportion), edits force a full refit
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import json
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.ai_engine.incremental_training import (
+    MODEL_INPUTS, ModelBackups, TrainingManifest, fingerprint, row_hashes,
+)
+
+TITLES = ["Software Engineer", "Staff Nurse", "Financial Analyst"]
+
+
+def _frame(n, start=0):
+    return pd.DataFrame({
+        "text": [f"candidate {i} " + "experience " * 20 for i in range(start, start + n)],
+        "job_title": [TITLES[i % 3] for i in range(start, start + n)],
+        "skills": [["python", "sql"][: i % 3] for i in range(start, start + n)],
+        "experience_years": [1 + i % 20 for i in range(start, start + n)],
+        "education": ["Bachelor"] * n,
+        "industry": ["Unknown"] * n,
+        "salary": [30000 + 1500 * (i % 20) for i in range(start, start + n)],
+    })
+
+
+def _candidates(n, start=0):
+    return [{
+        "Job Title": TITLES[i % 3],
+        "summary": f"candidate {i} with a long enough summary of their career so far",
+        "years_experience": 1 + i % 20,
+        "salary": 30000 + 1500 * (i % 20),
+    } for i in range(start, start + n)]
+
+
+class TestFingerprints:
+
+    def test_only_model_columns_count(self):
+        df = _frame(20)
+        cols = MODEL_INPUTS["bayesian_classifier"]
+        base = row_hashes(df, cols)
+        df2 = df.copy()
+        df2["industry"] = "Finance"
+        assert np.array_equal(row_hashes(df2, cols), base)
+        df2.loc[3, "job_title"] = "Nurse"
+        changed = row_hashes(df2, cols) != base
+        assert changed.tolist() == [i == 3 for i in range(20)]
+
+    def test_fingerprint_is_order_independent(self):
+        df = _frame(30)
+        cols = MODEL_INPUTS["statistical_models"]
+        shuffled = df.sample(frac=1, random_state=0)
+        assert fingerprint(row_hashes(df, cols)) == fingerprint(row_hashes(shuffled, cols))
+
+
+class TestPlans:
+
+    @pytest.fixture
+    def manifest(self, tmp_path):
+        for name in ("bayesian_classifier.pkl", "tfidf_vectorizer.pkl"):
+            (tmp_path / name).write_bytes(b"x")
+        return TrainingManifest(tmp_path)
+
+    def test_first_run_then_skip(self, manifest, tmp_path):
+        hashes = row_hashes(_frame(100), MODEL_INPUTS["bayesian_classifier"])
+        assert manifest.plan("bayesian_classifier", hashes).action == "full"
+        manifest.record("bayesian_classifier", hashes, "full", source="s1")
+
+        reloaded = TrainingManifest(tmp_path)
+        assert reloaded.plan("bayesian_classifier", hashes[::-1]).action == "skip"
+        assert reloaded.is_current("bayesian_classifier", "s1")
+        assert not reloaded.is_current("bayesian_classifier", "s2")
+        assert reloaded.plan("bayesian_classifier", hashes, force_full=True).action == "full"
+
+    def test_appends_update_until_drift(self, manifest):
+        cols = MODEL_INPUTS["bayesian_classifier"]
+        hashes = row_hashes(_frame(100), cols)
+        manifest.record("bayesian_classifier", hashes, "full")
+
+        grown = row_hashes(_frame(110), cols)
+        plan = manifest.plan("bayesian_classifier", grown)
+        assert plan.action == "update" and plan.n_new == 10
+        assert plan.new_rows[100:].all() and not plan.new_rows[:100].any()
+        manifest.record("bayesian_classifier", grown, "update")
+
+        # 10 + 30 rows since the last full fit > 25% of 140
+        assert manifest.plan("bayesian_classifier", row_hashes(_frame(140), cols)).action == "full"
+
+    def test_removed_rows_or_missing_artifacts_force_full(self, manifest, tmp_path):
+        hashes = row_hashes(_frame(100), MODEL_INPUTS["bayesian_classifier"])
+        manifest.record("bayesian_classifier", hashes, "full")
+        assert manifest.plan("bayesian_classifier", hashes[:90]).action == "full"
+        (tmp_path / "tfidf_vectorizer.pkl").unlink()
+        assert manifest.plan("bayesian_classifier", hashes).action == "full"
+
+
+class TestBackups:
+
+    def test_unchanged_files_are_not_copied_again(self, tmp_path):
+        models = tmp_path / "models"
+        (models / "sub").mkdir(parents=True)
+        (models / "a.pkl").write_bytes(b"a" * 1000)
+        (models / "sub" / "b.json").write_text("{}")
+        (models / "copy.pkl").write_bytes(b"a" * 1000)
+        backups = ModelBackups(tmp_path / "backups")
+
+        first = backups.snapshot(models)
+        assert first["files"] == 3 and first["new_blobs"] == 2
+        second = backups.snapshot(models)
+        assert second["new_blobs"] == 0 and second["bytes_written"] == 0
+
+        (models / "a.pkl").write_bytes(b"b" * 500)
+        third = backups.snapshot(models)
+        assert third["new_blobs"] == 1 and third["bytes_written"] == 500
+
+        restored = tmp_path / "restored"
+        assert backups.restore(first["manifest"], restored) == 3
+        assert (restored / "a.pkl").read_bytes() == b"a" * 1000
+        assert (restored / "sub" / "b.json").read_text() == "{}"
+
+    def test_prune_drops_unreferenced_blobs(self, tmp_path):
+        models = tmp_path / "models"
+        models.mkdir()
+        backups = ModelBackups(tmp_path / "backups")
+        for i in range(3):
+            (models / "m.pkl").write_bytes(bytes([i]) * 10)
+            backups.snapshot(models)
+        assert backups.prune(keep=1) == 2
+        assert len(backups.list_backups()) == 1
+        assert backups.restore(backups.list_backups()[0], tmp_path / "r") == 1
+        assert (tmp_path / "r" / "m.pkl").read_bytes() == bytes([2]) * 10
+
+
+class TestIncrementalOrchestrator:
+
+    @pytest.fixture
+    def env(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ML_MODELS_PATH", str(tmp_path / "models"))
+        data = tmp_path / "data"
+        (data / "core_databases").mkdir(parents=True)
+        return data
+
+    def _write(self, data, candidates):
+        path = data / "core_databases" / "Candidate_database_merged.json"
+        path.write_text(json.dumps(candidates), encoding="utf-8")
+
+    def _run(self, data, tmp_path, incremental=True):
+        from services.ai_engine.training_orchestrator import TrainingOrchestrator
+        orch = TrainingOrchestrator(data_dir=str(data), models_dir=str(tmp_path / "models"),
+                                    registry_dir=str(tmp_path / "registry"), incremental=incremental)
+        assert orch.train_all_models()
+        return orch
+
+    def test_skip_update_and_full(self, env, tmp_path, monkeypatch):
+        self._write(env, _candidates(600))
+        first = self._run(env, tmp_path)
+        assert {"bayesian_classifier", "statistical_models"} <= set(first.training_state["completed_models"])
+        assert first.training_state["updated_models"] == []
+
+        # Nothing changed: no reload, nothing retrained
+        from services.ai_engine.train_all_models import CareerTrojanModelTrainer
+        with monkeypatch.context() as m:
+            m.setattr(CareerTrojanModelTrainer, "load_cv_data",
+                      lambda self: pytest.fail("unchanged data must not be reloaded"))
+            second = self._run(env, tmp_path)
+        assert {"bayesian_classifier", "statistical_models"} <= set(second.training_state["skipped_models"])
+
+        # Appended rows: partial_fit / warm start
+        with open(tmp_path / "models" / "salary_predictor.pkl", "rb") as f:
+            trees_before = len(pickle.load(f).estimators_)
+        with open(tmp_path / "models" / "bayesian_classifier.pkl", "rb") as f:
+            seen_before = pickle.load(f).class_count_.sum()
+        self._write(env, _candidates(660))
+        third = self._run(env, tmp_path)
+        assert set(third.training_state["updated_models"]) == {"bayesian_classifier", "statistical_models"}
+        with open(tmp_path / "models" / "salary_predictor.pkl", "rb") as f:
+            assert len(pickle.load(f).estimators_) == trees_before  # 60 rows: deferred
+        assert third.training_state["all_metrics"]["salary_predictor"]["deferred_samples"] == 60
+        with open(tmp_path / "models" / "bayesian_classifier.pkl", "rb") as f:
+            assert pickle.load(f).class_count_.sum() == seen_before + 60
+
+        # Enough new salary rows: trees strictly in proportion (140 / 800 of 100)
+        self._write(env, _candidates(800))
+        self._run(env, tmp_path)
+        with open(tmp_path / "models" / "salary_predictor.pkl", "rb") as f:
+            assert len(pickle.load(f).estimators_) == trees_before + 18
+
+        # An edited row cannot be unlearned: full refit
+        edited = _candidates(800)
+        edited[0]["summary"] = "rewritten summary for the first candidate in the database"
+        self._write(env, edited)
+        fourth = self._run(env, tmp_path)
+        assert fourth.training_state["updated_models"] == []
+        assert "bayesian_classifier" in fourth.training_state["completed_models"]
+        manifest = TrainingManifest(tmp_path / "models")
+        assert manifest.entries["bayesian_classifier"]["mode"] == "full"
+        assert manifest.entries["bayesian_classifier"]["rows"] == 800
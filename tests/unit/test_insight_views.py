@@ -0,0 +1,203 @@
+"""
+Insight Materialized View Tests — CareerTrojan
+===============================================
+
+Tests cover:
+  1. Term frequencies and co-occurrence match a naive recount
+  2. Posting-set cohort resolve matches the list-filter semantics; rows keep
+     only the profile fields get_profile serves
+  3. Incremental refresh: new, modified and deleted files
+  4. At 100K rows: flat per-profile build cost, index memory ∝ postings
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import gc
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+import pytest
+
+from services.ai_engine.insight_views import InsightView, expected_axis_score
+
+SKILL_POOL = ["Python", "SQL", "AWS", "Sales", "CRM", "Excel", "Docker", "Leadership"]
+INDUSTRIES = ["Technology", "Finance", "Retail"]
+SENIORITIES = ["Junior", "Mid", "Senior"]
+
+
+def _profiles(n=300, seed=5):
+    rng = random.Random(seed)
+    return [{
+        "id": f"p{i}",
+        "role": rng.choice(["Engineer", "Sales Manager", "Analyst"]),
+        "seniority": rng.choice(SENIORITIES),
+        "skills": rng.sample(SKILL_POOL, rng.randint(0, 5)),
+        "experience_years": rng.randint(0, 25),
+        "match_score": rng.random() * 100,
+        "industry": rng.choice(INDUSTRIES),
+    } for i in range(n)]
+
+
+def _naive_cohort(profiles, filters):
+    matched = profiles
+    if "industry" in filters:
+        matched = [p for p in matched if p["industry"].lower() == filters["industry"].lower()]
+    if "seniority" in filters:
+        matched = [p for p in matched if p["seniority"].lower() == filters["seniority"].lower()]
+    if "min_experience" in filters:
+        matched = [p for p in matched if p["experience_years"] >= filters["min_experience"]]
+    if "max_experience" in filters:
+        matched = [p for p in matched if p["experience_years"] <= filters["max_experience"]]
+    if "skills" in filters:
+        req = {s.lower() for s in filters["skills"]}
+        matched = [p for p in matched if req & {s.lower() for s in p["skills"]}]
+    if "match_score_min" in filters:
+        matched = [p for p in matched if p["match_score"] >= filters["match_score_min"]]
+    return matched
+
+
+@pytest.fixture
+def view():
+    v = InsightView(axis_maps={"demo": {"Tech": ["python", "sql"], "Commercial": ["sales", "crm"]}}, sources=[])
+    for p in _profiles():
+        v.add_profile(p)
+    return v
+
+
+class TestAggregates:
+
+    def test_term_and_pair_counts(self, view):
+        profiles = _profiles()
+        terms = Counter(s.lower() for p in profiles for s in p["skills"])
+        pairs = Counter()
+        for p in profiles:
+            skills = sorted({s.lower() for s in p["skills"]})
+            for i, a in enumerate(skills):
+                for b in skills[i + 1:]:
+                    pairs[(a, b)] += 1
+        assert view.term_frequencies() == dict(terms)
+        top = view.cooccurrence(limit=5)
+        assert [c for _, _, c in top] == [c for _, c in pairs.most_common(5)]
+        for _, b, c in view.cooccurrence("python", limit=10):
+            assert pairs[tuple(sorted(("python", b)))] == c
+
+    def test_axis_averages_use_expected_scores(self, view):
+        profiles = _profiles()
+        expected = []
+        for kws in (["python", "sql"], ["sales", "crm"]):
+            total = 0.0
+            for p in profiles:
+                blob = " ".join(p["skills"]).lower() + " " + p["role"].lower()
+                total += expected_axis_score(sum(1 for k in kws if k in blob))
+            expected.append(round(total / len(profiles), 1))
+        assert view.axis_averages("demo") == expected
+
+
+class TestCohortResolve:
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"industry": "finance"},
+        {"industry": "Technology", "seniority": "Senior"},
+        {"skills": ["python", "CRM"], "min_experience": 5},
+        {"max_experience": 10, "match_score_min": 40},
+        {"industry": "Nowhere"},
+    ])
+    def test_matches_naive_filter(self, view, filters):
+        expected = _naive_cohort(_profiles(), filters)
+        res = view.resolve_cohort(filters)
+        assert res["count"] == len(expected)
+        assert res["profile_ids"] == [p["id"] for p in expected[:50]]
+        assert set(res["industries"]) == {p["industry"] for p in expected}
+        if expected:
+            avg = sum(p["match_score"] for p in expected) / len(expected)
+            assert res["avg_match_score"] == round(avg, 1)
+
+    def test_rows_keep_only_served_fields(self, view):
+        p0 = _profiles()[0]
+        assert view.get_profile("p0") == {f: p0[f] for f in ("id", "role", "skills") if f in p0}
+
+    def test_remove_profile_updates_everything(self, view):
+        before = view.resolve_cohort({})["count"]
+        assert view.remove_profile("p0")
+        assert view.resolve_cohort({})["count"] == before - 1
+        assert view.get_profile("p0") is None
+        remaining = [p for p in _profiles() if p["id"] != "p0"]
+        assert view.term_frequencies() == dict(Counter(s.lower() for p in remaining for s in p["skills"]))
+
+
+class TestIncrementalRefresh:
+
+    def _write(self, path, skills, title="Engineer"):
+        path.write_text(json.dumps({"file_hash": path.stem, "job_titles": [title], "skills": skills}))
+
+    def test_new_modified_and_deleted_files(self, tmp_path):
+        src = tmp_path / "parsed_resumes"
+        src.mkdir()
+        self._write(src / "a.json", ["Python", "SQL"])
+        self._write(src / "b.json", ["Python"])
+        view = InsightView(sources=[("parsed_resumes", src)])
+
+        view.refresh()
+        assert view.ready and view.profile_count() == 2
+        assert view.term_frequencies()["python"] == 2
+
+        # Unchanged directory: nothing rescanned
+        assert view.refresh()["dirs_scanned"] == 0
+
+        self._write(src / "c.json", ["SQL"])
+        (src / "b.json").unlink()
+        os.utime(src, ns=(0, src.stat().st_mtime_ns + 10**9))
+        stats = view.refresh()
+        assert stats["profiles"] == 2
+        assert view.term_frequencies() == {"python": 1, "sql": 2}
+
+        # In-place rewrite is picked up by a full sweep
+        self._write(src / "a.json", ["Go"])
+        os.utime(src / "a.json", ns=(0, (src / "a.json").stat().st_mtime_ns + 10**9))
+        view.refresh(full=True)
+        assert view.term_frequencies() == {"go": 1, "sql": 1}
+
+
+class TestScaling:
+
+    def test_100k_rows_index_grows_with_postings(self):
+        rows, chunk = 100_000, 10_000
+        rng = random.Random(11)
+        pool = [f"skill{i}" for i in range(20_000)]
+        view = InsightView(sources=[])
+        profiles = [{
+            "id": f"p{i}",
+            "seniority": rng.choice(SENIORITIES),
+            "skills": rng.sample(pool, 3),
+            "experience_years": rng.randint(0, 25),
+            "match_score": rng.random() * 100,
+            "industry": rng.choice(INDUSTRIES),
+        } for i in range(rows)]
+
+        timings = []
+        gc.disable()
+        try:
+            for start in range(0, rows, chunk):
+                t0 = time.perf_counter()
+                for p in profiles[start:start + chunk]:
+                    view.add_profile(p)
+                timings.append(time.perf_counter() - t0)
+        finally:
+            gc.enable()
+        assert timings[-1] < 4 * timings[0]
+
+        # Index bytes follow the 300K postings, not 20K skills x 100K rows
+        postings = sum(len(p["skills"]) for p in profiles)
+        index_bytes = sum(sys.getsizeof(v) for v in view._by_skill.values())
+        assert index_bytes < 100 * postings
+
+        filters = {"industry": "Finance", "skills": ["skill7", "skill8", "skill9"], "min_experience": 5}
+        expected = _naive_cohort(profiles, filters)
+        res = view.resolve_cohort(filters)
+        assert res["count"] == len(expected)
+        assert res["profile_ids"] == [p["id"] for p in expected[:50]]
@@ -0,0 +1,118 @@
+"""
+Interaction Partition Tests — CareerTrojan
+===========================================
+
+Tests cover:
+  1. append/iter_records per user; anonymous traffic is not partitioned
+  2. erase removes only that user's day files and partition
+  3. Erasure cost stays flat as other users' volume grows
+  4. backfill indexes legacy day files once
+  5. Erasure runs the backfill itself until it is recorded as done, so
+     legacy day files are erased without running the script; afterwards
+     the day directories are never walked again
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import json
+import time
+
+import pytest
+
+from services.backend_api.services.interaction_partitions import InteractionPartitions
+
+
+def _log(store, day_dir, user_id, n, start=0):
+    """Write n interactions the way the logger middleware does."""
+    day_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(start, start + n):
+        record = {"user_id": str(user_id), "path": f"/api/x/{i}", "action_type": "browse_click"}
+        path = day_dir / f"{i:06d}_{user_id}_browse_click.json"
+        path.write_text(json.dumps(record), encoding="utf-8")
+        store.append(record, day_file=path)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return InteractionPartitions(root=tmp_path / "by_user", interactions_dir=tmp_path / "interactions")
+
+
+class TestAppend:
+
+    def test_records_are_partitioned_by_user(self, store, tmp_path):
+        day = tmp_path / "interactions" / "2026-10-01"
+        _log(store, day, "7", 3)
+        _log(store, day, "alice@example.com", 2, start=100)
+        store.append({"user_id": "anonymous", "path": "/"})
+
+        recs = list(store.iter_records("7"))
+        assert [r["path"] for r in recs] == ["/api/x/0", "/api/x/1", "/api/x/2"]
+        assert recs[0]["day_file"] == "2026-10-01/000000_7_browse_click.json"
+        assert store.count(7, "alice@example.com") == 5
+        assert not store.path_for("anonymous").exists()
+
+    def test_unsafe_ids_get_distinct_files(self, store):
+        assert store.path_for("a/b") != store.path_for("a_b")
+        assert store.path_for("../x").parent.parent == store.root
+
+
+class TestErase:
+
+    def test_erase_touches_only_that_user(self, store, tmp_path):
+        day = tmp_path / "interactions" / "2026-10-01"
+        _log(store, day, "7", 4)
+        _log(store, day, "8", 3, start=50)
+
+        assert store.erase("7") == 4
+        assert list(store.iter_records("7")) == []
+        assert not list(day.glob("*_7_*.json"))
+        assert len(list(day.glob("*_8_*.json"))) == 3
+        assert store.count("8") == 3
+
+    def test_erasure_latency_is_flat(self, tmp_path):
+        timings = []
+        for others in (100, 20_000):
+            store = InteractionPartitions(root=tmp_path / f"p{others}", interactions_dir=tmp_path / f"i{others}")
+            day = tmp_path / f"i{others}" / "2026-10-01"
+            for u in range(others // 100):
+                _log(store, day, f"u{u}", 100, start=u * 100)
+            _log(store, day, "target", 20, start=10_000_000)
+            store.ensure_backfilled()  # one-time migration, not part of each erasure
+
+            t0 = time.perf_counter()
+            assert store.erase("target") == 20
+            timings.append(time.perf_counter() - t0)
+        # 200x more unrelated data must not make erasure meaningfully slower
+        assert timings[1] < max(timings[0] * 5, 0.05)
+
+
+class TestBackfill:
+
+    def test_backfill_is_idempotent(self, store, tmp_path):
+        legacy = tmp_path / "interactions" / "2026-09-30"
+        legacy.mkdir(parents=True)
+        for i, user in enumerate(["7", "7", "anonymous", "9"]):
+            (legacy / f"{i}.json").write_text(json.dumps({"user_id": user, "n": i}), encoding="utf-8")
+        (legacy / "broken.json").write_text("{", encoding="utf-8")
+
+        assert store.backfill() == 3
+        assert store.backfill() == 0
+        assert [r["n"] for r in store.iter_records("7")] == [0, 1]
+        assert store.erase("9") == 1
+        assert not (legacy / "3.json").exists()
+
+    def test_erase_backfills_legacy_files_once(self, store, tmp_path, monkeypatch):
+        legacy = tmp_path / "interactions" / "2026-09-30"
+        legacy.mkdir(parents=True)
+        (legacy / "old.json").write_text(json.dumps({"user_id": "7", "n": 0}), encoding="utf-8")
+        _log(store, tmp_path / "interactions" / "2026-10-01", "7", 2)
+        assert not store.backfill_done
+
+        assert store.erase("7") == 3
+        assert not (legacy / "old.json").exists()
+        assert store.backfill_done
+
+        monkeypatch.setattr(store, "backfill", lambda *a: pytest.fail("backfill must run only once"))
+        _log(store, tmp_path / "interactions" / "2026-10-02", "8", 1)
+        assert store.erase("8") == 1
+        assert store.ensure_backfilled() == 0
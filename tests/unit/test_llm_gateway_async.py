@@ -0,0 +1,193 @@
+"""
+LLM Gateway Async Path Tests — CareerTrojan
+============================================
+
+Exercises LLMGateway against a local fake provider server (vLLM- and
+Ollama-compatible endpoints with injectable latency).  Timing-sensitive
+behaviour is asserted through the server (requests held in flight
+together, hit counts), never through wall-clock bounds.
+
+Tests cover:
+  1. Concurrent async calls overlap instead of queueing on worker threads
+  2. In-flight coalescing of identical temperature-0 requests only
+  3. Content-addressed cache for temperature-0 calls (sync and async)
+  4. Hedged request to the next provider after a latency threshold
+  5. Fallback chain on provider failure
+  6. A provider missing part of the HTTP contract fails at construction
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services.ai_engine.llm_gateway import LLMGateway, _HTTPProvider, _VLLMProvider
+from services.shared.circuit_breaker import get_circuit_registry
+
+LATENCY = {"vllm": 0.2, "ollama": 0.2}
+STATUS = {"vllm": 200, "ollama": 200}
+
+
+class _FakeProviderHandler(BaseHTTPRequestHandler):
+    hits = {"vllm": 0, "ollama": 0}
+    done = {"vllm": 0, "ollama": 0}
+    barrier = None  # if set, every request waits here until all parties arrive
+    hold = {}       # provider name -> Event a request waits on before replying
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path.startswith("/v1/chat/completions"):
+            name = "vllm"
+            prompt = body["messages"][-1]["content"]
+            reply = {"model": body["model"], "choices": [{"message": {"content": f"vllm:{prompt}"}}]}
+        else:
+            name = "ollama"
+            reply = {"response": f"ollama:{body['prompt']}"}
+        _FakeProviderHandler.hits[name] += 1
+        status = STATUS[name]
+        if _FakeProviderHandler.barrier is not None:
+            try:
+                _FakeProviderHandler.barrier.wait()
+            except threading.BrokenBarrierError:
+                status = 503
+        if name in _FakeProviderHandler.hold:
+            _FakeProviderHandler.hold[name].wait(10)
+        time.sleep(LATENCY[name])
+        _FakeProviderHandler.done[name] += 1
+        payload = json.dumps(reply).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def fake_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeProviderHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _FakeProviderHandler.hits = {"vllm": 0, "ollama": 0}
+    _FakeProviderHandler.done = {"vllm": 0, "ollama": 0}
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    _FakeProviderHandler.barrier = None
+    for event in _FakeProviderHandler.hold.values():
+        event.set()
+    _FakeProviderHandler.hold = {}
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def gateway(fake_server, monkeypatch):
+    monkeypatch.setitem(LATENCY, "vllm", 0.2)
+    monkeypatch.setitem(LATENCY, "ollama", 0.2)
+    get_circuit_registry().reset_all()
+    return LLMGateway(config={
+        "default_provider": "vllm",
+        "fallback_chain": ["vllm", "ollama"],
+        "providers": {
+            "vllm": {"enabled": True, "base_url": f"{fake_server}/v1", "default_model": "fake", "timeout": 5},
+            "ollama": {"enabled": True, "base_url": fake_server, "default_model": "fake", "timeout": 5},
+        },
+    })
+
+
+class TestAsyncPath:
+
+    async def test_concurrent_calls_overlap(self, gateway):
+        # Each request is held until all ten are in flight at once; queued
+        # calls would break the barrier and be answered with a 503
+        _FakeProviderHandler.barrier = threading.Barrier(10, timeout=5)
+        responses = await asyncio.gather(*(gateway.agenerate(f"q{i}") for i in range(10)))
+        await gateway.aclose()
+
+        assert all(r.success and r.provider == "vllm" for r in responses)
+        assert [r.text for r in responses] == [f"vllm:q{i}" for i in range(10)]
+        assert _FakeProviderHandler.hits == {"vllm": 10, "ollama": 0}
+
+    async def test_identical_requests_are_coalesced(self, gateway):
+        responses = await asyncio.gather(*(gateway.agenerate("same prompt", temperature=0) for _ in range(8)))
+        await gateway.aclose()
+
+        assert {r.text for r in responses} == {"vllm:same prompt"}
+        assert _FakeProviderHandler.hits["vllm"] == 1
+        assert gateway.cache_stats()["coalesced_requests"] == 7
+
+    async def test_sampled_requests_are_not_coalesced(self, gateway):
+        responses = await asyncio.gather(*(gateway.agenerate("same prompt", temperature=0.7) for _ in range(3)))
+        responses += await asyncio.gather(*(gateway.agenerate("same prompt") for _ in range(2)))
+        await gateway.aclose()
+
+        assert all(r.success for r in responses)
+        assert _FakeProviderHandler.hits["vllm"] == 5
+        assert gateway.cache_stats()["coalesced_requests"] == 0
+
+    async def test_hedged_request_wins_over_slow_primary(self, gateway):
+        # The primary cannot answer until the test ends, so only the hedge can win
+        _FakeProviderHandler.hold["vllm"] = threading.Event()
+        resp = await gateway.agenerate("hedge me", hedge_after_ms=100)
+        await gateway.aclose()
+
+        assert resp.success and resp.provider == "ollama"
+        assert _FakeProviderHandler.hits == {"vllm": 1, "ollama": 1}
+        assert _FakeProviderHandler.done["vllm"] == 0
+
+    async def test_fallback_on_failure(self, gateway, monkeypatch):
+        monkeypatch.setitem(STATUS, "vllm", 500)
+        resp = await gateway.agenerate("fail over")
+        await gateway.aclose()
+        assert resp.success and resp.provider == "ollama"
+
+
+class TestResponseCache:
+
+    async def test_temperature_zero_is_cached(self, gateway):
+        first = await gateway.agenerate("deterministic", temperature=0)
+        second = await gateway.agenerate("deterministic", temperature=0)
+        await gateway.aclose()
+
+        assert not first.cached and second.cached
+        assert second.text == first.text
+        assert _FakeProviderHandler.hits["vllm"] == 1
+
+    async def test_sampled_calls_are_not_cached(self, gateway):
+        await gateway.agenerate("creative", temperature=0.7)
+        resp = await gateway.agenerate("creative", temperature=0.7)
+        await gateway.aclose()
+
+        assert not resp.cached
+        assert _FakeProviderHandler.hits["vllm"] == 2
+
+    def test_sync_path_shares_the_cache(self, gateway):
+        first = gateway.generate("sync", temperature=0)
+        second = gateway.generate("sync", temperature=0)
+        bypass = gateway.generate("sync", temperature=0, use_cache=False)
+
+        assert first.success and second.cached and not bypass.cached
+        assert _FakeProviderHandler.hits["vllm"] == 2
+
+
+class TestProviderContract:
+
+    def test_incomplete_provider_fails_at_construction(self):
+        class _NoParse(_HTTPProvider):
+            name = "partial"
+
+            def _default_model(self):
+                return "m"
+
+            def _build(self, prompt, model, **kwargs):
+                return "http://localhost", {}, {"prompt": prompt}
+
+        with pytest.raises(TypeError, match="_parse"):
+            _NoParse({})
+        assert _VLLMProvider({}).name == "vllm"
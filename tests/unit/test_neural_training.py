@@ -0,0 +1,117 @@
+"""
+Neural Network Trainer Tests — CareerTrojan
+============================================
+
+Tests cover:
+  1. BatchDataset slices whole batches from dense and sparse matrices, and
+     a ``rows=`` view selects a subset without copying
+  2. _predict runs batched forward passes and matches a full-matrix argmax
+  3. Early stopping halts after the patience window and restores the best
+     epoch's weights; an improving run uses every epoch
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import numpy as np
+import pytest
+from scipy import sparse as sp
+
+torch = pytest.importorskip("torch")
+
+from services.ai_engine import train_neural_networks as tnn
+from services.ai_engine.train_neural_networks import BatchDataset, NeuralNetworkTrainer
+
+
+def _separable(n, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 4)).astype(np.float32)
+    y = (X[:, 0] > 0).astype(np.int64)
+    return X, y
+
+
+@pytest.fixture
+def trainer(tmp_path, monkeypatch):
+    from services.ai_engine import config
+    monkeypatch.setattr(config, "models_path", tmp_path)
+    t = NeuralNetworkTrainer(base_path=str(tmp_path))
+    t.device = torch.device("cpu")
+    return t
+
+
+def _linear(seed=0):
+    torch.manual_seed(seed)
+    return torch.nn.Linear(4, 2)
+
+
+class TestBatchDataset:
+
+    def test_dense_batch_slice(self):
+        X, y = _separable(6)
+        X_b, y_b = BatchDataset(X, y)[[0, 2, 5]]
+        assert X_b.dtype == torch.float32 and y_b.dtype == torch.int64
+        np.testing.assert_array_equal(X_b.numpy(), X[[0, 2, 5]])
+        np.testing.assert_array_equal(y_b.numpy(), y[[0, 2, 5]])
+
+    def test_sparse_densified_per_batch(self):
+        X, _ = _separable(6)
+        X[X < 0.5] = 0.0
+        ds = BatchDataset(sp.csr_matrix(X))
+        assert ds.sparse and len(ds) == 6
+        (X_b,) = ds[[1, 4]]
+        np.testing.assert_array_equal(X_b.numpy(), X[[1, 4]])
+
+    def test_rows_view_selects_subset(self, trainer):
+        X, y = _separable(10)
+        rows = np.array([7, 3, 9])
+        ds = BatchDataset(X, y, rows=rows)
+        assert len(ds) == 3 and ds.X is X  # a view, not a copy
+        X_b, y_b = ds[[0, 2]]
+        np.testing.assert_array_equal(X_b.numpy(), X[[7, 9]])
+        np.testing.assert_array_equal(y_b.numpy(), y[[7, 9]])
+
+        loader = trainer._make_loader(X, y, batch_size=2, shuffle=False, rows=rows)
+        batches = [b_y.tolist() for _, b_y in loader]
+        assert batches == [y[[7, 3]].tolist(), y[[9]].tolist()]
+
+
+class TestPredict:
+
+    def test_batched_matches_full_forward(self, trainer, monkeypatch):
+        monkeypatch.setattr(tnn, "EVAL_BATCH_SIZE", 3)
+        X, _ = _separable(10)
+        model = _linear()
+        with torch.no_grad():
+            expected = model(torch.from_numpy(X)).argmax(dim=1).numpy()
+
+        np.testing.assert_array_equal(trainer._predict(model, X), expected)
+        np.testing.assert_array_equal(trainer._predict(model, sp.csr_matrix(X)), expected)
+        assert trainer._predict(model, X[:0]).shape == (0,)
+
+
+class TestEarlyStopping:
+
+    def test_stops_and_restores_best_weights(self, trainer, monkeypatch):
+        monkeypatch.setattr(tnn, "EARLY_STOPPING_PATIENCE", 3)
+        X, y = _separable(64)
+        # Validation labels contradict the training labels: every epoch after
+        # the first makes validation loss worse
+        model = _linear()
+        metrics = trainer._train_classifier(model, X, y, X, 1 - y, epochs=40, lr=0.05, batch_size=16)
+
+        assert metrics["stopped_early"] is True
+        assert metrics["best_epoch"] == 1
+        assert metrics["epochs"] == 1 + 3
+        assert metrics["max_epochs"] == 40
+
+        # The returned model carries the best epoch's weights, not the last epoch's
+        model.eval()
+        with torch.no_grad():
+            val_loss = torch.nn.functional.cross_entropy(
+                model(torch.from_numpy(X)), torch.from_numpy(1 - y)).item()
+        assert val_loss == pytest.approx(metrics["final_val_loss"], rel=1e-5)
+
+    def test_improving_run_uses_every_epoch(self, trainer):
+        X, y = _separable(64)
+        metrics = trainer._train_classifier(_linear(), X, y, X, y, epochs=5, lr=0.05, batch_size=16)
+        assert metrics["epochs"] == 5
+        assert metrics["stopped_early"] is False
@@ -0,0 +1,149 @@
+"""
+Rate Limiter Store Tests — CareerTrojan
+========================================
+
+Tests cover:
+  1. Approximate sliding window: previous window's weight decays linearly
+  2. Denied requests are not counted; Retry-After is sensible
+  3. Idle clients expire from the in-memory store
+  4. SQLite store enforces one limit across several worker processes
+  5. Middleware answers 429 from a shared store
+  6. Blocking stores are called off the event loop; incomplete stores fail at construction
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import multiprocessing
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from services.backend_api.middleware.rate_limiter import (
+    MemoryRateLimitStore,
+    RateLimitMiddleware,
+    RateLimitStore,
+    SQLiteRateLimitStore,
+)
+
+WINDOW = 60
+T0 = 1_000_020.0  # 0s into a window boundary (1_000_020 % 60 == 0)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryRateLimitStore()
+    return SQLiteRateLimitStore(str(tmp_path / "rl.db"))
+
+
+class TestSlidingWindow:
+
+    def test_limit_within_one_window(self, store):
+        results = [store.hit("ip", 5, WINDOW, T0 + i) for i in range(7)]
+        assert [ok for ok, _ in results] == [True] * 5 + [False] * 2
+        # 54s until the window rolls over, then 12s for the 5 carried hits to weigh 4
+        assert results[-1][1] == 67
+
+    def test_previous_window_decays(self, store):
+        for _ in range(10):
+            store.hit("ip", 10, WINDOW, T0)
+        # Half-way into the next window the previous 10 weigh 5
+        allowed = sum(store.hit("ip", 10, WINDOW, T0 + WINDOW + 30)[0] for _ in range(10))
+        assert allowed == 5
+
+    def test_keys_are_independent_and_clearable(self, store):
+        for _ in range(3):
+            store.hit("a", 3, WINDOW, T0)
+        assert not store.hit("a", 3, WINDOW, T0)[0]
+        assert store.hit("b", 3, WINDOW, T0)[0]
+        store.clear()
+        assert store.hit("a", 3, WINDOW, T0)[0]
+
+    def test_counters_reset_after_two_windows(self, store):
+        for _ in range(3):
+            store.hit("ip", 3, WINDOW, T0)
+        assert store.hit("ip", 3, WINDOW, T0 + 2 * WINDOW)[0]
+
+
+def test_idle_clients_expire_from_memory():
+    store = MemoryRateLimitStore()
+    for i in range(1_000):
+        store.hit(f"10.0.{i // 256}.{i % 256}", 100, WINDOW, T0)
+    store.hit("fresh", 100, WINDOW, T0 + 2 * WINDOW)
+    assert len(store) == 1
+
+
+def _worker(path, attempts, queue):
+    store = SQLiteRateLimitStore(path)
+    queue.put(sum(store.hit("shared-ip", 50, 3600, T0)[0] for _ in range(attempts)))
+
+
+def test_sqlite_store_shared_across_processes(tmp_path):
+    path = str(tmp_path / "shared.db")
+    SQLiteRateLimitStore(path)  # create schema before the workers race
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(path, 40, queue)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    allowed = [queue.get(timeout=60) for _ in procs]
+    for p in procs:
+        p.join(timeout=30)
+
+    # 160 attempts from four "workers" share one 50-request budget
+    assert sum(allowed) == 50
+
+
+def test_middleware_returns_429(tmp_path):
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    shared = SQLiteRateLimitStore(str(tmp_path / "mw.db"))
+    app.add_middleware(RateLimitMiddleware, max_requests=3, window_seconds=60, store=shared)
+    client = TestClient(app)
+
+    statuses = [client.get("/ping").status_code for _ in range(5)]
+    assert statuses == [200, 200, 200, 429, 429]
+    assert int(client.get("/ping").headers["Retry-After"]) >= 1
+
+
+class _RecordingStore(MemoryRateLimitStore):
+    blocking = True
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def hit(self, key, limit, window, now):
+        self.threads.append(threading.get_ident())
+        return super().hit(key, limit, window, now)
+
+
+def test_blocking_store_runs_off_event_loop():
+    app = FastAPI()
+    loop_threads = []
+
+    @app.get("/ping")
+    async def ping():
+        loop_threads.append(threading.get_ident())
+        return {"ok": True}
+
+    store = _RecordingStore()
+    app.add_middleware(RateLimitMiddleware, max_requests=10, window_seconds=60, store=store)
+    client = TestClient(app)
+    assert client.get("/ping").status_code == 200
+    assert store.threads and store.threads[0] != loop_threads[0]
+
+
+def test_incomplete_store_fails_at_construction():
+    class NoClear(RateLimitStore):
+        def hit(self, key, limit, window, now):
+            return True, 0
+
+    with pytest.raises(TypeError):
+        NoClear()
@@ -0,0 +1,103 @@
+"""
+Recency Index Tests — CareerTrojan
+===================================
+
+Tests cover:
+  1. Counts and newest-first ordering after the initial scan
+  2. Writer hooks (record_write / record_delete) without rescans
+  3. Rescan on directory change, top-k refill after deleting a recent file
+  4. A limit beyond top_k still returns the newest ``limit`` files
+  5. Rewriting a tracked file in place (directory mtime unchanged) reorders
+     it on the next full rescan, both polled and on read
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import os
+
+import pytest
+
+from services.shared.recency_index import RecencyIndex
+
+
+def _touch(path, mtime):
+    path.write_text("{}")
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def root(tmp_path):
+    d = tmp_path / "parsed_resumes"
+    d.mkdir()
+    for i in range(30):
+        _touch(d / f"r{i:02d}.json", 1_000 + i)
+    (d / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def test_initial_counts_and_order(root):
+    idx = RecencyIndex(root, directories=["parsed_resumes", "companies"], top_k=5)
+    assert idx.counts() == {"parsed_resumes": 30, "companies": 0}
+    assert not idx.exists("companies")
+    assert [p.name for p, _ in idx.recent("parsed_resumes", 3)] == ["r29.json", "r28.json", "r27.json"]
+
+
+def test_writer_hooks(root):
+    idx = RecencyIndex(root, directories=["parsed_resumes"], top_k=5)
+    idx.refresh()
+    idx._running = True  # simulate a live watcher: reads must not rescan
+
+    new = root / "parsed_resumes" / "fresh.json"
+    _touch(new, 5_000)
+    idx.record_write(new)
+    assert idx.count("parsed_resumes") == 31
+    assert idx.recent("parsed_resumes", 1)[0][0] == new
+
+    idx.record_delete(new)
+    idx.record_write(root / "elsewhere" / "x.json")  # untracked: ignored
+    assert idx.count("parsed_resumes") == 30
+    assert idx.recent("parsed_resumes", 1)[0][0].name == "r29.json"
+
+
+def test_rescan_and_topk_refill(root):
+    idx = RecencyIndex(root, directories=["parsed_resumes"], top_k=3)
+    idx.refresh()
+    d = root / "parsed_resumes"
+    (d / "r29.json").unlink()
+    _touch(d / "late.json", 900)
+    os.utime(d, ns=(0, d.stat().st_mtime_ns + 10**9))
+
+    assert idx.count("parsed_resumes") == 30
+    assert [p.name for p, _ in idx.recent("parsed_resumes", 3)] == ["r28.json", "r27.json", "r26.json"]
+
+
+def test_limit_beyond_top_k(root):
+    idx = RecencyIndex(root, directories=["parsed_resumes"], top_k=5)
+    names = [f"r{i:02d}.json" for i in range(29, -1, -1)]
+    assert [p.name for p, _ in idx.recent("parsed_resumes", 5)] == names[:5]
+    assert [p.name for p, _ in idx.recent("parsed_resumes", 6)] == names[:6]
+    assert [p.name for p, _ in idx.recent("parsed_resumes", 12)] == names[:12]
+    assert [p.name for p, _ in idx.recent("parsed_resumes", 100)] == names
+    assert idx.recent("parsed_resumes", 0) == []
+
+
+def test_in_place_rewrite_reorders(root):
+    idx = RecencyIndex(root, directories=["parsed_resumes"], top_k=5)
+    idx.refresh(full=True)
+    d = root / "parsed_resumes"
+    dir_stat = d.stat()
+
+    _touch(d / "r05.json", 9_000)
+    os.utime(d, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    assert idx.refresh() == 0  # directory unchanged: the cheap check misses it
+    assert idx.recent("parsed_resumes", 1)[0][0].name == "r29.json"
+
+    assert idx.refresh(full=True) == 1  # what the polling thread runs
+    assert [p.name for p, _ in idx.recent("parsed_resumes", 2)] == ["r05.json", "r29.json"]
+
+    # Reading without a watcher runs a full rescan once the interval elapses
+    _touch(d / "r07.json", 9_500)
+    os.utime(d, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    idx.FULL_RESCAN_INTERVAL = 0.0
+    assert idx.recent("parsed_resumes", 1)[0][0].name == "r07.json"
+    assert idx.count("parsed_resumes") == 30
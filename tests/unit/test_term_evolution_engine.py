@@ -0,0 +1,154 @@
+"""
+Term Evolution Fuzzy Resolution Tests — CareerTrojan
+=====================================================
+
+Tests cover:
+  1. Exact term and abbreviation resolution with position info
+  2. Containment fallback agrees with the original linear scan
+  3. Bounded edit-distance matches for misspellings; short terms stay exact
+  4. resolve_many is aligned with its input and memoized; reloads reset the memo
+  5. Whole-document resolution over a large vocabulary stays fast
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import json
+import random
+import string
+import time
+
+import pytest
+
+from services.ai_engine.term_evolution_engine import TermEvolutionEngine
+
+CHAINS = [
+    {
+        "chain_id": "mrp_erp",
+        "domain": "manufacturing",
+        "current_term": "enterprise resource planning",
+        "lineage": [
+            {"term": "material requirements planning", "abbrev": "MRP", "status": "historical"},
+            {"term": "manufacturing resource planning", "abbrev": "MRP II", "status": "historical"},
+            {"term": "enterprise resource planning", "abbrev": "ERP", "status": "current"},
+        ],
+        "complementary_skills": ["inventory management", "supply chain management"],
+    },
+    {
+        "chain_id": "hr",
+        "domain": "people",
+        "current_term": "human resources",
+        "lineage": [
+            {"term": "personnel management", "status": "historical"},
+            {"term": "human resources", "abbrev": "HR", "status": "current"},
+            {"term": "people operations", "status": "emerging"},
+        ],
+    },
+    {
+        "chain_id": "containers",
+        "domain": "technology",
+        "current_term": "kubernetes",
+        "lineage": [
+            {"term": "virtual machines", "status": "historical"},
+            {"term": "kubernetes", "abbrev": "k8s", "status": "current"},
+        ],
+    },
+]
+
+
+def _write(tmp_path, chains, name="term_evolution.json"):
+    path = tmp_path / name
+    path.write_text(json.dumps({"evolution_chains": chains}), encoding="utf-8")
+    return path
+
+
+def _linear_chain_id(engine, term):
+    """Original resolve() fallback: first indexed term containing / contained in the query."""
+    normalized = term.lower().strip()
+    ids = engine._term_to_chains.get(normalized) or engine._abbrev_to_chains.get(normalized)
+    if ids:
+        return ids[0]
+    for indexed_term, ids in engine._term_to_chains.items():
+        if normalized in indexed_term or indexed_term in normalized:
+            return ids[0]
+    return None
+
+
+@pytest.fixture
+def engine(tmp_path):
+    eng = TermEvolutionEngine()
+    eng.load(_write(tmp_path, CHAINS))
+    return eng
+
+
+class TestResolve:
+
+    def test_exact_and_abbreviation(self, engine):
+        assert engine.resolve("Material Requirements Planning")["matched_position"] == 0
+        erp = engine.resolve("erp")
+        assert erp["chain_id"] == "mrp_erp" and erp["is_current"]
+        assert engine.resolve("k8s")["chain_id"] == "containers"
+
+    def test_containment_matches_linear_scan(self, engine):
+        queries = ["resource planning", "senior people operations lead", "personnel", "machines",
+                   "ops", "plan", "hr business partner", "operations", "zzz", "a", ""]
+        for q in queries:
+            got = engine.resolve(q)
+            assert (got or {}).get("chain_id") == _linear_chain_id(engine, q), q
+
+    def test_misspelling_within_edit_budget(self, engine):
+        typo = engine.resolve("kubernetse")
+        assert typo["chain_id"] == "containers"
+        assert typo["matched_term"] == "kubernetes"
+        assert engine.resolve("personel managment")["chain_id"] == "hr"
+
+    def test_short_terms_do_not_fuzzy_match(self, engine):
+        assert engine.resolve("erq") is None
+        assert engine.resolve("quantum cryptography") is None
+
+
+class TestResolveMany:
+
+    def test_aligned_and_memoized(self, engine):
+        terms = ["MRP", "kubernetse", "nothing here", "mrp ", "HR"]
+        results = engine.resolve_many(terms)
+        assert [r and r["chain_id"] for r in results] == ["mrp_erp", "containers", None, "mrp_erp", "hr"]
+        assert set(engine._resolve_memo) == {"mrp", "kubernetse", "nothing here", "hr"}
+
+    def test_loading_chains_resets_memo(self, engine, tmp_path):
+        assert engine.resolve("prompt engineering") is None
+        engine.load(_write(tmp_path, [{
+            "chain_id": "ai", "current_term": "prompt engineering",
+            "lineage": [{"term": "prompt engineering", "status": "emerging"}],
+        }], name="more.json"))
+        assert engine.resolve("prompt engineering")["chain_id"] == "ai"
+
+
+class TestScale:
+
+    def test_document_resolution_on_large_vocabulary(self, tmp_path):
+        rng = random.Random(0)
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10))) for _ in range(6000)]
+        chains = [
+            {"chain_id": f"c{i}", "lineage": [{"term": f"{words[i % 6000]} {words[(i * 7 + 1) % 6000]}"}]}
+            for i in range(20_000)
+        ]
+        eng = TermEvolutionEngine()
+        eng.load(_write(tmp_path, chains))
+
+        doc = []
+        for _ in range(300):
+            w = rng.choice(words)
+            pos = rng.randrange(len(w))
+            doc.append(w[:pos] + rng.choice(string.ascii_lowercase) + w[pos + 1:])  # one substitution
+        doc += ["unrelated phrase %d" % i for i in range(100)]
+
+        t0 = time.perf_counter()
+        results = eng.resolve_many(doc)
+        elapsed = time.perf_counter() - t0
+
+        assert sum(r is not None for r in results[:300]) == 300
+        assert elapsed < 2.0
+
+        for q in doc[:40]:
+            if eng._containment_match(q.lower()) is not None:
+                assert eng.resolve(q)["chain_id"] == _linear_chain_id(eng, q)
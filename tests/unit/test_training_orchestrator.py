@@ -0,0 +1,116 @@
+"""
+Training Orchestrator Tests — CareerTrojan
+===========================================
+
+Tests cover:
+  1. Concurrent training in a process pool produces the same models as in-process
+  2. Worker reports are merged back and models registered; timings recorded
+  3. A crash mid-run resumes only the unfinished models from the checkpoint
+  4. Checkpoints from a different data snapshot are ignored
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import json
+import pickle
+
+import pytest
+
+from services.ai_engine.train_all_models import CareerTrojanModelTrainer
+from services.ai_engine.training_orchestrator import TrainingOrchestrator
+
+TITLES = ["Software Engineer", "Staff Nurse", "Financial Analyst"]
+DATA_MODELS = {"bayesian_classifier", "statistical_models"}
+
+
+def _candidates(n):
+    return [{
+        "Job Title": TITLES[i % 3],
+        "summary": f"candidate {i} with a long enough summary of their career so far",
+        "years_experience": 1 + i % 20,
+        "salary": 30000 + 1500 * (i % 20),
+    } for i in range(n)]
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # checkpoints live under ./models/training
+    monkeypatch.setenv("ML_MODELS_PATH", str(tmp_path / "models"))
+    data = tmp_path / "data"
+    (data / "core_databases").mkdir(parents=True)
+    (data / "core_databases" / "Candidate_database_merged.json").write_text(
+        json.dumps(_candidates(600)), encoding="utf-8")
+    return data
+
+
+def _orchestrator(data_dir, tmp_path, cpu_budget):
+    return TrainingOrchestrator(data_dir=str(data_dir), models_dir=str(tmp_path / "models"),
+                                registry_dir=str(tmp_path / "registry"), cpu_budget=cpu_budget)
+
+
+def _load(tmp_path, name):
+    with open(tmp_path / "models" / name, "rb") as f:
+        return pickle.load(f)
+
+
+class TestParallelTraining:
+
+    def test_pool_matches_in_process(self, data_dir, tmp_path):
+        serial = _orchestrator(data_dir, tmp_path, cpu_budget=1)
+        assert serial.train_all_models()
+        serial_nb = _load(tmp_path, "bayesian_classifier.pkl")
+        serial_rf = _load(tmp_path, "salary_predictor.pkl")
+
+        parallel = _orchestrator(data_dir, tmp_path, cpu_budget=2)
+        assert parallel.train_all_models()
+        state = parallel.training_state
+        assert state["workers"] == 2
+        assert DATA_MODELS <= set(state["completed_models"])
+        assert DATA_MODELS <= set(state["model_durations"])
+        assert state["total_duration"] > 0 and state["model_time"] > 0
+
+        nb = _load(tmp_path, "bayesian_classifier.pkl")
+        assert list(nb.classes_) == list(serial_nb.classes_)
+        assert (nb.class_count_ == serial_nb.class_count_).all()
+        assert len(_load(tmp_path, "salary_predictor.pkl").estimators_) == len(serial_rf.estimators_)
+
+        # Metrics trained in workers reach the parent's report and the registry
+        perf = parallel.trainer.training_report["model_performance"]
+        assert {"bayesian_classifier", "salary_predictor"} <= set(perf)
+        assert parallel.training_state["all_metrics"]["salary_predictor"]["r2_score"] == perf["salary_predictor"]["r2_score"]
+        assert "salary_predictor" in parallel.registry.list_models()
+
+
+class TestCheckpointResume:
+
+    def test_crash_resumes_only_unfinished_models(self, data_dir, tmp_path, monkeypatch):
+        def crash(self, df):
+            raise SystemExit("killed mid-run")
+
+        with monkeypatch.context() as m:
+            m.setattr(CareerTrojanModelTrainer, "train_statistical_models", crash)
+            with pytest.raises(SystemExit):
+                _orchestrator(data_dir, tmp_path, cpu_budget=1).train_all_models()
+        checkpoint = json.loads((tmp_path / "models/training/checkpoints/checkpoint.json").read_text())
+        assert "bayesian_classifier" in checkpoint["completed"]
+
+        with monkeypatch.context() as m:
+            m.setattr(CareerTrojanModelTrainer, "train_bayesian_classifier",
+                      lambda self, df: pytest.fail("completed model retrained after resume"))
+            resumed = _orchestrator(data_dir, tmp_path, cpu_budget=1)
+            assert resumed.train_all_models()
+        assert DATA_MODELS <= set(resumed.training_state["completed_models"])
+        assert not (tmp_path / "models/training/checkpoints/checkpoint.json").exists()
+
+    def test_stale_checkpoint_is_ignored(self, data_dir, tmp_path):
+        checkpoints = tmp_path / "models/training/checkpoints"
+        checkpoints.mkdir(parents=True)
+        (checkpoints / "checkpoint.json").write_text(json.dumps({
+            "last_completed_model": "bayesian_classifier",
+            "completed": {"bayesian_classifier": "full"},
+            "source": "some other snapshot",
+            "state": {},
+        }))
+        orch = _orchestrator(data_dir, tmp_path, cpu_budget=1)
+        assert orch.train_all_models()
+        assert DATA_MODELS <= set(orch.training_state["completed_models"])
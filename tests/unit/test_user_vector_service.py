@@ -0,0 +1,117 @@
+"""
+User Vector Service Tests — CareerTrojan
+=========================================
+
+Tests cover:
+  1. Vectors survive a new service/store instance (durable storage)
+  2. Batched upserts replace records in place
+  3. Cosine top-k matches an exact numpy reference and skips the caller
+  4. A second store on the same directory sees writes and grown matrices
+  5. Missing vectors and erasure
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import asyncio
+
+import numpy as np
+import pytest
+
+from services.backend_api.services.career.user_vector_service import (
+    CORE_AXES,
+    UserVectorService,
+    UserVectorStore,
+)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _signals(rng):
+    return {axis: float(v) for axis, v in zip(CORE_AXES, rng.random(len(CORE_AXES)))}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UserVectorStore(tmp_path / "vectors")
+
+
+@pytest.fixture
+def service(store):
+    return UserVectorService(store=store)
+
+
+class TestPersistence:
+
+    def test_vector_survives_new_instance(self, service, tmp_path):
+        _run(service.update_vector("u1", "r1", {"leadership": 0.8, "delivery": 0.25}))
+
+        fresh = UserVectorService(store=UserVectorStore(tmp_path / "vectors"))
+        result = _run(fresh.get_current_vector("u1", "r1"))
+        assert result["status"] == "ok"
+        assert result["vector"]["leadership"] == 0.8
+        assert result["confidence"]["leadership"] == 0.9
+        assert result["confidence"]["innovation"] == 0.0
+        assert result["resume_id"] == "r1"
+
+    def test_batch_upsert_replaces_in_place(self, service, store):
+        rng = np.random.default_rng(0)
+        _run(service.update_vectors([(f"u{i}", "r", _signals(rng)) for i in range(50)]))
+        out = _run(service.update_vectors([("u3", "r", {"innovation": 1.0}), ("u51", "r", {"delivery": 0.5})]))
+        assert out["updated"] == 2
+        assert len(store) == 51
+        assert _run(service.get_current_vector("u3", "r"))["vector"]["innovation"] == 1.0
+
+    def test_missing_vector(self, service):
+        result = _run(service.get_current_vector("nobody", "r9"))
+        assert result["status"] == "missing_resume"
+        assert result["vector"] is None
+
+
+class TestSimilarity:
+
+    def test_top_k_matches_exact_cosine(self, service, store):
+        rng = np.random.default_rng(1)
+        items = [(f"u{i}", "r", _signals(rng)) for i in range(5000)]
+        _run(service.update_vectors(items))
+
+        matrix = np.array([[round(s[a], 3) for a in CORE_AXES] for _, _, s in items])
+        normed = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+        ref = np.argsort(-(normed @ normed[7]))
+        expected = [f"u{i}" for i in ref if i != 7][:10]
+
+        result = _run(service.find_similar_users("u7", "r", k=10))
+        assert result["status"] == "ok"
+        got = [m["user_id"] for m in result["matches"]]
+        assert len(set(got) & set(expected)) >= 9  # float32 ties may swap the tail
+        assert "u7" not in got
+
+    def test_second_store_sees_grown_matrix(self, store, tmp_path):
+        reader = UserVectorStore(tmp_path / "vectors")
+        store.upsert_many([{"user_id": "a", "resume_id": "r", "vector": {"leadership": 1.0}, "confidence": {}}])
+        assert reader.top_k({"leadership": 1.0}, k=1)[0][0]["user_id"] == "a"
+
+        rng = np.random.default_rng(2)
+        store.upsert_many([
+            {"user_id": f"b{i}", "resume_id": "r", "vector": _signals(rng), "confidence": {}}
+            for i in range(UserVectorStore._GROW_ROWS + 10)
+        ])
+        store.upsert_many([{"user_id": "z", "resume_id": "r", "vector": {"innovation": 1.0}, "confidence": {}}])
+        hit, score = reader.top_k({"innovation": 1.0}, k=1)[0]
+        assert hit["user_id"] == "z" and score == pytest.approx(1.0, abs=1e-6)
+
+    def test_missing_user_has_no_matches(self, service):
+        assert _run(service.find_similar_users("ghost", "r"))["matches"] == []
+
+
+class TestErasure:
+
+    def test_delete_user_removes_from_lookup_and_search(self, service, store):
+        _run(service.update_vector("u1", "r1", {"leadership": 1.0}))
+        _run(service.update_vector("u1", "r2", {"leadership": 0.9}))
+        _run(service.update_vector("u2", "r1", {"leadership": 0.5, "delivery": 0.1}))
+
+        assert service.delete_user("u1") == 2
+        assert _run(service.get_current_vector("u1", "r1"))["status"] == "missing_resume"
+        assert [h["user_id"] for h, _ in store.top_k({"leadership": 1.0}, k=5)] == ["u2"]
@@ -0,0 +1,122 @@
+"""
+Web Intelligence Result Cache Tests — CareerTrojan
+===================================================
+
+Tests cover:
+  1. LRU eviction by entry count and by byte budget, with counters
+  2. TTL expiry
+  3. Spill tier: evicted entries promote back; persist() survives a restart
+  4. Spill tier is itself bounded
+  5. Memory stays flat under a stream of unique company lookups
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import time
+import tracemalloc
+
+import pytest
+
+from services.backend_api.services.web_fetch_cache import BoundedTTLCache
+
+
+def _result(name, padding=200):
+    return {"company_name": name, "confidence_score": 55, "notes": "x" * padding}
+
+
+class TestBounds:
+
+    def test_lru_entry_bound(self):
+        cache = BoundedTTLCache(max_entries=3)
+        for name in "abcd":
+            cache.set(name, _result(name))
+        cache.get("b")  # b becomes most recent
+        cache.set("e", _result("e"))
+
+        assert len(cache) == 3
+        assert cache.get("a") is None and cache.get("c") is None
+        assert cache.get("b")["company_name"] == "b"
+        stats = cache.get_stats()
+        assert stats["evictions"] == 2
+        assert stats["misses"] == 2
+
+    def test_byte_bound(self):
+        cache = BoundedTTLCache(max_entries=1000, max_bytes=2_000)
+        for i in range(50):
+            cache.set(f"k{i}", _result(f"k{i}", padding=300))
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 2_000
+        assert stats["entries"] < 10
+
+    def test_ttl_expiry(self):
+        cache = BoundedTTLCache(ttl=0.05)
+        cache.set("a", _result("a"))
+        assert cache.get("a") is not None
+        time.sleep(0.06)
+        assert cache.get("a") is None
+        assert cache.get_stats()["expirations"] == 1
+
+
+class TestSpillTier:
+
+    def test_evicted_entry_promotes_from_disk(self, tmp_path):
+        cache = BoundedTTLCache(max_entries=2, spill_dir=tmp_path)
+        for name in "abc":
+            cache.set(name, _result(name))
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        assert cache.get("a")["company_name"] == "a"
+        stats = cache.get_stats()
+        assert stats["spill_hits"] == 1
+        assert stats["entries"] == 2
+
+    def test_persist_survives_restart(self, tmp_path):
+        cache = BoundedTTLCache(spill_dir=tmp_path)
+        cache.set("company_acme_False", _result("Acme"))
+        cache.persist()
+
+        restarted = BoundedTTLCache(spill_dir=tmp_path)
+        assert restarted.get("company_acme_False")["company_name"] == "Acme"
+        assert restarted.get("company_other_False") is None
+
+    def test_expired_spill_entry_is_dropped(self, tmp_path):
+        cache = BoundedTTLCache(spill_dir=tmp_path, ttl=0.05)
+        cache.set("a", _result("a"))
+        cache.persist()
+        time.sleep(0.06)
+        assert BoundedTTLCache(spill_dir=tmp_path).get("a") is None
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_spill_tier_is_bounded(self, tmp_path):
+        cache = BoundedTTLCache(max_entries=1, spill_dir=tmp_path, max_spill_entries=5)
+        for i in range(20):
+            cache.set(f"k{i}", _result(f"k{i}"))
+        assert len(list(tmp_path.glob("*.json"))) == 5
+        assert cache.get("k18") is not None
+        assert cache.get("k0") is None
+
+
+def test_memory_flat_under_unique_company_stream():
+    pytest.importorskip("bs4")
+    pytest.importorskip("streamlit")
+    from services.backend_api.services.production_web_intelligence import ProductionWebIntelligence
+
+    intel = ProductionWebIntelligence()
+    intel.cache.max_entries = 200
+    try:
+        def feed(start, count):
+            for i in range(start, start + count):
+                intel._cache_result(f"company_synthetic-{i}_False", _result(f"Synthetic {i}", padding=500))
+
+        feed(0, 1_000)  # reach steady state
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        feed(1_000, 5_000)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(intel.cache) == 200
+        assert current - baseline < 256 * 1024
+        assert intel.get_cache_stats()["results"]["evictions"] == 5_800
+    finally:
+        intel.close()
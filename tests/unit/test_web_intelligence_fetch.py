@@ -0,0 +1,251 @@
+"""
+Web Intelligence Fetch Pipeline Tests — CareerTrojan
+=====================================================
+
+Runs ProductionWebIntelligence against a local stub HTTP server with
+injected per-source delays.
+
+Tests cover:
+  1. Sources are fetched concurrently (lookup ≈ slowest source, not the sum)
+  2. A source past its deadline is reported as degraded without stalling
+  3. Response cache: fresh hits, ETag revalidation (304), on-disk persistence;
+     the file is rewritten off the request thread after a change count or
+     interval, and API keys in query strings never reach it
+  4. Per-host rate limiter reserves slots and honours a deadline
+  5. The global instance persists its caches at exit
+
+Author: CareerTrojan System
+Date: October 2026
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("streamlit")
+
+from services.backend_api.services.production_web_intelligence import ProductionWebIntelligence
+from services.backend_api.services.web_fetch_cache import HostRateLimiter
+
+DELAYS = {"/ddg": 0.3, "/site": 0.3, "/social": 0.3, "/news": 0.3}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    hits = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, body: bytes):
+        prefix = "/" + self.path.lstrip("/").split("/")[0].split("?")[0]
+        _StubHandler.hits[prefix] = _StubHandler.hits.get(prefix, 0) + 1
+        time.sleep(DELAYS.get(prefix, 0))
+        if prefix == "/etag" and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if prefix == "/etag":
+            self.send_header("ETag", '"v1"')
+            self.send_header("Cache-Control", "max-age=0")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/site"):
+            self._reply(b"<html><title>Acme</title><main>Acme builds things</main></html>")
+        else:
+            self._reply(json.dumps({"Abstract": "Acme Corp", "AbstractURL": "http://acme.test",
+                                    "status": "ok", "articles": []}).encode())
+
+    def do_HEAD(self):
+        self._reply(b"")
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.block_on_close = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _StubHandler.hits = {}
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def intel(stub_server, tmp_path):
+    wi = ProductionWebIntelligence(cache_dir=tmp_path)
+    wi.rate_limiter.min_interval = 0.0  # every stub source shares one host
+    wi.endpoints = {"duckduckgo": f"{stub_server}/ddg", "news_api": f"{stub_server}/news"}
+    wi.website_url_templates = [stub_server + "/site/{nospace}"]
+    wi.social_url_templates = {"linkedin": [stub_server + "/social/{slug}"]}
+    wi.api_keys["news_api"] = "test-key"
+    yield wi
+    wi.close()
+
+
+class TestConcurrentLookup:
+
+    def test_sources_overlap(self, intel):
+        t0 = time.monotonic()
+        result = intel.search_company_real("Acme", deep_search=True)
+        elapsed = time.monotonic() - t0
+
+        # Four sources × 0.3s would take ≥ 1.2s sequentially
+        assert elapsed < 0.9
+        assert set(result["source_timings_ms"]) >= {"duckduckgo", "website", "news_api", "social_media"}
+        assert result["extracted_information"]["description"] == "Acme Corp"
+        assert result["extracted_information"]["social_presence"]["linkedin"].endswith("/social/acme")
+        assert result["degraded_sources"] == []
+
+    def test_slow_source_degrades_instead_of_stalling(self, intel, monkeypatch):
+        monkeypatch.setitem(DELAYS, "/news", 2.0)
+        intel.source_deadlines["news_api"] = 0.5
+
+        t0 = time.monotonic()
+        result = intel.search_company_real("Globex", deep_search=True)
+        elapsed = time.monotonic() - t0
+
+        assert elapsed < 1.5
+        assert result["degraded_sources"] == ["news_api"]
+        assert "news_api" not in result["sources_used"]
+        assert "duckduckgo" in result["sources_used"]
+
+
+class TestResponseCache:
+
+    def test_fresh_hit_skips_network(self, intel, stub_server):
+        intel._fetch(f"{stub_server}/ddg", params={"q": "x"})
+        again = intel._fetch(f"{stub_server}/ddg", params={"q": "x"})
+        assert again.from_cache
+        assert _StubHandler.hits["/ddg"] == 1
+
+    def test_stale_entry_revalidates_with_etag(self, intel, stub_server):
+        first = intel._fetch(f"{stub_server}/etag")
+        second = intel._fetch(f"{stub_server}/etag")
+        assert _StubHandler.hits["/etag"] == 2
+        assert second.from_cache and second.json() == first.json()
+        assert intel.http_cache.stats["revalidated"] == 1
+
+    def test_cache_persists_across_instances(self, intel, stub_server, tmp_path):
+        intel._fetch(f"{stub_server}/ddg", params={"q": "persist"})
+        intel.http_cache.flush()
+
+        reloaded = ProductionWebIntelligence(cache_dir=tmp_path)
+        try:
+            assert reloaded._fetch(f"{stub_server}/ddg", params={"q": "persist"}).from_cache
+        finally:
+            reloaded.close()
+        assert _StubHandler.hits["/ddg"] == 1
+
+    def test_bounded_entries(self, tmp_path):
+        from services.backend_api.services.web_fetch_cache import CachedResponse, HTTPResponseCache
+
+        cache = HTTPResponseCache(max_entries=3)
+        for i in range(5):
+            cache.store(f"k{i}", CachedResponse(200, f"http://x/{i}", {}, b"{}"))
+        assert len(cache) == 3
+        assert cache.stats["evictions"] == 2
+
+    def test_flush_is_batched(self, tmp_path, monkeypatch):
+        from services.backend_api.services import web_fetch_cache
+        from services.backend_api.services.web_fetch_cache import CachedResponse, HTTPResponseCache
+
+        path = tmp_path / "http.json"
+        cache = HTTPResponseCache(persist_path=path, flush_every=3, flush_interval=60.0)
+        for i in range(2):
+            cache.store(f"k{i}", CachedResponse(200, f"http://x/{i}", {}, b"{}"))
+            assert cache.maybe_flush() is False
+        assert not path.exists()
+
+        writers = []
+        real_dump = web_fetch_cache.json.dump
+        monkeypatch.setattr(web_fetch_cache.json, "dump",
+                            lambda *a, **k: writers.append(threading.current_thread().name) or real_dump(*a, **k))
+        cache.store("k2", CachedResponse(200, "http://x/2", {}, b"{}"))
+        assert cache.maybe_flush() is True
+        cache._flush_thread.join(timeout=5)
+        assert writers == ["web-cache-flush"]  # not the request thread
+        assert len(json.loads(path.read_text())["entries"]) == 3
+        assert cache.maybe_flush() is False  # nothing new
+
+        # A single change is written once the interval has passed
+        cache.store("k3", CachedResponse(200, "http://x/3", {}, b"{}"))
+        assert cache.maybe_flush() is False
+        now = time.monotonic()
+        monkeypatch.setattr(web_fetch_cache.time, "monotonic", lambda: now + 61.0)
+        assert cache.maybe_flush() is True
+        cache._flush_thread.join(timeout=5)
+        assert len(json.loads(path.read_text())["entries"]) == 4
+
+    def test_api_key_never_persisted(self, intel, stub_server, tmp_path):
+        intel._fetch(f"{stub_server}/ddg", params={"q": "x", "apiKey": "SECRET-KEY"})
+        intel.http_cache.flush()
+        stored = (tmp_path / "http_responses.json").read_text()
+        assert "SECRET-KEY" not in stored
+        assert f"{stub_server}/ddg" in stored
+
+    def test_legacy_urls_redacted_on_load(self, tmp_path):
+        from services.backend_api.services.web_fetch_cache import CachedResponse, HTTPResponseCache
+
+        path = tmp_path / "http.json"
+        entry = {"response": CachedResponse(200, "https://news.test/v2/everything?q=x&apiKey=SECRET",
+                                            {}, b"{}").to_dict(), "expires_at": time.time() + 60}
+        path.write_text(json.dumps({"entries": [["k", entry]]}))
+        cache = HTTPResponseCache(persist_path=path)
+        cache.flush()
+        assert "SECRET" not in path.read_text()
+        assert cache.lookup("k")[0].url == "https://news.test/v2/everything"
+
+
+class TestHostRateLimiter:
+
+    def test_slots_are_spaced_per_host(self):
+        limiter = HostRateLimiter(min_interval=1.0)
+        assert limiter.reserve("a.test") == 0
+        assert limiter.reserve("a.test") == pytest.approx(1.0, abs=0.05)
+        assert limiter.reserve("b.test") == 0
+
+    def test_slot_past_deadline_is_declined(self):
+        limiter = HostRateLimiter(min_interval=5.0)
+        limiter.reserve("a.test")
+        assert limiter.reserve("a.test", not_after=time.monotonic() + 1.0) is None
+        # Declining does not consume the slot
+        assert limiter.reserve("a.test") == pytest.approx(5.0, abs=0.05)
+
+
+class TestGlobalInstance:
+
+    def test_caches_persist_at_exit(self, tmp_path, monkeypatch):
+        import atexit
+        from services.backend_api.services import production_web_intelligence as pwi
+
+        registered = []
+        monkeypatch.setattr(atexit, "register", registered.append)
+        monkeypatch.setenv("WEB_INTEL_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(pwi, "_web_intelligence", None)
+
+        intel = pwi.get_web_intelligence()
+        assert pwi.get_web_intelligence() is intel
+        assert registered == [pwi.close_web_intelligence]
+        intel._cache_result("company_acme", {"confidence_score": 80})
+
+        registered[0]()              # what the interpreter runs at exit
+        pwi.close_web_intelligence()  # API shutdown hook too: a no-op now
+        assert pwi._web_intelligence is None
+
+        restarted = pwi.get_web_intelligence()
+        try:
+            assert restarted is not intel
+            assert restarted._get_cached_result("company_acme") == {"confidence_score": 80}
+        finally:
+            pwi.close_web_intelligence()